@@ -21,6 +21,7 @@ from .rules import (
 from .lexicon import (
     globalStopWords, globalAllowShortTokens, globalPhraseCanonical, globalWeakTokens,
 )
+from .skill_kb import canonical_skill_key, skill_kb_version
 
 # --- debugging.
 import json
@@ -99,24 +100,17 @@ PRESERVED_SIGNAL_PHRASES = {
 SIGNAL_CANONICAL = {
     "ai": "artificial intelligence",
     "api integrations": "api integration",
-    "aws": "amazon web services",
     "ci/cd": "ci/cd",
     "ci cd": "ci/cd",
     "conversational applications": "conversational ai",
-    "dialog flow": "dialogflow",
-    "dialog flows": "dialogflow",
-    "gcp": "google cloud platform",
-    "google cloud": "google cloud platform",
     "llm": "large language models",
     "llm models": "large language models",
-    "open ai": "openai",
     "version control": "git",
     "etl/elt pipelines": "etl pipelines",
     "printed circuit board": "pcb",
     "printed circuit boards": "pcb",
     "bill of materials": "bom",
     "boms": "bom",
-    "cadence orcad": "orcad",
 }
 
 TOOL_PLATFORM_TERMS = {
@@ -300,7 +294,8 @@ def canonicalize_token(token):
         return SIGNAL_CANONICAL[with_space]
     if with_space in globalPhraseCanonical:
         return globalPhraseCanonical[with_space]
-    return low
+    # named skills / tools (k8s, reactjs, postgres) come from the shared skill dictionary.
+    return canonical_skill_key(low) or low
 
 
 # --- map multi-word known phrases to a single ranked key (e.g. microsoft azure -> azure) so stack + phrase credit collapse. --- #
@@ -310,7 +305,9 @@ def canonicalize_phrase_key(phrase):
     low = phrase.strip().lower()
     if low in SIGNAL_CANONICAL:
         return SIGNAL_CANONICAL[low]
-    return globalPhraseCanonical.get(low, low)
+    if low in globalPhraseCanonical:
+        return globalPhraseCanonical[low]
+    return canonical_skill_key(low) or low
 
 
 def classify_jd_line(line: str) -> str:
@@ -951,6 +948,7 @@ def extract_keywords(jobDescription, targetRole, numKeywords, company=""):
         debug["profile.activeDomains"] = profile["activeDomains"]
         debug["profile.weakTokens"] = list(profile["weakTokens"])
         debug["company"] = company
+        debug["skillKbVersion"] = skill_kb_version()
 
     # 2. parse jd into lines.
     res.bodyLines, res.downweightedLines = parse_jd_lines(jobDescription)
@@ -353,33 +353,17 @@ globalBoostWords = {
 
 # --- a dict of global phrase canonicals. --- #
 globalPhraseCanonical = {
-    "postgres": "postgresql",
-    "my sql": "mysql",
-    "mongo": "mongodb",
     "js frameworks": "javascript frameworks",
     "javascript framework": "javascript frameworks",
     "js framework": "javascript frameworks",
-    "js": "javascript",
-    "ts": "typescript",
-    "node": "node.js",
-    "reactjs": "react",
-    "react.js": "react",
     "front-end": "frontend",
     "front end": "frontend",
     "infra-engineer": "infrastructure",
     "infra": "infrastructure",
-    "rails": "ruby on rails",
-    "tailwind": "tailwind css",
-    "claude": "anthropic claude",
     "user centric": "user-centric",
     "early stage": "early-stage",
     "health care": "healthcare",
     "practitioner facing": "practitioner-facing",
-    "next js": "next.js",
-    "vue": "vue.js",
-    "vuejs": "vue.js",
-    "vue.js": "vue.js",
-    "react-native": "react native",
     "full-stack engineer": "full stack engineer",
     "full stack developer": "full stack engineer",
     "full-stack developer": "full stack engineer",
@@ -387,8 +371,6 @@ globalPhraseCanonical = {
     "micro services": "microservices",
     "restful api": "restful apis",
     "restful services": "restful apis",
-    "graph ql": "graphql",
-    "sklearn": "scikit-learn",
     "ml": "machine learning",
     "ai/ml": "machine learning",
     "ml/ai": "machine learning",
@@ -403,33 +385,12 @@ globalPhraseCanonical = {
     "ci cd": "continuous integration continuous delivery",
     "containers": "docker",
     "containerization": "docker",
-    "k8s": "kubernetes",
-    "aws": "amazon web services",
-    "gcp": "google cloud platform",
-    "gke": "google kubernetes engine",
-    "microsoft azure": "azure",
-    "microsoft sql server": "sql server",
-    "ms sql server": "sql server",
-    "google cloud platform": "google cloud platform",
-    "amazon web services": "amazon web services",
-    "open ai": "openai",
     "azure ai": "azure",
     "azure openai": "azure",
-    "dialog flow": "dialogflow",
-    "dialog flows": "dialogflow",
     "azure-native": "azure",
     "azure native": "azure",
-    "microsoft power automate": "power automate",
-    "power-automate": "power automate",
-    "powerautomate": "power automate",
-    "microsoft copilot": "copilot",
     "bi": "business intelligence",
-    "tableau desktop": "tableau",
-    "powerbi": "power bi",
-    "power-bi": "power bi",
     "d b t": "dbt",
-    "cadence orcad": "orcad",
-    "cadence allegro": "cadence allegro",
     "printed circuit board": "pcb",
     "printed circuit boards": "pcb",
     "bill of materials": "bom",
@@ -439,7 +400,6 @@ globalPhraseCanonical = {
     "u.s. citizenship": "us citizenship",
     "u s citizenship": "us citizenship",
     "crm": "customer relationship management",
-    "sfdc": "salesforce",
     "kpi": "key performance indicators",
     "kpis": "key performance indicators",
     "seo": "search engine optimization",
@@ -524,20 +484,15 @@ globalPhraseCanonical = {
     "interface design documents": "interface documentation",
     "idds": "interface documentation",
     "llm based solutions": "llm-based solutions",
-    "powerautomate": "power automate",
-    "microsoft copilot": "copilot",
     "fullstack engineer": "full stack engineer",
     "full stack": "full stack engineer",
     "end to end": "end-to-end",
-    "nextjs": "next.js",
     "rest api": "restful apis",
     "rest apis": "restful apis",
     "third party apis": "third-party apis",
     "bi": "business intelligence",
-    "scikit learn": "scikit-learn",
     "ml ops": "mlops",
     "ai ml": "machine learning model development",
-    "vue js": "vue.js",
     "cloud/on-premises": "cloud on-premises deployment",
     "cross-functional teams": "cross functional collaboration",
     "architectural discussions": "technical architecture",
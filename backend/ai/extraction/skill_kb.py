@@ -0,0 +1,26 @@
+# --- the shared skill dictionary (resume_parser/gazetteer/data/skills.tsv), seen from the tailor. --- #
+# the skills parser names uploaded skills from the same file, so a canonical key here
+# ("amazon web services", "node.js") is the lowercase of the name the resume was saved with.
+# the file is sorted and memory-mapped on first lookup; nothing is built at import time.
+
+try:
+    # the app runs from backend/, where resume_parser is a top-level package.
+    from resume_parser.gazetteer import skill_key, skills
+except ImportError:
+    from backend.resume_parser.gazetteer import skill_key, skills
+
+
+# --- lowercase canonical key for a known skill or alias ("k8s" -> "kubernetes"), else None. --- #
+def canonical_skill_key(term):
+    return skill_key(term) if term else None
+
+
+# --- every (alias key, canonical key) pair, for the alias index. --- #
+def iter_skill_aliases():
+    for alias, value in skills.items():
+        yield alias, value.partition("\t")[0].lower()
+
+
+# --- content hash of the dictionary, for anything cached across edits to it. --- #
+def skill_kb_version():
+    return skills.version
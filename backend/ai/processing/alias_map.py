@@ -4,6 +4,7 @@ import re
 from functools import lru_cache
 
 from ..extraction.lexicon import domainDicts, globalPhraseCanonical
+from ..extraction.skill_kb import canonical_skill_key, iter_skill_aliases
 from ..extraction.lexicon import titleAnchorHints
 from ..shared.text_utils import normalize_term
 
@@ -63,6 +64,10 @@ def build_alias_index():
     for alias, canonical in globalPhraseCanonical.items():
         register(alias, canonical)
 
+    # iterate over the shared skill dictionary (named tools / languages and their aliases).
+    for alias, canonical in iter_skill_aliases():
+        register(alias, canonical)
+
     # initialize our canonical to aliases map.
     canonical_to_aliases: Dict[str, Set[str]] = {}
     for alias, canonical in alias_to_canonical.items():
@@ -78,8 +83,8 @@ def canonicalize_term(term):
     # get maps from alias index.
     alias_to_canonical, _ = build_alias_index()
 
-    # return the canonicalized term.
-    return alias_to_canonical.get(term, term)
+    # return the canonicalized term (the skill dictionary also knows spellings like "react-native").
+    return alias_to_canonical.get(term) or canonical_skill_key(term) or term
 
 
 # --- get the aliases for a term. --- #
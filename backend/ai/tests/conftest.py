@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def chromium():
+    # tests that print real PDFs need Playwright's Chromium (`playwright install chromium`).
+    from playwright.sync_api import sync_playwright
+
+    try:
+        with sync_playwright() as playwright:
+            playwright.chromium.launch().close()
+    except Exception as e:
+        pytest.skip(f"no Chromium for Playwright: {str(e).splitlines()[0]}")
@@ -0,0 +1,140 @@
+import copy
+import io
+import json
+from pathlib import Path
+
+from pdfminer.pdfpage import PDFPage
+
+from backend.generator.auto_fit import (
+    _fit_pdf_on_page,
+    generate_docx_auto_fit,
+    generate_pdf_auto_fit_sync,
+    search_fit_ladder,
+)
+from backend.generator.pipeline import generate_resume
+from backend.generator.shared.style_presets import FIT_PRESET_LADDER, fit_preset_preferences
+from backend.generator.shared.styles import resolve_styles
+
+FIXTURE = Path(__file__).resolve().parents[2] / "templates" / "preview_fixture.json"
+
+
+def test_ladder_search_finds_the_first_fitting_step_in_few_probes():
+    for steps in (1, 4, 9):
+        for first_fit in range(steps + 1):
+            probed = []
+
+            def fits(step):
+                probed.append(step)
+                return step >= first_fit
+
+            step, fitted = search_fit_ladder(fits, steps)
+            assert (step, fitted) == ((first_fit, True) if first_fit < steps else (steps - 1, False))
+            assert len(probed) <= steps.bit_length()
+
+
+def test_ladder_swaps_only_the_fit_presets():
+    prefs = {"fontPairing": "calibri_modern", "margin_preset": "tight", "typeScalePreset": "large"}
+    densest = fit_preset_preferences(prefs, len(FIT_PRESET_LADDER) - 1)
+    assert densest == {"fontPairing": "calibri_modern", **FIT_PRESET_LADDER[-1]}
+
+
+def test_docx_auto_fit_keeps_fitting_styles_and_compresses_the_rest():
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    prefs = {"fontPairing": "serif_classic"}
+
+    # two pages is plenty: the user's own preferences come back untouched.
+    _, chosen, pages = generate_docx_auto_fit("classic", resume_data, prefs, max_pages=2)
+    assert chosen == prefs and pages == 2
+
+    # one page needs a denser preset.
+    data, chosen, pages = generate_docx_auto_fit("classic", resume_data, prefs, max_pages=1)
+    assert chosen != prefs and chosen["fontPairing"] == "serif_classic"
+    assert pages == 1 and data[:2] == b"PK"
+
+    # more than the densest preset can hold: the densest is returned, with its real page count.
+    long_resume = copy.deepcopy(resume_data)
+    long_resume["experience"] = long_resume["experience"] * 3
+    _, chosen, pages = generate_docx_auto_fit("classic", long_resume, prefs, max_pages=1)
+    assert chosen == fit_preset_preferences(prefs, len(FIT_PRESET_LADDER) - 1)
+    assert pages == 2
+
+    # split layouts own their insets; the presets don't apply there.
+    _, chosen, _ = generate_docx_auto_fit("sidebar", long_resume, prefs, max_pages=1)
+    assert chosen == prefs
+
+
+class _FitPage:
+    # Stands in for a Playwright page: content height comes from whichever tokens are swapped in.
+    def __init__(self, heights):
+        self.heights = heights
+        self.log = []
+        self.css = None
+
+    def emulate_media(self, media):
+        self.log.append(("media", media))
+
+    def set_content(self, html, wait_until):
+        self.log.append(("load", wait_until))
+
+    def set_viewport_size(self, size):
+        pass
+
+    def evaluate(self, script, arg=None):
+        if arg is None:
+            return True
+        self.css = arg
+        self.log.append(("probe", None))
+        return self.heights[arg]
+
+    def pdf(self, **kwargs):
+        self.log.append(("pdf", kwargs["margin"]))
+        return b"%PDF:" + self.css.encode("utf-8")
+
+
+def test_pdf_auto_fit_probes_presets_on_one_page_and_prints_the_chosen_one():
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    prefs = {"fontPairing": "serif_classic"}
+    html = generate_resume("classic", resume_data, prefs)
+
+    def css(preferences):
+        return resolve_styles("classic", preferences).rootCss
+
+    # the user's style runs to two pages; ladder steps from 2 on fit one.
+    heights = {css(prefs): 1500}
+    for step in range(len(FIT_PRESET_LADDER)):
+        heights[css(fit_preset_preferences(prefs, step))] = 5000 if step < 2 else 100
+
+    page = _FitPage(heights)
+    pdf, chosen, pages = _fit_pdf_on_page(page, "classic", html, prefs, 1)
+    assert chosen == fit_preset_preferences(prefs, 2) and pages == 1
+    # loaded once (print media, "load"), probed in place, and printed with the chosen tokens.
+    assert page.log[:2] == [("media", "print"), ("load", "load")]
+    assert [entry[0] for entry in page.log].count("load") == 1
+    assert pdf == b"%PDF:" + css(chosen).encode("utf-8")
+    margin = page.log[-1][1]
+    assert page.log[-1][0] == "pdf" and set(margin) == {"top", "right", "bottom", "left"}
+
+    # a style that already fits comes back untouched after one probe.
+    page = _FitPage({css(prefs): 100})
+    _, chosen, pages = _fit_pdf_on_page(page, "classic", html, prefs, 1)
+    assert chosen == prefs and pages == 1
+    assert [entry[0] for entry in page.log].count("probe") == 2
+
+
+def test_fitted_pdf_really_has_the_reported_page_count(chromium):
+    # the pages returned here go out as X-Fit-Pages; the printed PDF has to agree with them,
+    # whether the chosen preset fits or even the densest one runs over.
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    long_resume = copy.deepcopy(resume_data)
+    long_resume["experience"] = long_resume["experience"] * 3
+    prefs = {"fontPairing": "serif_classic"}
+
+    for template, data, max_pages in (
+        ("classic", resume_data, 2),
+        ("classic", resume_data, 1),
+        ("classic", long_resume, 1),
+        ("sidebar", resume_data, 1),
+    ):
+        pdf, chosen, pages = generate_pdf_auto_fit_sync(template, data, prefs, max_pages)
+        printed = sum(1 for _ in PDFPage.get_pages(io.BytesIO(pdf)))
+        assert printed == pages, (template, max_pages, chosen)
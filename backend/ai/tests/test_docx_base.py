@@ -0,0 +1,52 @@
+import io
+import zipfile
+from dataclasses import replace
+from pathlib import Path
+
+from docx import Document
+from docx.shared import Pt
+
+from backend.generator.word import docx_base
+from backend.generator.word.docx_styles import DocxStyleConfig
+
+PNG = (Path(__file__).resolve().parents[2] / "templates" / "classic" / "preview.png").read_bytes()
+
+
+def test_base_is_built_once_per_style_and_rebuilt_when_tokens_change():
+    docx_base.clear_base_package_cache()
+    calls = []
+
+    def setup(doc, style, rows):
+        calls.append(rows)
+        docx_base.setup_page_margins(doc, style)
+        doc.add_table(rows=rows, cols=2)
+
+    style = DocxStyleConfig()
+    first = docx_base.base_document("test", style, setup, 2)
+    first.tables[0].rows[0].cells[0].text = "filled in"
+    second = docx_base.base_document("test", replace(style), setup, 2)
+    assert calls == [2]
+    # every export gets its own copy of the base.
+    assert second.tables[0].rows[0].cells[0].text == ""
+    assert second.sections[0].top_margin == first.sections[0].top_margin
+
+    docx_base.base_document("test", style, setup, 3)
+    edited = docx_base.base_document("test", replace(style, margin_top_in=0.9), setup, 2)
+    assert calls == [2, 3, 2]
+    assert round(edited.sections[0].top_margin.inches, 2) == 0.9
+
+
+def test_save_stores_media_and_round_trips():
+    doc = Document()
+    doc.add_paragraph("Tony Stark").runs[0].font.size = Pt(20)
+    doc.add_paragraph().add_run().add_picture(io.BytesIO(PNG))
+
+    data = docx_base.save_docx_bytes(doc)
+    with zipfile.ZipFile(io.BytesIO(data)) as package:
+        types = {info.filename: info.compress_type for info in package.infolist()}
+    assert types["word/media/image1.png"] == zipfile.ZIP_STORED
+    assert types["word/document.xml"] == zipfile.ZIP_DEFLATED
+
+    reopened = Document(io.BytesIO(data))
+    assert reopened.paragraphs[0].text == "Tony Stark"
+    assert reopened.inline_shapes[0].type is not None
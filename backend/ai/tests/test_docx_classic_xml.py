@@ -0,0 +1,66 @@
+import copy
+import io
+import json
+from pathlib import Path
+
+import pytest
+from docx import Document
+from docx.oxml.ns import qn
+from lxml import etree
+
+from backend.generator.pipeline import generate_docx
+from backend.generator.word import docx_builder
+
+FIXTURE = Path(__file__).resolve().parents[2] / "templates" / "preview_fixture.json"
+
+
+def _body(data):
+    # Body paragraphs as canonical XML; pPr / rPr children sorted, since the python-docx
+    # helpers append color, spacing and the title border after the schema-ordered children.
+    body = copy.deepcopy(Document(io.BytesIO(data)).element.body)
+    for props in body.iter(qn("w:pPr"), qn("w:rPr")):
+        props[:] = sorted(props, key=lambda el: el.tag)
+    return [etree.tostring(el, method="c14n") for el in body]
+
+
+def _variants():
+    base = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    yield "fixture", base
+
+    rich = copy.deepcopy(base)
+    rich["header"]["tagline"] = "**Builder** of _suits_ & <things> — est. 2008"
+    rich["education"][0]["gpa"] = "3.9"
+    rich["education"][0]["subsections"] = {"Honors": "Summa cum laude", "": "Robotics club", "Empty": " "}
+    rich["skills"].append({"name": "Welding"})
+    rich["skills"].append("Soldering")
+    rich["projects"][0]["url"] = "https://example.com/mark-i"
+    rich["experience"][0]["description"] = "Led the lab.\nKept notes.\n• Built arc reactor\n•   Tab\there"
+    rich["sectionOrder"] = ["skills", "projects", "header", "summary", "experience", "education"]
+    yield "rich", rich
+
+    sparse = copy.deepcopy(base)
+    sparse["summary"] = {"summary": "  "}
+    sparse["projects"] = []
+    sparse["header"]["visibility"] = {"showTagline": False, "showPhone": False}
+    yield "sparse", sparse
+
+
+@pytest.mark.parametrize("template", ["classic", "ats-compact", "executive-summary", "modern-rule"])
+def test_direct_writer_matches_python_docx(template, monkeypatch):
+    style = docx_builder.get_styles(template)
+    for label, resume_data in _variants():
+        direct = docx_builder.build_classic_docx_xml(resume_data, style)
+        monkeypatch.setenv("DOCX_CLASSIC_ENGINE", "python-docx")
+        reference = generate_docx(template, resume_data)
+        monkeypatch.delenv("DOCX_CLASSIC_ENGINE")
+        assert _body(direct) == _body(reference), (template, label)
+
+
+def test_invalid_text_fails_in_both_engines():
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    resume_data["summary"] = {"summary": "bad \x01 byte"}
+    with pytest.raises(ValueError):
+        docx_builder.build_classic_docx_xml(resume_data, docx_builder.get_styles("classic"))
+    # the builder then retries with python-docx, which rejects the same text.
+    with pytest.raises(ValueError):
+        generate_docx("classic", resume_data)
@@ -0,0 +1,90 @@
+import asyncio
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import worker_pool  # noqa: E402  (the export service imports the app-style `worker_pool` module)
+from backend.generator.export_service import DocxBusyError, DocxExportService, DocxTimeoutError  # noqa: E402
+from backend.generator.pipeline import generate_docx  # noqa: E402
+
+FIXTURE = Path(__file__).resolve().parents[2] / "templates" / "preview_fixture.json"
+
+
+@pytest.fixture(scope="module")
+def pool():
+    service = DocxExportService(workers=2, queueSize=2, timeoutSeconds=30)
+    service.start()
+    yield service
+    service.stop()
+
+
+def _text(data):
+    return [p.text for p in Document(io.BytesIO(data)).paragraphs]
+
+
+def test_pool_builds_match_inline_builds(pool):
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+
+    async def exports():
+        return await asyncio.gather(*(pool.build(t, resume_data, {}) for t in ("classic", "sidebar", "timeline-split")))
+
+    built = asyncio.run(exports())
+    for template, data in zip(("classic", "sidebar", "timeline-split"), built):
+        assert _text(data) == _text(generate_docx(template, resume_data, {}))
+    assert pool.inFlight == 0
+
+
+def test_slow_build_times_out_and_the_pool_keeps_working(pool):
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    pool.timeoutSeconds = 0.001
+    try:
+        with pytest.raises(DocxTimeoutError):
+            asyncio.run(pool.build("timeline-split", resume_data))
+    finally:
+        pool.timeoutSeconds = 30
+
+    assert asyncio.run(pool.build("classic", resume_data))
+    assert pool.inFlight == 0
+
+
+def test_a_backlog_longer_than_the_hard_timeout_does_not_restart_the_pool(monkeypatch):
+    # six 0.3 s builds on one worker: the last finishes ~1.8 s after submit, well past the
+    # 1.1 s hard timeout, but none of them runs longer than the soft timeout once picked up.
+    monkeypatch.setattr(worker_pool, "hardTimeoutGraceSeconds", 0.1)
+    service = DocxExportService(workers=1, queueSize=8, timeoutSeconds=1.0)
+    service.start()
+    try:
+        executor = service.executor
+
+        async def backlog():
+            return await asyncio.gather(*(service.run("sleep", time.sleep, 0.3) for _ in range(6)))
+
+        assert asyncio.run(backlog()) == [None] * 6
+        assert service.executor is executor
+    finally:
+        service.stop()
+
+
+def test_full_queue_is_refused():
+    service = DocxExportService(workers=0, queueSize=0, timeoutSeconds=30)
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+
+    async def two_exports():
+        return await asyncio.gather(
+            service.build("classic", resume_data),
+            service.build("classic", resume_data),
+            return_exceptions=True,
+        )
+
+    first, second = asyncio.run(two_exports())
+    assert isinstance(first, bytes)
+    assert isinstance(second, DocxBusyError)
@@ -0,0 +1,76 @@
+import io
+
+from docx import Document
+from docx.oxml import parse_xml
+
+from backend.resume_parser.Aextractor import docx_extractor
+
+NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape" '
+    'xmlns:v="urn:schemas-microsoft-com:vml"'
+)
+
+
+def _text_box_paragraph(lines):
+    # a floating text box as Word writes it: the DrawingML shape plus a VML fallback copy.
+    content = "".join(f"<w:p><w:r><w:t>{line}</w:t></w:r></w:p>" for line in lines)
+    return parse_xml(
+        f"<w:p {NAMESPACES}>"
+        '<w:pPr><w:tabs><w:tab w:val="right" w:pos="9000"/></w:tabs></w:pPr>'
+        "<w:r><mc:AlternateContent>"
+        f'<mc:Choice Requires="wps"><w:drawing><wps:txbx><w:txbxContent>{content}</w:txbxContent></wps:txbx></w:drawing></mc:Choice>'
+        f"<mc:Fallback><w:pict><v:textbox><w:txbxContent>{content}</w:txbxContent></v:textbox></w:pict></mc:Fallback>"
+        "</mc:AlternateContent></w:r><w:r><w:t>Anchor</w:t></w:r></w:p>"
+    )
+
+
+def _templated_resume():
+    doc = Document()
+    doc.sections[0].header.paragraphs[0].text = "Jane Doe | jane@example.com"
+    doc.add_paragraph("EXPERIENCE")
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "Acme Corp"
+    table.cell(0, 1).text = "May 2021 - Present"
+    table.cell(1, 0).text = "SKILLS"
+    table.cell(1, 0).add_paragraph("Python")
+    table.cell(1, 1).text = "Built things"
+    table.cell(1, 1).add_paragraph("Shipped stuff")
+    run = doc.add_paragraph().add_run("Engineer")
+    run.add_tab()
+    run.add_text("2020")
+    doc.element.body.insert(len(doc.element.body) - 1, _text_box_paragraph(["PROJECTS", "Resume parser"]))
+    out = io.BytesIO()
+    doc.save(out)
+    return out.getvalue()
+
+
+def test_reads_headers_tables_and_text_boxes_in_order():
+    text = docx_extractor.extract_docx(_templated_resume())
+
+    assert text.splitlines() == [
+        "Jane Doe | jane@example.com",
+        "EXPERIENCE",
+        "Acme Corp May 2021 - Present",
+        "SKILLS",
+        "Python",
+        "Built things",
+        "Shipped stuff",
+        "Engineer\t2020",
+        "PROJECTS",
+        "Resume parser",
+        "Anchor",
+    ]
+
+
+def test_plain_paragraphs_match_the_python_docx_object_model():
+    doc = Document()
+    for line in ["Jane Doe", "", "Summary", "Line with\ta tab"]:
+        doc.add_paragraph(line)
+    doc.paragraphs[0].runs[0].add_break()
+    out = io.BytesIO()
+    doc.save(out)
+
+    data = out.getvalue()
+    assert docx_extractor.extract_docx(data) == docx_extractor.extract_docx_object_model(data)
@@ -0,0 +1,86 @@
+import copy
+import io
+import json
+from pathlib import Path
+
+import pytest
+from docx import Document
+from docx.shared import Inches, Pt
+
+from backend.generator.pipeline import generate_docx
+from backend.generator.word import docx_page_fit
+from backend.generator.word.docx_text_metrics import line_height_pt, text_width_pt, wrapped_line_count
+
+FIXTURE = Path(__file__).resolve().parents[2] / "templates" / "preview_fixture.json"
+
+
+def test_wrapping_follows_glyph_widths_not_character_counts():
+    # same character count, very different widths: capitals wrap where lowercase doesn't.
+    lower = "illicit little lilies fill the hill " * 3
+    upper = lower.upper().replace("I", "W").replace("L", "M")
+    assert len(lower) == len(upper)
+    assert wrapped_line_count(lower, 400, "Georgia", 10) == 1
+    assert wrapped_line_count(upper, 400, "Georgia", 10) > 1
+
+    assert text_width_pt("Engineer", "Georgia", 10, bold=True) > text_width_pt("Engineer", "Georgia", 10)
+    assert text_width_pt("Engineer", "Calibri", 10) < text_width_pt("Engineer", "Georgia", 10)
+    assert text_width_pt("Engineer", "Georgia", 20) == pytest.approx(2 * text_width_pt("Engineer", "Georgia", 10))
+
+
+def test_line_breaks_and_overlong_words():
+    assert wrapped_line_count("one\ntwo\n\nfour", 300, "Calibri", 11) == 4
+    url = "https://example.com/" + "a" * 200
+    width = text_width_pt(url, "Calibri", 11)
+    assert wrapped_line_count(url, 100, "Calibri", 11) == pytest.approx(width / 100, abs=1.5)
+
+
+def test_paragraph_and_merged_table_heights():
+    doc = Document()
+    p = doc.add_paragraph()
+    p.add_run("Short line").font.size = Pt(10)
+    p.runs[0].font.name = "Georgia"
+    p.paragraph_format.space_before = Pt(2)
+    p.paragraph_format.space_after = Pt(3)
+    p.paragraph_format.line_spacing = 1.0
+    assert docx_page_fit.paragraph_height_pt(p, 400, "Georgia") == pytest.approx(2 + line_height_pt("Georgia", 10) + 3)
+
+    # a rail merged down two rows counts once, against both rows together.
+    table = doc.add_table(rows=2, cols=2)
+    rail = table.rows[0].cells[0].merge(table.rows[1].cells[0])
+    for _ in range(9):
+        rail.add_paragraph("rail line")
+    table.rows[0].cells[1].add_paragraph("main")
+    rowPt = docx_page_fit.paragraph_height_pt(table.rows[0].cells[1].paragraphs[0], 200, "Calibri")
+    railPt = sum(docx_page_fit.paragraph_height_pt(q, 200, "Calibri") for q in rail.paragraphs)
+    assert docx_page_fit.table_height_pt(table._tbl, "Calibri") == pytest.approx(railPt)
+    assert railPt > 4 * rowPt
+
+
+def test_fit_checks_use_the_section_body():
+    doc = Document()
+    sect = doc.sections[0]
+    sect.top_margin = sect.bottom_margin = Inches(1)
+    body = docx_page_fit.body_height_pt(sect)
+    assert body == pytest.approx(11 * 72 - 144)
+    assert docx_page_fit.fits_pages(body * 0.9, sect, 1)
+    assert not docx_page_fit.fits_pages(body * 1.1, sect, 1)
+    assert docx_page_fit.fits_pages(body * 1.1, sect, 2)
+    assert docx_page_fit.estimated_pages(body * 2.5, sect) == 3
+
+
+def _sidebar_row_height(resume_data):
+    doc = Document(io.BytesIO(generate_docx("sidebar", resume_data)))
+    return doc.tables[0].rows[0]._tr.xpath("./w:trPr/w:trHeight/@w:val")
+
+
+def test_sidebar_fills_the_page_only_when_measured_content_fits():
+    # the sidebar template pins docxMaxPages to 1 (always fill); allowing two pages lets the
+    # measurement decide.
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    resume_data["docxMaxPages"] = 2
+    assert _sidebar_row_height(resume_data)
+
+    # three times the experience can't fit one page: the row is left to grow and split.
+    long_resume = copy.deepcopy(resume_data)
+    long_resume["experience"] = long_resume["experience"] * 3
+    assert _sidebar_row_height(long_resume) == []
@@ -0,0 +1,120 @@
+import asyncio
+import importlib.util
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import models  # noqa: E402  (routers/email_outbox.py imports the app-style `models` package)
+
+
+def _load_module(relative_path: str, name: str):
+    module_path = BACKEND_DIR / relative_path
+    spec = importlib.util.spec_from_file_location(name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+email_outbox = _load_module("routers/email_outbox.py", "email_outbox")
+
+
+def _session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    models.Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def _queue(factory, count=1):
+    db = factory()
+    for i in range(count):
+        email_outbox.enqueue_email(db, f"user{i}@example.com", "Hi", "<p>hi</p>")
+    db.commit()
+    db.close()
+
+
+def _rows(factory):
+    db = factory()
+    rows = db.query(models.EmailOutbox).order_by(models.EmailOutbox.id).all()
+    db.close()
+    return rows
+
+
+def test_queued_emails_are_delivered_once():
+    factory = _session_factory()
+    provider = email_outbox.FakeEmailProvider()
+    _queue(factory, 3)
+
+    assert asyncio.run(email_outbox.deliver_due_emails(factory, provider)) == 3
+    assert asyncio.run(email_outbox.deliver_due_emails(factory, provider)) == 0
+    assert [to for to, _, _ in provider.sent] == ["user0@example.com", "user1@example.com", "user2@example.com"]
+    assert {row.status for row in _rows(factory)} == {"sent"}
+
+
+def test_retryable_failures_back_off_and_permanent_failures_stop():
+    factory = _session_factory()
+    provider = email_outbox.FakeEmailProvider()
+    _queue(factory, 2)
+    provider.failures = [
+        email_outbox.EmailDeliveryError("status=503"),
+        email_outbox.EmailDeliveryError("status=422", retryable=False),
+    ]
+
+    assert asyncio.run(email_outbox.deliver_due_emails(factory, provider)) == 0
+    retried, rejected = _rows(factory)
+    assert (retried.status, retried.attempts) == ("pending", 1)
+    assert retried.next_attempt_at > datetime.utcnow() + timedelta(seconds=20)
+    assert (rejected.status, rejected.last_error) == ("failed", "status=422")
+
+    # not due yet -> untouched; once the backoff has passed it goes out.
+    assert asyncio.run(email_outbox.deliver_due_emails(factory, provider)) == 0
+    later = datetime.utcnow() + timedelta(minutes=5)
+    assert asyncio.run(email_outbox.deliver_due_emails(factory, provider, now=later)) == 1
+    assert _rows(factory)[0].status == "sent"
+
+
+def test_gives_up_after_max_attempts():
+    factory = _session_factory()
+    provider = email_outbox.FakeEmailProvider()
+    _queue(factory)
+    provider.failures = [email_outbox.EmailDeliveryError("timeout") for _ in range(email_outbox.outboxMaxAttempts)]
+
+    now = datetime.utcnow()
+    for _ in range(email_outbox.outboxMaxAttempts):
+        asyncio.run(email_outbox.deliver_due_emails(factory, provider, now=now))
+        now += timedelta(seconds=email_outbox.outboxBackoffMaxSeconds + 1)
+
+    row = _rows(factory)[0]
+    assert (row.status, row.attempts) == ("failed", email_outbox.outboxMaxAttempts)
+    assert provider.sent == []
+
+
+def test_finished_rows_drop_the_token_body_and_are_purged_later():
+    factory = _session_factory()
+    provider = email_outbox.FakeEmailProvider()
+    db = factory()
+    email_outbox.enqueue_email(db, "bob@example.com", "Reset", '<a href="https://app/reset?token=reset-token">reset</a>')
+    email_outbox.enqueue_email(db, "ada@example.com", "Verify", '<a href="https://app/verify?token=verify-token">verify</a>')
+    db.commit()
+    db.close()
+    provider.failures = [email_outbox.EmailDeliveryError("status=422", retryable=False)]
+
+    assert asyncio.run(email_outbox.deliver_due_emails(factory, provider)) == 1
+    failed, sent = _rows(factory)
+    assert (failed.status, sent.status) == ("failed", "sent")
+    assert "verify-token" in provider.sent[0][2]
+    assert failed.html is None and sent.html is None
+
+    # kept for debugging inside the retention window, deleted after it.
+    asyncio.run(email_outbox.deliver_due_emails(factory, provider, now=datetime.utcnow() + timedelta(hours=1)))
+    assert len(_rows(factory)) == 2
+    later = datetime.utcnow() + timedelta(seconds=email_outbox.outboxRetentionSeconds + 3600)
+    asyncio.run(email_outbox.deliver_due_emails(factory, provider, now=later))
+    assert _rows(factory) == []
@@ -8,7 +8,7 @@ if "openai" not in sys.modules:
     sys.modules["openai"] = openai_stub
 
 
-from backend.ai.extraction.extractor import extract_keywords
+from backend.ai.extraction.extractor import canonicalize_token, extract_keywords
 from backend.ai.processing.tailor_context import build_tailor_context
 
 
@@ -187,3 +187,35 @@ def test_claim_sensitive_requirements_flow_into_tailor_context_as_warnings_not_k
     assert context["claimSensitiveRequirements"] == claim_sensitive
     assert [item["term"] for item in context["unsupportedClaimSensitiveRequirements"]] == ["fine dining experience"]
     assert "fine dining experience" not in [item["term"] for item in context["keywords"]]
+
+
+DATA_PIPELINE_JD = """
+Responsibilities:
+Build streaming pipelines on Kafka and batch jobs in PySpark.
+Load curated tables into Redshift for analytics and reporting.
+"""
+
+
+PCB_LAYOUT_JD = """
+Responsibilities:
+Lay out multilayer boards in Altium and review schematics.
+Tools: Altium, KiCad, OrCAD
+"""
+
+
+def _scores(jd, role):
+    return {entry["term"]: (entry["score"], entry["sources"]) for entry in extract_keywords(jd, role, 30)["rawKeywords"]}
+
+
+def test_skill_dictionary_keeps_the_tailors_keys_and_boosts():
+    # skills.tsv names these the way lexicon boostWords, rules.concreteStackTerms and
+    # TOOL_PLATFORM_TERMS do; a different key ("apache kafka") silently drops the boosts.
+    for term in ("kafka", "redshift", "altium", "pyspark", "node.js"):
+        assert canonicalize_token(term) == term
+    assert canonicalize_token("Apache Kafka") == "kafka"
+    assert canonicalize_token("nodejs") == "node.js"
+
+    data = _scores(DATA_PIPELINE_JD, "Data Engineer")
+    assert data["kafka"] == (5.3, ["bodyToken"])
+    assert data["pyspark"] == (0.3, ["bodyToken"])
+    assert _scores(PCB_LAYOUT_JD, "PCB Design Engineer")["altium"] == (8.1, ["bodyToken", "concreteStack"])
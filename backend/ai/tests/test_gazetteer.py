@@ -0,0 +1,80 @@
+from backend.resume_parser import gazetteer
+from backend.resume_parser.gazetteer.phrase_index import PhraseIndex, format_bank, phrase_tokens
+
+
+def test_lookups_are_normalized_and_follow_aliases():
+    assert gazetteer.schools.get("University of South Florida") == "University of South Florida"
+    assert gazetteer.schools.get("  university of SOUTH florida ") == "University of South Florida"
+    assert gazetteer.schools.get("USF") == "University of South Florida"
+    assert gazetteer.degrees.get("B.S.") == "Bachelor of Science"
+    assert gazetteer.regions.get("Florida") == "FL"
+    assert "Computer Science" in gazetteer.majors
+    assert gazetteer.schools.get("University of Nowhere") is None
+
+
+def test_longest_match_wins_and_run_together_schools_split():
+    text = "University of South Florida Florida State University"
+    matches = gazetteer.find_schools(text)
+    assert [text[start:end] for start, end, _ in matches] == ["University of South Florida", "Florida State University"]
+
+    degree = gazetteer.find_degree("BBA, Bachelor of Business Administration - Finance")
+    assert degree[2] == "Bachelor of Business Administration"
+
+
+def test_known_city_checks_region_codes_and_names():
+    assert gazetteer.is_known_city("Winter Park", "FL")
+    assert gazetteer.is_known_city("Winter Park", "Florida")
+    assert gazetteer.is_known_city("Toronto", "Ontario")
+    assert not gazetteer.is_known_city("Winter Park", "TX")
+    assert gazetteer.known_city_word_count(["Rollins", "College", "Winter", "Park"], "FL") == 2
+    assert gazetteer.known_city_word_count(["Montevallo", "-", "Montevallo"], "AL") == 1
+
+
+def test_phrase_index_on_a_small_file(tmp_path):
+    path = tmp_path / "bank.tsv"
+    path.write_text("\n".join(format_bank(["New York", "New York City", "york\tYork, UK"])) + "\n", encoding="utf-8")
+    index = PhraseIndex(path)
+    assert index.get("new york city") == "New York City"
+    assert index.find_all("Moved from New York City to York.") == [(11, 24, "New York City"), (28, 32, "York, UK")]
+
+    empty = tmp_path / "empty.tsv"
+    empty.write_text("", encoding="utf-8")
+    assert PhraseIndex(empty).get("anything") is None
+
+
+def test_data_files_are_sorted_and_normalized():
+    # run `python -m resume_parser.gazetteer` (from backend/) after editing a data file.
+    for path in sorted(gazetteer.dataDir.glob("*.tsv")):
+        lines = path.read_text(encoding="utf-8").splitlines()
+        tokenizer = gazetteer.bankTokenizers.get(path.name, phrase_tokens)
+        assert lines and format_bank(lines, tokenizer) == lines, path.name
+
+
+def test_skill_dictionary_keeps_symbols_and_shares_canonical_names():
+    from backend.ai.extraction.extractor import canonicalize_phrase_key, canonicalize_token
+    from backend.ai.processing.alias_map import canonicalize_term
+    from backend.resume_parser.Dnlp.skill_matcher import extract_skills_nlp
+
+    assert gazetteer.canonical_skill("c++") == ("C++", "languages")
+    assert gazetteer.canonical_skill("C#") == ("C#", "languages")
+    assert gazetteer.canonical_skill("NodeJS") == ("Node.js", "frameworks")
+    assert gazetteer.canonical_skill("C") == ("C", "languages")
+
+    found = extract_skills_nlp("Shipped a React/Node.js app on AWS (EC2, S3) backed by Postgres; some C# too.")
+    assert found["frameworks"] == ["React", "Node.js"]
+    assert found["cloud"] == ["Amazon Web Services", "Amazon EC2", "Amazon S3"]
+    assert found["databases"] == ["PostgreSQL"]
+    assert found["languages"] == ["C#"]
+
+    # skills that are also ordinary words only count capitalized, and not opening a sentence.
+    prose = "I excel at go-to-market plans. Swift delivery matters. Assembly line work, in c or rust."
+    assert extract_skills_nlp(prose) == {category: [] for category in gazetteer.skillCategories}
+    found = extract_skills_nlp("Wrote services in Go and Swift, reports in Excel, games in Unreal.")
+    assert found["languages"] == ["Go", "Swift"] and found["tools"] == ["Excel"]
+    assert found["frameworks"] == ["Unreal Engine"]
+
+    # the tailor ranks by the lowercase of the name the parser saves.
+    for alias in ("AWS", "k8s", "reactjs", "react-native", "Postgres"):
+        key = gazetteer.skill_key(alias)
+        assert canonicalize_token(alias) == canonicalize_phrase_key(alias) == canonicalize_term(alias.lower()) == key
+    assert gazetteer.skill_key("k8s") == "kubernetes"
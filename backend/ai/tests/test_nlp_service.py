@@ -0,0 +1,69 @@
+import gc
+
+import pytest
+
+spacy = pytest.importorskip("spacy")
+
+from backend.resume_parser.Dnlp import nlp_utils  # noqa: E402
+from backend.resume_parser.Dnlp.nlp_service import NlpService  # noqa: E402
+
+
+@pytest.fixture
+def tiny_model(tmp_path):
+    # a saved pipeline that loads like en_core_web_sm would, without the download.
+    nlp = spacy.blank("en")
+    nlp.add_pipe("entity_ruler").add_patterns([
+        {"label": "ORG", "pattern": "Google"},
+        {"label": "GPE", "pattern": "Orlando"},
+    ])
+    nlp.add_pipe("sentencizer", name="senter")
+    path = tmp_path / "tiny_model"
+    nlp.to_disk(path)
+    yield str(path)
+    # free the loaded pipelines now: on CPython 3.11.7 a gc pass that lands inside a later
+    # ast.parse (pytest's assertion rewriting) fails with "AST constructor recursion depth mismatch".
+    gc.collect()
+
+
+def test_load_excludes_unused_components_and_reports_load_time(tiny_model):
+    service = NlpService(model=tiny_model)
+
+    assert service.load() is service.load()
+    stats = service.stats()
+    assert stats["components"] == ["entity_ruler"]
+    assert stats["loadMs"] is not None
+
+
+def test_docs_batches_misses_into_one_call_and_caches_by_text(tiny_model):
+    service = NlpService(model=tiny_model)
+    texts = ["Intern at Google", "Orlando office", "Intern at Google"]
+
+    docs = service.docs(texts)
+    assert docs[0] is docs[2]
+    assert [ent.text for ent in docs[1].ents] == ["Orlando"]
+    assert (service.calls, service.stats()["textsParsed"]) == (1, 2)
+
+    assert service.doc("Orlando office") is docs[1]
+    assert service.calls == 1
+    assert service.cacheHits == 1
+
+
+def test_entity_helpers_share_the_service_cache(tiny_model, monkeypatch):
+    service = NlpService(model=tiny_model)
+    monkeypatch.setattr(nlp_utils, "nlp_service", service)
+
+    batch = nlp_utils.extract_entities_batch(["Engineer at Google", "Moved to Orlando"])
+    assert batch[0]["ORG"] == ["Google"]
+    assert batch[1]["GPE"] == ["Orlando"]
+    assert nlp_utils.extract_entities("Engineer at Google")["ORG"] == ["Google"]
+    assert service.calls == 1
+
+
+def test_missing_model_degrades_to_empty_results(monkeypatch):
+    service = NlpService(model="no_such_model_installed")
+    monkeypatch.setattr(nlp_utils, "nlp_service", service)
+
+    assert service.load() is None
+    assert service.docs(["a", "b"]) == [None, None]
+    assert nlp_utils.extract_entities("Engineer at Google") == {"ORG": [], "DATE": [], "GPE": [], "PERSON": []}
+    assert nlp_utils.detect_job_titles("Software Engineer at Google") == ["Software Engineer"]
@@ -0,0 +1,40 @@
+from backend.resume_parser import benchmark
+
+
+def test_score_counts_matches_per_field_regardless_of_record_order():
+    golden = {
+        "contact_info": {"email": "a@b.com", "phone": None},
+        "education": [
+            {"school": "University of South Florida", "degree": "Master of Business", "current": False},
+            {"school": "Florida State University", "degree": "Bachelor of Science"},
+        ],
+        "skills": [{"name": "SQL"}, {"name": "Python"}],
+    }
+    predicted = {
+        "contact_info": {"email": "A@B.com "},
+        "education": [
+            {"school": "Florida State University", "degree": "Bachelor of Science"},
+            {"school": "University of South Florida Florida State University", "degree": None},
+        ],
+        "skills": [{"name": "python"}, {"name": "Excel"}],
+    }
+
+    counts = benchmark.score(predicted, golden)
+
+    assert counts["contact_info.email"] == [1, 1, 1]
+    assert counts["education.school"] == [1, 2, 2]
+    assert counts["education.degree"] == [1, 1, 2]
+    assert counts["skills"] == [1, 2, 2]
+    assert "education.current" not in counts
+
+
+def test_sample_resumes_parse_like_the_golden_files():
+    # after an intended parser change: `python -m resume_parser.benchmark --update-golden`
+    # from backend/, then review the golden diff.
+    paths = sorted(benchmark.samplesDir.glob("*.pdf"))
+    run = benchmark.run_benchmark(paths, workers=0, repeat=1, measureMemory=False)
+
+    assert len(run["samples"]) == len(paths) == 18
+    assert benchmark.mismatched_samples(run) == []
+    assert set(run["stageTotalsMs"]) == set(benchmark.stages)
+    assert all(set(sample["timingsMs"]) == set(benchmark.stages) for sample in run["samples"])
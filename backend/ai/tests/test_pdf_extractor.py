@@ -0,0 +1,62 @@
+import importlib.util
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def _load_module(relative_path: str, name: str):
+    module_path = BACKEND_DIR / relative_path
+    spec = importlib.util.spec_from_file_location(name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+pdf_extractor = _load_module("resume_parser/Aextractor/pdf_extractor.py", "pdf_extractor")
+
+
+def _chars(text, x, top, size=10, width=5):
+    # one (x0, x1, top, bottom, size, text) tuple per character, laid out left to right.
+    return [(x + i * width, x + (i + 1) * width, top, top + size, size, ch) for i, ch in enumerate(text)]
+
+
+def _lines(chars, pageWidth=612):
+    rowSegments = [pdf_extractor.row_segments(row) for row in pdf_extractor.group_rows(chars)]
+    return pdf_extractor.page_lines(rowSegments, pdf_extractor.find_gutter(rowSegments, pageWidth))
+
+
+def test_rows_split_into_words_on_spaces_and_gaps():
+    chars = _chars("Jane Doe", 50, 40) + _chars("Engineer", 50 + 8 * 5 + 4, 41)
+    assert _lines(chars) == ["Jane Doe Engineer"]
+
+
+def test_sidebar_layout_reads_left_column_then_right_column():
+    chars = _chars("JANE DOE - jane@example.com - 555 123 4567", 40, 20)
+    sidebar = ["SKILLS", "Python", "SQL", "Excel", "LANGUAGES", "Spanish", "French", "Italian"]
+    main = ["EXPERIENCE", "Acme Corp", "Built things", "Shipped stuff", "EDUCATION", "State University", "BS Math", "2020"]
+    for index, (left, right) in enumerate(zip(sidebar, main)):
+        chars += _chars(left, 40, 60 + index * 14)
+        chars += _chars(right, 300, 60 + index * 14)
+
+    assert _lines(chars) == ["JANE DOE - jane@example.com - 555 123 4567"] + sidebar + main
+
+
+def test_single_column_with_right_aligned_dates_keeps_rows_together():
+    chars = []
+    for index in range(12):
+        chars += _chars(f"Bullet point number {index} that runs across the page width", 40, 40 + index * 14)
+        # a date on each job's header row, the way most single-column resumes lay them out.
+        if index % 6 == 0:
+            chars += _chars("May 2020", 520, 40 + index * 14)
+
+    lines = _lines(chars)
+    assert len(lines) == 12
+    assert lines[0].endswith("May 2020") and lines[6].endswith("May 2020")
+
+
+def test_sample_resumes_extract_in_reading_order():
+    text = pdf_extractor.extract_pdf((BACKEND_DIR / "resume_parser" / "tests" / "taylor.pdf").read_bytes())
+    lines = text.splitlines()
+    # the name is drawn last in this file's content stream but sits at the top of the page.
+    assert lines[0] == "Taylor Kirby"
+    assert lines.index("EDUCATION") > lines.index("KEY COMPETENCIES")
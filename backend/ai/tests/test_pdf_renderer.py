@@ -0,0 +1,171 @@
+import asyncio
+import io
+import json
+import time
+from pathlib import Path
+
+import playwright.sync_api as playwright_sync_api
+import pytest
+from pdfminer.high_level import extract_text
+from pdfminer.pdfpage import PDFPage
+
+from backend.generator.pipeline import generate_resume
+from backend.generator import pdf_renderer, pipeline
+
+FIXTURE = Path(__file__).resolve().parents[2] / "templates" / "preview_fixture.json"
+
+
+class _Page:
+    def __init__(self, log, fail_next):
+        self.log = log
+        self.fail_next = fail_next
+
+    def set_default_timeout(self, ms):
+        pass
+
+    def route(self, pattern, handler):
+        self.log.append(("route", pattern.pattern))
+
+    def set_content(self, html, wait_until):
+        self.log.append(("load", wait_until))
+
+    def evaluate(self, script, arg=None):
+        if self.fail_next:
+            self.fail_next.pop()
+            raise RuntimeError("Target crashed")
+        self.log.append(("swap", arg["title"] if arg else None))
+
+    def pdf(self, **kwargs):
+        return b"%PDF"
+
+    def close(self):
+        self.log.append(("close", None))
+
+
+class _Playwright:
+    def __init__(self, fail_next=()):
+        self.log = []
+        self.fail_next = list(fail_next)
+        self.chromium = self
+
+    def launch(self):
+        return self
+
+    def is_connected(self):
+        return True
+
+    def new_page(self):
+        return _Page(self.log, self.fail_next)
+
+
+def test_split_document_keeps_one_shell_per_template():
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    html = generate_resume("classic", resume_data, {})
+    shell, title, tokens, body = pdf_renderer.split_document(html)
+    assert title == "Tony Stark - Resume"
+    assert tokens.lstrip().startswith("/*") and ":root" in tokens
+    assert "<title></title>" in shell and "<body></body>" in shell.replace("\n", "").replace(" ", "")
+    assert body in html and body not in shell
+
+    # other data / style preferences -> the same shell; other templates -> their own.
+    resume_data["header"]["first_name"] = "Howard"
+    assert pdf_renderer.split_document(generate_resume("classic", resume_data, {"typeScalePreset": "compact"}))[0] == shell
+    assert pdf_renderer.split_document(generate_resume("sidebar", resume_data, {}))[0] != shell
+    assert pdf_renderer.split_document("<p>no document</p>") is None
+
+
+def test_warm_pages_load_each_shell_once_and_retry_on_a_fresh_page():
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    playwright = _Playwright()
+    warm = pdf_renderer._WarmBrowser(playwright)
+    margin = {"top": "0.5in", "right": "0.5in", "bottom": "0.5in", "left": "0.5in"}
+
+    for template in ("classic", "classic", "sidebar", "classic"):
+        assert warm.render(generate_resume(template, resume_data, {}), margin) == b"%PDF"
+    # network requests are refused on every page.
+    assert ("route", r"^(https?|ftp)://") in playwright.log
+    playwright.log[:] = [entry for entry in playwright.log if entry[0] != "route"]
+    # two shells loaded (with "load", never networkidle); every render is a swap.
+    assert [entry for entry in playwright.log if entry[0] == "load"] == [("load", "load")] * 2
+    assert len([entry for entry in playwright.log if entry[0] == "swap"]) == 4
+
+    # a crashed page is dropped and the render retried once on a fresh one.
+    playwright.fail_next.append(True)
+    playwright.log.clear()
+    assert warm.render(generate_resume("classic", resume_data, {}), margin) == b"%PDF"
+    assert [entry[0] for entry in playwright.log] == ["close", "route", "load", "swap"]
+
+    playwright.fail_next.extend([True, True])
+    with pytest.raises(RuntimeError):
+        warm.render(generate_resume("classic", resume_data, {}), margin)
+
+
+class _SyncPlaywright:
+    def __init__(self, playwright):
+        self.playwright = playwright
+
+    def __enter__(self):
+        return self.playwright
+
+    def __exit__(self, *exc):
+        return False
+
+
+def test_renderer_queue_is_bounded_and_abandoned_jobs_are_skipped(monkeypatch):
+    renderer = pdf_renderer.WarmPdfRenderer(max_pending=2)
+    # no renderer thread yet: submitted jobs just wait in the queue.
+    monkeypatch.setattr(renderer, "_ensure_started", lambda: None)
+
+    first = renderer.submit(lambda warm: "first")
+    renderer.submit(lambda warm: "second")
+    with pytest.raises(pdf_renderer.PdfBusyError):
+        renderer.submit(lambda warm: "third")
+
+    # a caller that gives up cancels its queued job, which frees its slot.
+    monkeypatch.setattr(pdf_renderer, "RENDER_WAIT_SECONDS", 0.05)
+    first.cancel()
+    with pytest.raises(pdf_renderer.FutureTimeoutError):
+        renderer.render("<p>never printed</p>", {})
+    assert renderer.pending == 1
+
+    # the renderer thread skips the cancelled jobs and runs the rest, auto-fit pages included.
+    playwright = _Playwright()
+    monkeypatch.setattr(playwright_sync_api, "sync_playwright", lambda: _SyncPlaywright(playwright))
+    monkeypatch.setattr(pdf_renderer, "RENDER_WAIT_SECONDS", 5)
+    monkeypatch.delattr(renderer, "_ensure_started")
+    renderer.max_pending = 4
+    ran = []
+    renderer.submit(lambda warm: ran.append("late"))
+    assert renderer.render("<p>cold</p>", {}) == b"%PDF"
+    fitted = asyncio.run(renderer.run(lambda warm: warm.on_page(lambda page: page.pdf())))
+    assert fitted == b"%PDF" and ran == ["late"]
+    assert ("route", r"^(https?|ftp)://") in playwright.log
+    renderer.stop()
+    # slots are released by the futures' done callbacks, just after the results are handed over.
+    deadline = time.monotonic() + 2
+    while renderer.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert renderer.pending == 0
+
+
+def _printed(pdf):
+    # (page count, text with whitespace collapsed) of a printed PDF.
+    pages = sum(1 for _ in PDFPage.get_pages(io.BytesIO(pdf)))
+    return pages, " ".join(extract_text(io.BytesIO(pdf)).split())
+
+
+def test_warm_pages_print_what_a_launched_browser_prints(chromium, monkeypatch):
+    # the warm path stays opt-in (PDF_RENDERER=warm) until it matches the launch path in Chromium.
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    monkeypatch.setattr(pipeline, "pdf_renderer_mode", "launch")
+    renderer = pdf_renderer.WarmPdfRenderer()
+    try:
+        for template in ("classic", "sidebar", "timeline-split"):
+            # the second style swaps into the shell the first one loaded.
+            for preferences in ({}, {"typeScalePreset": "compact"}):
+                html = generate_resume(template, resume_data, preferences)
+                warm = renderer.render(html, pipeline.pdf_page_margin(template, preferences))
+                launched = pipeline.convert_html_to_pdf_sync(html, template, preferences)
+                assert _printed(warm) == _printed(launched), (template, preferences)
+    finally:
+        renderer.stop()
@@ -0,0 +1,60 @@
+import copy
+import json
+import re
+from pathlib import Path
+
+from backend.generator import preview_fragments
+from backend.generator.pipeline import generate_resume
+
+FIXTURE = Path(__file__).resolve().parents[2] / "templates" / "preview_fixture.json"
+
+
+def _splice(html, sections):
+    # what the editor does with a patch.
+    for key, fragment in sections.items():
+        html = re.sub(
+            f"<!--rt:{key}-->.*?<!--/rt:{key}-->",
+            lambda _: f"<!--rt:{key}-->{fragment}<!--/rt:{key}-->",
+            html,
+            flags=re.S,
+        )
+    return html
+
+
+def test_unchanged_sections_are_reused():
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    preview_fragments.clear_fragment_cache()
+    calls = []
+    built = preview_fragments.cached_fragment("classic", "summary", {"summary": "x"}, "Summary", lambda: calls.append(1) or "<p>x</p>")
+    again = preview_fragments.cached_fragment("classic", "summary", {"summary": "x"}, "Summary", lambda: calls.append(1) or "<p>x</p>")
+    assert built == again == "<!--rt:summary--><p>x</p><!--/rt:summary-->"
+    assert calls == [1]
+    assert preview_fragments.cached_fragment("classic", "summary", {}, "Summary", lambda: "") == ""
+
+    # one edited bullet: only that section's entries are rebuilt.
+    generate_resume("classic", resume_data, {})
+    cached = len(preview_fragments.fragmentCache)
+    resume_data["experience"][0]["description"] += " Shipped on time."
+    generate_resume("classic", resume_data, {})
+    assert len(preview_fragments.fragmentCache) == cached + 1
+
+
+def test_patch_sends_only_changed_sections_and_splices_to_the_full_render():
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    for template in ("classic", "sidebar", "timeline-split"):
+        first = preview_fragments.patch_preview(generate_resume(template, resume_data, {}), None)
+        assert first["full"]
+
+        edited = copy.deepcopy(resume_data)
+        edited["experience"][0]["title"] = "Chief Engineer"
+        html = generate_resume(template, edited, {})
+        patch = preview_fragments.patch_preview(html, first["renderId"])
+        assert not patch["full"]
+        assert list(patch["sections"]) == ["experience"]
+        assert _splice(first["html"], patch["sections"]) == html
+
+        # header edits (outside any section) or an unknown id fall back to the full document.
+        renamed = copy.deepcopy(edited)
+        renamed["header"]["first_name"] = "Howard"
+        assert preview_fragments.patch_preview(generate_resume(template, renamed, {}), patch["renderId"])["full"]
+        assert preview_fragments.patch_preview(html, "unknown")["full"]
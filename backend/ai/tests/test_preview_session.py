@@ -0,0 +1,226 @@
+import asyncio
+import copy
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from backend.generator.pipeline import generate_resume
+from backend.generator.preview_fragments import split_tokens
+from backend.generator.preview_session import PreviewPatchError, PreviewSession, apply_json_patch, run_preview_session
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import database  # noqa: E402  (the router imports the app-style `database` / `generator` modules)
+from routers import resume_generator  # noqa: E402
+from routers.security import create_access_token  # noqa: E402
+
+FIXTURE = Path(__file__).resolve().parents[2] / "templates" / "preview_fixture.json"
+
+
+def _splice(html, message):
+    # what the editor does with a "patch" message.
+    for key, fragment in message["sections"].items():
+        start = html.index(f"<!--rt:{key}-->") + len(f"<!--rt:{key}-->")
+        html = html[:start] + fragment + html[html.index(f"<!--/rt:{key}-->", start):]
+    if "css" in message:
+        start = html.index("/*rt:tokens*/") + len("/*rt:tokens*/")
+        html = html[:start] + message["css"] + html[html.index("/*/rt:tokens*/", start):]
+    return html
+
+
+def test_json_patch_ops_and_atomic_failure():
+    document = {"a": {"b": [1, 2, 3]}, "c~/d": "x"}
+    patched = apply_json_patch(document, [
+        {"op": "replace", "path": "/a/b/0", "value": 9},
+        {"op": "add", "path": "/a/b/-", "value": 4},
+        {"op": "remove", "path": "/a/b/1"},
+        {"op": "copy", "from": "/a/b", "path": "/e"},
+        {"op": "move", "from": "/c~0~1d", "path": "/f"},
+        {"op": "test", "path": "/f", "value": "x"},
+    ])
+    assert patched == {"a": {"b": [9, 3, 4]}, "e": [9, 3, 4], "f": "x"}
+
+    for ops in (
+        [{"op": "replace", "path": "/a/b/0", "value": 0}, {"op": "remove", "path": "/missing"}],
+        [{"op": "test", "path": "/c~0~1d", "value": "y"}],
+        [{"op": "add", "path": "/a/b/7", "value": 0}],
+        [{"op": "move", "from": "/a", "path": "/a/b/0"}],
+        [{"op": "frobnicate", "path": "/a"}],
+        "not a list",
+    ):
+        with pytest.raises(PreviewPatchError):
+            apply_json_patch(document, ops)
+    assert document == {"a": {"b": [1, 2, 3]}, "c~/d": "x"}
+
+
+def test_session_sends_changed_sections_and_css_only_on_style_change():
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    for template in ("classic", "sidebar"):
+        session = PreviewSession()
+        session.apply({"type": "init", "template": template, "resume_data": resume_data, "style": {}, "seq": 1})
+        first = session.render()
+        assert first["type"] == "full" and first["seq"] == 1
+
+        session.apply({"type": "patch", "seq": 2, "ops": [
+            {"op": "replace", "path": "/resume_data/experience/0/title", "value": "Chief Engineer"},
+        ]})
+        edit = session.render()
+        assert edit["type"] == "patch" and edit["seq"] == 2
+        assert list(edit["sections"]) == ["experience"] and "css" not in edit
+        edited = copy.deepcopy(resume_data)
+        edited["experience"][0]["title"] = "Chief Engineer"
+        assert _splice(first["html"], edit) == generate_resume(template, edited, {})
+
+        # a style-only change sends the new :root tokens and no sections (the presets only
+        # restyle the classic engine; sidebar's tokens don't move, so nothing is sent).
+        session.apply({"type": "patch", "seq": 3, "ops": [{"op": "add", "path": "/style/typeScalePreset", "value": "compact"}]})
+        restyled = session.render()
+        assert restyled["type"] == "patch" and restyled["sections"] == {}
+        html = generate_resume(template, edited, {"typeScalePreset": "compact"})
+        assert ("css" in restyled) == (template == "classic")
+        if template == "classic":
+            assert restyled["css"] == split_tokens(html)[1]
+        assert _splice(_splice(first["html"], edit), restyled) == html
+
+        # header edits live outside the sections: full document.
+        session.apply({"type": "patch", "ops": [{"op": "replace", "path": "/resume_data/header/first_name", "value": "Howard"}]})
+        assert session.render()["type"] == "full"
+
+    with pytest.raises(PreviewPatchError):
+        PreviewSession().apply({"type": "patch", "ops": []})
+
+
+def test_connection_coalesces_bursts_into_one_render():
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+
+    async def scenario():
+        inbox: asyncio.Queue = asyncio.Queue()
+        sent = []
+
+        async def receive():
+            message = await inbox.get()
+            if message is None:
+                raise ConnectionError("closed")
+            return message
+
+        async def send(message):
+            sent.append(message)
+
+        connection = asyncio.create_task(run_preview_session(receive, send, debounceSeconds=0.05, maxWaitSeconds=1))
+        await inbox.put({"type": "init", "template": "classic", "resume_data": resume_data, "seq": 1})
+        for seq, title in enumerate(("C", "Ch", "Chi", "Chief"), start=2):
+            await inbox.put({"type": "patch", "seq": seq, "ops": [
+                {"op": "replace", "path": "/resume_data/experience/0/title", "value": title},
+            ]})
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.2)
+        await inbox.put({"type": "patch", "seq": 6, "ops": [{"op": "remove", "path": "/nope"}]})
+        await asyncio.sleep(0.1)
+        await inbox.put(None)
+        with pytest.raises(ConnectionError):
+            await connection
+        return sent
+
+    sent = asyncio.run(scenario())
+    # init + four keystrokes inside the debounce window: one render of the final state.
+    assert [message["type"] for message in sent] == ["full", "error"]
+    assert sent[0]["seq"] == 5 and "Chief" in sent[0]["html"]
+    assert sent[1]["resync"] and sent[1]["seq"] == 5
+
+
+def test_a_frame_that_is_not_json_asks_for_a_resync_and_keeps_the_session():
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+
+    async def scenario():
+        inbox: asyncio.Queue = asyncio.Queue()
+        sent = []
+
+        async def receive():
+            message = await inbox.get()
+            if message is None:
+                raise ConnectionError("closed")
+            if isinstance(message, str):
+                return json.loads(message)
+            return message
+
+        async def send(message):
+            sent.append(message)
+
+        connection = asyncio.create_task(run_preview_session(receive, send, debounceSeconds=0.01, maxWaitSeconds=1))
+        await inbox.put("{not json")
+        await asyncio.sleep(0.05)
+        await inbox.put({"type": "init", "template": "classic", "resume_data": resume_data, "seq": 1})
+        await asyncio.sleep(0.3)
+        await inbox.put(None)
+        with pytest.raises(ConnectionError):
+            await connection
+        return sent
+
+    sent = asyncio.run(scenario())
+    assert sent[0] == {"type": "error", "seq": None, "detail": "invalid JSON", "resync": True}
+    assert sent[1]["type"] == "full" and sent[1]["seq"] == 1
+
+
+def test_an_init_during_a_render_makes_the_next_render_full(monkeypatch):
+    from backend.generator import preview_session
+
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    session = PreviewSession()
+    init = {"type": "init", "template": "classic", "resume_data": resume_data, "seq": 1}
+    session.apply(init)
+
+    # renders run in a thread: the client re-inits while one is in progress.
+    def render_while_reinit(*args):
+        session.apply({**init, "seq": 2})
+        return generate_resume(*args)
+
+    monkeypatch.setattr(preview_session, "generate_resume", render_while_reinit)
+    assert session.render()["seq"] == 1
+    assert session.sent is None
+    monkeypatch.setattr(preview_session, "generate_resume", generate_resume)
+    message = session.render()
+    assert message["type"] == "full" and message["seq"] == 2
+
+
+class _UserQuery:
+    # db.query(User).filter(...).first() -> one verified user.
+    def query(self, model):
+        return self
+
+    def filter(self, *conditions):
+        return self
+
+    def first(self):
+        return SimpleNamespace(email="tony@stark.com", email_verified=True)
+
+
+def test_socket_requires_a_signed_in_user():
+    app = FastAPI()
+    app.include_router(resume_generator.socket_router)
+    app.dependency_overrides[database.get_db] = _UserQuery
+    client = TestClient(app)
+
+    # no cookie, then a token that doesn't verify: closed with 1008 before the session starts.
+    for cookies in ({}, {"taylor_session": "not-a-token"}):
+        client.cookies.clear()
+        client.cookies.update(cookies)
+        with pytest.raises(WebSocketDisconnect) as closed:
+            with client.websocket_connect("/api/resume/generator/preview/ws") as socket:
+                socket.send_json({"type": "init", "template": "classic", "resume_data": {}})
+                socket.receive_json()
+        assert closed.value.code == 1008
+
+    # a signed-in user gets the live session.
+    client.cookies.set("taylor_session", create_access_token({"sub": "tony@stark.com"}))
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    with client.websocket_connect("/api/resume/generator/preview/ws") as socket:
+        socket.send_json({"type": "init", "template": "classic", "resume_data": resume_data, "seq": 1})
+        assert socket.receive_json()["type"] == "full"
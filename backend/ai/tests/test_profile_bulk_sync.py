@@ -0,0 +1,99 @@
+import importlib.util
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import Base, Education, Experience, Projects, Skills, User
+
+
+def _load_module(relative_path: str, name: str):
+    module_path = Path(__file__).resolve().parents[2] / relative_path
+    spec = importlib.util.spec_from_file_location(name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+profile_sync = _load_module("routers/profile_sync.py", "profile_sync")
+
+
+def _seeded_session(skill_count):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2].split()[0]))
+    db = sessionmaker(bind=engine)()
+    db.add(User(id=1, first_name="Ada", last_name="L", email="ada@example.com", password_hash="x"))
+    db.add_all([Skills(user_id=1, name=f"Skill{i}", category="Old") for i in range(skill_count)])
+    db.commit()
+    return db, statements
+
+
+def test_sync_updates_matches_inserts_new_and_deletes_dropped_rows_in_order():
+    db, _ = _seeded_session(3)
+    incoming = [
+        {"name": "NEW", "category": None},
+        {"name": "skill1", "category": "Tools"},
+    ]
+
+    saved = profile_sync.sync_user_rows(db, Skills, 1, incoming, profile_sync.skill_match_key, updateFields=["category"])
+
+    assert [(row["name"], row["category"]) for row in saved] == [("NEW", None), ("Skill1", "Tools")]
+    stored = {s.name: s.category for s in db.query(Skills).filter(Skills.user_id == 1)}
+    assert stored == {"NEW": None, "Skill1": "Tools"}
+    assert all(isinstance(row["id"], int) for row in saved)
+
+
+def test_sync_round_trips_do_not_grow_with_profile_size():
+    counts = []
+    for size in (5, 200):
+        db, statements = _seeded_session(size)
+        incoming = [{"name": f"skill{i}", "category": "New"} for i in range(0, size, 2)]
+        incoming += [{"name": f"Fresh{i}", "category": None} for i in range(size)]
+        statements.clear()
+        profile_sync.sync_user_rows(db, Skills, 1, incoming, profile_sync.skill_match_key, updateFields=["category"])
+        counts.append(len([s for s in statements if s in ("SELECT", "INSERT", "UPDATE", "DELETE")]))
+
+    assert counts[0] == counts[1]
+
+
+def test_duplicate_keys_keep_one_row_each():
+    cases = [
+        (Education, profile_sync.education_match_key, lambda n: {"school": "MIT", "degree": "BS", "discipline": "CS", "gpa": f"3.{n}"}, "gpa"),
+        (Experience, profile_sync.experience_match_key, lambda n: {"title": "Engineer", "company": "Acme", "start_date": datetime(2020, 1, 1), "description": f"d{n}"}, "description"),
+        (Projects, profile_sync.project_match_key, lambda n: {"title": "Jarvis", "description": f"d{n}"}, "description"),
+    ]
+    for model, keyOf, make, field in cases:
+        db, _ = _seeded_session(0)
+
+        first = profile_sync.sync_user_rows(db, model, 1, [make(1), make(2)], keyOf)
+        assert len({row["id"] for row in first}) == 2
+
+        # same two entries again: each keeps its own row, nothing is merged or deleted.
+        second = profile_sync.sync_user_rows(db, model, 1, [make(3), make(4)], keyOf)
+        assert [row["id"] for row in second] == [row["id"] for row in first]
+        assert sorted(getattr(r, field) for r in db.query(model)) == sorted(row[field] for row in second)
+
+        # a third duplicate is inserted; dropping back to one deletes the unmatched rows.
+        third = profile_sync.sync_user_rows(db, model, 1, [make(5), make(6), make(7)], keyOf)
+        assert len({row["id"] for row in third}) == 3 and db.query(model).count() == 3
+        fourth = profile_sync.sync_user_rows(db, model, 1, [make(8)], keyOf)
+        assert fourth[0]["id"] == first[0]["id"] and db.query(model).count() == 1
+
+
+def test_skills_differing_only_in_case_are_saved_once():
+    db, _ = _seeded_session(1)
+    incoming = [
+        {"name": "React", "category": "Frameworks"},
+        {"name": "react", "category": "Other"},
+        {"name": "skill0", "category": "New"},
+        {"name": " SKILL0 ", "category": "Other"},
+    ]
+
+    # called the way the /skills/bulk route calls it.
+    saved = profile_sync.sync_user_rows(db, Skills, 1, incoming, profile_sync.skill_match_key, updateFields=["category"], uniqueKeys=True)
+
+    assert [(row["name"], row["category"]) for row in saved] == [("React", "Frameworks"), ("Skill0", "New")]
+    assert sorted(s.name for s in db.query(Skills)) == ["React", "Skill0"]
@@ -0,0 +1,151 @@
+import asyncio
+import os
+import re
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("EMAIL_OUTBOX_WORKER", "0")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import models  # noqa: E402
+from database import get_db  # noqa: E402
+from main import app  # noqa: E402
+from routers import email_outbox  # noqa: E402
+from routers.security import AUTH_COOKIE_NAME, create_access_token  # noqa: E402
+
+# every route query must use an index; a bare "SCAN <table>" is a full table scan.
+fullScan = re.compile(r"^SCAN (\w+)$")
+userCount = 400
+
+
+def _seed(engine):
+    now = datetime.utcnow()
+    users = [
+        {"id": u, "first_name": "U", "last_name": str(u), "email": f"u{u}@example.com", "password_hash": "x",
+         "email_verified": True, "setup_completed": True, "email_verification_token_hash": f"hash{u}" if u % 3 else None}
+        for u in range(1, userCount + 1)
+    ]
+    perUser = lambda count, row: [dict(row(u, i), user_id=u) for u in range(1, userCount + 1) for i in range(count)]
+    with engine.begin() as conn:
+        conn.execute(models.User.__table__.insert(), users)
+        conn.execute(models.Skills.__table__.insert(), perUser(12, lambda u, i: {"name": f"Skill{i}", "category": "Tools"}))
+        conn.execute(models.Experience.__table__.insert(), perUser(4, lambda u, i: {"title": f"Role{i}", "company": f"Co{i}"}))
+        conn.execute(models.Projects.__table__.insert(), perUser(3, lambda u, i: {"title": f"Project{i}"}))
+        conn.execute(models.Education.__table__.insert(), perUser(2, lambda u, i: {"school": f"School{i}", "current": False}))
+        conn.execute(models.Summary.__table__.insert(), perUser(1, lambda u, i: {"summary": "hi"}))
+        conn.execute(models.Contact.__table__.insert(), perUser(1, lambda u, i: {"email": f"u{u}@example.com"}))
+        conn.execute(models.SavedResume.__table__.insert(), perUser(5, lambda u, i: {
+            "name": f"Resume{i}", "status": "draft", "snapshot": b"j{}", "created_at": now - timedelta(days=i), "updated_at": now,
+        }))
+        conn.execute(models.EmailOutbox.__table__.insert(), [
+            {"to_email": f"u{n}@example.com", "subject": "s", "html": "h", "status": "sent", "attempts": 1,
+             "next_attempt_at": now, "created_at": now} for n in range(2000)
+        ])
+        conn.exec_driver_sql("ANALYZE")
+
+
+@pytest.fixture(scope="module")
+def seeded(tmp_path_factory):
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}", connect_args={"check_same_thread": False})
+    models.Base.metadata.create_all(engine)
+    _seed(engine)
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().split()[0].upper() in ("SELECT", "UPDATE", "DELETE"):
+            statements.append((statement, parameters[0] if executemany else parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    client = TestClient(app)
+    client.cookies.set(AUTH_COOKIE_NAME, create_access_token(data={"sub": f"u{userCount // 2}@example.com"}))
+    yield engine, factory, client, statements
+    app.dependency_overrides.pop(get_db, None)
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def _plan(engine, statement, parameters):
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).fetchall()
+    return [row[-1] for row in rows]
+
+
+def _full_scans(engine, statements):
+    scans = []
+    for statement, parameters in statements:
+        for detail in _plan(engine, statement, parameters):
+            if fullScan.match(detail):
+                scans.append((detail, " ".join(statement.split())[:160]))
+    return scans
+
+
+# (method, path, json) per route; each one's queries are planned separately.
+routeCalls = [
+    ("get", "/api/profile/me", None),
+    ("post", "/api/profile/skills", {"name": "skill3", "category": "Languages"}),
+    ("post", "/api/profile/skills/bulk", [{"name": "Skill1", "category": "Tools"}, {"name": "Rust"}]),
+    ("post", "/api/profile/experiences/bulk", [{"title": "Role1", "company": "Co1"}, {"title": "New"}]),
+    ("post", "/api/profile/projects/bulk", [{"title": "Project0"}]),
+    ("post", "/api/profile/education/bulk", [{"school": "School0"}]),
+    ("post", "/api/profile/summary", {"summary": "updated"}),
+    ("post", "/api/profile/contact", {"email": "new@example.com"}),
+    ("get", "/api/profile/saved-resumes", None),
+    ("get", "/api/auth/verify-email?token=not-a-real-token", None),
+    ("post", "/api/auth/forgot-password", {"email": "u7@example.com"}),
+]
+
+
+@pytest.mark.parametrize("method,path,payload", routeCalls, ids=[f"{m} {p}" for m, p, _ in routeCalls])
+def test_route_queries_use_indexes(seeded, method, path, payload):
+    engine, _, client, statements = seeded
+    statements.clear()
+    response = getattr(client, method)(path, **({"json": payload} if payload is not None else {}), follow_redirects=False)
+    assert response.status_code < 400, response.text
+    assert statements
+    assert _full_scans(engine, statements) == []
+
+
+def test_saved_resume_routes_use_indexes(seeded):
+    engine, _, client, statements = seeded
+    savedId = client.get("/api/profile/saved-resumes").json()["items"][0]["id"]
+    statements.clear()
+    assert client.get(f"/api/profile/saved-resumes/{savedId}").status_code == 200
+    assert client.patch(f"/api/profile/saved-resumes/{savedId}", json={"status": "ready"}).status_code == 200
+    assert client.delete(f"/api/profile/saved-resumes/{savedId}").status_code == 200
+    assert _full_scans(engine, statements) == []
+
+
+def test_saved_resume_list_sorts_from_the_index(seeded):
+    engine, _, client, statements = seeded
+    statements.clear()
+    client.get("/api/profile/saved-resumes")
+    details = [d for s, p in statements for d in _plan(engine, s, p)]
+    assert any("ix_saved_resumes_user_id_created_at" in d for d in details)
+    assert not any("TEMP B-TREE" in d for d in details)
+
+
+def test_outbox_poll_uses_index(seeded):
+    engine, factory, _, statements = seeded
+    statements.clear()
+    asyncio.run(email_outbox.deliver_due_emails(factory, email_outbox.FakeEmailProvider()))
+    assert statements
+    assert _full_scans(engine, statements) == []
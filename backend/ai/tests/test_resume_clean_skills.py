@@ -1,13 +1,8 @@
-import importlib.util
-from pathlib import Path
+import importlib
 
 
 def _load_skills_parser():
-    parser_path = Path(__file__).resolve().parents[2] / "resume_parser" / "Eparsers" / "skills_parser.py"
-    spec = importlib.util.spec_from_file_location("skills_parser", parser_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+    return importlib.import_module("backend.resume_parser.Eparsers.skills_parser")
 
 
 def test_skills_parser_preserves_spaced_ampersand_categories():
@@ -90,3 +85,11 @@ def test_skills_parser_treats_standalone_category_labels_as_separators():
     assert by_name["Strong work ethic"] == "Personal Traits"
     assert "Problem-solving Technical Skills" not in by_name
     assert "Presentation (PowerPoint) Personal Traits" not in by_name
+
+
+def test_skills_parser_names_known_skills_canonically():
+    parser = _load_skills_parser()
+    skills = parser.parse_skills("Languages: JS, JavaScript, python, C++\nDatabases: Postgres, MongoDB, Supabase Edge Functions")
+    names = [skill["name"] for skill in skills]
+
+    assert names == ["JavaScript", "Python", "C++", "PostgreSQL", "MongoDB", "Supabase Edge Functions"]
@@ -1,13 +1,9 @@
-import importlib.util
-from pathlib import Path
+import importlib
 
 
 def _load_experience_parser():
-    parser_path = Path(__file__).resolve().parents[2] / "resume_parser" / "Eparsers" / "experience_parser.py"
-    spec = importlib.util.spec_from_file_location("experience_parser", parser_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+    # imported through the package: the parser pulls in resume_parser.gazetteer relatively.
+    return importlib.import_module("backend.resume_parser.Eparsers.experience_parser")
 
 
 def test_experience_parser_extracts_tab_separated_stack_and_remote_location():
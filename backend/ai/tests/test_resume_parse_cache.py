@@ -0,0 +1,58 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from backend.resume_parser import parse_cache, pipeline  # noqa: E402
+from backend.resume_parser.parse_service import ResumeParseService  # noqa: E402
+
+SAMPLE_PDF = Path(__file__).resolve().parents[2] / "resume_parser" / "tests" / "dylan.pdf"
+
+
+def test_key_depends_on_bytes_extension_and_parser_fingerprint():
+    key = parse_cache.parse_cache_key(b"abc", "resume.PDF")
+    assert key == parse_cache.parse_cache_key(b"abc", "other-name.pdf")
+    assert key != parse_cache.parse_cache_key(b"abd", "resume.pdf")
+    assert key != parse_cache.parse_cache_key(b"abc", "resume.docx")
+    assert key.startswith(parse_cache.parserFingerprint + ":")
+
+
+def test_entries_expire_and_the_size_cap_evicts_least_recently_used():
+    cache = parse_cache.ParseResultCache(ttlSeconds=60, maxBytes=250)
+    result = {"summary": "x" * 50, "warnings": []}
+    for name in ("a", "b", "c"):
+        cache.put(name, result)
+    assert cache.get("a", "f.pdf") == result
+    cache.put("d", result)  # over 250 -> drops "b", the least recently used
+    assert cache.get("b", "f.pdf") is None
+    assert cache.get("a", "f.pdf") == result
+    assert cache.totalBytes <= 250
+
+    cache.entries["a"] = (time.monotonic() - 1, cache.entries["a"][1])
+    assert cache.get("a", "f.pdf") is None
+
+
+def test_failed_pipelines_are_not_cached():
+    cache = parse_cache.ParseResultCache()
+    cache.put("k", {"warnings": ["Pipeline failed: boom"]})
+    assert cache.get("k", "f.pdf") is None
+
+
+def test_second_upload_of_identical_bytes_skips_the_parser(monkeypatch):
+    # the thread-mode parse would otherwise rewrite the tracked debug_out/ files.
+    monkeypatch.setattr(pipeline, "debugFilesEnabled", False)
+    parse_cache.parseCache.clear()
+    service = ResumeParseService(workers=0, queueSize=1, timeoutSeconds=30)
+    fileBytes = SAMPLE_PDF.read_bytes()
+    first = asyncio.run(service.parse(fileBytes, SAMPLE_PDF.name))
+
+    monkeypatch.setattr(service, "parse_uncached", None)  # any call would now blow up
+    second = asyncio.run(service.parse(fileBytes, "renamed.pdf"))
+    assert second["contact_info"] == first["contact_info"]
+    assert second["debug"]["filename"] == "renamed.pdf"
+    second["skills"].append("mutated")
+    assert asyncio.run(service.parse(fileBytes, SAMPLE_PDF.name))["skills"] == first["skills"]
@@ -0,0 +1,142 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import worker_pool  # noqa: E402  (the parse service imports the app-style `worker_pool` module)
+from backend.resume_parser import parse_cache, pipeline  # noqa: E402
+from backend.resume_parser.parse_service import (  # noqa: E402
+    ParserBusyError,
+    ParserTimeoutError,
+    ResumeParseService,
+)
+from backend.resume_parser.pipeline import SECTION_RESULT_KEYS, parse_resume_file  # noqa: E402
+
+SAMPLE_PDF = Path(__file__).resolve().parents[2] / "resume_parser" / "tests" / "dylan.pdf"
+
+
+@pytest.fixture(autouse=True)
+def no_debug_files(monkeypatch):
+    # inline / thread-mode parses would otherwise rewrite the tracked debug_out/ files.
+    monkeypatch.setattr(pipeline, "debugFilesEnabled", False)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    service = ResumeParseService(workers=1, queueSize=2, timeoutSeconds=30)
+    service.start()
+    yield service
+    service.stop()
+
+
+def _debug_snapshots():
+    return {path.name: path.stat().st_mtime_ns for path in pipeline.DEBUG_DIR.glob("*")}
+
+
+def test_pool_parse_matches_inline_parse(pool):
+    fileBytes = SAMPLE_PDF.read_bytes()
+    before = _debug_snapshots()
+    parsed = asyncio.run(pool.parse(fileBytes, SAMPLE_PDF.name))
+    # workers leave debug_out/ alone unless RESUME_PARSER_DEBUG_FILES=1.
+    assert _debug_snapshots() == before
+    inline = parse_resume_file(fileBytes, SAMPLE_PDF.name)
+
+    assert parsed["contact_info"] == inline["contact_info"]
+    assert parsed["experiences"] == inline["experiences"]
+    assert parsed["warnings"] == []
+
+
+def test_slow_parse_times_out_and_the_pool_keeps_working(pool):
+    fileBytes = SAMPLE_PDF.read_bytes()
+    pool.timeoutSeconds = 0.001
+    try:
+        with pytest.raises(ParserTimeoutError):
+            asyncio.run(pool.parse_uncached(fileBytes, SAMPLE_PDF.name))
+    finally:
+        pool.timeoutSeconds = 30
+
+    assert asyncio.run(pool.parse_uncached(fileBytes, SAMPLE_PDF.name))["contact_info"]
+    assert pool.inFlight == 0
+
+
+def test_a_backlog_longer_than_the_hard_timeout_does_not_restart_the_pool(monkeypatch):
+    # six 0.3 s jobs on one worker: the last finishes ~1.8 s after submit, well past the
+    # 1.1 s hard timeout, but none of them runs longer than the soft timeout once picked up.
+    monkeypatch.setattr(worker_pool, "hardTimeoutGraceSeconds", 0.1)
+    service = ResumeParseService(workers=1, queueSize=8, timeoutSeconds=1.0)
+    service.start()
+    try:
+        executor = service.executor
+
+        async def backlog():
+            return await asyncio.gather(*(service.run_job("sleep", time.sleep, 0.3) for _ in range(6)))
+
+        assert asyncio.run(backlog()) == [None] * 6
+        assert service.executor is executor
+    finally:
+        service.stop()
+
+
+def test_full_queue_is_refused():
+    service = ResumeParseService(workers=0, queueSize=0, timeoutSeconds=30)
+    fileBytes = SAMPLE_PDF.read_bytes()
+
+    async def two_uploads():
+        return await asyncio.gather(
+            service.parse_uncached(fileBytes, SAMPLE_PDF.name),
+            service.parse_uncached(fileBytes, SAMPLE_PDF.name),
+            return_exceptions=True,
+        )
+
+    first, second = asyncio.run(two_uploads())
+    assert first["contact_info"]
+    assert isinstance(second, ParserBusyError)
+
+
+async def _stream(service, fileBytes, filename):
+    return [item async for item in await service.stream(fileBytes, filename)]
+
+
+def test_stream_emits_every_section_then_done_and_matches_inline_parse(pool):
+    fileBytes = SAMPLE_PDF.read_bytes()
+    inline = parse_resume_file(fileBytes, SAMPLE_PDF.name)
+    parse_cache.parseCache.clear()
+
+    events = asyncio.run(_stream(pool, fileBytes, SAMPLE_PDF.name))
+    names = [name for name, _ in events]
+    sections = dict(events)
+
+    assert sorted(names[:-1]) == sorted(SECTION_RESULT_KEYS)
+    assert names[-1] == "done"
+    for name, resultKey in SECTION_RESULT_KEYS.items():
+        assert sections[name] == inline[resultKey]
+    assert sections["done"]["warnings"] == []
+    debug = sections["done"]["debug"]
+    assert debug["parsedCounts"] == inline["debug"]["parsedCounts"]
+    # everything the "Show parser debug" panel reads on the merge path.
+    for key in ("rawTextPreview", "cleanedTextPreview", "sectionPreviews", "parserDebug"):
+        assert debug[key] == inline["debug"][key]
+    assert pool.inFlight == 0
+
+    # the finished stream filled the cache, so the same upload replays without the pool.
+    cached = parse_cache.parseCache.get(parse_cache.parse_cache_key(fileBytes, SAMPLE_PDF.name), SAMPLE_PDF.name)
+    assert cached["experiences"] == inline["experiences"]
+    replayed = asyncio.run(_stream(pool, fileBytes, SAMPLE_PDF.name))
+    assert [name for name, _ in replayed] == list(SECTION_RESULT_KEYS) + ["done"]
+
+
+def test_stream_of_an_unreadable_file_ends_with_a_warning():
+    service = ResumeParseService(workers=0, queueSize=2, timeoutSeconds=30)
+
+    events = asyncio.run(_stream(service, b"not a pdf", "broken.pdf"))
+
+    assert events[-1][0] == "done"
+    assert events[-1][1]["warnings"][0].startswith("Pipeline failed")
+    assert dict(events)["experience"] == []
+    assert service.inFlight == 0
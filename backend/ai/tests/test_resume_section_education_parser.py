@@ -1,13 +1,10 @@
-import importlib.util
-from pathlib import Path
+import importlib
+from pathlib import PurePosixPath
 
 
 def _load_module(relative_path: str, name: str):
-    module_path = Path(__file__).resolve().parents[2] / relative_path
-    spec = importlib.util.spec_from_file_location(name, module_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+    # imported through the package: the parsers pull in resume_parser.gazetteer relatively.
+    return importlib.import_module("backend." + ".".join(PurePosixPath(relative_path).with_suffix("").parts))
 
 
 def test_segmenter_recognizes_skills_and_extracurriculars_header_after_summary():
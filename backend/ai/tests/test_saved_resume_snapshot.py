@@ -0,0 +1,49 @@
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import Base, SavedResume, User
+from backend.models.saved_resume import decode_snapshot, encode_snapshot
+
+
+def _session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return sessionmaker(bind=engine)(), statements
+
+
+def test_snapshot_round_trips_and_hash_ignores_key_order():
+    resume = {"header": {"first_name": "Ada"}, "experience": [{"title": "Engineer " * 200}]}
+
+    blob, size_bytes, content_hash = encode_snapshot(resume)
+    reordered_hash = encode_snapshot({"experience": resume["experience"], "header": resume["header"]})[2]
+
+    assert decode_snapshot(blob) == resume
+    assert len(blob) < size_bytes
+    assert content_hash == reordered_hash
+    assert decode_snapshot(None) == {}
+
+
+def test_listing_saved_resumes_never_selects_the_snapshot():
+    db, statements = _session()
+    user = User(first_name="Ada", last_name="L", email="ada@example.com", password_hash="x")
+    db.add(user)
+    db.flush()
+    user_id = user.id
+    saved = SavedResume(user_id=user_id, name="SWE", template="classic", status="ready")
+    saved.set_resume_data({"summary": {"summary": "x" * 5000}})
+    db.add(saved)
+    db.commit()
+    db.expunge_all()
+
+    statements.clear()
+    cards = db.query(SavedResume).filter(SavedResume.user_id == user_id).all()
+
+    assert [card.status for card in cards] == ["ready"]
+    assert cards[0].size_bytes > 5000
+    assert all("snapshot" not in sql for sql in statements)
+
+    # the snapshot only comes off disk when the editor actually opens it.
+    assert cards[0].resume_data["summary"]["summary"] == "x" * 5000
+    assert any("snapshot" in sql for sql in statements)
@@ -0,0 +1,75 @@
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from resume_parser.Aextractor import extract_pdf  # noqa: E402
+from resume_parser.pipeline import minimal_clean  # noqa: E402
+
+SAMPLES_DIR = BACKEND_DIR / "resume_parser" / "tests"
+GOLDEN_PATH = Path(__file__).resolve().parent / "golden" / "section_splits.json"
+
+
+def _load_module(relative_path: str, name: str):
+    module_path = BACKEND_DIR / relative_path
+    spec = importlib.util.spec_from_file_location(name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+segmenter = _load_module("resume_parser/Csegmenter/section_finder.py", "section_finder")
+
+
+def _sample_splits():
+    splits = {}
+    for path in sorted(SAMPLES_DIR.glob("*.pdf")):
+        text = minimal_clean(extract_pdf(path.read_bytes()))
+        splits[path.name] = segmenter.split_into_sections(text)
+    return splits
+
+
+def test_sample_resumes_split_like_the_golden_file():
+    # regenerate after an intended extractor / cleaner change:
+    #   UPDATE_GOLDEN=1 python -m pytest backend/ai/tests/test_section_finder_golden.py
+    splits = _sample_splits()
+    if os.getenv("UPDATE_GOLDEN") == "1":
+        GOLDEN_PATH.write_text(json.dumps(splits, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        pytest.skip("golden file rewritten")
+
+    golden = json.loads(GOLDEN_PATH.read_text(encoding="utf-8"))
+    assert sorted(splits) == sorted(golden)
+    for filename, sections in golden.items():
+        assert splits[filename] == sections, filename
+
+
+def test_only_the_first_header_of_each_name_opens_a_section():
+    sections = segmenter.split_into_sections("\n".join([
+        "EDUCATION",
+        "State University",
+        "Skills:",
+        "Python",
+        "• Education",
+        "Bootcamp",
+        "E X P E R I E N C E",
+        "Acme Corp",
+    ]))
+
+    assert sections == {
+        "education": "State University",
+        "skills": "Python\n• Education\nBootcamp",
+        "experience": "Acme Corp",
+    }
+
+
+def test_lone_bullet_and_colon_lines_around_a_header_belong_to_it():
+    sections = segmenter.split_into_sections("Summary\nBuilds things.\n•\nSkills\n:\nPython")
+
+    assert sections == {"summary": "Builds things.", "skills": "Python"}
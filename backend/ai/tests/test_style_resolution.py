@@ -0,0 +1,30 @@
+import dataclasses
+
+import pytest
+
+from backend.generator.shared import styles
+from backend.generator.shared.resume_tokens import build_resume_tokens_css, load_resume_token_dict
+from backend.generator.shared.style_presets import merge_resume_token_overrides
+
+
+def test_equivalent_preferences_share_one_resolution():
+    styles.clear_style_cache()
+    first = styles.resolve_styles("classic", {"marginPreset": "tight", "fontPairing": "calibri_modern"})
+    second = styles.resolve_styles("classic", {"fontPairing": "calibri_modern", "marginPreset": "tight"})
+    assert second is first
+    assert styles.get_styles("classic", {"fontPairing": "calibri_modern", "marginPreset": "tight"}) is first.docx
+    assert styles.resolve_styles("classic", None) is styles.resolve_styles("classic", {})
+
+    tokens = merge_resume_token_overrides("classic", load_resume_token_dict("classic"), {"marginPreset": "tight", "fontPairing": "calibri_modern"})
+    assert first.rootCss == build_resume_tokens_css(tokens)
+    assert first.docx.font_primary == "Calibri"
+    assert styles.resolve_styles("classic", {"marginPreset": "spacious"}) is not first
+
+
+def test_resolved_styles_are_read_only():
+    resolved = styles.resolve_styles("sidebar")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        resolved.docx.margin_top_in = 1.0
+    with pytest.raises(TypeError):
+        resolved.tokens["margin_top_in"] = 1.0
+    assert dataclasses.replace(resolved.docx, margin_top_in=1.0).margin_top_in == 1.0
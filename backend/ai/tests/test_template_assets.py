@@ -0,0 +1,61 @@
+import base64
+import json
+from pathlib import Path
+
+from backend.generator.pipeline import generate_resume
+from backend.generator.shared import assets
+from backend.generator.shared.template_slug import TEMPLATES_DIR
+
+FIXTURE = Path(__file__).resolve().parents[2] / "templates" / "preview_fixture.json"
+
+
+def test_local_fonts_are_inlined_and_everything_else_left_alone(tmp_path):
+    (tmp_path / "fonts").mkdir()
+    (tmp_path / "fonts" / "Body.woff2").write_bytes(b"wOF2-font-bytes")
+    (tmp_path.parent / "outside.woff2").write_bytes(b"secret")
+    css = (
+        '@font-face { font-family: "Body"; src: url("fonts/Body.woff2") format("woff2"); }\n'
+        ".a { background: url(fonts/missing.png); }\n"
+        ".b { background: url('../outside.woff2'); }\n"
+        ".c { background: url(data:image/png;base64,AAAA); }\n"
+    )
+    inlined = assets.inline_template_assets(css, tmp_path)
+    payload = base64.b64encode(b"wOF2-font-bytes").decode("ascii")
+    assert f'url("data:font/woff2;base64,{payload}") format("woff2")' in inlined
+    assert "url(fonts/missing.png)" in inlined
+    assert "url('../outside.woff2')" in inlined
+    assert "url(data:image/png;base64,AAAA)" in inlined
+    assert assets.inline_template_assets(".x { color: red; }", tmp_path) == ".x { color: red; }"
+
+
+def test_external_references_ignore_links_the_reader_clicks():
+    html = (
+        '<head><link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter">'
+        "<style>@import url('https://cdn.example.com/a.css'); .x { background: url(//cdn.example.com/b.png); }</style></head>"
+        '<body><img srcset="https://img.example.com/1x.png 1x, local.png 2x">'
+        '<a href="https://linkedin.com/in/tony">LinkedIn</a><p>see url(https://not-css.example.com)</p>'
+        '<div style="background: url(http://img.example.com/c.png)"></div></body>'
+    )
+    assert assets.external_references(html) == [
+        "https://cdn.example.com/a.css",
+        "//cdn.example.com/b.png",
+        "http://img.example.com/c.png",
+        "https://fonts.googleapis.com/css2?family=Inter",
+        "https://img.example.com/1x.png",
+    ]
+    assert assets.external_references("@import 'https://x.example.com/y.css';", "css") == ["https://x.example.com/y.css"]
+
+
+def test_shipped_templates_render_without_network_fetches():
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    for folder in sorted(path for path in TEMPLATES_DIR.iterdir() if (path / "template.html").is_file()):
+        assert assets.preflight_template(folder.name) == []
+        assert assets.external_references(generate_resume(folder.name, resume_data, {})) == []
+
+
+def test_vendored_template_fonts_ship_inside_the_document():
+    resume_data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    html = generate_resume("executive-summary", resume_data, {})
+    assert html.count('font-family: "Cambria";') == 4
+    assert html.count('url("data:font/woff2;base64,') == 4
+    assert "fonts/Caladea" not in html
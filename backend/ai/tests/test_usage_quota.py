@@ -0,0 +1,71 @@
+import importlib.util
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import models  # noqa: E402  (routers/quota.py imports the app-style `models` package)
+
+
+def _load_module(relative_path: str, name: str):
+    module_path = BACKEND_DIR / relative_path
+    spec = importlib.util.spec_from_file_location(name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+quota = _load_module("routers/quota.py", "quota")
+
+
+def _session():
+    engine = create_engine("sqlite://")
+    models.Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(models.User(id=1, first_name="Ada", last_name="L", email="ada@example.com", password_hash="x"))
+    db.commit()
+    return db
+
+
+def test_db_backend_gates_on_the_limit_and_refunds():
+    db = _session()
+    backend = quota.DatabaseQuotaBackend()
+
+    counts = [backend.consume(db, 1, "tailor", 3) for _ in range(4)]
+    assert counts == [1, 2, 3, None]
+
+    backend.refund(db, 1, "tailor")
+    assert backend.consume(db, 1, "tailor", 3) == 3
+    assert backend.consume(db, 1, "tailor", 3) is None
+
+
+def test_db_backend_starts_a_fresh_window_on_a_new_day_and_honours_cooldown():
+    db = _session()
+    backend = quota.DatabaseQuotaBackend()
+    assert backend.consume(db, 1, "reset_email", 5, cooldownSeconds=60) == 1
+    assert backend.consume(db, 1, "reset_email", 5, cooldownSeconds=60) is None
+
+    row = db.query(models.UsageQuota).filter_by(user_id=1, kind="reset_email").one()
+    row.window_date = datetime.utcnow().date() - timedelta(days=1)
+    row.count = 5
+    row.last_used_at = row.last_used_at - timedelta(minutes=5)
+    db.commit()
+
+    assert backend.consume(db, 1, "reset_email", 5, cooldownSeconds=60) == 1
+
+
+def test_memory_backend_is_a_sliding_window():
+    backend = quota.MemoryQuotaBackend()
+    assert [backend.consume(None, 1, "tailor", 2) for _ in range(3)] == [1, 2, None]
+
+    backend.uses[(1, "tailor")][0] -= backend.windowSeconds
+    assert backend.consume(None, 1, "tailor", 2) == 2
+
+    backend.refund(None, 1, "tailor")
+    assert backend.consume(None, 1, "tailor", 2) == 2
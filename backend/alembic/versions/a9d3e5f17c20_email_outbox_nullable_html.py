@@ -0,0 +1,32 @@
+"""email_outbox.html nullable: cleared once a message is sent or given up on
+
+Revision ID: a9d3e5f17c20
+Revises: f2b8d0c6a413
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a9d3e5f17c20"
+down_revision: Union[str, None] = "f2b8d0c6a413"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # the body carries verify / reset links with live tokens; the worker nulls it when the
+    # row is done, so existing finished rows get the same treatment here.
+    with op.batch_alter_table("email_outbox", schema=None) as batch_op:
+        batch_op.alter_column("html", existing_type=sa.Text(), nullable=True)
+    op.execute("UPDATE email_outbox SET html = NULL WHERE status IN ('sent', 'failed')")
+
+
+def downgrade() -> None:
+    op.execute("UPDATE email_outbox SET html = '' WHERE html IS NULL")
+    with op.batch_alter_table("email_outbox", schema=None) as batch_op:
+        batch_op.alter_column("html", existing_type=sa.Text(), nullable=False)
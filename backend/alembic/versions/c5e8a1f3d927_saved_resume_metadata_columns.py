@@ -0,0 +1,158 @@
+"""split saved resume metadata columns from a deferred compressed snapshot
+
+Revision ID: c5e8a1f3d927
+Revises: b41e7a93c5d2
+Create Date: 2026-10-19
+
+"""
+import hashlib
+import json
+import zlib
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e8a1f3d927"
+down_revision: Union[str, None] = "b41e7a93c5d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# frozen copies of the saved-resume snapshot codec / card extraction — migrations must
+# not import app code, which keeps moving after this revision ships.
+def encode_snapshot(resumeData):
+    raw = json.dumps(resumeData or {}, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return b"z" + zlib.compress(raw, 6), len(raw), hashlib.sha256(raw).hexdigest()
+
+
+def decode_snapshot(blob):
+    if not blob:
+        return {}
+    blob = bytes(blob)
+    raw = zlib.decompress(blob[1:]) if blob[:1] == b"z" else blob[1:]
+    return json.loads(raw.decode("utf-8"))
+
+
+# same rules as routers/profile.clean_saved_tags: trimmed, no leading '#', 28 chars max,
+# case-insensitive dedupe (first spelling wins), max 8.
+def clean_tags(tags):
+    seen = set()
+    cleanTags = []
+    for tag in tags or []:
+        cleanTag = str(tag or "").strip().lstrip("#")[:28]
+        key = cleanTag.lower()
+        if not cleanTag or key in seen:
+            continue
+        seen.add(key)
+        cleanTags.append(cleanTag)
+        if len(cleanTags) >= 8:
+            break
+    return cleanTags
+
+
+def card_fields(resumeData):
+    metadata = resumeData.get("saveMetadata") or {}
+    tailorIntent = resumeData.get("tailorIntent") or {}
+    status = str(metadata.get("status") or "").strip().lower().replace(" ", "_")[:40] or "draft"
+    role = metadata.get("targetRole") or tailorIntent.get("jobTitle")
+    company = metadata.get("targetCompany") or tailorIntent.get("company")
+    return {
+        "status": status,
+        "tags": clean_tags(metadata.get("tags")),
+        "target_role": str(role)[:255] if role else None,
+        "target_company": str(company)[:255] if company else None,
+        "changed_sections": [str(s) for s in (metadata.get("changedSections") or []) if s][:12],
+    }
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("saved_resumes") as batch_op:
+        batch_op.add_column(sa.Column("status", sa.String(length=40), nullable=False, server_default="draft"))
+        batch_op.add_column(sa.Column("tags", sa.JSON(), nullable=True))
+        batch_op.add_column(sa.Column("target_role", sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column("target_company", sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column("changed_sections", sa.JSON(), nullable=True))
+        batch_op.add_column(sa.Column("size_bytes", sa.Integer(), nullable=False, server_default="0"))
+        batch_op.add_column(sa.Column("content_hash", sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column("snapshot", sa.LargeBinary(), nullable=True))
+
+    # backfill: compress each existing json blob and lift its card metadata into columns.
+    conn = op.get_bind()
+    savedResumes = sa.table(
+        "saved_resumes",
+        sa.column("id", sa.Integer),
+        sa.column("resume_data", sa.JSON),
+        sa.column("created_at", sa.DateTime),
+        sa.column("status", sa.String),
+        sa.column("tags", sa.JSON),
+        sa.column("target_role", sa.String),
+        sa.column("target_company", sa.String),
+        sa.column("changed_sections", sa.JSON),
+        sa.column("size_bytes", sa.Integer),
+        sa.column("content_hash", sa.String),
+        sa.column("updated_at", sa.DateTime),
+        sa.column("snapshot", sa.LargeBinary),
+    )
+    rows = conn.execute(sa.select(savedResumes.c.id, savedResumes.c.resume_data, savedResumes.c.created_at)).fetchall()
+    for rowId, resumeData, createdAt in rows:
+        if isinstance(resumeData, str):
+            resumeData = json.loads(resumeData)
+        resumeData = resumeData or {}
+        blob, sizeBytes, contentHash = encode_snapshot(resumeData)
+        conn.execute(
+            savedResumes.update()
+            .where(savedResumes.c.id == rowId)
+            .values(
+                snapshot=blob,
+                size_bytes=sizeBytes,
+                content_hash=contentHash,
+                updated_at=createdAt or datetime.utcnow(),
+                **card_fields(resumeData),
+            )
+        )
+
+    with op.batch_alter_table("saved_resumes") as batch_op:
+        batch_op.alter_column("snapshot", existing_type=sa.LargeBinary(), nullable=False)
+        batch_op.alter_column("updated_at", existing_type=sa.DateTime(), nullable=False)
+        batch_op.drop_column("resume_data")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("saved_resumes") as batch_op:
+        batch_op.add_column(sa.Column("resume_data", sa.JSON(), nullable=True))
+
+    # fold the status/tags columns back into saveMetadata so nothing edited since upgrade is lost.
+    conn = op.get_bind()
+    savedResumes = sa.table(
+        "saved_resumes",
+        sa.column("id", sa.Integer),
+        sa.column("resume_data", sa.JSON),
+        sa.column("status", sa.String),
+        sa.column("tags", sa.JSON),
+        sa.column("snapshot", sa.LargeBinary),
+    )
+    rows = conn.execute(sa.select(savedResumes.c.id, savedResumes.c.snapshot, savedResumes.c.status, savedResumes.c.tags)).fetchall()
+    for rowId, blob, status, tags in rows:
+        resumeData = decode_snapshot(blob)
+        metadata = dict(resumeData.get("saveMetadata") or {})
+        metadata["status"] = status
+        metadata["tags"] = tags or []
+        resumeData["saveMetadata"] = metadata
+        conn.execute(savedResumes.update().where(savedResumes.c.id == rowId).values(resume_data=resumeData))
+
+    with op.batch_alter_table("saved_resumes") as batch_op:
+        batch_op.alter_column("resume_data", existing_type=sa.JSON(), nullable=False)
+        batch_op.drop_column("snapshot")
+        batch_op.drop_column("updated_at")
+        batch_op.drop_column("content_hash")
+        batch_op.drop_column("size_bytes")
+        batch_op.drop_column("changed_sections")
+        batch_op.drop_column("target_company")
+        batch_op.drop_column("target_role")
+        batch_op.drop_column("tags")
+        batch_op.drop_column("status")
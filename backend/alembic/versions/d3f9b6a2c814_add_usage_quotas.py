@@ -0,0 +1,124 @@
+"""move tailor cap + email throttle counters into usage_quotas
+
+Revision ID: d3f9b6a2c814
+Revises: c5e8a1f3d927
+Create Date: 2026-10-19
+
+"""
+from datetime import datetime, time
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3f9b6a2c814"
+down_revision: Union[str, None] = "c5e8a1f3d927"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# quota kind -> (count column, window date column, last-used column) on users.
+legacyColumns = {
+    "tailor": ("daily_tailor_count", "daily_tailor_reset_date", None),
+    "verification_email": ("verification_email_daily_count", "verification_email_count_date", "verification_email_last_sent_at"),
+    "reset_email": ("reset_email_daily_count", "reset_email_count_date", "reset_email_last_sent_at"),
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "usage_quotas",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=40), nullable=False),
+        sa.Column("window_date", sa.Date(), nullable=True),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_used_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "kind", name="uq_usage_quotas_user_kind"),
+    )
+    with op.batch_alter_table("usage_quotas", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_usage_quotas_id"), ["id"], unique=False)
+
+    # carry today's counts over so the deploy doesn't hand everyone a fresh daily allowance.
+    conn = op.get_bind()
+    users = sa.table("users", sa.column("id", sa.Integer), *[
+        sa.column(name, sa.DateTime if "date" in name or "sent_at" in name else sa.Integer)
+        for cols in legacyColumns.values() for name in cols if name
+    ])
+    quotas = sa.table(
+        "usage_quotas",
+        sa.column("user_id", sa.Integer),
+        sa.column("kind", sa.String),
+        sa.column("window_date", sa.Date),
+        sa.column("count", sa.Integer),
+        sa.column("last_used_at", sa.DateTime),
+    )
+    rows = []
+    for user in conn.execute(sa.select(users)).mappings():
+        for kind, (countCol, dateCol, lastCol) in legacyColumns.items():
+            windowAt = user[dateCol]
+            lastUsedAt = user[lastCol] if lastCol else None
+            if not windowAt and not lastUsedAt:
+                continue
+            rows.append({
+                "user_id": user["id"],
+                "kind": kind,
+                "window_date": windowAt.date() if windowAt else None,
+                "count": user[countCol] or 0,
+                "last_used_at": lastUsedAt,
+            })
+    if rows:
+        op.bulk_insert(quotas, rows)
+
+    with op.batch_alter_table("users") as batch_op:
+        for countCol, dateCol, lastCol in legacyColumns.values():
+            batch_op.drop_column(countCol)
+            batch_op.drop_column(dateCol)
+            if lastCol:
+                batch_op.drop_column(lastCol)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.add_column(sa.Column("daily_tailor_count", sa.Integer(), nullable=False, server_default="0"))
+        batch_op.add_column(sa.Column("daily_tailor_reset_date", sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column("verification_email_last_sent_at", sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column("verification_email_daily_count", sa.Integer(), nullable=False, server_default="0"))
+        batch_op.add_column(sa.Column("verification_email_count_date", sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column("reset_email_last_sent_at", sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column("reset_email_daily_count", sa.Integer(), nullable=False, server_default="0"))
+        batch_op.add_column(sa.Column("reset_email_count_date", sa.DateTime(), nullable=True))
+
+    conn = op.get_bind()
+    users = sa.table("users", sa.column("id", sa.Integer), *[
+        sa.column(name, sa.DateTime if "date" in name or "sent_at" in name else sa.Integer)
+        for cols in legacyColumns.values() for name in cols if name
+    ])
+    quotas = sa.table(
+        "usage_quotas",
+        sa.column("user_id", sa.Integer),
+        sa.column("kind", sa.String),
+        sa.column("window_date", sa.Date),
+        sa.column("count", sa.Integer),
+        sa.column("last_used_at", sa.DateTime),
+    )
+    for quota in conn.execute(sa.select(quotas)).mappings():
+        if quota["kind"] not in legacyColumns:
+            continue
+        countCol, dateCol, lastCol = legacyColumns[quota["kind"]]
+        windowDate = quota["window_date"]
+        values = {
+            countCol: quota["count"],
+            dateCol: datetime.combine(windowDate, time()) if windowDate else None,
+        }
+        if lastCol:
+            values[lastCol] = quota["last_used_at"]
+        conn.execute(users.update().where(users.c.id == quota["user_id"]).values(**values))
+
+    with op.batch_alter_table("usage_quotas", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_usage_quotas_id"))
+    op.drop_table("usage_quotas")
@@ -0,0 +1,45 @@
+"""add email_outbox for queued auth emails
+
+Revision ID: e7a4c2d91b35
+Revises: d3f9b6a2c814
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a4c2d91b35"
+down_revision: Union[str, None] = "d3f9b6a2c814"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("to_email", sa.String(length=255), nullable=False),
+        sa.Column("subject", sa.String(length=255), nullable=False),
+        sa.Column("html", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sa.String(length=500), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("email_outbox", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_email_outbox_id"), ["id"], unique=False)
+        batch_op.create_index(batch_op.f("ix_email_outbox_status"), ["status"], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("email_outbox", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_email_outbox_status"))
+        batch_op.drop_index(batch_op.f("ix_email_outbox_id"))
+    op.drop_table("email_outbox")
@@ -0,0 +1,63 @@
+"""composite / functional indexes for per-user lookups
+
+Revision ID: f2b8d0c6a413
+Revises: e7a4c2d91b35
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b8d0c6a413"
+down_revision: Union[str, None] = "e7a4c2d91b35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# plain per-user child tables: every read filters on user_id.
+userIdIndexes = {
+    "experiences": "ix_experiences_user_id",
+    "projects": "ix_projects_user_id",
+    "education": "ix_education_user_id",
+    "professional_summary": "ix_professional_summary_user_id",
+}
+
+
+def upgrade() -> None:
+    for table, name in userIdIndexes.items():
+        op.create_index(name, table, ["user_id"], unique=False)
+
+    # create_skill matches func.lower(name) per user.
+    op.create_index("ix_skills_user_id_lower_name", "skills", ["user_id", sa.text("lower(name)")], unique=False)
+
+    # saved-resume list: WHERE user_id = ? ORDER BY created_at DESC. replaces the single-column index.
+    op.drop_index("ix_saved_resumes_user_id", table_name="saved_resumes")
+    op.create_index("ix_saved_resumes_user_id_created_at", "saved_resumes", ["user_id", "created_at"], unique=False)
+
+    # verify-email / reset-password look the user up by token hash.
+    op.create_index("ix_users_email_verification_token_hash", "users", ["email_verification_token_hash"], unique=False)
+    op.create_index("ix_users_password_reset_token_hash", "users", ["password_reset_token_hash"], unique=False)
+
+    # outbox worker poll: status = 'pending' AND next_attempt_at <= now.
+    op.drop_index("ix_email_outbox_status", table_name="email_outbox")
+    op.create_index("ix_email_outbox_status_next_attempt_at", "email_outbox", ["status", "next_attempt_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_email_outbox_status_next_attempt_at", table_name="email_outbox")
+    op.create_index("ix_email_outbox_status", "email_outbox", ["status"], unique=False)
+
+    op.drop_index("ix_users_password_reset_token_hash", table_name="users")
+    op.drop_index("ix_users_email_verification_token_hash", table_name="users")
+
+    op.drop_index("ix_saved_resumes_user_id_created_at", table_name="saved_resumes")
+    op.create_index("ix_saved_resumes_user_id", "saved_resumes", ["user_id"], unique=False)
+
+    op.drop_index("ix_skills_user_id_lower_name", table_name="skills")
+
+    for table, name in userIdIndexes.items():
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,207 @@
+# Auto-fit exports: pick the roomiest style preset that still fits the resume on N pages.
+
+# Users used to toggle marginPreset / lineSpacingPreset / typeScalePreset and re-export until
+# the PDF came out on one page, each try a full Playwright launch + render. Here one export
+# does the search itself:
+# - the user's own preferences are tried first; if they fit, nothing changes.
+# - otherwise the ladder in style_presets.FIT_PRESET_LADDER (ordered roomy -> dense) is
+#   binary-searched for its first step that fits.
+# PDF: the resume is rendered once into one browser page; each probe swaps the :root token
+# block in place (a <style> appended after the template's) and measures the content height in
+# JS, so a probe is a style recalc + layout, not a render. The PDF is printed from that page,
+# which belongs to the warm renderer's browser (pdf_renderer.py) when PDF_RENDERER=warm.
+# DOCX: each probe builds the document and measures it with word/docx_page_fit. Passing the
+# preset a PDF fit returned makes the Word export match it without searching again.
+
+from __future__ import annotations
+
+import asyncio
+import math
+import sys
+from io import BytesIO
+from typing import Any, Callable, Dict, Tuple
+
+# pipeline first: importing generator.layouts on its own hits the shared <-> layouts import cycle.
+from .pipeline import generate_docx, generate_resume
+from .layouts import LAYOUT_SIDEBAR_SPLIT, LAYOUT_TIMELINE_SPLIT, docx_export_template_slug, load_layout_profile
+from .pdf_renderer import RENDERED_JS, pdf_renderer, pdf_renderer_mode
+from .shared.style_presets import FIT_PRESET_LADDER, fit_preset_preferences, supports_fit_presets
+from .shared.styles import resolve_styles
+from .shared.template_slug import normalize_template_slug
+
+# Letter, in CSS px (96 per inch).
+_PAGE_WIDTH_IN = 8.5
+_PAGE_HEIGHT_IN = 11.0
+_PX_PER_IN = 96.0
+
+# Share of the page body measured content may use: Chromium's page breaks skip past blocks
+# that avoid splitting, which costs a little of each page.
+PDF_FIT_SAFETY = 0.98
+
+# Appends (or replaces) the probe's :root tokens after the template's own; returns the
+# content height in px at the current viewport width.
+_SWAP_AND_MEASURE_JS = """(css) => {
+    let el = document.getElementById("rt-fit-tokens");
+    if (!el) {
+        el = document.createElement("style");
+        el.id = "rt-fit-tokens";
+        document.head.appendChild(el);
+    }
+    el.textContent = css;
+    const root = document.querySelector(".resume") || document.body;
+    return Math.ceil(root.getBoundingClientRect().height);
+}"""
+
+
+# --- Handle Ladder Search ---
+def search_fit_ladder(fits: Callable[[int], bool], steps: int = len(FIT_PRESET_LADDER)) -> Tuple[int, bool]:
+    # First step where fits(step) holds, assuming it only flips from False to True along the
+    # ladder; (last step, False) when even the densest preset doesn't fit.
+    lo, hi = 0, steps
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if fits(mid):
+            hi = mid
+        else:
+            lo = mid + 1
+    if lo == steps:
+        return steps - 1, False
+    return lo, True
+
+
+# --- Handle Generic Fit ---
+def _fit(
+    template_name: str,
+    style_preferences: Dict[str, Any] | None,
+    measure: Callable[[Dict[str, Any]], Tuple[int, Any]],
+    max_pages: int,
+) -> Tuple[Dict[str, Any], int, Any]:
+    # measure(preferences) -> (pages, artifact). Returns the chosen preferences, their page
+    # count and artifact (pages > max_pages means nothing fit; the densest step is returned).
+    own = dict(style_preferences or {})
+    pages, artifact = measure(own)
+    if pages <= max_pages or not supports_fit_presets(template_name):
+        return own, pages, artifact
+
+    probes: Dict[int, Tuple[int, Any]] = {}
+
+    def fits(step: int) -> bool:
+        if step not in probes:
+            probes[step] = measure(fit_preset_preferences(style_preferences, step))
+        return probes[step][0] <= max_pages
+
+    step, _ = search_fit_ladder(fits)
+    fits(step)
+    pages, artifact = probes[step]
+    return fit_preset_preferences(style_preferences, step), pages, artifact
+
+
+# --- Handle Auto-fit DOCX ---
+def generate_docx_auto_fit(
+    template_name: str,
+    resume_data: Dict[str, Any],
+    style_preferences: Dict[str, Any] | None = None,
+    max_pages: int = 1,
+) -> Tuple[bytes, Dict[str, Any], int]:
+    from docx import Document
+
+    from .word.docx_page_fit import document_height_pt, estimated_pages
+
+    export_slug = docx_export_template_slug(template_name)
+
+    def measure(preferences: Dict[str, Any]) -> Tuple[int, bytes]:
+        data = generate_docx(template_name, resume_data, preferences)
+        doc = Document(BytesIO(data))
+        family = resolve_styles(export_slug, preferences).docx.font_primary
+        return estimated_pages(document_height_pt(doc, family), doc.sections[0]), data
+
+    preferences, pages, data = _fit(export_slug, style_preferences, measure, max_pages)
+    return data, preferences, pages
+
+
+# --- Handle Auto-fit PDF ---
+def _pdf_margins_in(slug: str, preferences: Dict[str, Any]) -> Dict[str, float]:
+    # Same page margins as convert_html_to_pdf_sync.
+    if load_layout_profile(slug) in (LAYOUT_SIDEBAR_SPLIT, LAYOUT_TIMELINE_SPLIT):
+        return {"top": 0.0, "right": 0.0, "bottom": 0.0, "left": 0.0}
+    style = resolve_styles(slug, preferences).docx
+    return {
+        "top": style.margin_top_in,
+        "right": style.margin_right_in,
+        "bottom": style.margin_bottom_in,
+        "left": style.margin_left_in,
+    }
+
+
+def _fit_pdf_on_page(
+    page,
+    slug: str,
+    html_content: str,
+    style_preferences: Dict[str, Any] | None,
+    max_pages: int,
+) -> Tuple[bytes, Dict[str, Any], int]:
+    # The whole search on one Playwright page: load once, probe by swapping tokens, print.
+    page.emulate_media(media="print")
+    # assets are inline (shared/assets.py): wait for fonts + a painted frame, not the network.
+    page.set_content(html_content, wait_until="load")
+    page.evaluate(RENDERED_JS)
+
+    def measure(preferences: Dict[str, Any]) -> Tuple[int, Dict[str, float]]:
+        margins = _pdf_margins_in(slug, preferences)
+        width_px = (_PAGE_WIDTH_IN - margins["left"] - margins["right"]) * _PX_PER_IN
+        body_px = (_PAGE_HEIGHT_IN - margins["top"] - margins["bottom"]) * _PX_PER_IN
+        page.set_viewport_size({"width": int(round(width_px)), "height": int(round(body_px))})
+        height_px = page.evaluate(_SWAP_AND_MEASURE_JS, resolve_styles(slug, preferences).rootCss)
+        return max(1, math.ceil(height_px / (body_px * PDF_FIT_SAFETY))), margins
+
+    preferences, pages, margins = _fit(slug, style_preferences, measure, max_pages)
+    # The last probe may not be the chosen one; put its tokens back before printing.
+    measure(preferences)
+    pdf = page.pdf(
+        format="Letter",
+        print_background=True,
+        margin={side: f"{inches}in" for side, inches in margins.items()},
+    )
+    return pdf, preferences, pages
+
+
+def generate_pdf_auto_fit_sync(
+    template_name: str,
+    resume_data: Dict[str, Any],
+    style_preferences: Dict[str, Any] | None = None,
+    max_pages: int = 1,
+) -> Tuple[bytes, Dict[str, Any], int]:
+    from playwright.sync_api import sync_playwright
+
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+    slug = normalize_template_slug(template_name)
+    html_content = generate_resume(template_name, resume_data, style_preferences)
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch()
+        try:
+            return _fit_pdf_on_page(browser.new_page(), slug, html_content, style_preferences, max_pages)
+        finally:
+            browser.close()
+
+
+async def generate_pdf_auto_fit(
+    template_name: str,
+    resume_data: Dict[str, Any],
+    style_preferences: Dict[str, Any] | None = None,
+    max_pages: int = 1,
+) -> Tuple[bytes, Dict[str, Any], int]:
+    if pdf_renderer_mode == "launch":
+        return await asyncio.to_thread(
+            generate_pdf_auto_fit_sync, template_name, resume_data, style_preferences, max_pages
+        )
+    # Warm path: the search runs on a page of the renderer thread's browser (network refused).
+    slug = normalize_template_slug(template_name)
+    html_content = generate_resume(template_name, resume_data, style_preferences)
+    return await pdf_renderer.run(
+        lambda warm: warm.on_page(
+            lambda page: _fit_pdf_on_page(page, slug, html_content, style_preferences, max_pages)
+        )
+    )
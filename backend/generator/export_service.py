@@ -0,0 +1,62 @@
+# Runs DOCX builds off the event loop, in a pool of pre-started worker processes.
+
+# generate_resume_docx is an async route, but python-docx / lxml work is CPU-bound and holds
+# the GIL: a sidebar or timeline export is a few hundred ms of the event loop, and parallel
+# exports queued behind each other. Each build now runs in the shared worker pool
+# (worker_pool.py, also behind resume_parser/parse_service.py), with its per-build timeout
+# and bounded queue; past the queue, callers get DocxBusyError (-> 503). Workers keep their
+# own DOCX base-package caches (word/docx_base.py), so after a worker's first export of a
+# template it is warm.
+
+import os
+
+from worker_pool import PoolBusyError, PoolCrashedError, PoolTimeoutError, WorkerPool
+
+from .auto_fit import generate_docx_auto_fit
+from .pipeline import generate_docx
+
+# DOCX_EXPORT_WORKERS=0 builds in a thread instead (still off the loop; for dev / tests).
+exportWorkers = int(os.getenv("DOCX_EXPORT_WORKERS", str(min(4, os.cpu_count() or 1))))
+exportQueueSize = int(os.getenv("DOCX_EXPORT_QUEUE", "16"))
+exportTimeoutSeconds = float(os.getenv("DOCX_EXPORT_TIMEOUT_SECONDS", "15"))
+# seconds a refused caller is told to wait.
+retryAfterSeconds = 2
+
+
+class DocxBusyError(PoolBusyError):
+    """Too many exports running or queued; the caller should retry later."""
+
+
+class DocxTimeoutError(PoolTimeoutError):
+    """The build ran past its time budget and was stopped."""
+
+
+class DocxCrashedError(PoolCrashedError):
+    """The worker died mid-build."""
+
+
+def warm_worker():
+    # python-docx, lxml and the builders come in with the pipeline import; the builder
+    # modules are imported lazily by generate_docx, so pull them in now.
+    from .word import docx_builder  # noqa: F401
+
+
+class DocxExportService(WorkerPool):
+    jobName = "[DOCX] export"
+    busyError = DocxBusyError
+    timeoutError = DocxTimeoutError
+    crashedError = DocxCrashedError
+
+    def __init__(self, workers=exportWorkers, queueSize=exportQueueSize, timeoutSeconds=exportTimeoutSeconds):
+        super().__init__(workers, queueSize, timeoutSeconds, warm_worker)
+
+    async def build(self, template, resumeData, style=None):
+        """generate_docx off the event loop. Raises DocxBusyError / DocxTimeoutError / DocxCrashedError."""
+        return await self.run(f"template={template}", generate_docx, template, resumeData, style)
+
+    async def build_fitted(self, template, resumeData, style=None, maxPages=1):
+        """generate_docx_auto_fit off the event loop: (docx, chosen preferences, pages). Same errors as build."""
+        return await self.run(f"template={template}", generate_docx_auto_fit, template, resumeData, style, maxPages)
+
+
+docxExports = DocxExportService()
@@ -0,0 +1,280 @@
+# Warm PDF rendering: one long-lived browser, one page per template shell, content swapped in place.
+
+# convert_html_to_pdf_sync used to launch Chromium for every PDF and load the document with
+# set_content(wait_until="networkidle"): a browser start, a full parse of the template CSS, and
+# networkidle's 500 ms quiet window, every time. Here:
+# - a renderer thread owns a browser for the life of the process (Playwright's sync API is
+#   bound to the thread that started it, so every call is handed to that thread).
+# - each distinct template shell (the document with its <title>, :root tokens and <body> emptied,
+#   i.e. template.html + preview.css) keeps a page with that shell loaded.
+# - a render injects only the title, the token CSS and the body with page.evaluate, then waits
+#   on document.fonts.ready, image decodes and two animation frames (the frame after layout
+#   has painted) before page.pdf - no networkidle.
+# A page that errors is thrown away and the render retried once on a fresh one.
+# Every PDF (auto-fit included) runs on that one thread, so the queue in front of it is bounded
+# (PdfBusyError -> 503 past it) and a caller that stops waiting cancels its queued job.
+# Opt-in with PDF_RENDERER=warm: launch (a browser per PDF) stays the default until the warm
+# path has been benchmarked (scripts/bench_pdf_render.py) and checked against it in Chromium.
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import queue
+import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Tuple
+
+from .preview_fragments import split_tokens
+
+logger = logging.getLogger(__name__)
+
+pdf_renderer_mode = os.getenv("PDF_RENDERER", "launch").strip().lower()
+# Template shells kept loaded (there are 8 templates; user CSS variants share a shell).
+warm_page_limit = int(os.getenv("PDF_WARM_PAGE_LIMIT", "8"))
+# Playwright timeout for each step of a render, and the most a caller waits on the thread.
+RENDER_TIMEOUT_MS = 15000
+RENDER_WAIT_SECONDS = 60
+# PDFs running or waiting on the renderer thread; past it, callers get PdfBusyError (-> 503).
+render_queue_size = int(os.getenv("PDF_RENDER_QUEUE", "8"))
+# seconds a refused caller is told to wait.
+RETRY_AFTER_SECONDS = 2
+
+# Templates ship their assets inline (shared/assets.py); anything still reaching for the
+# network is refused rather than waited on.
+_NETWORK_RE = re.compile(r"^(https?|ftp)://", re.I)
+
+_TITLE_RE = re.compile(r"(<title>)(.*?)(</title>)", re.S | re.I)
+_BODY_RE = re.compile(r"(<body[^>]*>)(.*)(</body>)", re.S | re.I)
+
+# Resolves once fonts used by the (laid out) document are loaded and a frame has painted.
+_WAIT_RENDERED = """
+    void document.body.offsetHeight;
+    await document.fonts.ready;
+    await Promise.all(Array.from(document.images, (img) => img.decode().catch(() => null)));
+    await new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+    return true;
+"""
+
+RENDERED_JS = "async () => {" + _WAIT_RENDERED + "}"
+
+# Tokens go in their own <style> ahead of the template's, so the cascade order is unchanged.
+_SWAP_JS = """async ({title, tokens, body}) => {
+    let el = document.getElementById("rt-tokens");
+    if (!el) {
+        el = document.createElement("style");
+        el.id = "rt-tokens";
+        document.head.insertBefore(el, document.head.firstChild);
+    }
+    el.textContent = tokens;
+    const titleEl = document.querySelector("title");
+    if (titleEl) titleEl.innerHTML = title;
+    document.body.innerHTML = body;""" + _WAIT_RENDERED + "}"
+
+
+# --- Handle Document Split ---
+def split_document(html: str) -> Tuple[str, str, str, str] | None:
+    # (shell, title, token CSS, body) or None when the document has no <title> / <body> to swap.
+    html, tokens = split_tokens(html)
+    title = _TITLE_RE.search(html)
+    body = _BODY_RE.search(html)
+    if title is None or body is None or title.start() > body.start():
+        return None
+    shell = (
+        html[: title.end(1)] + html[title.start(3) : body.end(1)] + html[body.start(3) :]
+    )
+    return shell, title.group(2), tokens, body.group(2)
+
+
+# --- Handle Renderer Thread ---
+class _WarmBrowser:
+    # Lives entirely on one renderer thread.
+
+    def __init__(self, playwright) -> None:
+        self.playwright = playwright
+        self.browser = None
+        self.pages: OrderedDict[str, object] = OrderedDict()
+
+    def _browser(self):
+        if self.browser is None or not self.browser.is_connected():
+            self.pages.clear()
+            self.browser = self.playwright.chromium.launch()
+        return self.browser
+
+    def _new_page(self):
+        page = self._browser().new_page()
+        page.set_default_timeout(RENDER_TIMEOUT_MS)
+        page.route(_NETWORK_RE, lambda route: route.abort())
+        return page
+
+    def _drop(self, key: str) -> None:
+        page = self.pages.pop(key, None)
+        if page is not None:
+            try:
+                page.close()
+            except Exception:
+                pass
+
+    def _shell_page(self, key: str, shell: str):
+        page = self.pages.get(key)
+        if page is not None:
+            self.pages.move_to_end(key)
+            return page
+        page = self._new_page()
+        # the shell has no content yet; "load" covers the template's own stylesheets and images.
+        page.set_content(shell, wait_until="load")
+        self.pages[key] = page
+        while len(self.pages) > warm_page_limit:
+            self._drop(next(iter(self.pages)))
+        return page
+
+    def _render_cold(self, html: str, margin: Dict[str, str]) -> bytes:
+        page = self._new_page()
+        try:
+            page.set_content(html, wait_until="load")
+            page.evaluate(RENDERED_JS)
+            return page.pdf(format="Letter", print_background=True, margin=margin)
+        finally:
+            page.close()
+
+    def render(self, html: str, margin: Dict[str, str]) -> bytes:
+        parts = split_document(html)
+        if parts is None:
+            return self._render_cold(html, margin)
+        shell, title, tokens, body = parts
+        key = hashlib.sha1(shell.encode("utf-8")).hexdigest()
+        for attempt in range(2):
+            try:
+                page = self._shell_page(key, shell)
+                page.evaluate(_SWAP_JS, {"title": title, "tokens": tokens, "body": body})
+                return page.pdf(format="Letter", print_background=True, margin=margin)
+            except Exception:
+                # a crashed / wedged page (or browser): start over from a fresh one, once.
+                self._drop(key)
+                if attempt:
+                    raise
+                logger.warning("[PDF] warm page failed; retrying on a fresh page", exc_info=True)
+
+    def on_page(self, function: Callable[[Any], Any]) -> Any:
+        # function(page) on a fresh page of the warm browser (network refused), closed after.
+        page = self._new_page()
+        try:
+            return function(page)
+        finally:
+            page.close()
+
+    def close(self) -> None:
+        for key in list(self.pages):
+            self._drop(key)
+        if self.browser is not None:
+            try:
+                self.browser.close()
+            except Exception:
+                pass
+            self.browser = None
+
+
+class PdfBusyError(Exception):
+    """Too many PDFs running or queued on the renderer; the caller should retry later."""
+
+
+class WarmPdfRenderer:
+
+    def __init__(self, max_pending: int = render_queue_size) -> None:
+        # jobs are (function(warm browser), future); None stops the thread.
+        self.jobs: queue.Queue = queue.Queue()
+        self.thread: threading.Thread | None = None
+        self.lock = threading.Lock()
+        self.max_pending = max_pending
+        self.pending = 0
+
+    def _ensure_started(self) -> None:
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="pdf-renderer", daemon=True)
+                self.thread.start()
+
+    def stop(self) -> None:
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                self.jobs.put(None)
+            self.thread = None
+
+    def _release(self, future: Future) -> None:
+        with self.lock:
+            self.pending -= 1
+
+    def submit(self, function: Callable[[_WarmBrowser], Any]) -> Future:
+        """Queue function(warm browser) for the renderer thread. Raises PdfBusyError when full."""
+        # backpressure: every PDF runs on the one thread, so past a few waiting, refuse.
+        with self.lock:
+            if self.pending >= self.max_pending:
+                raise PdfBusyError()
+            self.pending += 1
+        future: Future = Future()
+        future.add_done_callback(self._release)
+        self._ensure_started()
+        self.jobs.put((function, future))
+        return future
+
+    def render(self, html: str, margin: Dict[str, str]) -> bytes:
+        """Print html to a Letter PDF on the renderer thread (blocks the caller until done)."""
+        future = self.submit(lambda warm: warm.render(html, margin))
+        try:
+            return future.result(timeout=RENDER_WAIT_SECONDS)
+        except FutureTimeoutError:
+            # nobody is waiting any more: a job still queued is skipped, not rendered.
+            future.cancel()
+            raise
+
+    async def run(self, function: Callable[[_WarmBrowser], Any]) -> Any:
+        """function(warm browser) on the renderer thread, awaited without holding a thread."""
+        # wait_for cancels the wrapped future on timeout, so a queued job is skipped.
+        return await asyncio.wait_for(asyncio.wrap_future(self.submit(function)), RENDER_WAIT_SECONDS)
+
+    async def render_async(self, html: str, margin: Dict[str, str]) -> bytes:
+        return await self.run(lambda warm: warm.render(html, margin))
+
+    def _run(self) -> None:
+        from playwright.sync_api import sync_playwright
+
+        # On Windows, Playwright needs ProactorEventLoop for subprocess support.
+        if sys.platform == "win32":
+            asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+        try:
+            with sync_playwright() as playwright:
+                warm = _WarmBrowser(playwright)
+                try:
+                    while True:
+                        job = self.jobs.get()
+                        if job is None:
+                            return
+                        function, future = job
+                        if not future.set_running_or_notify_cancel():
+                            continue
+                        try:
+                            future.set_result(function(warm))
+                        except Exception as e:
+                            future.set_exception(e)
+                finally:
+                    warm.close()
+        except Exception as e:
+            # Playwright itself failed to start: fail whatever is waiting; the next call retries.
+            logger.error("[PDF] renderer thread stopped: %s", e)
+            while True:
+                try:
+                    job = self.jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is not None and job[1].set_running_or_notify_cancel():
+                    job[1].set_exception(e)
+
+
+pdf_renderer = WarmPdfRenderer()
@@ -9,9 +9,8 @@ import sys
 from datetime import datetime
 
 # local imports.
-from .shared.styles import get_styles
-from .shared.resume_tokens import build_resume_tokens_css, load_resume_token_dict
-from .shared.style_presets import merge_resume_token_overrides
+from .shared.assets import inline_template_assets
+from .shared.styles import get_styles, resolve_styles
 from .layouts import (
     LAYOUT_EARLY_CAREER,
     LAYOUT_PROJECT_FORWARD,
@@ -29,6 +28,8 @@ from .layouts.project_forward import project_forward_body_order
 from .layouts.early_career import early_career_body_order
 from .layouts.timeline_split import timeline_main_column_order
 from .shared.template_slug import normalize_template_slug, resolve_template_folder
+from .preview_fragments import cached_fragment, mark_tokens
+from .pdf_renderer import pdf_renderer, pdf_renderer_mode
 
 # HTML fragment generators (preview / pdf)
 from .html import (
@@ -103,34 +104,47 @@ def build_sections_map(
     elif layout_profile in (LAYOUT_PROJECT_FORWARD, LAYOUT_TIMELINE_SPLIT):
         project_variant = "project_forward"
 
+    # Each section is memoized on its own data + title (preview_fragments.py).
     summary = resume_data.get("summary")
-    if summary is not None:
+
+    def _summary_html() -> str:
         summary_text = summary.get("summary", "") if isinstance(summary, dict) else ""
         summary_content = ""
         if summary_text and summary_text.strip():
             summary_content = f'<div class="summary-section">{summary_text}</div>'
-        sections_map["summary"] = _build_section(titles["summary"], summary_content)
+        return _build_section(titles["summary"], summary_content)
+
+    if summary is not None:
+        sections_map["summary"] = cached_fragment(layout_profile, "summary", summary, titles["summary"], _summary_html)
     else:
         sections_map["summary"] = ""
 
     education = resume_data.get("education") or []
-    education_entries = [build_education_entry(edu) for edu in education]
-    sections_map["education"] = _build_section(titles["education"], "\n".join(education_entries))
+    sections_map["education"] = cached_fragment(
+        layout_profile, "education", education, titles["education"],
+        lambda: _build_section(titles["education"], "\n".join(build_education_entry(edu) for edu in education)),
+    )
 
     experience = resume_data.get("experience") or []
-    experience_entries = [build_experience_entry(exp) for exp in experience]
-    sections_map["experience"] = _build_section(titles["experience"], "\n".join(experience_entries))
+    sections_map["experience"] = cached_fragment(
+        layout_profile, "experience", experience, titles["experience"],
+        lambda: _build_section(titles["experience"], "\n".join(build_experience_entry(exp) for exp in experience)),
+    )
 
     projects = resume_data.get("projects") or []
-    project_entries = [
-        build_project_entry(proj, variant=project_variant) for proj in projects
-    ]
-    sections_map["projects"] = _build_section(titles["projects"], "\n".join(project_entries))
+    sections_map["projects"] = cached_fragment(
+        layout_profile, "projects", projects, titles["projects"],
+        lambda: _build_section(
+            titles["projects"], "\n".join(build_project_entry(proj, variant=project_variant) for proj in projects)
+        ),
+    )
 
     skills = resume_data.get("skills") or []
     skills_category_order = resume_data.get("skillsCategoryOrder") or []
-    skill_entries_html = build_skill_entry(skills, skills_category_order)
-    sections_map["skills"] = _build_section(titles["skills"], skill_entries_html)
+    sections_map["skills"] = cached_fragment(
+        layout_profile, "skills", [skills, skills_category_order], titles["skills"],
+        lambda: _build_section(titles["skills"], build_skill_entry(skills, skills_category_order)),
+    )
 
     return sections_map
 
@@ -152,26 +166,34 @@ def _body_section_order(resume_data: Dict[str, Any], layout_profile: str | None
 def _sidebar_rail_skills_section(resume_data: Dict[str, Any]) -> str:
     skills = resume_data.get("skills") or []
     order = resume_data.get("skillsCategoryOrder") or []
-    inner = build_skill_entry_rail(skills, order)
-    if not inner.strip():
-        return ""
     titles = _section_titles(resume_data)
-    return _build_section(titles["skills"], inner)
+
+    def _build() -> str:
+        inner = build_skill_entry_rail(skills, order)
+        if not inner.strip():
+            return ""
+        return _build_section(titles["skills"], inner)
+
+    return cached_fragment("rail", "rail-skills", [skills, order], titles["skills"], _build)
 
 
 # Builds sidebar rail education section from resume data.
 def _sidebar_rail_education_section(resume_data: Dict[str, Any]) -> str:
     """Education in the rail uses build_education_entry_rail (tighter than full education-entry)."""
     education = resume_data.get("education") or []
-    entries: list = []
-    for edu in education:
-        frag = build_education_entry_rail(edu if isinstance(edu, dict) else {})
-        if frag and frag.strip():
-            entries.append(frag)
-    if not entries:
-        return ""
     titles = _section_titles(resume_data)
-    return _build_section(titles["education"], "\n".join(entries))
+
+    def _build() -> str:
+        entries: list = []
+        for edu in education:
+            frag = build_education_entry_rail(edu if isinstance(edu, dict) else {})
+            if frag and frag.strip():
+                entries.append(frag)
+        if not entries:
+            return ""
+        return _build_section(titles["education"], "\n".join(entries))
+
+    return cached_fragment("rail", "rail-education", education, titles["education"], _build)
 
 
 def _timeline_contact_section(
@@ -358,16 +380,14 @@ def generate_resume(
     with open(styles_path, 'r', encoding='utf-8') as file:
         styles = file.read()
 
-    # Normalize template slug and load resume tokens.
-    slug = normalize_template_slug(template_name)
-    raw_tokens = load_resume_token_dict(template_name)
+    # Inline the template's own fonts / images (fonts/...) so the document fetches nothing.
+    styles = inline_template_assets(styles, folder)
 
-    # Merge resume tokens and build resume tokens CSS.
-    token_dict = merge_resume_token_overrides(slug, raw_tokens, style_preferences)
-    token_css = build_resume_tokens_css(token_dict)
+    # Merged resume tokens as :root CSS (resolved once, shared with the PDF margins and Word).
+    token_css = resolve_styles(template_name, style_preferences).rootCss
 
-    # Replace {{template_css}} placeholder with styles.
-    html_template = html_template.replace("{{template_css}}", token_css + styles)
+    # Replace {{template_css}} placeholder with styles (tokens marked for the live preview session).
+    html_template = html_template.replace("{{template_css}}", mark_tokens(token_css) + styles)
 
     # Fill template based on placeholders.
     profile = load_layout_profile(template_name)
@@ -378,6 +398,24 @@ def generate_resume(
     # Return filled document.
     return filled_html
 
+# PDF page margins for a template + style.
+def pdf_page_margin(
+    template_name: str | None = None,
+    style_preferences: Dict[str, Any] | None = None,
+) -> Dict[str, str]:
+    slug = normalize_template_slug(template_name)
+
+    # Split layouts draw a full Letter canvas and own their page inset in CSS.
+    if load_layout_profile(slug) in (LAYOUT_SIDEBAR_SPLIT, LAYOUT_TIMELINE_SPLIT):
+        return {"top": "0", "right": "0", "bottom": "0", "left": "0"}
+    style = get_styles(slug, style_preferences)
+    return {
+        "top": f"{style.margin_top_in}in",
+        "right": f"{style.margin_right_in}in",
+        "bottom": f"{style.margin_bottom_in}in",
+        "left": f"{style.margin_left_in}in",
+    }
+
 # Converts HTML to PDF synchronously.
 def convert_html_to_pdf_sync(
     html_content: str,
@@ -390,20 +428,11 @@ def convert_html_to_pdf_sync(
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
-    slug = normalize_template_slug(template_name)
-    style = get_styles(slug, style_preferences)
-    layout_profile = load_layout_profile(slug)
+    margin = pdf_page_margin(template_name, style_preferences)
 
-    # Split layouts draw a full Letter canvas and own their page inset in CSS.
-    if layout_profile in (LAYOUT_SIDEBAR_SPLIT, LAYOUT_TIMELINE_SPLIT):
-        margin = {"top": "0", "right": "0", "bottom": "0", "left": "0"}
-    else:
-        margin = {
-            "top": f"{style.margin_top_in}in",
-            "right": f"{style.margin_right_in}in",
-            "bottom": f"{style.margin_bottom_in}in",
-            "left": f"{style.margin_left_in}in",
-        }
+    # Warm path: the long-lived renderer swaps this document into a page with the template loaded.
+    if pdf_renderer_mode != "launch":
+        return pdf_renderer.render(html_content, margin)
 
     # Keep browser/page/pdf inside `with` — exiting early stops Playwright and causes
     # "Event loop is closed! Is Playwright already stopped?" on page.pdf().
@@ -430,6 +459,10 @@ async def generate_pdf(
     # Generate HTML resume.
     html_content = generate_resume(template_name, resume_data, style_preferences)
 
+    # Warm path: awaited on the renderer thread, no worker thread held while the PDF queues.
+    if pdf_renderer_mode != "launch":
+        return await pdf_renderer.render_async(html_content, pdf_page_margin(template_name, style_preferences))
+
     # Generate PDF from HTML content using thread pool (fixes Windows asyncio issue).
     pdf_bytes = await asyncio.to_thread(
         convert_html_to_pdf_sync,
@@ -0,0 +1,120 @@
+# Section fragments for the live preview: memoized section HTML + incremental re-render.
+
+# The editor posts the whole resume to /preview on every (debounced) keystroke, and every
+# section used to be rebuilt through the build_*_entry helpers even when one bullet changed.
+# - cached_fragment memoizes each section's HTML on (layout profile, section key, hash of
+#   that section's data, its title), so unchanged sections are a dict lookup.
+# - Each section's HTML is wrapped in comment markers (<!--rt:key-->...<!--/rt:key-->);
+#   comments don't take part in layout, so the preview / PDF render the same.
+# - patch_preview compares a render against an earlier one (by render id): when everything
+#   outside the markers is unchanged, only the changed sections are sent back for the client
+#   to splice in between the same markers; otherwise the full document is.
+# - The :root token CSS is marked the same way with CSS comments (/*rt:tokens*/.../*/rt:tokens*/)
+#   so the live preview session can send it on its own when only the style changed.
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+
+# Built sections held at once (a resume has ~7; a few hundred editors' worth).
+fragmentCacheSize = 2048
+# Render ids remembered for patching.
+renderStateSize = 1024
+
+sectionMarkers = re.compile(r"<!--rt:([a-z-]+)-->(.*?)<!--/rt:\1-->", re.S)
+tokenMarkers = re.compile(r"/\*rt:tokens\*/(.*?)/\*/rt:tokens\*/", re.S)
+
+fragmentCache = OrderedDict()
+renderStates = OrderedDict()
+cacheLock = threading.Lock()
+
+
+def content_digest(value):
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def remember(store, key, value, limit):
+    with cacheLock:
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > limit:
+            store.popitem(last=False)
+
+
+# --- Handle Fragment Cache ---
+def cached_fragment(layoutProfile, sectionKey, data, title, build):
+    # build() -> the section's HTML ("" when empty), marked and memoized.
+    key = (layoutProfile, sectionKey, content_digest(data), title)
+    with cacheLock:
+        html = fragmentCache.get(key)
+        if html is not None:
+            fragmentCache.move_to_end(key)
+            return html
+    html = build()
+    if html:
+        html = f"<!--rt:{sectionKey}-->{html}<!--/rt:{sectionKey}-->"
+    remember(fragmentCache, key, html, fragmentCacheSize)
+    return html
+
+
+def clear_fragment_cache():
+    with cacheLock:
+        fragmentCache.clear()
+        renderStates.clear()
+
+
+def mark_tokens(css):
+    return f"/*rt:tokens*/{css}/*/rt:tokens*/"
+
+
+# --- Handle Render Ids ---
+def split_fragments(html):
+    # (the document with every marked section emptied, section key -> section HTML).
+    fragments = {}
+
+    def empty_section(match):
+        fragments[match.group(1)] = match.group(2)
+        return f"<!--rt:{match.group(1)}--><!--/rt:{match.group(1)}-->"
+
+    skeleton = sectionMarkers.sub(empty_section, html)
+    return skeleton, fragments
+
+
+def split_tokens(html):
+    # (the document with the marked token CSS emptied, that CSS).
+    tokens = []
+
+    def empty_tokens(match):
+        tokens.append(match.group(1))
+        return mark_tokens("")
+
+    return tokenMarkers.sub(empty_tokens, html, count=1), "".join(tokens)
+
+
+def register_render(html):
+    # Remember a render's skeleton + section hashes; returns its render id.
+    skeleton, fragments = split_fragments(html)
+    renderId = hashlib.sha1(html.encode("utf-8")).hexdigest()[:20]
+    state = (content_digest(skeleton), {key: content_digest(fragment) for key, fragment in fragments.items()})
+    remember(renderStates, renderId, state, renderStateSize)
+    return renderId
+
+
+# --- Handle Patch ---
+def patch_preview(html, previousRenderId):
+    # {"renderId", "full": True, "html"} or {"renderId", "full": False, "sections": {key: html}}.
+    renderId = register_render(html)
+    with cacheLock:
+        previous = renderStates.get(previousRenderId) if previousRenderId else None
+    skeleton, fragments = split_fragments(html)
+    if previous is None or previous[0] != content_digest(skeleton) or set(previous[1]) != set(fragments):
+        return {"renderId": renderId, "full": True, "html": html}
+    changed = {
+        key: fragment
+        for key, fragment in fragments.items()
+        if previous[1][key] != content_digest(fragment)
+    }
+    return {"renderId": renderId, "full": False, "sections": changed}
@@ -0,0 +1,267 @@
+# Live preview over a WebSocket: the resume lives server-side, edits arrive as JSON-patch deltas.
+
+# /preview/patch still has the editor post the whole resume on every debounced keystroke. A
+# preview session keeps {"template", "resume_data", "style"} for the connection instead:
+# - the client sends {"type": "init", ...} once, then {"type": "patch", "ops": [...]} with RFC
+#   6902 operations against that document (e.g. replace /resume_data/experience/0/title).
+# - bursts are coalesced: a render waits until edits pause for the debounce window (capped at
+#   the max wait), so a fast typist gets one render per pause, not one per keystroke.
+# - each render is diffed against the last one sent (preview_fragments markers): only changed
+#   sections go back, plus the :root token CSS when (and only when) it changed, i.e. when the
+#   style preferences did. Anything else outside the markers changing sends the full document.
+# Every message may carry "seq"; replies echo the last seq they include, so the client knows
+# which of its edits the preview reflects.
+
+import asyncio
+import contextlib
+import copy
+import hashlib
+import logging
+import os
+
+from .pipeline import generate_resume
+from .preview_fragments import split_fragments, split_tokens
+
+logger = logging.getLogger(__name__)
+
+# Quiet time after an edit before rendering, and the longest a burst can hold a render back.
+previewDebounceSeconds = float(os.getenv("PREVIEW_WS_DEBOUNCE_MS", "120")) / 1000
+previewMaxWaitSeconds = float(os.getenv("PREVIEW_WS_MAX_WAIT_MS", "600")) / 1000
+# Operations accepted in one patch message.
+maxPatchOps = 500
+
+
+class PreviewPatchError(ValueError):
+    """A patch that can't be applied; the client should re-send its state with "init"."""
+
+
+# --- Handle JSON Pointer ---
+def pointer_parts(path):
+    if not isinstance(path, str) or (path and not path.startswith("/")):
+        raise PreviewPatchError(f"invalid path: {path!r}")
+    if not path:
+        return []
+    return [part.replace("~1", "/").replace("~0", "~") for part in path[1:].split("/")]
+
+
+def array_index(container, token, allowEnd):
+    if allowEnd and token == "-":
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token.startswith("0")):
+        raise PreviewPatchError(f"invalid array index: {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allowEnd):
+        raise PreviewPatchError(f"array index out of range: {token}")
+    return index
+
+
+def resolve_parent(document, parts):
+    target = document
+    for token in parts[:-1]:
+        if isinstance(target, dict) and token in target:
+            target = target[token]
+        elif isinstance(target, list):
+            target = target[array_index(target, token, allowEnd=False)]
+        else:
+            raise PreviewPatchError(f"path not found: /{'/'.join(parts)}")
+    return target, parts[-1]
+
+
+def get_value(document, parts):
+    if not parts:
+        return document
+    parent, token = resolve_parent(document, parts)
+    if isinstance(parent, dict) and token in parent:
+        return parent[token]
+    if isinstance(parent, list):
+        return parent[array_index(parent, token, allowEnd=False)]
+    raise PreviewPatchError(f"path not found: /{'/'.join(parts)}")
+
+
+def add_value(document, parts, value):
+    if not parts:
+        return value
+    parent, token = resolve_parent(document, parts)
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(array_index(parent, token, allowEnd=True), value)
+    else:
+        raise PreviewPatchError(f"path not found: /{'/'.join(parts)}")
+    return document
+
+
+def remove_value(document, parts):
+    if not parts:
+        raise PreviewPatchError("can't remove the whole document")
+    parent, token = resolve_parent(document, parts)
+    if isinstance(parent, dict) and token in parent:
+        return document, parent.pop(token)
+    if isinstance(parent, list):
+        return document, parent.pop(array_index(parent, token, allowEnd=False))
+    raise PreviewPatchError(f"path not found: /{'/'.join(parts)}")
+
+
+# Apply RFC 6902 operations to a copy of the document.
+# In : Document, Operations
+# Out : Patched Document (the input is left alone if any operation fails)
+def apply_json_patch(document, operations):
+    if not isinstance(operations, list):
+        raise PreviewPatchError("ops must be a list")
+    if len(operations) > maxPatchOps:
+        raise PreviewPatchError(f"too many ops in one patch (max {maxPatchOps})")
+    patched = copy.deepcopy(document)
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise PreviewPatchError("each op must be an object")
+        op = operation.get("op")
+        parts = pointer_parts(operation.get("path"))
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise PreviewPatchError(f"{op} needs a value")
+        if op == "add":
+            patched = add_value(patched, parts, copy.deepcopy(operation["value"]))
+        elif op == "remove":
+            patched, _ = remove_value(patched, parts)
+        elif op == "replace":
+            if parts:
+                patched, _ = remove_value(patched, parts)
+            patched = add_value(patched, parts, copy.deepcopy(operation["value"]))
+        elif op in ("move", "copy"):
+            source = pointer_parts(operation.get("from"))
+            if op == "move":
+                if parts[: len(source)] == source and parts != source:
+                    raise PreviewPatchError("can't move a value into itself")
+                patched, value = remove_value(patched, source)
+            else:
+                value = copy.deepcopy(get_value(patched, source))
+            patched = add_value(patched, parts, value)
+        elif op == "test":
+            if get_value(patched, parts) != operation["value"]:
+                raise PreviewPatchError(f"test failed at {operation.get('path')}")
+        else:
+            raise PreviewPatchError(f"unknown op: {op!r}")
+    return patched
+
+
+# --- Handle Session State ---
+def text_digest(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class PreviewSession:
+
+    def __init__(self):
+        self.document = None
+        self.seq = None
+        # (skeleton digest, section key -> digest, token CSS digest) of the last render sent.
+        self.sent = None
+        # bumped by "init": a render that started before it must not become the diff base.
+        self.generation = 0
+
+    def apply(self, message):
+        """Apply one client message ("init" or "patch"). Raises PreviewPatchError."""
+        if not isinstance(message, dict):
+            raise PreviewPatchError("messages must be JSON objects")
+        kind = message.get("type")
+        if kind == "init":
+            style = message.get("style")
+            self.document = {
+                "template": message.get("template"),
+                "resume_data": message.get("resume_data") or {},
+                "style": style if isinstance(style, dict) else {},
+            }
+            self.sent = None
+            self.generation += 1
+        elif kind == "patch":
+            if self.document is None:
+                raise PreviewPatchError("patch before init")
+            patched = apply_json_patch(self.document, message.get("ops"))
+            if not isinstance(patched, dict) or not isinstance(patched.get("style", {}), dict):
+                raise PreviewPatchError("patch left the session without a valid document")
+            self.document = patched
+        else:
+            raise PreviewPatchError(f"unknown message type: {kind!r}")
+        if "seq" in message:
+            self.seq = message["seq"]
+
+    def render(self):
+        """Render the current state: a "full" or "patch" message, or None before init."""
+        # apply() swaps in a new document rather than editing it, so this snapshot holds still
+        # while render runs off the event loop and more edits arrive.
+        document, seq, generation, previous = self.document, self.seq, self.generation, self.sent
+        if document is None:
+            return None
+        style = document.get("style")
+        html = generate_resume(
+            document.get("template"),
+            document.get("resume_data") or {},
+            style if isinstance(style, dict) else {},
+        )
+        skeleton, fragments = split_fragments(html)
+        skeleton, css = split_tokens(skeleton)
+        state = (text_digest(skeleton), {key: text_digest(fragment) for key, fragment in fragments.items()}, text_digest(css))
+        if generation == self.generation:
+            self.sent = state
+
+        if previous is None or previous[0] != state[0] or set(previous[1]) != set(state[1]):
+            return {"type": "full", "seq": seq, "html": html}
+        message = {
+            "type": "patch",
+            "seq": seq,
+            "sections": {key: fragments[key] for key, digest in state[1].items() if previous[1][key] != digest},
+        }
+        if previous[2] != state[2]:
+            message["css"] = css
+        return message
+
+
+# --- Handle Connection Loop ---
+async def run_preview_session(receiveJson, sendJson, debounceSeconds=previewDebounceSeconds, maxWaitSeconds=previewMaxWaitSeconds):
+    # Runs until receiveJson raises (the connection closed).
+    session = PreviewSession()
+    edited = asyncio.Event()
+
+    async def render_loop():
+        loop = asyncio.get_running_loop()
+        while True:
+            await edited.wait()
+            deadline = loop.time() + maxWaitSeconds
+            # debounce: keep waiting while edits keep coming, up to the deadline.
+            while True:
+                edited.clear()
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(edited.wait(), min(debounceSeconds, remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                # generate_resume is CPU work; keep the event loop (and every other socket) free.
+                message = await asyncio.to_thread(session.render)
+            except Exception as e:
+                logger.warning("[PREVIEW] live render failed: %s", e)
+                message = {"type": "error", "seq": session.seq, "detail": "render failed", "resync": False}
+            if message is not None:
+                await sendJson(message)
+
+    renderer = asyncio.create_task(render_loop())
+    try:
+        while True:
+            try:
+                message = await receiveJson()
+            except (ValueError, TypeError, KeyError):
+                # a frame that isn't JSON text (or is binary): the client's state is unknown, have it re-init.
+                await sendJson({"type": "error", "seq": session.seq, "detail": "invalid JSON", "resync": True})
+                continue
+            try:
+                session.apply(message)
+            except PreviewPatchError as e:
+                # the client's copy and ours may have diverged; it should send "init" again.
+                await sendJson({"type": "error", "seq": session.seq, "detail": str(e), "resync": True})
+                continue
+            edited.set()
+    finally:
+        renderer.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await renderer
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+from .assets import external_references, inline_template_assets, preflight_template
+
 from .dates import format_date_month_year, format_date_range
 
 from .skills import skills_group_ordered
@@ -18,7 +20,7 @@ from .resume_tokens import (
 
 from .style_presets import merge_resume_token_overrides, user_style_to_token_overrides
 
-from .styles import get_styles
+from .styles import ResolvedStyles, clear_style_cache, get_styles, resolve_styles
 
 from .tagline import TAGLINE_INTERPUNCT, parse_tagline_runs
 
@@ -38,12 +40,18 @@ __all__ = [
     "skills_group_ordered",
     "apply_resume_tokens_to_docx_config",
     "build_resume_tokens_css",
+    "clear_style_cache",
+    "external_references",
     "get_styles",
+    "inline_template_assets",
     "load_resume_token_dict",
     "merge_resume_token_overrides",
     "normalize_template_slug",
+    "resolve_styles",
     "resolve_template_folder",
+    "ResolvedStyles",
     "TAGLINE_INTERPUNCT",
     "parse_tagline_runs",
+    "preflight_template",
     "user_style_to_token_overrides",
 ]
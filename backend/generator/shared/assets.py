@@ -0,0 +1,129 @@
+# Template assets for offline rendering: local fonts / images inlined, external fetches refused.
+
+# A PDF is only deterministic if everything the template draws with ships with it. Any
+# web font or remote image in preview.css / template.html made the renderer wait on the
+# network, and a PDF came out in a fallback font whenever the fetch failed.
+# - fonts (and images) a template needs live in its own folder (fonts/ by convention; see
+#   scripts/vendor_template_fonts.py, which subsets them to the characters resumes use).
+# - generate_resume inlines every relative url(...) in preview.css as a data URI, so the
+#   document is self-contained: no file:// or http fetches at render time.
+# - external_references / preflight_template report anything still fetched from the
+#   network; scripts/validate_templates.py fails on them, and the PDF renderer aborts any
+#   http(s) request a page makes anyway.
+
+import base64
+import mimetypes
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from .template_slug import resolve_template_folder
+
+fontsDirname = "fonts"
+
+mimeTypes = {
+    ".woff2": "font/woff2",
+    ".woff": "font/woff",
+    ".ttf": "font/ttf",
+    ".otf": "font/otf",
+    ".svg": "image/svg+xml",
+}
+
+cssUrlPattern = re.compile(r"""url\(\s*(["']?)([^"')]+)\1\s*\)""", re.I)
+cssImportPattern = re.compile(r"""@import\s+(?:url\(\s*)?["']?([^"');\s]+)""", re.I)
+# Elements the browser fetches for on its own (links the reader clicks, like <a href>, aren't fetches).
+htmlFetchPattern = re.compile(
+    r"""<(?:link|script|img|iframe|source|video|audio|embed|object|image|use)\b[^>]*?\b(?:href|src|srcset|data|poster)\s*=\s*(["']?)((?(1)(?:(?!\1).)*|[^\s>]+))\1""",
+    re.I,
+)
+styleBlockPattern = re.compile(r"<style\b[^>]*>(.*?)</style>", re.S | re.I)
+inlineStylePattern = re.compile(r"""\bstyle\s*=\s*(["'])(.*?)\1""", re.S | re.I)
+
+
+def is_external(url):
+    lowered = url.strip().lower()
+    return lowered.startswith(("http:", "https:", "//", "ftp:"))
+
+
+def is_local(url):
+    lowered = url.strip().lower()
+    return not (is_external(lowered) or lowered.startswith(("data:", "#", "about:", "blob:")))
+
+
+# --- Handle External References ---
+def external_references(text, kind="html"):
+    # Every URL a document (kind="html") or stylesheet (kind="css") would fetch from the network.
+    found = []
+    if kind == "css":
+        cssBlocks = [text]
+    else:
+        cssBlocks = styleBlockPattern.findall(text) + [m.group(2) for m in inlineStylePattern.finditer(text)]
+    for css in cssBlocks:
+        found.extend(m.group(2).strip() for m in cssUrlPattern.finditer(css) if is_external(m.group(2)))
+        found.extend(m.group(1).strip() for m in cssImportPattern.finditer(css) if is_external(m.group(1)))
+    if kind != "css":
+        for match in htmlFetchPattern.finditer(text):
+            candidates = (entry.strip().split(" ")[0] for entry in match.group(2).split(","))
+            found.extend(url for url in candidates if url and is_external(url))
+    return list(dict.fromkeys(found))
+
+
+# --- Handle Inlining ---
+def resolve_asset(folder, url):
+    # The file a relative url() points at, if it exists inside the template folder.
+    relative = url.split("#", 1)[0].split("?", 1)[0]
+    candidate = (folder / relative).resolve()
+    try:
+        candidate.relative_to(folder.resolve())
+    except ValueError:
+        return None
+    return candidate if candidate.is_file() else None
+
+
+@lru_cache(maxsize=128)
+def data_uri(path, mtimeNs, size):
+    # mtime / size are part of the key so a re-vendored font is picked up.
+    suffix = Path(path).suffix.lower()
+    mime = mimeTypes.get(suffix) or mimetypes.guess_type(path)[0] or "application/octet-stream"
+    payload = base64.b64encode(Path(path).read_bytes()).decode("ascii")
+    return f"data:{mime};base64,{payload}"
+
+
+def inline_template_assets(css, folder):
+    # Relative url(...)s in a template stylesheet -> data URIs (anything else is left alone).
+    if "url(" not in css.lower():
+        return css
+
+    def inline_url(match):
+        url = match.group(2).strip()
+        if not is_local(url):
+            return match.group(0)
+        path = resolve_asset(folder, url)
+        if path is None:
+            return match.group(0)
+        stat = path.stat()
+        fragment = "#" + url.split("#", 1)[1] if "#" in url else ""
+        return f'url("{data_uri(str(path), stat.st_mtime_ns, stat.st_size)}{fragment}")'
+
+    return cssUrlPattern.sub(inline_url, css)
+
+
+# --- Handle Preflight ---
+def preflight_template(templateName):
+    # Problems that would make a render touch the network or miss an asset; [] when clean.
+    folder = resolve_template_folder(templateName)
+    problems = []
+    for filename in ("template.html", "preview.css"):
+        path = folder / filename
+        if not path.is_file():
+            continue
+        text = path.read_text(encoding="utf-8")
+        kind = "css" if filename.endswith(".css") else "html"
+        for url in external_references(text, kind):
+            problems.append(f"{filename} fetches an external resource: {url}")
+        if filename == "preview.css":
+            for match in cssUrlPattern.finditer(text):
+                url = match.group(2).strip()
+                if is_local(url) and resolve_asset(folder, url) is None:
+                    problems.append(f"preview.css references a missing or out-of-folder asset: {url}")
+    return problems
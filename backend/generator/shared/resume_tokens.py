@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import fields
+from dataclasses import fields, replace
 from typing import Any, Dict
 
 from .template_slug import PRIMARY_TEMPLATE_SLUG, TEMPLATES_DIR, resolve_template_folder
@@ -38,9 +38,10 @@ def load_resume_token_dict(template_name: str) -> Dict[str, Any]:
 
 # Apply the resume tokens to the DocxStyleConfig.
 # In : DocxStyleConfig, Dictionary of Resume Tokens
-# Out : None
-def apply_resume_tokens_to_docx_config(cfg: DocxStyleConfig, tokens: Dict[str, Any]) -> None:
+# Out : DocxStyleConfig (a copy; the config is frozen)
+def apply_resume_tokens_to_docx_config(cfg: DocxStyleConfig, tokens: Dict[str, Any]) -> DocxStyleConfig:
     fmap = {f.name: f for f in fields(DocxStyleConfig)}
+    values = {}
     for key, val in tokens.items():
         if key not in fmap or val is None:
             continue
@@ -48,13 +49,14 @@ def apply_resume_tokens_to_docx_config(cfg: DocxStyleConfig, tokens: Dict[str, A
         if isinstance(val, bool) and f.type is not bool:
             continue
         if f.type is bool:
-            setattr(cfg, key, bool(val))
+            values[key] = bool(val)
         elif f.type is int:
-            setattr(cfg, key, int(val))
+            values[key] = int(val)
         elif f.type is float:
-            setattr(cfg, key, float(val))
+            values[key] = float(val)
         else:
-            setattr(cfg, key, val)
+            values[key] = val
+    return replace(cfg, **values)
 
 # Converts the resume token key to a CSS variable name.
 def _css_var_name(key: str) -> str:
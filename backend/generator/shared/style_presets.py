@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from ..layouts.registry import DEFAULT_LAYOUT_PROFILE, LAYOUT_EARLY_CAREER, LAYOUT_PROJECT_FORWARD, load_layout_profile
 
@@ -60,6 +60,35 @@ _CLASSIC_FONT_PAIRINGS: Dict[str, Dict[str, Any]] = {
     },
 }
 
+# --- Auto-fit ladder -------------------------------------------------------
+
+# Preset combinations for one-page (N-page) fitting, each step denser than the one before it
+# (line spacing first, then page margins, then type), so "fits" only ever flips from False to
+# True along the ladder and it can be binary-searched. Roomier presets ("tight" margins,
+# "relaxed" spacing, "large" type) never help content fit, so they aren't on it.
+FIT_PRESET_LADDER: List[Dict[str, str]] = [
+    {"marginPreset": "balanced", "lineSpacingPreset": "standard", "typeScalePreset": "standard"},
+    {"marginPreset": "balanced", "lineSpacingPreset": "compact", "typeScalePreset": "standard"},
+    {"marginPreset": "spacious", "lineSpacingPreset": "compact", "typeScalePreset": "standard"},
+    {"marginPreset": "spacious", "lineSpacingPreset": "compact", "typeScalePreset": "compact"},
+]
+
+# Whether the preset knobs do anything for this template (split layouts own their insets).
+def supports_fit_presets(template_name: Optional[str]) -> bool:
+    return _classic_single_column_engine(template_name)
+
+# The user's preferences with one ladder step's presets swapped in (font pairing etc. kept).
+def fit_preset_preferences(preferences: Optional[Dict[str, Any]], step: int) -> Dict[str, Any]:
+    out = {k: v for k, v in (preferences or {}).items() if k not in _FIT_PRESET_ALIASES}
+    out.update(FIT_PRESET_LADDER[step])
+    return out
+
+_FIT_PRESET_ALIASES = frozenset((
+    "marginPreset", "margin_preset",
+    "lineSpacingPreset", "line_spacing_preset",
+    "typeScalePreset", "type_scale_preset",
+))
+
 # Pick the first non-empty value from the list of keys.
 # In : Dictionary, List of Keys
 # Out : First Non-Empty Value.
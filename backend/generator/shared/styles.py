@@ -1,43 +1,120 @@
 # Export-agnostic style loading: merges resume tokens, presets, and template overrides into a DocxStyleConfig used by PDF margins and Word layout.
 
-from __future__ import annotations
+# Resolution is cached. One export used to resolve the same styles two or three times
+# (generate_resume's token merge + :root CSS, convert_html_to_pdf_sync's get_styles, the
+# Word builder's get_styles), each time re-reading resume_tokens.json / docx_styles.json.
+# resolve_styles keys on (template slug, canonical preferences, source file stamps), so a
+# repeat is a dict lookup, and editing a token file still takes effect on the next call.
 
 import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+from types import MappingProxyType
 
-from .resume_tokens import apply_resume_tokens_to_docx_config, load_resume_token_dict
+from .resume_tokens import TOKEN_FILENAME, apply_resume_tokens_to_docx_config, build_resume_tokens_css, load_resume_token_dict
 from .style_presets import merge_resume_token_overrides
-from .template_slug import PRIMARY_TEMPLATE_SLUG, normalize_template_slug, resolve_template_folder
+from .template_slug import PRIMARY_TEMPLATE_SLUG, TEMPLATES_DIR, normalize_template_slug, resolve_template_folder
 from ..word.docx_styles import DocxStyleConfig
 
+docxOverridesFilename = "docx_styles.json"
+
+# Distinct (template, preferences) pairs held at once.
+styleCacheSize = 256
+
+resolvedCache = OrderedDict()
+resolvedLock = threading.Lock()
+
+
+# Everything one export needs from its styles.
+@dataclass(frozen=True)
+class ResolvedStyles:
+    slug: str
+    docx: DocxStyleConfig
+    tokens: MappingProxyType
+    rootCss: str
+
+
+# --- Handle Cache Key ---
+def preferences_key(stylePreferences):
+    # None and {} resolve the same; key order doesn't matter.
+    return json.dumps(stylePreferences or {}, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def source_stamps(slug):
+    # (mtime, size) of every file resolution may read, including the classic fallbacks.
+    stamps = []
+    for folder in (resolve_template_folder(slug), TEMPLATES_DIR / PRIMARY_TEMPLATE_SLUG):
+        for filename in (TOKEN_FILENAME, docxOverridesFilename):
+            try:
+                stat = Path(folder, filename).stat()
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamps.append(None)
+    return tuple(stamps)
+
+
+# --- Handle Template Overrides ---
+def load_docx_overrides(slug):
+    overridePath = resolve_template_folder(slug) / docxOverridesFilename
+    if not overridePath.exists():
+        overridePath = resolve_template_folder(PRIMARY_TEMPLATE_SLUG) / docxOverridesFilename
+    if not overridePath.exists():
+        return {}
+    try:
+        with open(overridePath, "r", encoding="utf-8") as f:
+            overrides = json.load(f)
+    except Exception:
+        return {}
+    if not isinstance(overrides, dict):
+        return {}
+    names = {f.name for f in fields(DocxStyleConfig)}
+    return {key: val for key, val in overrides.items() if key in names}
+
+
+# --- Handle Uncached Resolution ---
+def resolve_uncached(slug, stylePreferences):
+    # Loads resume_tokens.json, merges optional user presets, then docx_styles.json overrides.
+    rawTokens = load_resume_token_dict(slug)
+    tokens = merge_resume_token_overrides(slug, rawTokens, stylePreferences)
+    docx = apply_resume_tokens_to_docx_config(DocxStyleConfig(), tokens)
+    docx = replace(docx, **load_docx_overrides(slug))
+    return ResolvedStyles(
+        slug=slug,
+        docx=docx,
+        tokens=MappingProxyType(tokens),
+        rootCss=build_resume_tokens_css(tokens),
+    )
+
+
+# Resolve the styles for a given template.
+# In : Template Name, Style Preferences
+# Out : ResolvedStyles (frozen DocxStyleConfig, merged tokens, :root CSS)
+def resolve_styles(templateName, stylePreferences=None):
+    slug = normalize_template_slug(templateName)
+    key = (slug, preferences_key(stylePreferences), source_stamps(slug))
+    with resolvedLock:
+        resolved = resolvedCache.get(key)
+        if resolved is not None:
+            resolvedCache.move_to_end(key)
+            return resolved
+
+    resolved = resolve_uncached(slug, stylePreferences)
+    with resolvedLock:
+        resolvedCache[key] = resolved
+        while len(resolvedCache) > styleCacheSize:
+            resolvedCache.popitem(last=False)
+    return resolved
+
+
 # Get the styles for a given template.
 # In : Template Name, Style Preferences
 # Out : DocxStyleConfig
 def get_styles(template_name: str, style_preferences: dict | None = None) -> DocxStyleConfig:
+    return resolve_styles(template_name, style_preferences).docx
 
-    # Loads resume_tokens.json, merges optional user presets, then docx_styles.json overrides.
-    name = normalize_template_slug(template_name)
-
-    # Initialize the base DocxStyleConfig.
-    base = DocxStyleConfig()
-
-    # Load Tokens, Merge Presets, Apply to DocxStyleConfig.
-    raw_tokens = load_resume_token_dict(name)
-    tokens = merge_resume_token_overrides(name, raw_tokens, style_preferences)
-    apply_resume_tokens_to_docx_config(base, tokens)
-
-    # Load Template Overrides.
-    override_path = resolve_template_folder(name) / "docx_styles.json"
-    if not override_path.exists():
-        override_path = resolve_template_folder(PRIMARY_TEMPLATE_SLUG) / "docx_styles.json"
-    if override_path.exists():
-        # Load the overrides.
-        try:
-            with open(override_path, "r", encoding="utf-8") as f:
-                overrides = json.load(f)
-            # Apply the overrides to the DocxStyleConfig.
-            for key, val in overrides.items():
-                if not key.startswith("_") and hasattr(base, key):
-                    setattr(base, key, val)
-        except Exception:
-            pass
-    return base
+
+def clear_style_cache():
+    with resolvedLock:
+        resolvedCache.clear()
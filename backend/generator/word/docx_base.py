@@ -0,0 +1,103 @@
+# Prebuilt base packages: the page and table scaffolding a layout sets up before any content.
+
+# Every export used to start from Document() and redo margins, section properties, the
+# layout table's geometry, cell margins, borders and rail shading. That work depends only on
+# the layout and its resolved style tokens, so it is done once and the saved .docx bytes are
+# kept; each export opens a copy and fills in the body.
+#
+# Saving goes through save_docx_bytes: python-docx writes the package as usual, then it is
+# re-zipped with media parts (the rail / timeline icons are PNGs of up to ~0.5 MB) stored
+# as they are. Deflating a PNG saves no bytes, and a stored member opens without being
+# inflated again each time an export reopens the cached base.
+#
+# The key is a fingerprint of the whole DocxStyleConfig. get_styles re-resolves when
+# resume_tokens.json or docx_styles.json change on disk, so editing either file changes the
+# fingerprint and the next export builds a fresh base; nothing has to be cleared by hand.
+
+import hashlib
+import json
+import threading
+import zipfile
+from collections import OrderedDict
+from dataclasses import asdict
+from functools import lru_cache
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from docx import Document
+from docx.shared import Inches
+
+# Bases held at once: a few per template, more when users pick custom colors / fonts.
+baseCacheSize = 64
+
+# Part extensions that are compressed already.
+storedExtensions = frozenset((".png", ".jpg", ".jpeg", ".gif"))
+
+basePackages = OrderedDict()
+baseLock = threading.Lock()
+
+
+# --- Handle Style Fingerprint (configs are frozen, so hashable) ---
+@lru_cache(maxsize=baseCacheSize)
+def style_fingerprint(style):
+    payload = json.dumps(asdict(style), sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+# --- Handle Base Package Bytes ---
+def base_package_bytes(layout, style, setup, *args):
+    # The saved .docx of layout's scaffolding; setup(doc, style, *args) builds it on a miss.
+    key = (layout, style_fingerprint(style), *args)
+    with baseLock:
+        package = basePackages.get(key)
+        if package is not None:
+            basePackages.move_to_end(key)
+            return package
+
+    doc = Document()
+    setup(doc, style, *args)
+    package = save_docx_bytes(doc)
+    with baseLock:
+        basePackages[key] = package
+        while len(basePackages) > baseCacheSize:
+            basePackages.popitem(last=False)
+    return package
+
+
+# --- Handle Base Document ---
+def base_document(layout, style, setup, *args):
+    # A fresh Document opened from the cached base package.
+    return Document(BytesIO(base_package_bytes(layout, style, setup, *args)))
+
+
+# --- Handle Save Docx Bytes ---
+def save_docx_bytes(doc):
+    # doc.save(), re-zipped so already-compressed media is written stored.
+    saved = BytesIO()
+    doc.save(saved)
+
+    buffer = BytesIO()
+    with zipfile.ZipFile(saved) as src, zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        for info in src.infolist():
+            stored = PurePosixPath(info.filename).suffix.lower() in storedExtensions
+            zf.writestr(
+                info.filename,
+                src.read(info),
+                compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED,
+            )
+    return buffer.getvalue()
+
+
+# --- Handle Clear Base Package Cache ---
+def clear_base_package_cache():
+    with baseLock:
+        basePackages.clear()
+
+
+# --- Handle Single-Flow Base (classic, early-career, project-forward) ---
+def setup_page_margins(doc, style):
+    sect = doc.sections[0]
+    sect.top_margin = Inches(style.margin_top_in)
+    sect.bottom_margin = Inches(style.margin_bottom_in)
+    sect.left_margin = Inches(style.margin_left_in)
+    sect.right_margin = Inches(style.margin_right_in)
@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-from io import BytesIO
+import logging
+import os
 from typing import Any, Dict
 
-from docx import Document
-from docx.shared import Inches
-
 from ..layouts.registry import (
     LAYOUT_EARLY_CAREER,
     LAYOUT_PROJECT_FORWARD,
@@ -18,6 +16,8 @@ from ..layouts.registry import (
 )
 from ..shared.styles import get_styles
 from ..shared.template_slug import normalize_template_slug
+from .docx_base import base_document, save_docx_bytes, setup_page_margins
+from .docx_classic_xml import build_classic_docx_xml
 from .docx_header import _add_header
 from .docx_sections import (
     _normalize_docx_section_order,
@@ -32,6 +32,13 @@ from .docx_project_forward import build_docx_project_forward_document
 from .docx_early_career import build_docx_early_career_document
 from .docx_timeline_split import build_docx_timeline_split_document
 
+logger = logging.getLogger(__name__)
+
+
+# Single-column engine: "xml" writes document.xml directly, "python-docx" builds it object by object.
+def classic_engine():
+    return (os.getenv("DOCX_CLASSIC_ENGINE") or "xml").strip().lower()
+
 
 # Main Docx Orchestration Function.
 def build_docx(resume_data: Dict[str, Any], template_name: str = "classic", style_preferences: dict | None = None) -> bytes:
@@ -76,15 +83,15 @@ def build_docx(resume_data: Dict[str, Any], template_name: str = "classic", styl
             docx_max_pages=resolve_docx_max_pages(name, resume_data),
         )
 
-    # Initialize Docx.
-    doc = Document()
+    # Direct OOXML writer first; the python-docx build below is the reference and the fallback.
+    if classic_engine() == "xml":
+        try:
+            return build_classic_docx_xml(resume_data, style, style_preferences)
+        except Exception:
+            logger.warning("[DOCX] direct writer failed for %s, using python-docx", name, exc_info=True)
 
-    # Set page margins (match .resume padding).
-    sect = doc.sections[0]
-    sect.top_margin = Inches(style.margin_top_in)
-    sect.bottom_margin = Inches(style.margin_bottom_in)
-    sect.left_margin = Inches(style.margin_left_in)
-    sect.right_margin = Inches(style.margin_right_in)
+    # Start from the cached base package: page margins are already set from the template tokens.
+    doc = base_document("flow", style, setup_page_margins)
 
     # Add header (always first).
     _add_header(doc, resume_data, style, style_preferences)
@@ -123,7 +130,4 @@ def build_docx(resume_data: Dict[str, Any], template_name: str = "classic", styl
             fn(doc, resume_data, style, indent, section_labels, defaults)
 
     # Save document.
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer.read()
+    return save_docx_bytes(doc)
@@ -0,0 +1,577 @@
+# Direct OOXML writer for the single-column (classic) layout.
+
+# The python-docx path builds every paragraph as lxml objects (add_paragraph / add_run /
+# OxmlElement per property), then doc.save() serializes and deflates the whole package.
+# This writer produces word/document.xml as text from small fragment templates instead:
+#
+# - Run and paragraph property fragments (<w:rPr>, <w:pPr>) are rendered once per distinct
+#   (font, size, bold, italic, color, ...) and cached; a resume only uses a few dozen.
+# - Everything outside document.xml comes from the cached flow base package (docx_base):
+#   its other parts are zipped once per style, and each export appends only document.xml.
+# - Unit conversions go through docx.shared, so spacing / indent / size values round exactly
+#   like python-docx's.
+#
+# Section logic mirrors docx_header._add_header, docx_sections and docx_description one for
+# one; the python-docx renderers stay the reference (and the fallback in docx_builder), and
+# test_docx_classic_xml compares the two documents paragraph by paragraph.
+
+import re
+import zipfile
+from functools import lru_cache
+from io import BytesIO
+from xml.sax.saxutils import escape, quoteattr
+
+from docx.shared import Emu, Inches, Pt, Twips
+
+from ..html import format_contact_field_display, resolve_contact_url_display
+from ..shared.dates import format_date_range
+from ..shared.tagline import parse_tagline_runs
+from .docx_base import base_package_bytes, setup_page_margins
+from .docx_description import _parse_description_items
+from .docx_run_style import _hex_rgb_6_for_word, _resume_color_token_to_word_hex
+from .docx_sections import _normalize_docx_section_order
+
+documentPart = "word/document.xml"
+
+# Characters lxml refuses in text (python-docx raises on them too).
+invalidXmlChars = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f￾￿]")
+runBreaks = re.compile(r"(\t|\n|\r)")
+
+
+# --- Handle Unit Conversions (same rounding as python-docx) ---
+def twips(pt):
+    return Pt(pt).twips
+
+
+def half_points(pt):
+    return int(Pt(pt).pt * 2)
+
+
+def line_multiple(mult):
+    return Emu(float(mult) * Twips(240)).twips
+
+
+# --- Handle Run Properties Fragment ---
+@lru_cache(maxsize=512)
+def run_properties(font=None, sizePt=None, bold=None, italic=None, color=None, spacingPt=0, underline=None):
+    parts = []
+    if font:
+        name = quoteattr(font)
+        parts.append(f"<w:rFonts w:ascii={name} w:hAnsi={name}/>")
+    if bold is not None:
+        parts.append("<w:b/>" if bold else '<w:b w:val="0"/>')
+    if italic is not None:
+        parts.append("<w:i/>" if italic else '<w:i w:val="0"/>')
+    if color:
+        parts.append(f'<w:color w:val="{color}"/>')
+    if spacingPt:
+        parts.append(f'<w:spacing w:val="{int(round(float(spacingPt) * 20))}"/>')
+    if sizePt is not None:
+        parts.append(f'<w:sz w:val="{half_points(sizePt)}"/>')
+    if underline is not None:
+        parts.append('<w:u w:val="single"/>' if underline else '<w:u w:val="none"/>')
+    return f"<w:rPr>{''.join(parts)}</w:rPr>" if parts else ""
+
+
+# --- Handle Paragraph Properties Fragment ---
+@lru_cache(maxsize=512)
+def paragraph_properties(*, border=None, tab=None, before=None, after=None, line=None, left=None, first=None, jc=None):
+    # line: a multiple (1.0 = single); left / first / before / after in points.
+    parts = []
+    if border is not None:
+        sz, color = border
+        parts.append(f'<w:pBdr><w:bottom w:val="single" w:sz="{sz}" w:space="1" w:color="{color}"/></w:pBdr>')
+    if tab is not None:
+        align, pos = tab
+        parts.append(f'<w:tabs><w:tab w:val="{align}" w:pos="{pos}"/></w:tabs>')
+    spacing = []
+    if before is not None:
+        spacing.append(f'w:before="{twips(before)}"')
+    if after is not None:
+        spacing.append(f'w:after="{twips(after)}"')
+    if line is not None:
+        spacing.append(f'w:line="{line_multiple(line)}" w:lineRule="auto"')
+    if spacing:
+        parts.append(f"<w:spacing {' '.join(spacing)}/>")
+    ind = []
+    if left is not None:
+        ind.append(f'w:left="{twips(left)}"')
+    if first is not None:
+        ind.append(f'w:hanging="{twips(-first)}"' if first < 0 else f'w:firstLine="{twips(first)}"')
+    if ind:
+        parts.append(f"<w:ind {' '.join(ind)}/>")
+    if jc:
+        parts.append(f'<w:jc w:val="{jc}"/>')
+    return f"<w:pPr>{''.join(parts)}</w:pPr>" if parts else ""
+
+
+# --- Handle Run ---
+def run_xml(text, rpr=""):
+    # add_run(text): a falsy text leaves the run empty.
+    text = str(text) if text else ""
+    if invalidXmlChars.search(text):
+        raise ValueError("All strings must be XML compatible")
+    content = []
+    for piece in runBreaks.split(text):
+        if piece == "\t":
+            content.append("<w:tab/>")
+        elif piece in ("\n", "\r"):
+            content.append("<w:br/>")
+        elif piece:
+            preserve = ' xml:space="preserve"' if piece != piece.strip() else ""
+            content.append(f"<w:t{preserve}>{escape(piece)}</w:t>")
+    return f"<w:r>{rpr}{''.join(content)}</w:r>"
+
+
+def paragraph_xml(ppr, runs):
+    return f"<w:p>{ppr}{''.join(runs)}</w:p>"
+
+
+class ClassicWriter:
+    # One document's worth of paragraphs; methods mirror the python-docx renderers by name.
+
+    def __init__(self, style):
+        self.style = style
+        self.paragraphs = []
+        self.colors = {}
+
+    def color(self, attr):
+        if attr not in self.colors:
+            self.colors[attr] = _resume_color_token_to_word_hex(getattr(self.style, attr, None))
+        return self.colors[attr]
+
+    def rpr(self, font, sizePt, *, bold=None, italic=None, colorAttr=None, spacingPt=0, underline=None):
+        color = self.color(colorAttr) if colorAttr else None
+        return run_properties(font, sizePt, bold, italic, color, spacingPt or 0, underline)
+
+    # --- docx_header._add_header ---
+    def header(self, resumeData, stylePreferences):
+        style = self.style
+        header = resumeData.get("header", {})
+        name = f"{header.get('first_name', '')} {header.get('last_name', '')}".strip()
+        # paragraph_alignment_from_style: left / right, anything else centers.
+        raw = str(getattr(style, "header_alignment", "center") or "center").strip().lower()
+        jc = raw if raw in ("left", "right") else "center"
+        if name:
+            self.paragraphs.append(paragraph_xml(
+                paragraph_properties(after=style.name_space_after_pt, line=1.0, jc=jc),
+                [run_xml(name, self.rpr(
+                    style.font_primary, style.name_font_size_pt, bold=True,
+                    colorAttr="resume_text_color_emphasis", spacingPt=style.name_letter_spacing_pt,
+                ))],
+            ))
+
+        hasTagline = False
+        vis = header.get("visibility", {})
+        if vis.get("showTagline", True):
+            tagline = (header.get("tagline") or "").strip()
+            if tagline:
+                hasTagline = True
+                runs = [
+                    run_xml(text, self.rpr(
+                        style.font_primary, style.tagline_font_size_pt, bold=tBold, italic=tItalic,
+                        colorAttr="resume_text_color_primary", underline=bool(tUnderline),
+                    ))
+                    for text, tBold, tItalic, tUnderline in parse_tagline_runs(tagline)
+                ]
+                self.paragraphs.append(paragraph_xml(
+                    paragraph_properties(after=style.tagline_space_after_pt, line=spacing_multiple(style.tagline_line_height), jc=jc),
+                    runs,
+                ))
+
+        contactOrder = header.get("contactOrder", ["email", "phone", "location", "linkedin", "github", "portfolio"])
+        visibilityMap = {
+            "email": "showEmail", "phone": "showPhone", "location": "showLocation",
+            "linkedin": "showLinkedin", "github": "showGithub", "portfolio": "showPortfolio",
+        }
+        urlDisp = resolve_contact_url_display(stylePreferences)
+        fields = []
+        for fieldKey in contactOrder:
+            if fieldKey not in visibilityMap:
+                continue
+            val = header.get(fieldKey, "")
+            isVisible = vis.get(visibilityMap[fieldKey], True)
+            if val and str(val).strip() and isVisible:
+                fields.append(format_contact_field_display(fieldKey, str(val).strip(), contact_url_display=urlDisp))
+        if fields:
+            before = style.contact_space_before_after_tagline_pt if hasTagline else style.contact_space_before_pt
+            self.paragraphs.append(paragraph_xml(
+                paragraph_properties(before=before, after=style.contact_space_after_pt, line=spacing_multiple(style.contact_line_height), jc=jc),
+                [run_xml(" | ".join(fields), self.rpr(
+                    style.font_primary, style.contact_font_size_pt,
+                    colorAttr="resume_text_color_primary", spacingPt=style.contact_span_letter_spacing_pt,
+                ))],
+            ))
+
+    # --- docx_sections._add_section_title ---
+    def section_title(self, title):
+        style = self.style
+        displayTitle = str(title or "")
+        if getattr(style, "section_title_uppercase", False):
+            displayTitle = displayTitle.upper()
+        border = None
+        if getattr(style, "section_divider_visible", True):
+            widthPt = float(getattr(style, "section_divider_width_pt", 0.25) or 0.25)
+            color = _hex_rgb_6_for_word(getattr(style, "section_divider_color", None))
+            border = (max(2, min(96, int(round(widthPt * 8)))), color or "000000")
+        self.paragraphs.append(paragraph_xml(
+            paragraph_properties(border=border, before=style.section_title_space_before_pt, after=style.section_title_space_after_pt, line=1.0),
+            [run_xml(displayTitle, self.rpr(
+                style.font_primary, style.section_title_font_size_pt,
+                colorAttr="resume_text_color_emphasis",
+                spacingPt=getattr(style, "section_title_letter_spacing_pt", 0) or 0,
+            ))],
+        ))
+
+    # --- docx_layout._add_two_column_line ---
+    def two_column_line(self, leftRuns, rightRun, *, indentPt=0, spaceAfterPt=0, spaceBeforePt=0, lineSpacingSingle=False):
+        style = self.style
+        hasLeft = any(r[0] for r in leftRuns)
+        hasRight = rightRun and rightRun[0]
+        if not hasLeft and not hasRight:
+            return
+        runs = []
+        for runSpec in leftRuns:
+            if len(runSpec) == 5:
+                text, sz, bold, italic, forcePrimary = runSpec
+            else:
+                text, sz, bold, italic = runSpec
+                forcePrimary = False
+            if not text:
+                continue
+            font = style.font_primary if forcePrimary or bold else style.font_secondary
+            if bold:
+                colorAttr = "resume_text_color_emphasis"
+            elif italic:
+                colorAttr = "resume_text_color_secondary"
+            else:
+                colorAttr = "resume_text_color_primary"
+            runs.append(run_xml(text, self.rpr(font, sz, bold=bold, italic=italic, colorAttr=colorAttr)))
+        if hasRight and rightRun:
+            text, sz, bold, italic = rightRun
+            if text and str(text).strip():
+                runs.append(run_xml("\t"))
+                font = style.font_primary if bold else style.font_secondary
+                runs.append(run_xml(str(text).strip(), self.rpr(
+                    font, sz, bold=bold, italic=italic, colorAttr="resume_text_color_secondary",
+                )))
+        self.paragraphs.append(paragraph_xml(
+            paragraph_properties(
+                tab=("right", Inches(style.two_column_tab_in).twips) if hasRight else None,
+                before=spaceBeforePt,
+                after=spaceAfterPt,
+                line=1.0 if lineSpacingSingle else None,
+                left=indentPt,
+            ),
+            runs,
+        ))
+
+    # --- docx_description._add_description_block ---
+    def description_block(self, description, indentPt):
+        style = self.style
+        first = True
+        for itemType, content in _parse_description_items(description):
+            if not content or not str(content).strip():
+                continue
+            if first:
+                before = style.description_block_space_before_pt
+                if itemType == "bullet":
+                    before += style.word_bullet_space_before_pt
+                first = False
+            else:
+                before = style.word_bullet_space_before_pt if itemType == "bullet" else 0
+            textRpr = self.rpr(style.font_primary, style.description_font_size_pt, colorAttr="resume_text_color_primary")
+            if itemType == "bullet":
+                liPad = float(getattr(style, "description_bullet_li_padding_left_pt", 2.0) or 0.0)
+                hang = float(style.description_bullet_hang_pt)
+                textLeftPt = indentPt + style.description_bullet_indent_pt + hang + liPad
+                ppr = paragraph_properties(
+                    tab=("left", twips(textLeftPt)),
+                    before=before,
+                    after=style.word_bullet_space_after_pt,
+                    line=1.0,
+                    left=textLeftPt,
+                    first=-(hang + liPad),
+                    jc="both",
+                )
+                runs = [
+                    run_xml("•", textRpr),
+                    run_xml("\t", self.rpr(style.font_primary, style.description_font_size_pt)),
+                    run_xml(str(content).strip(), textRpr),
+                ]
+            else:
+                ppr = paragraph_properties(
+                    before=before,
+                    after=style.description_paragraph_space_pt,
+                    line=spacing_multiple(style.prose_line_height),
+                    left=indentPt,
+                    jc="both",
+                )
+                runs = [run_xml(str(content).strip(), textRpr)]
+            self.paragraphs.append(paragraph_xml(ppr, runs))
+
+    # --- docx_sections._render_docx_summary_section ---
+    def summary(self, resumeData, indent, sectionLabels, defaults):
+        style = self.style
+        summary = resumeData.get("summary")
+        if not summary or not isinstance(summary, dict):
+            return
+        text = summary.get("summary", "").strip()
+        if not text:
+            return
+        self.section_title(sectionLabels.get("summary", defaults["summary"]))
+        summaryIndent = indent + style.summary_text_padding_left_pt
+        firstLine = style.summary_first_line_indent_pt
+        self.paragraphs.append(paragraph_xml(
+            paragraph_properties(
+                before=0,
+                after=style.summary_space_after_pt,
+                line=spacing_multiple(style.summary_line_height),
+                left=summaryIndent if summaryIndent else None,
+                first=firstLine if firstLine else None,
+                jc="both",
+            ),
+            [run_xml(text, self.rpr(
+                style.font_primary, style.summary_font_size_pt or style.description_font_size_pt,
+                bold=False, italic=False, colorAttr="resume_text_color_primary",
+            ))],
+        ))
+
+    # --- docx_sections._render_docx_education_section ---
+    def education(self, resumeData, indent, sectionLabels, defaults):
+        style = self.style
+        education = resumeData.get("education") or []
+        if not education:
+            return
+        self.section_title(sectionLabels.get("education", defaults["education"]))
+        for edu in education:
+            degree = edu.get("degree", "")
+            discipline = edu.get("discipline", "")
+            minor = edu.get("minor", "")
+            degreeText = f"{degree} in {discipline}" if discipline else degree
+            if minor:
+                degreeText += f", Minor in {minor}"
+
+            startRaw = edu.get("start_date") or edu.get("startDate") or ""
+            endRaw = edu.get("end_date") or edu.get("endDate") or ""
+            dateRange = format_date_range(startRaw, endRaw, edu.get("current", False))
+            gpa = edu.get("gpa", "")
+            gpaText = f" (GPA: {gpa})" if gpa else ""
+
+            leftRuns = [(edu.get("school", ""), style.school_name_font_size_pt, True, False)]
+            if gpaText:
+                leftRuns.append((gpaText, style.school_gpa_font_size_pt, False, True, False))
+            self.two_column_line(
+                leftRuns,
+                (dateRange, style.school_meta_font_size_pt, False, True) if dateRange else None,
+                indentPt=indent,
+                spaceAfterPt=style.school_name_line_space_after_pt,
+            )
+
+            loc = edu.get("location", "")
+            self.two_column_line(
+                [(degreeText, style.education_degree_line_font_size_pt, False, True)],
+                (loc, style.school_meta_font_size_pt, False, True) if loc else None,
+                indentPt=indent,
+                spaceAfterPt=style.school_line_space_after_pt,
+            )
+
+            hlBetween = float(getattr(style, "highlights_gap_pt", 4.5) or 4.5)
+            hlOrd = 0
+            for subTitle, subContent in (edu.get("subsections") or {}).items():
+                if not (subContent and str(subContent).strip()):
+                    continue
+                runs = []
+                if subTitle:
+                    runs.append(run_xml(f"{subTitle}: ", self.rpr(
+                        style.font_primary, style.highlight_font_size_pt, bold=True,
+                        colorAttr="resume_text_color_highlight_title",
+                    )))
+                runs.append(run_xml(str(subContent).strip(), self.rpr(
+                    style.font_primary, style.highlight_font_size_pt, colorAttr="resume_text_color_primary",
+                )))
+                self.paragraphs.append(paragraph_xml(
+                    paragraph_properties(
+                        before=0 if hlOrd == 0 else hlBetween,
+                        after=style.word_highlight_space_after_pt,
+                        line=1.0,
+                        left=indent,
+                    ),
+                    runs,
+                ))
+                hlOrd += 1
+
+    # --- docx_sections._render_docx_experience_section ---
+    def experience(self, resumeData, indent, sectionLabels, defaults):
+        style = self.style
+        experience = resumeData.get("experience") or []
+        if not experience:
+            return
+        self.section_title(sectionLabels.get("experience", defaults["experience"]))
+        for exp in experience:
+            startRaw = exp.get("start_date") or exp.get("startDate") or ""
+            endRaw = exp.get("end_date") or exp.get("endDate") or ""
+            dateRange = format_date_range(startRaw, endRaw, exp.get("current", False))
+            self.two_column_line(
+                [(exp.get("title", ""), style.experience_title_font_size_pt, True, False)],
+                (dateRange, style.experience_meta_font_size_pt, False, True) if dateRange else None,
+                indentPt=indent,
+                spaceBeforePt=style.experience_line_space_before_pt,
+                spaceAfterPt=style.experience_line_space_pt,
+                lineSpacingSingle=True,
+            )
+
+            company = exp.get("company", "")
+            skills = exp.get("skills", "")
+            loc = exp.get("location", "")
+            leftRuns = [(company, style.experience_meta_font_size_pt, True, False)]
+            if skills:
+                leftRuns.append((f" | {skills}", style.experience_meta_font_size_pt, False, True))
+            self.two_column_line(
+                leftRuns,
+                (loc, style.experience_meta_font_size_pt, False, True) if loc else None,
+                indentPt=indent,
+                spaceAfterPt=style.company_line_space_after_pt,
+                lineSpacingSingle=True,
+            )
+
+            desc = exp.get("description", "")
+            if desc and str(desc).strip():
+                self.description_block(str(desc), indent)
+
+    # --- docx_sections._render_docx_projects_section (single column) ---
+    def projects(self, resumeData, indent, sectionLabels, defaults):
+        style = self.style
+        projects = resumeData.get("projects") or []
+        if not projects:
+            return
+        self.section_title(sectionLabels.get("projects", defaults["projects"]))
+        metaSz = float(style.project_title_font_size_pt)
+        for proj in projects:
+            title = proj.get("title", "")
+            tech = proj.get("tech_stack") or proj.get("techStack") or []
+            techStr = ", ".join(tech) if isinstance(tech, list) else str(tech or "")
+            url = str(proj.get("url") or "").strip()
+
+            runs = [run_xml(title, self.rpr(
+                style.font_primary, metaSz, bold=True, colorAttr="resume_text_color_emphasis",
+            ))]
+            if techStr or url:
+                extras = [extra for extra in (techStr, url) if extra]
+                runs.append(run_xml(" | "))
+                runs.append(run_xml(" | ".join(extras), self.rpr(
+                    style.font_secondary, metaSz, italic=True, colorAttr="resume_text_color_secondary",
+                )))
+            self.paragraphs.append(paragraph_xml(
+                paragraph_properties(
+                    before=style.project_title_space_before_pt,
+                    after=style.project_line_space_pt,
+                    line=1.0,
+                    left=indent,
+                ),
+                runs,
+            ))
+
+            desc = proj.get("description", "")
+            if desc and str(desc).strip():
+                self.description_block(str(desc), indent)
+
+    # --- docx_sections._render_docx_skills_section ---
+    def skills(self, resumeData, indent, sectionLabels, defaults):
+        style = self.style
+        skills = resumeData.get("skills") or []
+        skillsCategoryOrder = resumeData.get("skillsCategoryOrder") or []
+        if not skills:
+            return
+
+        skillsByCat = {}
+        uncategorized = []
+        for s in skills:
+            if isinstance(s, dict):
+                cat = s.get("category") or s.get("Category")
+                name = s.get("name") or s.get("Name", "")
+            else:
+                cat = None
+                name = str(s)
+            if not name:
+                continue
+            if cat:
+                skillsByCat.setdefault(cat, []).append(name)
+            else:
+                uncategorized.append(name)
+
+        self.section_title(sectionLabels.get("skills", defaults["skills"]))
+        order = [c for c in skillsCategoryOrder if c in skillsByCat]
+        for c in sorted(skillsByCat.keys()):
+            if c not in order:
+                order.append(c)
+
+        ppr = paragraph_properties(after=style.skill_line_space_pt, line=1.0, left=indent)
+        namesRpr = self.rpr(style.font_primary, style.skill_names_font_size_pt, colorAttr="resume_text_color_primary")
+        for cat in order:
+            self.paragraphs.append(paragraph_xml(ppr, [
+                run_xml(f"{cat}: ", self.rpr(
+                    style.font_primary, style.skill_category_font_size_pt, bold=True,
+                    colorAttr="resume_text_color_emphasis",
+                )),
+                run_xml(", ".join(skillsByCat[cat]), namesRpr),
+            ]))
+        if uncategorized:
+            self.paragraphs.append(paragraph_xml(ppr, [run_xml(", ".join(uncategorized), namesRpr)]))
+
+
+def spacing_multiple(mult):
+    # docx_run_style._set_line_spacing_multiple: zero or less means single.
+    return float(mult) if float(mult) > 0 else 1.0
+
+
+# --- Handle Split Base Package ---
+@lru_cache(maxsize=16)
+def split_base_package(package):
+    # (zip of every part but document.xml, document.xml up to the body's sectPr, the rest).
+    prefix = BytesIO()
+    with zipfile.ZipFile(BytesIO(package)) as source, zipfile.ZipFile(prefix, "w", zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            if info.filename == documentPart:
+                document = source.read(info)
+            else:
+                target.writestr(info, source.read(info))
+    cut = document.rindex(b"<w:sectPr")
+    return prefix.getvalue(), document[:cut], document[cut:]
+
+
+# --- Handle Classic Body ---
+def iter_classic_paragraphs(resumeData, style, stylePreferences=None):
+    writer = ClassicWriter(style)
+    writer.header(resumeData, stylePreferences)
+    sectionLabels = resumeData.get("sectionLabels", {})
+    defaults = {
+        "summary": "Professional Summary",
+        "education": "Education",
+        "experience": "Experience",
+        "projects": "Projects",
+        "skills": "Skills",
+    }
+    indent = style.section_content_indent_pt
+    renderers = {
+        "summary": writer.summary,
+        "education": writer.education,
+        "experience": writer.experience,
+        "projects": writer.projects,
+        "skills": writer.skills,
+    }
+    for sectionKey in _normalize_docx_section_order(resumeData.get("sectionOrder")):
+        renderers[sectionKey](resumeData, indent, sectionLabels, defaults)
+    return iter(writer.paragraphs)
+
+
+# --- Handle Build Classic Docx ---
+def build_classic_docx_xml(resumeData, style, stylePreferences=None):
+    prefix, head, tail = split_base_package(base_package_bytes("flow", style, setup_page_margins))
+    body = "".join(iter_classic_paragraphs(resumeData, style, stylePreferences)).encode("utf-8")
+
+    buffer = BytesIO(prefix)
+    buffer.seek(0, 2)
+    with zipfile.ZipFile(buffer, "a", zipfile.ZIP_DEFLATED) as package:
+        package.writestr(documentPart, head + body + tail)
+    return buffer.getvalue()
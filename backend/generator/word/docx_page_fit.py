@@ -0,0 +1,243 @@
+# Page fitting for docxMaxPages: measure the rendered document instead of re-estimating it.
+
+# Layouts build their paragraphs first, then ask here how tall they came out. Each paragraph
+# is measured from its own runs (font, size, bold, character spacing), indents, spacing and
+# line rule, at the width of the column it sits in, with docx_text_metrics doing the wrapping.
+# Tables measure row by row (tallest cell); a vertically merged cell (the timeline rail)
+# counts once against the rows it spans.
+
+import logging
+import math
+
+import numpy as np
+from docx.enum.text import WD_LINE_SPACING
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Length
+from docx.text.paragraph import Paragraph
+
+from .docx_text_metrics import code_points, count_wrapped_lines, family_metrics, glyph_widths
+
+logger = logging.getLogger(__name__)
+
+# --- python-docx default template: 11pt text, 10pt after, 1.15 lines, 0.075in cell sides ---
+defaultSizePt = 11.0
+defaultSpaceAfterPt = 10.0
+defaultLineMultiple = 1.15
+defaultCellSidePt = 5.4
+
+# Measured content must come in under this share of the body: Word's own rounding and
+# widow/orphan control still move a line now and then.
+fitSafety = 0.96
+
+emuPerPt = 12700
+
+
+def length_pt(value, default=0.0):
+    return float(value.pt) if value is not None else default
+
+
+def twips_attr_pt(el, attr, default=0.0):
+    if el is None or el.get(qn(attr)) is None:
+        return default
+    try:
+        return float(el.get(qn(attr))) / 20.0
+    except ValueError:
+        return default
+
+
+# --- Handle Run Advances ---
+def run_advances(run, family):
+    # Code points, per-character widths (plus any w:spacing letter spacing) and the run size.
+    size = length_pt(run.font.size, defaultSizePt)
+    codes = code_points(run.text.replace("\t", " "))
+    advances = glyph_widths(run.font.name or family, size, bool(run.bold))[codes]
+    rPr = run._r.rPr
+    spacing = twips_attr_pt(rPr.find(qn("w:spacing")) if rPr is not None else None, "w:val")
+    return codes, advances + spacing if spacing else advances, size
+
+
+def line_pitch_pt(paragraph, family, sizePt):
+    pf = paragraph.paragraph_format
+    single = sizePt * family_metrics(family)[2]
+    spacing = pf.line_spacing
+    if spacing is None:
+        return single * defaultLineMultiple
+    if isinstance(spacing, Length):
+        if pf.line_spacing_rule == WD_LINE_SPACING.AT_LEAST:
+            return max(single, float(spacing.pt))
+        return float(spacing.pt)
+    return single * float(spacing)
+
+
+# --- Handle Paragraph Height ---
+def paragraph_height_pt(paragraph, widthPt, family):
+    pf = paragraph.paragraph_format
+    runs = [run_advances(run, family) for run in paragraph.runs if run.text]
+    size = max((r[2] for r in runs), default=0.0)
+    if not size:
+        sizes = [length_pt(run.font.size) for run in paragraph.runs]
+        size = max(sizes, default=0.0) or defaultSizePt
+
+    left = length_pt(pf.left_indent)
+    right = length_pt(pf.right_indent)
+    first = length_pt(pf.first_line_indent)
+    textWidth = max(float(widthPt) - left - right, size)
+
+    lines = 1
+    if runs:
+        codes = np.concatenate([r[0] for r in runs])
+        advances = np.concatenate([r[1] for r in runs])
+        # Hard line breaks (w:br / w:cr read as "\n") start a new line box.
+        lines = 0
+        start = 0
+        for end in [*np.flatnonzero(codes == 10).tolist(), len(codes)]:
+            firstWidth = max(textWidth - first, size) if lines == 0 else textWidth
+            lines += count_wrapped_lines(advances[start:end], codes[start:end] == 32, textWidth, firstWidth)
+            start = end + 1
+
+    pictures = paragraph._p.xpath(".//wp:extent/@cy")
+    picturePt = max((int(cy) for cy in pictures), default=0) / emuPerPt
+    body = max(lines * line_pitch_pt(paragraph, family, size), picturePt)
+    return length_pt(pf.space_before) + body + length_pt(pf.space_after, defaultSpaceAfterPt)
+
+
+# --- Handle Block Height (paragraphs and tables of a body or cell, in order) ---
+def blocks_height_pt(containerEl, widthPt, family):
+    total = 0.0
+    for child in containerEl.iterchildren():
+        if child.tag == qn("w:p"):
+            total += paragraph_height_pt(Paragraph(child, None), widthPt, family)
+        elif child.tag == qn("w:tbl"):
+            total += table_height_pt(child, family)
+    return total
+
+
+def cell_margins_pt(tc):
+    tcPr = tc.tcPr
+    mar = tcPr.find(qn("w:tcMar")) if tcPr is not None else None
+    if mar is None:
+        return 0.0, defaultCellSidePt, 0.0, defaultCellSidePt
+    return (
+        twips_attr_pt(mar.find(qn("w:top")), "w:w"),
+        twips_attr_pt(mar.find(qn("w:left")), "w:w", defaultCellSidePt),
+        twips_attr_pt(mar.find(qn("w:bottom")), "w:w"),
+        twips_attr_pt(mar.find(qn("w:right")), "w:w", defaultCellSidePt),
+    )
+
+
+# --- Handle Cell Height ---
+def cell_height_pt(cell, widthPt, family):
+    # widthPt is the cell's full width; its tcMar insets come off here.
+    top, left, bottom, right = cell_margins_pt(cell._tc)
+    return top + blocks_height_pt(cell._tc, widthPt - left - right, family) + bottom
+
+
+# --- Handle Table Height ---
+def table_height_pt(tblEl, family):
+    grid = [twips_attr_pt(col, "w:w") for col in tblEl.tblGrid.findall(qn("w:gridCol"))]
+    rowsPt = []
+    merged = []  # (first row, height) of vertically merged cells
+    for rowIndex, tr in enumerate(tblEl.tr_lst):
+        rowPt = 0.0
+        col = 0
+        for tc in tr.tc_lst:
+            span = tc.grid_span
+            width = sum(grid[col:col + span]) if grid else twips_attr_pt(tc.tcPr.find(qn("w:tcW")), "w:w")
+            col += span
+            vMerge = tc.vMerge
+            if vMerge == "continue":
+                continue
+            top, left, bottom, right = cell_margins_pt(tc)
+            height = top + blocks_height_pt(tc, width - left - right, family) + bottom
+            if vMerge == "restart":
+                merged.append((rowIndex, height))
+            else:
+                rowPt = max(rowPt, height)
+        rowsPt.append(rowPt)
+    total = sum(rowsPt)
+    for firstRow, height in merged:
+        total = max(total, sum(rowsPt[:firstRow]) + height)
+    return total
+
+
+# --- Handle Section Geometry ---
+def body_width_pt(sect):
+    return float(sect.page_width.pt) - float(sect.left_margin.pt) - float(sect.right_margin.pt)
+
+
+def body_height_pt(sect):
+    return max(72.0, float(sect.page_height.pt) - float(sect.top_margin.pt) - float(sect.bottom_margin.pt))
+
+
+# --- Handle Document Height ---
+def document_height_pt(doc, family):
+    return blocks_height_pt(doc.element.body, body_width_pt(doc.sections[0]), family)
+
+
+# --- Handle Page Estimates ---
+def estimated_pages(contentPt, sect):
+    return max(1, math.ceil(float(contentPt) / (body_height_pt(sect) * fitSafety)))
+
+
+def fits_pages(contentPt, sect, maxPages=1):
+    return float(contentPt) <= body_height_pt(sect) * fitSafety * max(1, int(maxPages))
+
+
+# --- Handle Check Docx Max Pages (flow layouts: report, don't rescale) ---
+def check_docx_max_pages(doc, family, docxMaxPages, layout):
+    # early-career / project-forward call this after building: it only warns. shrinking the
+    # style to fit is the one-page export's job (auto_fit.generate_docx_auto_fit).
+    if not docxMaxPages:
+        return True
+    sect = doc.sections[0]
+    contentPt = document_height_pt(doc, family)
+    if fits_pages(contentPt, sect, docxMaxPages):
+        return True
+    logger.warning(
+        "[DOCX] %s content measures %.0fpt (~%d pages), over docxMaxPages=%d",
+        layout,
+        contentPt,
+        estimated_pages(contentPt, sect),
+        docxMaxPages,
+    )
+    return False
+
+
+# --- Handle Tail Paragraph Before SectPr ---
+def add_tail_paragraph_before_sectpr(doc):
+    # A body ending in a table gets a 1pt paragraph after it; without one, Word adds its own
+    # full-height empty paragraph, which spills onto a blank last page.
+    body = doc.element.body
+    kids = list(body)
+    if len(kids) < 2 or kids[-1].tag != qn("w:sectPr"):
+        return
+    if kids[-2].tag == qn("w:p"):
+        return
+    idx = len(kids) - 1
+    p = OxmlElement("w:p")
+    pPr = OxmlElement("w:pPr")
+    spacing = OxmlElement("w:spacing")
+    spacing.set(qn("w:before"), "0")
+    spacing.set(qn("w:after"), "0")
+    spacing.set(qn("w:line"), "20")
+    spacing.set(qn("w:lineRule"), "exact")
+    pPr.append(spacing)
+    p.append(pPr)
+
+    # Add run.
+    r = OxmlElement("w:r")
+    rPr = OxmlElement("w:rPr")
+    sz = OxmlElement("w:sz")
+    sz.set(qn("w:val"), "2")
+    szCs = OxmlElement("w:szCs")
+    szCs.set(qn("w:val"), "2")
+    rPr.append(sz)
+    rPr.append(szCs)
+    r.append(rPr)
+    t = OxmlElement("w:t")
+    t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+    t.text = "​"
+    r.append(t)
+    p.append(r)
+    body.insert(idx, p)
@@ -2,13 +2,10 @@
 
 from __future__ import annotations
 
-from io import BytesIO
-
-from docx import Document
-from docx.shared import Inches
-
 from ..layouts.project_forward import project_forward_body_order
+from .docx_base import base_document, save_docx_bytes, setup_page_margins
 from .docx_header import _add_header
+from .docx_page_fit import check_docx_max_pages
 from .docx_sections import (
     _render_docx_education_section,
     _render_docx_experience_section,
@@ -19,15 +16,8 @@ from .docx_sections import (
 
 
 def build_docx_project_forward_document(resumeData, style, stylePreferences=None, templateSlug="project-forward", docxMaxPages=None):
-    # Initialize Docx.
-    doc = Document()
-
-    # Set page margins from the active template tokens.
-    sect = doc.sections[0]
-    sect.top_margin = Inches(style.margin_top_in)
-    sect.bottom_margin = Inches(style.margin_bottom_in)
-    sect.left_margin = Inches(style.margin_left_in)
-    sect.right_margin = Inches(style.margin_right_in)
+    # Start from the cached base package: page margins are already set from the template tokens.
+    doc = base_document("flow", style, setup_page_margins)
 
     # Add header first; project-forward templates can use header_alignment tokens.
     _add_header(doc, resumeData, style, stylePreferences)
@@ -63,7 +53,7 @@ def build_docx_project_forward_document(resumeData, style, stylePreferences=None
         elif sectionKey == "education":
             _render_docx_education_section(doc, resumeData, style, indent, sectionLabels, defaults)
 
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer.read()
+    # Single flow: nothing to shrink here, but say so when docxMaxPages won't hold.
+    check_docx_max_pages(doc, style.font_primary, docxMaxPages, layout=templateSlug)
+
+    return save_docx_bytes(doc)
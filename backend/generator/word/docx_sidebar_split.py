@@ -5,7 +5,6 @@
 
 from __future__ import annotations
 
-from io import BytesIO
 from dataclasses import replace
 from typing import Any, Dict
 
@@ -18,8 +17,10 @@ from docx.shared import Inches, Pt
 from ..layouts.sidebar_split import sidebar_main_column_order, sidebar_rail_section_order
 from ..shared.dates import format_date_range
 from ..shared.skills import skills_group_ordered
+from .docx_base import base_document, save_docx_bytes
 from .docx_header import _add_sidebar_rail_header
 from .docx_layout import _apply_section_title_bottom_border
+from .docx_page_fit import add_tail_paragraph_before_sectpr, cell_height_pt, fits_pages
 from .docx_run_style import _apply_run_resume_color, _hex_rgb_6_for_word, _set_line_spacing_multiple
 from .docx_sections import (
     _render_docx_experience_section,
@@ -56,175 +57,26 @@ def _set_cell_margins_inches(cell: Any, *, top: float = 0, left: float = 0, bott
 
 # --- Handle Sidebar DOCX: stretch table row to page height only when content likely fits on one page. ---
 # Word may still paginate oddly if the row splits across pages (tall fixed row + overflow).
-_SIDEBAR_DOCX_FILL_ROW_SLACK_TWIPS = 720  # heuristic one-pager: room for pagination / sectPr
+_SIDEBAR_DOCX_FILL_ROW_SLACK_TWIPS = 720  # measured one-pager: room for pagination / sectPr
 _SIDEBAR_DOCX_FILL_ROW_SLACK_TWIPS_DOCX_MAX_1 = (
     720  # ~0.5in under full body + stub para before sectPr - fewer phantom pages than 240
 )
-_SIDEBAR_DOCX_AVG_LINE_PT = 12.75
-_SIDEBAR_DOCX_ONE_PAGE_LINES_FRAC = 0.78  # conservative; underestimate risk = blank page again
-
-# --- Handle Sidebar DOCX Wrapped Line Count ---
-def _sidebar_docx_wrapped_line_count(text: str, chars_per_line: float = 58.0) -> float:
-    # Get text.
-    t = (text or "").strip()
-
-    # Check if text is empty.
-    if not t:
-        return 0.0
-
-    # Initialize total.
-    total = 0.0
-
-    # Iterate over each line.
-    for seg in t.split("\n"):
-        seg = seg.strip()
-        if not seg:
-            # Add 0.35 to total for empty line.
-            total += 0.35
-            continue
-
-        # Add 1.0 to total for each segment.
-        total += max(1.0, len(seg) / chars_per_line)
-    return total
-
-# --- Handle Estimate Sidebar DOCX Main Column Lines ---
-def _estimate_sidebar_docx_main_column_lines(resume_data: Dict[str, Any]) -> float:
-    # Initialize lines.
-    lines = 0.0
-
-    # Iterate over each key in sidebar main column order.
-    for key in sidebar_main_column_order(resume_data):
-        if key == "summary":
-            # Get summary.
-            summ = (resume_data.get("summary") or {}).get("summary") or ""
-            if not str(summ).strip():
-                continue
-            lines += 3.4
-            lines += _sidebar_docx_wrapped_line_count(str(summ), 56.0)
-        elif key == "experience":
-            # Get experience.
-            exps = resume_data.get("experience") or []
-            if not exps:
-                continue
-            lines += 3.6
-
-            for exp in exps:
-                if not isinstance(exp, dict):
-                    exp = {}
-                lines += 2.8
-                desc = str(exp.get("description") or "")
-                lines += _sidebar_docx_wrapped_line_count(desc, 56.0) * 1.08
-                lines += 1.35
-        elif key == "projects":
-            # Get projects.
-            projs = resume_data.get("projects") or []
-            if not projs:
-                continue
-            lines += 3.6
-
-            # Iterate over each project.
-            for proj in projs:
-                if not isinstance(proj, dict):
-                    proj = {}
-                lines += 3.2
-                desc = str(proj.get("description") or "")
-                lines += _sidebar_docx_wrapped_line_count(desc, 56.0)
-                lines += 0.9
-
-    return lines
-
-# --- Handle Estimate Sidebar DOCX Rail Lines ---
-def _estimate_sidebar_docx_rail_lines(resume_data: Dict[str, Any]) -> float:
-    # Initialize lines.
-    lines = 6.5
-    header = resume_data.get("header") or {}
-    vis = header.get("visibility") or {}
-    if vis.get("showTagline", True) and (header.get("tagline") or "").strip():
-        lines += 1.6
-
-    # Get contact order.
-    order = header.get("contactOrder", ["email", "phone", "location", "linkedin", "github", "portfolio"])
-    field_map = {
-        "email": header.get("email", ""),
-        "phone": header.get("phone", ""),
-        "location": header.get("location", ""),
-        "linkedin": header.get("linkedin", ""),
-        "github": header.get("github", ""),
-        "portfolio": header.get("portfolio", ""),
-    }
-    vis_map = {
-        "email": "showEmail",
-        "phone": "showPhone",
-        "location": "showLocation",
-        "linkedin": "showLinkedin",
-        "github": "showGithub",
-        "portfolio": "showPortfolio",
-    }
-    n_contact = 0
-
-    # Iterate over each contact field.
-    for fk in order:
-        if fk not in field_map:
-            continue
-        val = str(field_map.get(fk) or "").strip()
-        if not val:
-            continue
-        vk = vis_map.get(fk)
-        if vk and not vis.get(vk, True):
-            continue
-        n_contact += 1
-    lines += max(0.0, n_contact - 1) * 1.05 + (1.0 if n_contact else 0.0)
-
-    # Iterate over each key in sidebar rail section order.
-    for key in sidebar_rail_section_order(resume_data):
-        if key == "skills":
-            skills = resume_data.get("skills") or []
-            if not skills:
-                continue
-            lines += 3.0
-            cat_order = resume_data.get("skillsCategoryOrder") or []
-            groups = skills_group_ordered(skills, cat_order if cat_order else None)
-            for category, names in groups:
-                if not names:
-                    continue
-                if category:
-                    lines += 1.15
-                # Narrow column: names wrap more often
-                joined_len = sum(len(str(n)) for n in names) + max(0, len(names) - 1) * 2
-                lines += max(1.0, joined_len / 34.0)
-                lines += 0.35
-        elif key == "education":
-            edu_list = resume_data.get("education") or []
-            if not edu_list:
-                continue
-            lines += 3.0
-            for edu in edu_list:
-                if not isinstance(edu, dict):
-                    edu = {}
-                subs = edu.get("subsections") or {}
-                if not isinstance(subs, dict):
-                    subs = {}
-                lines += 5.8 + min(8.0, len(subs)) * 1.8
-    return lines
 
 # --- Handle Sidebar DOCX Row Likely Fits One Page ---
-def _sidebar_docx_row_likely_fits_one_page(sect: Any, resume_data: Dict[str, Any]) -> bool:
-
-    # Get body height in inches.
-    body_h_in = float(sect.page_height.inches) - float(sect.top_margin.inches) - float(
-        sect.bottom_margin.inches
-    )
-
-    # Get usable lines.
-    usable_lines = (max(1.0, body_h_in) * 72.0) / _SIDEBAR_DOCX_AVG_LINE_PT
-    cap = usable_lines * _SIDEBAR_DOCX_ONE_PAGE_LINES_FRAC
-
-    # Get main and rail lines.
-    main_l = _estimate_sidebar_docx_main_column_lines(resume_data)
-    rail_l = _estimate_sidebar_docx_rail_lines(resume_data)
-
-    # Return if the main or rail lines are less than or equal to the capacity.
-    return max(main_l, rail_l) <= cap
+def _sidebar_docx_row_likely_fits_one_page(
+    sect: Any,
+    left_cell: Any,
+    right_cell: Any,
+    rail_in: float,
+    main_in: float,
+    style: DocxStyleConfig,
+) -> bool:
+    # Measure both rendered columns at their real widths; the row is as tall as the taller one,
+    # and a filled row stops the slack short of the page.
+    family = style.font_primary
+    rail_pt = cell_height_pt(left_cell, float(rail_in) * 72.0, family)
+    main_pt = cell_height_pt(right_cell, float(main_in) * 72.0, family)
+    return fits_pages(max(rail_pt, main_pt) + _SIDEBAR_DOCX_FILL_ROW_SLACK_TWIPS / 20.0, sect, 1)
 
 
 # --- Handle Finalize Sidebar Split Table ---
@@ -682,57 +534,23 @@ def _strip_document_leading_empty_paragraph(doc: Document) -> None:
     if parent is not None:
         parent.remove(el)
 
-# --- Handle Sidebar DOCX Tail Paragraph Before SectPr ---
-def _sidebar_docx_tail_paragraph_before_sectpr(doc: Document) -> None:
-    # Get body.
-    body = doc.element.body
-    kids = list(body)
-    if len(kids) < 2 or kids[-1].tag != qn("w:sectPr"):
-        return
-    if kids[-2].tag == qn("w:p"):
-        return
-    idx = len(kids) - 1
-    p = OxmlElement("w:p")
-    pPr = OxmlElement("w:pPr")
-    spacing = OxmlElement("w:spacing")
-    spacing.set(qn("w:before"), "0")
-    spacing.set(qn("w:after"), "0")
-    spacing.set(qn("w:line"), "20")
-    spacing.set(qn("w:lineRule"), "exact")
-    pPr.append(spacing)
-    p.append(pPr)
-
-    # Add run.
-    r = OxmlElement("w:r")
-    rPr = OxmlElement("w:rPr")
-    sz = OxmlElement("w:sz")
-    sz.set(qn("w:val"), "2")
-    sz_cs = OxmlElement("w:szCs")
-    sz_cs.set(qn("w:val"), "2")
-    rPr.append(sz)
-    rPr.append(sz_cs)
-    r.append(rPr)
-    t = OxmlElement("w:t")
-    t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
-    t.text = "\u200b"
-    r.append(t)
-    p.append(r)
-    body.insert(idx, p)
-
+# --- Handle Sidebar Split Column Widths ---
+def _sidebar_split_widths_in(sect: Any, style: DocxStyleConfig) -> tuple[float, float]:
+    # Get usable points.
+    usable_pt = (
+        float(sect.page_width.pt)
+        - float(sect.left_margin.pt)
+        - float(sect.right_margin.pt)
+    )
+    usable_in = usable_pt / 72.0
+    rail_in = float(style.sidebar_width_in)
+    main_in = max(1.25, usable_in - rail_in)
+    return rail_in, main_in
 
-# --- Handle Build Sidebar DOCX Split Document ---
-def _build_docx_sidebar_split_document(
-    resume_data: Dict[str, Any],
-    style: DocxStyleConfig,
-    style_preferences: dict | None = None,
-    *,
-    template_slug: str = "sidebar",
-    docx_max_pages: int | None = None,
-) -> bytes:
 
-    # Initialize document.
-    doc = Document()
-    # Get section.
+# --- Handle Setup Sidebar Split Base ---
+def _setup_sidebar_split_base(doc: Document, style: DocxStyleConfig) -> None:
+    # Page setup and the empty two-cell table; cached per style by docx_base.
     sect = doc.sections[0]
 
     # Match PDF: Playwright margin is 0 for sidebar; resume is a full Letter box and
@@ -750,15 +568,7 @@ def _build_docx_sidebar_split_document(
     # Strip document leading empty paragraph.
     _strip_document_leading_empty_paragraph(doc)
 
-    # Get usable points.
-    usable_pt = (
-        float(sect.page_width.pt)
-        - float(sect.left_margin.pt)
-        - float(sect.right_margin.pt)
-    )
-    usable_in = usable_pt / 72.0
-    rail_in = float(style.sidebar_width_in)
-    main_in = max(1.25, usable_in - rail_in)
+    rail_in, main_in = _sidebar_split_widths_in(sect, style)
 
     # Add table and set columns.
     tbl = doc.add_table(rows=1, cols=2)
@@ -792,6 +602,29 @@ def _build_docx_sidebar_split_document(
         right_cell, top=mt, bottom=mb, left=main_left_pad, right=mr
     )
 
+
+# --- Handle Build Sidebar DOCX Split Document ---
+def _build_docx_sidebar_split_document(
+    resume_data: Dict[str, Any],
+    style: DocxStyleConfig,
+    style_preferences: dict | None = None,
+    *,
+    template_slug: str = "sidebar",
+    docx_max_pages: int | None = None,
+) -> bytes:
+
+    # Start from the cached base package: zero page margins and the empty, styled table.
+    doc = base_document("sidebar", style, _setup_sidebar_split_base)
+    sect = doc.sections[0]
+    rail_in, main_in = _sidebar_split_widths_in(sect, style)
+
+    # Get table and cells.
+    tbl = doc.tables[0]
+    left_cell = tbl.rows[0].cells[0]
+    right_cell = tbl.rows[0].cells[1]
+    main_left_pad = float(style.sidebar_body_pad_left_in)
+    mr = float(style.margin_right_in)
+
     # Add sidebar rail header.
     _add_sidebar_rail_header(
         left_cell,
@@ -892,7 +725,7 @@ def _build_docx_sidebar_split_document(
         slack = _SIDEBAR_DOCX_FILL_ROW_SLACK_TWIPS_DOCX_MAX_1
     # Otherwise, set fill row to the likely fits one page and slack to the default slack twips.
     else:
-        fill_row = _sidebar_docx_row_likely_fits_one_page(sect, resume_data)
+        fill_row = _sidebar_docx_row_likely_fits_one_page(sect, left_cell, right_cell, rail_in, main_in, style)
         slack = _SIDEBAR_DOCX_FILL_ROW_SLACK_TWIPS
     row_h_in = float(getattr(style, "sidebar_docx_fill_row_height_in", 0.0) or 0.0)
     _finalize_sidebar_split_table(
@@ -905,10 +738,7 @@ def _build_docx_sidebar_split_document(
         fill_row_height_in=row_h_in if row_h_in > 0 else None,
     )
     if fill_row:
-        _sidebar_docx_tail_paragraph_before_sectpr(doc)
+        add_tail_paragraph_before_sectpr(doc)
 
-    # Save document to buffer and return the buffer.
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer.read()
+    # Save document.
+    return save_docx_bytes(doc)
@@ -1,11 +1,12 @@
 # docx_styles.py
 # Word-facing style token dataclass. Values mirror backend/templates/classic/preview.css.
 # Merged token loading lives in ``generator.shared.styles`` (``get_styles``).
+# Frozen: resolved configs are cached and shared between exports; derive with dataclasses.replace.
 
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class DocxStyleConfig:
     """Style tokens for docx output. Matches preview.css where possible."""
 
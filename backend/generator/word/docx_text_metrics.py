@@ -0,0 +1,136 @@
+# Text measurement for DOCX page fitting: glyph advances instead of character counts.
+
+# Word wraps by the fonts' real glyph widths, so "58 characters per line" is wrong for any
+# line of capitals, digits or narrow letters. This module measures instead:
+#
+# - Glyph-advance tables come from the Adobe core-14 AFM metrics bundled with pdfminer
+#   (already installed for the resume parser), so nothing is read from system fonts.
+#   Each template family maps to its metric-compatible core face plus an average width
+#   scale (Arial = Helvetica, Calibri ~ 0.89 x Helvetica, Georgia ~ 1.13 x Times) and its
+#   single-spacing line height.
+# - Tables are built once per (family, size, bold) as NumPy vectors indexed by code point.
+# - Wrapping takes one cumulative-sum pass per paragraph and one binary search per output
+#   line, so it never loops over characters in Python.
+
+from functools import lru_cache
+
+import numpy as np
+from pdfminer.fontmetrics import FONT_METRICS
+
+# --- Core faces (regular, bold) per metric class ---
+coreFaces = {
+    "times": ("Times-Roman", "Times-Bold"),
+    "helvetica": ("Helvetica", "Helvetica-Bold"),
+    "courier": ("Courier", "Courier-Bold"),
+}
+
+# --- Template families: (core metric class, width scale vs. the core face, single line height in em) ---
+familyMetrics = {
+    "times new roman": ("times", 1.0, 1.15),
+    "times": ("times", 1.0, 1.15),
+    "georgia": ("times", 1.13, 1.14),
+    "cambria": ("times", 1.07, 1.17),
+    "garamond": ("times", 0.96, 1.12),
+    "book antiqua": ("times", 1.07, 1.17),
+    "palatino linotype": ("times", 1.07, 1.17),
+    "arial": ("helvetica", 1.0, 1.15),
+    "helvetica": ("helvetica", 1.0, 1.15),
+    "calibri": ("helvetica", 0.89, 1.22),
+    "verdana": ("helvetica", 1.16, 1.22),
+    "tahoma": ("helvetica", 0.98, 1.21),
+    "segoe ui": ("helvetica", 0.98, 1.33),
+    "courier new": ("courier", 1.0, 1.13),
+}
+defaultFamily = "times new roman"
+
+# Code points past the table (CJK, emoji) measure as the face's median glyph.
+advanceTableSize = 0x2200
+
+
+# --- Handle Family Metrics ---
+def family_metrics(family):
+    # "Calibri, sans-serif" / "'Georgia'" -> the first family we know, else the default.
+    for name in str(family or "").split(","):
+        key = name.strip().strip("'\"").lower()
+        if key in familyMetrics:
+            return familyMetrics[key]
+    return familyMetrics[defaultFamily]
+
+
+# --- Handle Core Advances (1/1000 em, per code point) ---
+@lru_cache(maxsize=None)
+def core_advances(face):
+    _, widths = FONT_METRICS[face]
+    table = np.full(advanceTableSize + 1, np.nan)
+    for char, width in widths.items():
+        if len(char) == 1 and ord(char) < advanceTableSize:
+            table[ord(char)] = width
+    table[np.isnan(table)] = np.nanmedian(table)
+    table.setflags(write=False)
+    return table
+
+
+# --- Handle Glyph Widths (points, per code point) ---
+@lru_cache(maxsize=256)
+def glyph_widths(family, sizePt, bold=False):
+    metricClass, scale, _ = family_metrics(family)
+    face = coreFaces[metricClass][1 if bold else 0]
+    widths = core_advances(face) * (scale * float(sizePt) / 1000.0)
+    widths.setflags(write=False)
+    return widths
+
+
+def code_points(text):
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype="<u4")
+    return np.minimum(codes, advanceTableSize)
+
+
+# --- Handle Text Width ---
+def text_width_pt(text, family, sizePt, bold=False):
+    if not text:
+        return 0.0
+    return float(glyph_widths(family, sizePt, bold)[code_points(text)].sum())
+
+
+# --- Handle Line Height ---
+def line_height_pt(family, sizePt, multiple=1.0):
+    # Word "single" spacing is the font's ascent + descent + line gap; "multiple" scales it.
+    return float(sizePt) * family_metrics(family)[2] * float(multiple or 1.0)
+
+
+# --- Handle Line Breaking (one run of text with no hard breaks) ---
+def count_wrapped_lines(advances, isSpace, widthPt, firstLineWidthPt):
+    # advances[i] is character i's width in points; lines break after spaces, like Word.
+    cum = np.concatenate(([0.0], np.cumsum(advances)))
+    end = len(advances)
+    spaces = np.flatnonzero(isSpace)
+    # Width of the text before each space: a trailing space hangs past the margin.
+    beforeSpace = cum[spaces]
+
+    lines = 1
+    start = 0
+    available = firstLineWidthPt
+    while cum[end] - cum[start] > available:
+        limit = cum[start] + available
+        k = int(np.searchsorted(beforeSpace, limit, side="right")) - 1
+        if k >= 0 and spaces[k] > start:
+            start = int(spaces[k]) + 1
+        else:
+            # One word wider than the line: Word breaks it where it overflows.
+            start = max(start + 1, int(np.searchsorted(cum, limit, side="right")) - 1)
+        lines += 1
+        available = widthPt
+    return lines
+
+
+# --- Handle Wrapped Line Count ---
+def wrapped_line_count(text, widthPt, family, sizePt, bold=False, firstLineIndentPt=0.0):
+    # Lines one paragraph takes at this column width; "\n" is a line break inside it.
+    widthPt = max(float(widthPt), float(sizePt))
+    widths = glyph_widths(family, sizePt, bold)
+    total = 0
+    for segment in str(text or "").split("\n"):
+        firstWidth = widthPt - float(firstLineIndentPt) if total == 0 else widthPt
+        codes = code_points(segment)
+        total += count_wrapped_lines(widths[codes], codes == 32, widthPt, max(firstWidth, float(sizePt)))
+    return total
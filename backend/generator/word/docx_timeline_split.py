@@ -32,7 +32,9 @@ from ..layouts.timeline_split import timeline_main_column_order
 from ..shared.skills import skills_group_ordered
 from ..shared.tagline import parse_tagline_runs
 from ..shared.template_slug import resolve_template_folder
+from .docx_base import base_document, save_docx_bytes
 from .docx_layout import _apply_section_title_bottom_border
+from .docx_page_fit import add_tail_paragraph_before_sectpr, document_height_pt, fits_pages
 from .docx_run_style import (
     _apply_run_resume_color,
     _hex_rgb_6_for_word,
@@ -366,25 +368,7 @@ def _merge_left_rail(table: Any) -> Any:
     return table.rows[0].cells[0].merge(table.rows[-1].cells[0])
 
 
-def build_docx_timeline_split_document(
-    resume_data: Dict[str, Any],
-    style: DocxStyleConfig,
-    style_preferences: dict | None = None,
-    *,
-    template_slug: str = "timeline-split",
-    docx_max_pages: int | None = None,
-) -> bytes:
-    doc = Document()
-    section = doc.sections[0]
-    section.top_margin = Inches(style.margin_top_in)
-    section.bottom_margin = Inches(style.margin_bottom_in)
-    section.left_margin = Inches(style.margin_left_in)
-    section.right_margin = Inches(style.margin_right_in)
-
-    _add_timeline_header(doc, resume_data, style)
-
-    main_keys = _timeline_main_keys(resume_data)
-    rows = max(1, len(main_keys))
+def _timeline_column_widths_in(section: Any, style: DocxStyleConfig) -> List[float]:
     usable_in = (
         float(section.page_width.inches)
         - float(section.left_margin.inches)
@@ -395,9 +379,20 @@ def build_docx_timeline_split_document(
     rule_in = max(0.035, min(0.08, float(style.timeline_line_width_pt) / 72.0 + 0.035))
     spine_in = max(float(style.timeline_spine_width_in), marker_in + rule_in)
     content_in = max(1.5, usable_in - left_in - spine_in)
+    return [left_in, marker_in, rule_in, content_in]
+
+
+def _setup_timeline_split_base(doc: Document, style: DocxStyleConfig, rows: int) -> None:
+    # Page margins and the empty body table (rail merged down, spine borders, cell insets);
+    # cached per style and row count by docx_base.
+    section = doc.sections[0]
+    section.top_margin = Inches(style.margin_top_in)
+    section.bottom_margin = Inches(style.margin_bottom_in)
+    section.left_margin = Inches(style.margin_left_in)
+    section.right_margin = Inches(style.margin_right_in)
 
     table = doc.add_table(rows=rows, cols=4)
-    _set_table_geometry(table, [left_in, marker_in, rule_in, content_in])
+    _set_table_geometry(table, _timeline_column_widths_in(section, style))
 
     for row in table.rows:
         for cell in row.cells:
@@ -406,6 +401,47 @@ def build_docx_timeline_split_document(
     left_cell = _merge_left_rail(table)
     _remove_singleton_empty_paragraph(left_cell)
     _set_cell_margins_inches(left_cell, top=0, left=0, bottom=0, right=0.16)
+
+    body_gap_in = max(0.0, float(style.timeline_body_column_gap_pt) / 72.0)
+    for row in table.rows:
+        marker_cell, rule_cell, content_cell = row.cells[1:4]
+        _remove_singleton_empty_paragraph(marker_cell)
+        _remove_singleton_empty_paragraph(rule_cell)
+        _remove_singleton_empty_paragraph(content_cell)
+        _set_cell_margins_inches(marker_cell, top=0, left=0, bottom=0, right=0)
+        _set_cell_margins_inches(rule_cell, top=0, left=0, bottom=0, right=0)
+        _set_cell_margins_inches(content_cell, top=0, left=body_gap_in, bottom=0, right=0)
+        _set_cell_border(
+            rule_cell,
+            "left",
+            color=style.timeline_line_color,
+            width_pt=style.timeline_line_width_pt,
+        )
+
+
+def build_docx_timeline_split_document(
+    resume_data: Dict[str, Any],
+    style: DocxStyleConfig,
+    style_preferences: dict | None = None,
+    *,
+    template_slug: str = "timeline-split",
+    docx_max_pages: int | None = None,
+) -> bytes:
+    main_keys = _timeline_main_keys(resume_data)
+    rows = max(1, len(main_keys))
+
+    # Start from the cached base package: margins and the empty table are already set up.
+    doc = base_document("timeline-split", style, _setup_timeline_split_base, rows)
+    section = doc.sections[0]
+    table = doc.tables[0]
+
+    # The header goes above the base's table.
+    _add_timeline_header(doc, resume_data, style)
+    for el in list(table._tbl.itersiblings()):
+        if el.tag != qn("w:sectPr"):
+            table._tbl.addprevious(el)
+
+    left_cell = table.rows[0].cells[0]
     _render_contact_rail(
         left_cell,
         resume_data,
@@ -423,6 +459,7 @@ def build_docx_timeline_split_document(
         "projects": "Projects",
         "skills": "Skills",
     }
+    content_in = _timeline_column_widths_in(section, style)[-1]
     body_gap_in = max(0.0, float(style.timeline_body_column_gap_pt) / 72.0)
     style_main = replace(
         style,
@@ -431,20 +468,7 @@ def build_docx_timeline_split_document(
 
     for row_index, section_key in enumerate(main_keys):
         marker_cell = table.rows[row_index].cells[1]
-        rule_cell = table.rows[row_index].cells[2]
         content_cell = table.rows[row_index].cells[3]
-        _remove_singleton_empty_paragraph(marker_cell)
-        _remove_singleton_empty_paragraph(rule_cell)
-        _remove_singleton_empty_paragraph(content_cell)
-        _set_cell_margins_inches(marker_cell, top=0, left=0, bottom=0, right=0)
-        _set_cell_margins_inches(rule_cell, top=0, left=0, bottom=0, right=0)
-        _set_cell_margins_inches(content_cell, top=0, left=body_gap_in, bottom=0, right=0)
-        _set_cell_border(
-            rule_cell,
-            "left",
-            color=style.timeline_line_color,
-            width_pt=style.timeline_line_width_pt,
-        )
         _add_marker(marker_cell, section_key, style, template_slug)
         _render_main_section(
             content_cell,
@@ -460,7 +484,9 @@ def build_docx_timeline_split_document(
                 style.timeline_section_gap_pt
             )
 
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer.read()
+    # The body ends in the table: when the measured content fits docxMaxPages, close it
+    # with a 1pt paragraph so Word's own trailing paragraph can't push out a blank page.
+    if docx_max_pages and fits_pages(document_height_pt(doc, style.font_primary), section, docx_max_pages):
+        add_tail_paragraph_before_sectpr(doc)
+
+    return save_docx_bytes(doc)
@@ -16,7 +16,11 @@ logging.basicConfig(
 )
 
 # import routers.
-from routers import auth_router, profile_router, generator_router, templates_router, ai_router
+from routers import auth_router, profile_router, generator_router, generator_socket_router, templates_router, ai_router
+from routers.email_outbox import start_outbox_worker, stop_outbox_worker
+from resume_parser.parse_service import resumeParser
+from generator.export_service import docxExports
+from generator.pdf_renderer import pdf_renderer
 
 
 # ---------------- backend startup ----------------
@@ -42,7 +46,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
     allow_headers=["*"],
-    expose_headers=["*"],
+    # with credentials, browsers read "*" as a literal header name, so the headers the
+    # frontend reads are named explicitly.
+    expose_headers=["*", "X-Fit-Style", "X-Fit-Pages"],
     max_age=86400,  # cache preflight for 24 hours.
 )
 
@@ -50,9 +56,26 @@ app.add_middleware(
 app.include_router(auth_router)
 app.include_router(profile_router)
 app.include_router(generator_router)
+app.include_router(generator_socket_router)
 app.include_router(templates_router)
 app.include_router(ai_router)
 
+# background email delivery (see routers/email_outbox.py) + the resume parser and docx
+# export process pools (see resume_parser/parse_service.py, generator/export_service.py).
+# the pdf renderer's browser starts on the first export (generator/pdf_renderer.py).
+@app.on_event("startup")
+async def start_background_workers():
+    start_outbox_worker()
+    resumeParser.start()
+    docxExports.start()
+
+@app.on_event("shutdown")
+async def stop_background_workers():
+    await stop_outbox_worker()
+    resumeParser.stop()
+    docxExports.stop()
+    pdf_renderer.stop()
+
 # ---------------- routes startup ----------------
 
 # basic routes.
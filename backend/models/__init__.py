@@ -10,6 +10,8 @@ from .education import Education        # import 'education' model.
 from .summary import Summary            # import 'summary' model.
 from .base import Base                  # import 'base' model.
 from .saved_resume import SavedResume   # import 'saved_resume' model.
+from .usage_quota import UsageQuota     # import 'usage_quota' model.
+from .email_outbox import EmailOutbox   # import 'email_outbox' model.
 
-__all__ = ["User", "Experience", "Projects", "Skills", "Contact", "Education", "Summary", "SavedResume", "Base"]  # export our models.
+__all__ = ["User", "Experience", "Projects", "Skills", "Contact", "Education", "Summary", "SavedResume", "UsageQuota", "EmailOutbox", "Base"]  # export our models.
 
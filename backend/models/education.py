@@ -11,7 +11,7 @@ class Education(Base):
     __tablename__ = "education"
 
     id = Column(Integer, primary_key=True, index=True)                          # id.
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)       # foreign key to user.
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)       # foreign key to user.
     school = Column(String(200), nullable=True)                                 # school name.
     degree = Column(String(200), nullable=True)                                 # degree type.
     discipline = Column(String(200), nullable=True)                             # field of study.
@@ -0,0 +1,27 @@
+# models / email_outbox.py
+
+# outbound email queue. auth routes insert a row in the same transaction as the token
+# they're emailing, return right away, and routers/email_outbox.py delivers it later.
+
+# imports.
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from .base import Base
+
+
+# email outbox model.
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+    # the worker's poll: status = 'pending' and next_attempt_at <= now.
+    __table_args__ = (Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),)
+
+    id = Column(Integer, primary_key=True, index=True)                                  # id.
+    to_email = Column(String(255), nullable=False)                                      # recipient.
+    subject = Column(String(255), nullable=False)                                       # subject line.
+    html = Column(Text, nullable=True)                                                  # rendered html body; nulled once sent / failed (holds token links).
+    status = Column(String(20), nullable=False, default="pending")                      # pending / sent / failed.
+    attempts = Column(Integer, nullable=False, default=0)                               # delivery attempts so far.
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)         # due time (also the claim lease).
+    last_error = Column(String(500), nullable=True)                                     # last provider error, for debugging.
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)              # queued at.
+    sent_at = Column(DateTime, nullable=True)                                           # delivered at.
@@ -11,7 +11,7 @@ class Experience(Base):
     __tablename__ = "experiences"
 
     id = Column(Integer, primary_key=True, index=True)                      # id.
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)       # foreign key to user.
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)       # foreign key to user.
     title = Column(String(200), nullable=False)                             # title.
     company = Column(String(200), nullable=True)                            # company.
     description = Column(Text, nullable=True)                               # description.
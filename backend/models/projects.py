@@ -10,7 +10,7 @@ class Projects(Base):
     __tablename__ = "projects"
 
     id = Column(Integer, primary_key=True, index=True)                      # id.
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)       # foreign key to user.
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)       # foreign key to user.
     title = Column(String(200), nullable=False)                             # title.
     description = Column(String(500), nullable=True)                        # description.
     tech_stack = Column(JSON, nullable=True)                                # tech stack as list of strings.
@@ -3,20 +3,80 @@
 # Saved resume preview - user can save a snapshot of their resume for later.
 # Limited per user (configurable via MAX_SAVED_RESUMES).
 
+# card metadata (status, tags, target role, size, hash) lives in plain columns so the
+# dashboard list never touches the snapshot. the snapshot itself is a deferred blob —
+# only loaded when a single resume is opened in the editor.
+
+import hashlib
+import json
+import os
+import zlib
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, JSON, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, JSON, DateTime, ForeignKey, LargeBinary, Index
+from sqlalchemy.orm import relationship, deferred
 from .base import Base
 
+# snapshots are stored as zlib-compressed json unless SAVED_RESUME_COMPRESSION=0.
+# the first byte of every blob records which codec wrote it, so flipping the env
+# var never breaks reading rows saved under the other setting.
+compressSnapshots = os.getenv("SAVED_RESUME_COMPRESSION", "1") != "0"
+snapshotCodecZlib = b"z"
+snapshotCodecJson = b"j"
+
+
+def encode_snapshot(resumeData):
+    """Serialize a resume snapshot -> (blob, raw size in bytes, sha256 of the canonical json)."""
+    raw = json.dumps(resumeData or {}, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    contentHash = hashlib.sha256(raw).hexdigest()
+    if compressSnapshots:
+        blob = snapshotCodecZlib + zlib.compress(raw, 6)
+    else:
+        blob = snapshotCodecJson + raw
+    return blob, len(raw), contentHash
+
+
+def decode_snapshot(blob):
+    """Inverse of encode_snapshot; empty/missing blobs decode to {}."""
+    if not blob:
+        return {}
+    blob = bytes(blob)
+    codec, body = blob[:1], blob[1:]
+    raw = zlib.decompress(body) if codec == snapshotCodecZlib else body
+    return json.loads(raw.decode("utf-8"))
+
 
 class SavedResume(Base):
     __tablename__ = "saved_resumes"
+    # the dashboard list filters by user and sorts newest first; one index serves both.
+    __table_args__ = (Index("ix_saved_resumes_user_id_created_at", "user_id", "created_at"),)
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(255), nullable=False)  # e.g. "Software Engineer Resume"
-    resume_data = Column(JSON, nullable=False)      # full resume state (header, education, experience, etc.)
     template = Column(String(100), nullable=True)  # template used when saved
+
+    # dashboard card metadata — edited in place without rewriting the snapshot.
+    status = Column(String(40), nullable=False, default="draft")     # draft / ready / saved / ...
+    tags = Column(JSON, nullable=True)                                # short user tags, max 8
+    target_role = Column(String(255), nullable=True)                  # tailored-for role (saveMetadata / tailorIntent)
+    target_company = Column(String(255), nullable=True)               # tailored-for company
+    changed_sections = Column(JSON, nullable=True)                    # sections the tailor run touched
+    size_bytes = Column(Integer, nullable=False, default=0)           # uncompressed snapshot size
+    content_hash = Column(String(64), nullable=True)                  # sha256 of canonical snapshot json
+
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # full resume state (header, education, experience, etc.), see encode_snapshot.
+    snapshot = deferred(Column(LargeBinary, nullable=False))
 
     user = relationship("User", back_populates="saved_resumes")
+
+    @property
+    def resume_data(self):
+        # touching this loads the deferred snapshot — keep it out of list queries.
+        return decode_snapshot(self.snapshot)
+
+    def set_resume_data(self, resumeData):
+        """Replace the snapshot and keep size/hash columns in step with it."""
+        self.snapshot, self.size_bytes, self.content_hash = encode_snapshot(resumeData)
@@ -1,7 +1,7 @@
 # models / skills.py
 
 # imports.
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from .base import Base
 
@@ -18,3 +18,7 @@ class Skills(Base):
     # relationship back to user.
     user = relationship("User", back_populates="skills")
 
+
+# create_skill checks for an existing skill with func.lower(name); the leading user_id
+# column also covers the plain per-user loads (profile, bulk sync).
+Index("ix_skills_user_id_lower_name", Skills.user_id, func.lower(Skills.name))
@@ -10,7 +10,7 @@ class Summary(Base):
     __tablename__ = "professional_summary"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     summary = Column(Text, nullable=False)
 
     # relationship back to user.
@@ -0,0 +1,22 @@
+# models / usage_quota.py
+
+# per-user usage counters (daily tailor cap, outbound email throttles).
+# one row per (user, kind) — routers/quota.py updates it with a single conditional
+# UPDATE so concurrent requests can't both squeeze under the limit.
+
+# imports.
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, DateTime, UniqueConstraint
+from .base import Base
+
+
+# usage quota model.
+class UsageQuota(Base):
+    __tablename__ = "usage_quotas"
+    __table_args__ = (UniqueConstraint("user_id", "kind", name="uq_usage_quotas_user_kind"),)
+
+    id = Column(Integer, primary_key=True, index=True)                                          # id.
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)       # foreign key to user.
+    kind = Column(String(40), nullable=False)                                                   # e.g. "tailor", "verification_email".
+    window_date = Column(Date, nullable=True)                                                   # utc day the count belongs to.
+    count = Column(Integer, nullable=False, default=0)                                          # uses inside window_date.
+    last_used_at = Column(DateTime, nullable=True)                                              # last successful consume (cooldowns).
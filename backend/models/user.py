@@ -17,9 +17,9 @@ class User(Base):
     password_hash = Column(String(255), nullable=False)                     # password.
     email_verified = Column(Boolean, nullable=False, default=False)
     email_verified_at = Column(DateTime, nullable=True)
-    email_verification_token_hash = Column(String(255), nullable=True)
+    email_verification_token_hash = Column(String(255), nullable=True, index=True)
     email_verification_expires_at = Column(DateTime, nullable=True)
-    password_reset_token_hash = Column(String(255), nullable=True)
+    password_reset_token_hash = Column(String(255), nullable=True, index=True)
     password_reset_expires_at = Column(DateTime, nullable=True)
 
     # attached resume metadata (Info page: "Attached Resume" banner)
@@ -46,18 +46,8 @@ class User(Base):
     # source of truth — frontend must not rely on localStorage for this.
     setup_completed = Column(Boolean, nullable=False, default=False)
 
-    # daily tailor usage cap
-    daily_tailor_count = Column(Integer, nullable=False, default=0)
-    daily_tailor_reset_date = Column(DateTime, nullable=True)
-
-    # outbound email throttling (cooldown + daily cap per email type) — keeps the
-    # resend-verification / forgot-password endpoints from being used as email bombers.
-    verification_email_last_sent_at = Column(DateTime, nullable=True)
-    verification_email_daily_count = Column(Integer, nullable=False, default=0)
-    verification_email_count_date = Column(DateTime, nullable=True)
-    reset_email_last_sent_at = Column(DateTime, nullable=True)
-    reset_email_daily_count = Column(Integer, nullable=False, default=0)
-    reset_email_count_date = Column(DateTime, nullable=True)
+    # daily tailor cap + outbound email throttles live in usage_quotas (see routers/quota.py).
+    usage_quotas = relationship("UsageQuota", cascade="all, delete-orphan", passive_deletes=True)
 
     # saved resume previews (snapshots for later)
     saved_resumes = relationship("SavedResume", back_populates="user", cascade="all, delete-orphan")
@@ -2,22 +2,165 @@
 
 # docx text extraction.
 
+# streams the package's xml parts with lxml.iterparse instead of loading python-docx's
+# object model: headers first (templates often put the name / contact line there), then
+# word/document.xml in body order, then footers. besides top-level paragraphs this picks
+# up table cells and text boxes / shapes, where templated resumes keep a lot of content.
+# each paragraph is cleared once read, so memory stays flat on long documents.
+
+# - a table row whose cells are single lines ("Acme Corp | May 2021 - Present") reads as
+#   one line; a row with multi-line cells (a sidebar table) reads cell by cell, left to
+#   right, like the pdf extractor reads columns.
+# - a text box's paragraphs come out just before the paragraph it's anchored in.
+# - mc:Fallback (the legacy VML copy of a shape) is skipped, so text boxes aren't doubled.
+
 # imports.
 import logging
+import re
+import zipfile
 from io import BytesIO
 
+from lxml import etree
+
 # create logger.
 logger = logging.getLogger(__name__)
 
-# import docx.
-from docx import Document
+wordNs = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+markupCompatibilityNs = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+
+W_P = f"{{{wordNs}}}p"
+W_R = f"{{{wordNs}}}r"
+W_T = f"{{{wordNs}}}t"
+W_TAB = f"{{{wordNs}}}tab"
+W_BR = f"{{{wordNs}}}br"
+W_CR = f"{{{wordNs}}}cr"
+W_TR = f"{{{wordNs}}}tr"
+W_TC = f"{{{wordNs}}}tc"
+MC_FALLBACK = f"{{{markupCompatibilityNs}}}Fallback"
+
+# run children that stand for characters (w:tab also appears in w:pPr as a tab stop).
+runCharacters = {W_TAB: "\t", W_BR: "\n", W_CR: "\n"}
+
+headerPartRe = re.compile(r"^word/header(\d*)\.xml$")
+footerPartRe = re.compile(r"^word/footer(\d*)\.xml$")
+
+
+def _numbered_parts(names, partRe):
+    """header1.xml, header2.xml, ... in number order."""
+    return sorted((name for name in names if partRe.match(name)), key=lambda name: int(partRe.match(name).group(1) or 0))
+
+
+def _row_lines(cells):
+    """One table row (a list of cells, each a list of lines) -> lines."""
+    cells = [[line for line in cell if line.strip()] for cell in cells]
+    if all(len(cell) <= 1 for cell in cells):
+        row = " ".join(cell[0].strip() for cell in cells if cell)
+        return [row] if row else []
+    return [line for cell in cells for line in cell]
+
+
+def iter_part_lines(source):
+    """Yield a part's paragraphs as text lines, in reading order, streaming the xml."""
+    paragraphs = []         # text pieces of the open paragraphs (more than one inside a text box).
+    sinks = []              # open table cells, innermost last; a finished paragraph goes to the innermost.
+    rows = []               # open table rows (lists of cells), innermost last.
+    skipDepth = 0
+
+    for event, elem in etree.iterparse(source, events=("start", "end")):
+        tag = elem.tag
+        if tag == MC_FALLBACK:
+            skipDepth += 1 if event == "start" else -1
+            if event == "end":
+                elem.clear()
+            continue
+        if skipDepth:
+            continue
+
+        if event == "start":
+            if tag == W_P:
+                paragraphs.append([])
+            elif tag == W_TR:
+                rows.append([])
+            elif tag == W_TC:
+                sinks.append([])
+            continue
+
+        if tag == W_T:
+            if paragraphs and elem.text:
+                paragraphs[-1].append(elem.text)
+        elif tag in runCharacters:
+            parent = elem.getparent()
+            if paragraphs and parent is not None and parent.tag == W_R:
+                paragraphs[-1].append(runCharacters[tag])
+        elif tag == W_P:
+            text = "".join(paragraphs.pop())
+            if sinks:
+                sinks[-1].append(text)
+            else:
+                yield text
+        elif tag == W_TC:
+            cell = sinks.pop()
+            if rows:
+                rows[-1].append(cell)
+        elif tag == W_TR:
+            for line in _row_lines(rows.pop()):
+                if sinks:
+                    sinks[-1].append(line)
+                else:
+                    yield line
+        else:
+            continue
+
+        # done with this element: drop it and the siblings already read.
+        if tag in (W_P, W_TR):
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+
+def extract_docx_lines(file_bytes: bytes):
+    """Every line of a docx: header parts, body, footer parts. Headers repeated per section are read once."""
+    with zipfile.ZipFile(BytesIO(file_bytes)) as package:
+        names = package.namelist()
+        seen = set()
+        for partName in _numbered_parts(names, headerPartRe):
+            with package.open(partName) as part:
+                lines = [line for line in iter_part_lines(part) if line.strip()]
+            if lines and tuple(lines) not in seen:
+                seen.add(tuple(lines))
+                yield from lines
+
+        with package.open("word/document.xml") as part:
+            yield from iter_part_lines(part)
+
+        for partName in _numbered_parts(names, footerPartRe):
+            with package.open(partName) as part:
+                lines = [line for line in iter_part_lines(part) if line.strip()]
+            if lines and tuple(lines) not in seen:
+                seen.add(tuple(lines))
+                yield from lines
+
 
 # extract docx text.
 def extract_docx(file_bytes: bytes) -> str:
-    doc_file = BytesIO(file_bytes)      # create bytes io.
-    doc = Document(doc_file)            # create document.
-    text = ""                           # create empty string.
-    for paragraph in doc.paragraphs:    # iterate through paragraphs.
-        text += paragraph.text + "\n"   # add paragraph text to text.
-    return text                         # return text.
+    try:
+        lines = list(extract_docx_lines(file_bytes))
+
+        # log the number of lines extracted.
+        logger.info(f"[DOCX] Extracted {len(lines)} lines of text.")
+
+        # one line per paragraph / table row, newline-terminated like python-docx's paragraphs were.
+        return "".join(line + "\n" for line in lines)
+
+    except Exception as e:
+        logger.error(f"Error extracting text from DOCX: {str(e)}")
+        raise
+
+
+# the python-docx object model version: body paragraphs only. kept as the baseline for
+# `python -m resume_parser.benchmark --docx`.
+def extract_docx_object_model(file_bytes: bytes) -> str:
+    from docx import Document
 
+    doc = Document(BytesIO(file_bytes))
+    return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
@@ -33,11 +33,22 @@ SPACED_HEADER_ALIASES = {
 }
 
 
+# every header alternative in one compiled pattern, one named group per section. a line
+# is a header when the whole line (optional bullet, optional colon) matches.
+headerLinePattern = re.compile(
+    r"\s*[•\-\*]?\s*(?:" + "|".join(f"(?P<{name}>{pattern})" for name, pattern in SECTION_HEADERS.items()) + r")\s*:?\s*",
+    re.IGNORECASE,
+)
+bulletMarkers = ("•", "-", "*")
+nonLetters = re.compile(r"[^A-Za-z]")
+nonLettersOrSpaces = re.compile(r"[^A-Za-z\s]")
+
+
 def _spaced_header_name(line: str) -> str | None:
-    cleaned = re.sub(r"[^A-Za-z]", "", line or "").upper()
+    cleaned = nonLetters.sub("", line or "").upper()
     if len(cleaned) < 4:
         return None
-    letters_and_spaces = re.sub(r"[^A-Za-z\s]", "", line or "").strip()
+    letters_and_spaces = nonLettersOrSpaces.sub("", line or "").strip()
     if not letters_and_spaces:
         return None
     # Letter-spaced headers usually have more separators than words.
@@ -53,70 +64,45 @@ def split_into_sections(text: str) -> Dict[str, str]:
     Focuses on: Experience, Education, Skills, Contact, Projects, Summary.
     Handles variations in header formatting and multi-column layouts.
     """
+    # One sweep over the lines: the first header line of each section name opens that
+    # section, and it runs until the next opening header. A repeated header (the same
+    # name again, e.g. "Experience" inside a skills sidebar) stays in the content.
+    headers = []
+    seen = set()
+    position = 0
+    bulletLineStart = None
+    colonHeader = None
+    for line in text.split("\n"):
+        stripped = line.strip()
+        lineEnd = position + len(line) + 1
+        if stripped:
+            # "Skills" then a lone ":" on the next line — the colon is part of the header.
+            if colonHeader is not None and stripped == ":":
+                headers[colonHeader] = (headers[colonHeader][0], lineEnd, headers[colonHeader][2])
+            colonHeader = None
+
+            spacedName = _spaced_header_name(stripped)
+            keywordMatch = headerLinePattern.fullmatch(line)
+            name = spacedName or (keywordMatch.lastgroup if keywordMatch else None)
+            if name and name not in seen:
+                seen.add(name)
+                start = position
+                # a keyword header also takes a lone bullet above it ("•" then "Skills").
+                # (at the very top of the text the letter-spaced reading wins and takes neither.)
+                if keywordMatch and not (spacedName and position <= 1):
+                    if bulletLineStart is not None and stripped[0] not in bulletMarkers:
+                        start = bulletLineStart
+                    if ":" not in stripped:
+                        colonHeader = len(headers)
+                headers.append((start, lineEnd, name))
+            bulletLineStart = position if stripped in bulletMarkers else None
+        position = lineEnd
+
     sections = {}
-    
-    # Find all section headers - look for section name pattern
-    # Pattern matches: "Education", "Education:", "• Education", "EDUCATION", etc.
-    header_positions = []
-    for match in re.finditer(r'(?:^|\n)([^\n]+)(?:\n|$)', text, re.MULTILINE):
-        line = match.group(1).strip()
-        section_name = _spaced_header_name(line)
-        if section_name:
-            header_positions.append((match.start(), match.end(), section_name))
+    for i, (_, contentStart, sectionName) in enumerate(headers):
+        contentEnd = headers[i + 1][0] if i + 1 < len(headers) else len(text)
+        sectionContent = text[contentStart:contentEnd].strip()
+        if sectionContent:
+            sections[sectionName] = sectionContent
 
-    for name, pattern in SECTION_HEADERS.items():
-        # Match section headers that are typically on their own line
-        # Allow for optional bullet, colon, and whitespace variations
-        header_pattern = rf'(?:^|\n)\s*[•\-\*]?\s*{pattern}\s*:?\s*(?:\n|$)'
-        for match in re.finditer(header_pattern, text, re.IGNORECASE | re.MULTILINE):
-            # Store the position where content starts (after the header line)
-            # Also store the match start to handle duplicates
-            header_positions.append((match.start(), match.end(), name))
-    
-    if not header_positions:
-        return {}
-    
-    # Sort by position in text (by start position)
-    header_positions.sort(key=lambda x: x[0])
-    
-    # Remove duplicate headers (keep first occurrence)
-    seen = set()
-    unique_headers = []
-    for start, end, name in header_positions:
-        if name not in seen:
-            seen.add(name)
-            unique_headers.append((start, end, name))
-    
-    # Extract content for each section (from header to next header)
-    for i, (start_pos, end_pos, section_name) in enumerate(unique_headers):
-        # Find where this section ends (start of next section, or end of text)
-        if i + 1 < len(unique_headers):
-            next_start = unique_headers[i + 1][0]
-            section_end = next_start
-        else:
-            section_end = len(text)
-        
-        # Extract section content (from end of header to start of next section)
-        section_content = text[end_pos:section_end].strip()
-        
-        # Clean up: remove any section headers that might appear in the content
-        # (this can happen with multi-column layouts or nested content)
-        prior_section_names = {name for _, _, name in unique_headers[:i]}
-        for other_name, other_pattern in SECTION_HEADERS.items():
-            if other_name != section_name:
-                if other_name in prior_section_names:
-                    continue
-                # Remove any other section headers from this section's content
-                other_header_pattern = rf'\n\s*[•\-\*]?\s*{other_pattern}\s*:?\s*(?:\n|$).*'
-                section_content = re.sub(
-                    other_header_pattern, 
-                    '', 
-                    section_content, 
-                    flags=re.IGNORECASE | re.MULTILINE | re.DOTALL
-                )
-        
-        if section_content:
-            sections[section_name] = section_content.strip()
-    
     return sections
-
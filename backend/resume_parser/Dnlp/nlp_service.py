@@ -0,0 +1,126 @@
+# resume_parser/Dnlp/nlp_service.py
+
+# One spaCy pipeline per process, loaded once, shared by every NLP helper.
+
+# - load() is meant for worker startup (parse_service.warm_worker), so no request pays
+#   for the model load. components nobody reads (lemmatizer, senter) are excluded, which
+#   skips loading them at all.
+# - docs() runs nlp.pipe over a whole batch of texts (every entry of a resume) in one call.
+# - Docs are cached by text hash: extract_entities and detect_job_titles on the same text
+#   share one parse instead of running the model twice.
+# - stats() reports the load time and per-call latency.
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+defaultModel = "en_core_web_sm"
+# entities need ner; noun chunks need tagger + attribute_ruler + parser. nothing reads lemmas.
+excludedComponents = ("lemmatizer", "senter")
+docCacheSize = 256
+pipeBatchSize = 32
+
+
+class NlpService:
+    """Lazily loaded spaCy pipeline with batched, cached parsing. Every method degrades to None without spaCy."""
+
+    def __init__(self, model=defaultModel, exclude=excludedComponents, cacheSize=docCacheSize):
+        self.model = model
+        self.exclude = list(exclude)
+        self.cacheSize = cacheSize
+        self.pipeline = None
+        self.loaded = False
+        self.docCache = OrderedDict()  # sha-1 of text -> Doc
+        self.lock = threading.RLock()
+        self.loadMs = None
+        self.calls = 0
+        self.texts = 0
+        self.cacheHits = 0
+        self.pipeMs = 0.0
+        self.lastCallMs = None
+
+    def load(self):
+        """Load the pipeline (once). Returns it, or None if spaCy / the model isn't installed."""
+        with self.lock:
+            if self.loaded:
+                return self.pipeline
+            started = time.perf_counter()
+            try:
+                import spacy
+                self.pipeline = spacy.load(self.model, exclude=self.exclude)
+                self.loadMs = round((time.perf_counter() - started) * 1000, 1)
+                logger.info("spaCy model %s loaded in %.0f ms (components: %s).", self.model, self.loadMs, ", ".join(self.pipeline.pipe_names))
+            except Exception as e:
+                logger.warning(
+                    f"spaCy model not available. Install with: python -m spacy download {self.model}. Error: {e}"
+                )
+                self.pipeline = None
+            self.loaded = True
+            return self.pipeline
+
+    @property
+    def nlp(self):
+        return self.load()
+
+    def docs(self, texts):
+        """Parsed Doc for each text (None for all of them without a model). One nlp.pipe call for the misses."""
+        nlp = self.load()
+        if nlp is None:
+            return [None] * len(texts)
+
+        keys = [hashlib.sha1((text or "").encode("utf-8")).hexdigest() for text in texts]
+        with self.lock:
+            missing = {}
+            for key, text in zip(keys, texts):
+                if key in self.docCache:
+                    self.docCache.move_to_end(key)
+                    self.cacheHits += 1
+                elif key not in missing:
+                    missing[key] = text or ""
+
+            if missing:
+                started = time.perf_counter()
+                for key, doc in zip(missing, nlp.pipe(missing.values(), batch_size=pipeBatchSize)):
+                    self.docCache[key] = doc
+                self.lastCallMs = round((time.perf_counter() - started) * 1000, 3)
+                self.pipeMs += self.lastCallMs
+                self.calls += 1
+                self.texts += len(missing)
+                logger.debug("spaCy parsed %d texts in %.1f ms.", len(missing), self.lastCallMs)
+
+            docs = [self.docCache[key] for key in keys]
+            while len(self.docCache) > self.cacheSize:
+                self.docCache.popitem(last=False)
+            return docs
+
+    def doc(self, text):
+        return self.docs([text])[0]
+
+    def tokenize(self, text):
+        """Tokenizer only — for callers that just need tokens, not tags / entities."""
+        nlp = self.load()
+        return nlp.make_doc(text) if nlp is not None else None
+
+    def stats(self):
+        return {
+            "model": self.model,
+            "loaded": self.pipeline is not None,
+            "components": list(self.pipeline.pipe_names) if self.pipeline is not None else [],
+            "loadMs": self.loadMs,
+            "calls": self.calls,
+            "textsParsed": self.texts,
+            "cacheHits": self.cacheHits,
+            "avgCallMs": round(self.pipeMs / self.calls, 3) if self.calls else None,
+            "lastCallMs": self.lastCallMs,
+        }
+
+    def clear_cache(self):
+        with self.lock:
+            self.docCache.clear()
+
+
+nlp_service = NlpService()
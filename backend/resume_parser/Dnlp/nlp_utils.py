@@ -2,18 +2,13 @@
 
 import re
 from typing import List, Dict, Optional
-from .spacy_loader import get_nlp
+from .nlp_service import nlp_service
 
 
-def extract_entities(text: str) -> Dict[str, List[str]]:
-    """Extract ORG, DATE, GPE, PERSON using spaCy if available."""
-    nlp = get_nlp()
-    if not nlp:
-        return {"ORG": [], "DATE": [], "GPE": [], "PERSON": []}
-
-    doc = nlp(text)
-
+def entities_from_doc(doc):
     entities = {"ORG": [], "DATE": [], "GPE": [], "PERSON": []}
+    if doc is None:
+        return entities
 
     for ent in doc.ents:
         if ent.label_ in entities:
@@ -22,9 +17,18 @@ def extract_entities(text: str) -> Dict[str, List[str]]:
     return entities
 
 
+def extract_entities(text: str) -> Dict[str, List[str]]:
+    """Extract ORG, DATE, GPE, PERSON using spaCy if available."""
+    return entities_from_doc(nlp_service.doc(text))
+
+
+def extract_entities_batch(texts):
+    """extract_entities for every entry of a resume, parsed in one nlp.pipe call."""
+    return [entities_from_doc(doc) for doc in nlp_service.docs(texts)]
+
+
 def detect_job_titles(text: str) -> List[str]:
     """Naive title detection + spaCy enhanced title detection."""
-    nlp = get_nlp()
     titles = []
 
     title_patterns = [
@@ -43,8 +47,9 @@ def detect_job_titles(text: str) -> List[str]:
             titles.append(m.group())
 
     # If spaCy available, also grab nouns with title-like POS tags
-    if nlp:
-        doc = nlp(text)
+    # same cached Doc extract_entities used for this text, if it ran first.
+    doc = nlp_service.doc(text)
+    if doc is not None:
         for chunk in doc.noun_chunks:
             if any(word.lower_ in ["engineer", "developer", "scientist"] for word in chunk):
                 titles.append(chunk.text)
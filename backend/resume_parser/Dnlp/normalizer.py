@@ -2,16 +2,8 @@
 # Light spaCy-based normalization for Phase-1
 
 import re
-import spacy
-from functools import lru_cache
 
-# Load once using LRU cache so spaCy doesn't reload on every request
-@lru_cache(maxsize=1)
-def load_model():
-    try:
-        return spacy.load("en_core_web_sm")
-    except Exception:
-        return None  # Fail gracefully if spaCy isn't installed
+from .nlp_service import nlp_service
 
 
 def normalize_with_spacy(text: str) -> str:
@@ -21,8 +13,9 @@ def normalize_with_spacy(text: str) -> str:
     - DON'T touch dashes at all - preserve exactly as-is
     - DON'T change casing
     """
-    nlp = load_model()
-    if nlp is None:
+    # tokens are all this needs, so only the tokenizer runs (shared model, see nlp_service.py).
+    doc = nlp_service.tokenize(text)
+    if doc is None:
         # Without spaCy: just fix basic spacing, don't touch dashes
         cleaned = text.replace(" \n", "\n")
         cleaned = cleaned.replace("\n ", "\n")
@@ -30,7 +23,6 @@ def normalize_with_spacy(text: str) -> str:
         return cleaned.strip()
 
     # Process with spaCy but preserve dashes exactly
-    doc = nlp(text)
     tokens = []
     for token in doc:
         if token.text == "\n":
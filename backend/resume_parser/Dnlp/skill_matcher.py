@@ -1,35 +1,47 @@
 # resume_parser/Dnlp/skill_matcher.py
 
-import re
+# Keyword skill detection over the shared skill dictionary (gazetteer/data/skills.tsv):
+# one longest-match pass over the text instead of a regex per skill, and the same
+# canonical names the skills parser and the tailor use.
+
 from typing import List, Dict
 
-SKILL_DICT = {
-    "languages": [
-        "python", "javascript", "typescript", "java", "c++", "sql", "html", "css"
-    ],
-    "frameworks": [
-        "react", "next.js", "node.js", "django", "fastapi", "flask", 
-        "pytorch", "tensorflow", "xgboost"
-    ],
-    "databases": [
-        "postgresql", "mysql", "mongodb", "redis"
-    ],
-    "cloud": [
-        "aws", "ec2", "lambda", "s3", "gcp", "azure", "docker", "kubernetes"
-    ],
-}
-
-# Flatten for easier matching
-ALL_SKILLS = {skill.lower(): cat for cat, skills in SKILL_DICT.items() for skill in skills}
+from ..gazetteer import skillCategories, find_skills
+
+# Dictionary entries that are also everyday words ("I excel at", "go-to-market", "Swift
+# delivery", "Assembly line"). Free text only counts them capitalized the way a name is
+# ("Go", "Excel", "SAP") and not opening a sentence or line, where any word is capitalized.
+commonWordSkills = frozenset({
+    "angular", "assembly", "bootstrap", "c", "confluence", "copilot", "dart", "electron",
+    "excel", "flask", "git", "go", "groovy", "jest", "julia", "looker", "mocha", "notion",
+    "oracle", "outlook", "pinecone", "playwright", "rails", "react", "ruby", "rust", "sap",
+    "sass", "slack", "snowflake", "swift", "tableau", "unity", "unreal", "word", "workday",
+})
+
+sentenceBreaks = ".!?:;•*\r\n"
+
+
+def opens_sentence(text, start):
+    index = start - 1
+    while index >= 0 and text[index] in " \t":
+        index -= 1
+    return index < 0 or text[index] in sentenceBreaks
+
+
+def is_skill_mention(text, start, end):
+    mention = text[start:end]
+    if mention.lower() not in commonWordSkills:
+        return True
+    return mention[:1].isupper() and not opens_sentence(text, start)
 
 
 def extract_skills_nlp(text: str) -> Dict[str, List[str]]:
-    """Return skills found using keyword detection."""
-    found = {cat: [] for cat in SKILL_DICT.keys()}
-    lowered = text.lower()
+    """Return skills found using keyword detection, by category, as canonical display names."""
+    found = {cat: [] for cat in skillCategories}
+    text = text or ""
 
-    for skill, category in ALL_SKILLS.items():
-        if re.search(rf"\b{re.escape(skill)}\b", lowered):
+    for start, end, skill, category in find_skills(text):
+        if skill not in found[category] and is_skill_mention(text, start, end):
             found[category].append(skill)
 
     return found
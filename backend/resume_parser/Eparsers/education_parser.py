@@ -5,6 +5,8 @@
 import re
 from typing import Dict, List, Optional
 
+from ..gazetteer import cities, find_degree, find_schools, known_city_word_count, majors
+
 
 CITY_STATE_RE = re.compile(r"\b([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+){0,3}),\s*([A-Z]{2})\b$")
 CITY_PREFIXES = {
@@ -61,8 +63,11 @@ def _extract_trailing_location(text: str) -> tuple[str, Optional[str]]:
     if not words:
         return text, None
 
-    city_words = [words[-1]]
-    if len(words) >= 2 and words[-2] in CITY_PREFIXES:
+    # a known city of that state decides how many words it takes ("Winter Park, FL");
+    # unknown towns fall back to one word, or two after a prefix like "San" / "Fort".
+    cityWordCount = known_city_word_count(words[1:], state_code) if len(words) > 1 else 0
+    city_words = words[-cityWordCount:] if cityWordCount else [words[-1]]
+    if not cityWordCount and len(words) >= 2 and words[-2] in CITY_PREFIXES:
         city_words = words[-2:]
 
     city = " ".join(city_words)
@@ -70,6 +75,21 @@ def _extract_trailing_location(text: str) -> tuple[str, Optional[str]]:
     return remaining or text, f"{city}, {state_code}"
 
 
+def strip_trailing_city(text):
+    """'Computer Science Orlando FL' / 'Marketing Tampa' -> the field without the city."""
+    words = text.split()
+    if len(words) > 1 and re.fullmatch(r"[A-Z]{2}", words[-1]):
+        stateCode = words.pop()
+        cityWordCount = known_city_word_count(words[1:], stateCode)
+        return " ".join(words[:-cityWordCount] if cityWordCount else words)
+    # no state to check against: only drop a city that leaves a known field behind, so
+    # fields that merely end in a place-like word ("Digital Media") stay whole.
+    for count in range(min(len(words) - 1, 3), 0, -1):
+        if cities.get(" ".join(words[-count:])) and majors.get(" ".join(words[:-count])):
+            return " ".join(words[:-count])
+    return text
+
+
 def _strip_dates_and_locations(text: str) -> str:
     text = re.sub(
         rf"\s+{MONTH_PATTERN}\s+\d{{4}}\s*[-â€“â€”]\s*(?:{MONTH_PATTERN}\s+)?(?:\d{{4}}|present|current)\b.*$",
@@ -87,6 +107,12 @@ def _split_combined_school_line(line: str) -> List[str]:
     if not line:
         return []
 
+    # two known schools run together ("University of South Florida Florida State University").
+    knownSchools = find_schools(line)
+    if len(knownSchools) >= 2:
+        starts = [0] + [start for start, _end, _name in knownSchools[1:]]
+        return [line[start:end].strip() for start, end in zip(starts, starts[1:] + [len(line)])]
+
     leading_school_match = re.match(rf"^(.+?\b{SCHOOL_KEYWORD_RE})\s+({SCHOOL_KEYWORD_RE}\b.+)$", line)
     if leading_school_match:
         return [leading_school_match.group(1).strip(), leading_school_match.group(2).strip()]
@@ -100,7 +126,8 @@ def _split_combined_degree_line(line: str) -> List[str]:
     if not line:
         return []
 
-    starts = [match.start() for match in DEGREE_START_RE.finditer(line)]
+    # "(MBA)" right after "Master of Business Administration" is the same degree, not a new one.
+    starts = [match.start() for match in DEGREE_START_RE.finditer(line) if not line[: match.start()].endswith("(")]
     if len(starts) <= 1:
         return [line]
 
@@ -140,7 +167,7 @@ def _split_stacked_education_entries(entry: str) -> List[str]:
         if (
             index == 0
             or (
-                re.search(r'(?i)(university|college|institute|school|academy)', line)
+                (re.search(r'(?i)(university|college|institute|school|academy)', line) or find_schools(line))
                 and YEAR_AT_END_RE.search(line)
             )
         ):
@@ -269,7 +296,7 @@ def parse_education(section_text: str) -> List[Dict[str, Optional[str]]]:
         school_candidate_lines = [
             EXPECTED_GRADUATION_RE.sub("", re.sub(YEAR_AT_END_RE, "", line)).strip(" |/")
             for line in lines[:degree_line_index]
-            if re.search(r'(?i)(university|college|institute|school|academy)', line)
+            if re.search(r'(?i)(university|college|institute|school|academy)', line) or find_schools(line)
         ]
         if school_candidate_lines:
             cleaned_school_lines = []
@@ -320,7 +347,15 @@ def parse_education(section_text: str) -> List[Dict[str, Optional[str]]]:
             r'(?i)\b(m\.?a\.?\s+(?:in\s+)?[A-Za-z\s]+)',
         ]
         
+        # a spelled-out degree from the gazetteer keeps its full name ("Bachelor of Business
+        # Administration", not "Bachelor of Business"); the patterns cover everything else.
+        knownDegree = find_degree(entry)
+        if knownDegree:
+            edu_item["degree"] = re.sub(r'\s+', ' ', entry[knownDegree[0]:knownDegree[1]])
+
         for pattern in degree_patterns:
+            if edu_item["degree"]:
+                break
             degree_match = re.search(pattern, entry)
             if degree_match:
                 degree_text = degree_match.group(0).strip()
@@ -361,7 +396,7 @@ def parse_education(section_text: str) -> List[Dict[str, Optional[str]]]:
                     line,
                 )
                 if not line_field_match:
-                    line_field_match = re.search(r'(?i)\bin\s+(.+)$', line)
+                    line_field_match = re.search(r'(?i)\bin\s+(?!progress\b)(.+)$', line)
                 if line_field_match:
                     degree_line_field = _strip_dates_and_locations(line_field_match.group(1))
                     degree_line_field = re.sub(r'(?i)\s*[,;]\s*minor\s+in\s+.*$', '', degree_line_field)
@@ -375,7 +410,7 @@ def parse_education(section_text: str) -> List[Dict[str, Optional[str]]]:
                     break
 
         field_patterns = [
-            r'(?i)(?:in|major\s+in|degree\s+in)\s+([A-Z][A-Za-z\s&]+?)(?=\s*$|\s*[,;]|\s+[A-Z][a-z]+,\s*[A-Z]{2}|\s+[A-Z][a-z]+\s+\d{4}|\n)',
+            r'(?i)(?:in|major\s+in|degree\s+in)\s+(?!progress\b)([A-Z][A-Za-z\s&]+?)(?=\s*$|\s*[,;]|\s+[A-Z][a-z]+,\s*[A-Z]{2}|\s+[A-Z][a-z]+\s+\d{4}|\n)',
             r'(?i)(?:bachelor|master|phd|associate|b\.?s\.?|b\.?a\.?|m\.?s\.?|m\.?a\.?)\s+(?:of\s+)?(?:science|arts|engineering|business|technology)\s+in\s+([A-Z][A-Za-z\s&]+?)(?=\s*$|\s*[,;]|\s+[A-Z][a-z]+,\s*[A-Z]{2}|\s+[A-Z][a-z]+\s+\d{4}|\n)',
         ]
 
@@ -389,9 +424,8 @@ def parse_education(section_text: str) -> List[Dict[str, Optional[str]]]:
                     field_text = field_match.group(1).strip()
                     field_text = re.sub(r'(?i)\s*;\s*minor\s+in\s+.*$', '', field_text)
                     field_text = re.sub(r'(?i)\s*,\s*minor\s+in\s+.*$', '', field_text)
-                    field_text = re.sub(r'\s+[A-Z]{2}\s*$', '', field_text)
                     field_text = re.sub(r'\s+[A-Z][a-z]+,\s*[A-Z]{2}\s*$', '', field_text)
-                    field_text = re.sub(r'\s+(?:Orlando|Miami|Tampa|Jacksonville|Tallahassee|Gainesville|Atlanta|New York|Los Angeles|Chicago|Houston|Phoenix|Philadelphia|San Antonio|San Diego|Dallas|San Jose|Austin|San Francisco|Columbus|Fort Worth|Charlotte|Seattle|Denver|Washington|Boston|El Paso|Detroit|Nashville|Memphis|Portland|Oklahoma City|Las Vegas|Louisville|Baltimore|Milwaukee|Albuquerque|Tucson|Fresno|Sacramento|Kansas City|Mesa|Omaha|Raleigh|Long Beach|Virginia Beach|Oakland|Minneapolis|Tulsa|Cleveland|Wichita|Arlington)\s*$', '', field_text, flags=re.IGNORECASE)
+                    field_text = strip_trailing_city(field_text)
                     field_text = re.sub(r'\s+', ' ', field_text).strip()
                     if field_text and len(field_text) > 2:
                         edu_item["field"] = field_text
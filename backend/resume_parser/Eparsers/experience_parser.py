@@ -5,6 +5,8 @@
 import re
 from typing import Dict, List, Optional, Tuple
 
+from ..gazetteer import known_city_word_count, regions
+
 
 BULLET_RE = re.compile(r"^\s*(?:[-*•∙▪▫]|â€¢|âˆ™|â–ª|â–«)\s*", re.MULTILINE)
 DATE_RE = re.compile(
@@ -23,6 +25,8 @@ DATE_RE = re.compile(
 LOCATION_KEYWORD_RE = re.compile(r"^(Remote|On-site|Onsite|Hybrid)$", re.IGNORECASE)
 ROLE_TYPE_RE = re.compile(r"^(Full-time|Part-time|Contract|Internship|Freelance|Temporary)$", re.IGNORECASE)
 CITY_STATE_RE = re.compile(r"\b([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+){0,3}),\s*([A-Z]{2})\b$")
+# "Toronto, Ontario" / "London, United Kingdom": only trusted when the gazetteer knows both halves.
+cityRegionPattern = re.compile(r"\b([A-Z][A-Za-z.'\-]+(?:\s+[A-Z][A-Za-z.'\-]+){0,3}),\s*([A-Z][A-Za-z.]*(?:\s+[A-Z][A-Za-z.]*){0,2})$")
 TITLE_HINT_RE = re.compile(
     r"\b("
     r"engineer|developer|intern|analyst|manager|director|president|lead|"
@@ -107,7 +111,20 @@ def _is_bullet_line(line: str) -> bool:
 
 def _looks_like_location(text: str) -> bool:
     text = (text or "").strip()
-    return bool(LOCATION_KEYWORD_RE.match(text) or CITY_STATE_RE.search(text))
+    return bool(LOCATION_KEYWORD_RE.match(text) or CITY_STATE_RE.search(text) or known_city_region(text))
+
+
+def known_city_region(text):
+    """'Acme Corp Toronto, Ontario' -> ('Acme Corp', 'Toronto, Ontario') when the city is known there."""
+    match = cityRegionPattern.search(text)
+    if not match or not regions.get(match.group(2)):
+        return None
+    words = text[: match.start(2)].rstrip(" ,").split()
+    cityWordCount = known_city_word_count(words, match.group(2))
+    if not cityWordCount:
+        return None
+    city = " ".join(words[-cityWordCount:])
+    return " ".join(words[:-cityWordCount]), f"{city}, {match.group(2)}"
 
 
 def _looks_like_skills(text: str) -> bool:
@@ -275,8 +292,10 @@ def _extract_location_from_text(text: str) -> Tuple[str, Optional[str]]:
         if not words:
             return text, None
 
-        city_words = [words[-1]]
-        if len(words) >= 2 and words[-2] in CITY_PREFIXES:
+        # a known city of that state decides how many words it takes ("Winter Park, FL").
+        cityWordCount = known_city_word_count(words, state_code)
+        city_words = words[-cityWordCount:] if cityWordCount else [words[-1]]
+        if not cityWordCount and len(words) >= 2 and words[-2] in CITY_PREFIXES:
             city_words = words[-2:]
 
         city = " ".join(city_words)
@@ -285,6 +304,10 @@ def _extract_location_from_text(text: str) -> Tuple[str, Optional[str]]:
         text = " ".join(company_words).strip(" ,|-")
         return re.sub(r"\s+", " ", text).strip(), location
 
+    cityRegion = known_city_region(text)
+    if cityRegion:
+        return re.sub(r"\s+", " ", cityRegion[0]).strip(" ,|-"), cityRegion[1]
+
     return text, None
 
 
@@ -2,9 +2,15 @@
 
 # Skills extraction.
 
+# an item that is exactly a known skill or alias ("reactjs", "Postgres", "AWS") is stored
+# under its canonical name from the shared skill dictionary, the same name the tailor
+# ranks by; anything else is kept as written.
+
 import re
 from typing import Dict, List
 
+from ..gazetteer import canonical_skill
+
 
 SKILL_STOPWORDS_RE = re.compile(r"(?i)^(and|or|the|a|an|with|using)$")
 CATEGORY_PATTERN = re.compile(r"^([A-Z][A-Za-z0-9\s/&+\-.]+?)\s*:\s*(.+)$")
@@ -33,6 +39,12 @@ def _append_skill(skills: List[Dict[str, str]], skill: str, category: str | None
         return
     if SKILL_STOPWORDS_RE.match(skill):
         return
+    known = canonical_skill(skill)
+    if known:
+        skill = known[0]
+        # "JS, JavaScript" is one skill once both are canonical.
+        if any(existing["name"] == skill and existing.get("category") == category for existing in skills):
+            return
     entry = {"name": skill}
     if category:
         entry["category"] = category
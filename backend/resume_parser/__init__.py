@@ -1,7 +1,7 @@
 # resume_parser/__init__.py
 
 # Main export for resume parser package.
-from .pipeline import parse_resume_file
+from .pipeline import parse_resume_file, parserVersion
 
-__all__ = ["parse_resume_file"]
+__all__ = ["parse_resume_file", "parserVersion"]
 
@@ -0,0 +1,290 @@
+# resume_parser/benchmark.py
+
+# python -m resume_parser.benchmark   (run from backend/)
+# parses every sample resume in tests/ and reports, per pipeline stage, how long it took
+# (best of --repeat runs, from debug.stageTimingsMs), the peak python heap of one parse
+# (tracemalloc), and field-level precision / recall against the checked-in golden output
+# in tests/golden/. each run is saved to benchmark_runs/last.json and printed next to
+# the previous one, so a speedup that quietly changes parse output shows up in the table.
+
+# - --update-golden rewrites tests/golden/ from this run; review the diff before committing
+#   it (hand-corrected golden files are fine — they just stop matching until the parser
+#   catches up).
+# - --check exits 1 when any sample's output differs from its golden file.
+# - samples run in a process pool (--workers); --workers 1 gives steadier timings.
+# - --docx FILE ... times the streaming DOCX extractor against python-docx's object model
+#   on those files instead (text lines found, best-of-repeat ms, python heap peak).
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from . import pipeline
+from .Aextractor.docx_extractor import extract_docx, extract_docx_object_model
+
+packageDir = Path(__file__).resolve().parent
+samplesDir = packageDir / "tests"
+goldenDir = samplesDir / "golden"
+runsDir = packageDir / "benchmark_runs"
+stages = ("extract", "clean", "segment", "contact", "education", "experience", "skills", "projects", "summary")
+# parse output keys that hold lists of records; each record field is scored separately.
+recordLists = ("education", "experiences", "projects")
+
+
+def normalize_value(value):
+    if isinstance(value, list):
+        return "; ".join(normalize_value(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, sort_keys=True, ensure_ascii=False).lower()
+    return " ".join(str(value).split()).lower()
+
+
+def output_facts(result):
+    """Parse output -> multiset of (field, normalized value), e.g. ('education.degree', 'bachelor of science')."""
+    facts = Counter()
+    for key, value in (result.get("contact_info") or {}).items():
+        if value:
+            facts[(f"contact_info.{key}", normalize_value(value))] += 1
+    if result.get("summary"):
+        facts[("summary", normalize_value(result["summary"]))] += 1
+    for skill in result.get("skills") or []:
+        facts[("skills", normalize_value(skill.get("name") if isinstance(skill, dict) else skill))] += 1
+    for listName in recordLists:
+        for record in result.get(listName) or []:
+            for key, value in record.items():
+                # false / empty fields are absence, not a fact to get right.
+                if value not in (None, "", [], False):
+                    facts[(f"{listName}.{key}", normalize_value(value))] += 1
+    return facts
+
+
+def score(predicted, golden):
+    """field -> [matched, predicted, golden] counts; records are matched by field value, not position."""
+    predictedFacts, goldenFacts = output_facts(predicted), output_facts(golden)
+    counts = {}
+    for (field, _value), count in predictedFacts.items():
+        counts.setdefault(field, [0, 0, 0])[1] += count
+    for (field, _value), count in goldenFacts.items():
+        counts.setdefault(field, [0, 0, 0])[2] += count
+    for fact, count in (predictedFacts & goldenFacts).items():
+        counts[fact[0]][0] += count
+    return counts
+
+
+def ratio(part, whole):
+    return part / whole if whole else 1.0
+
+
+def init_worker():
+    pipeline.debugFilesEnabled = False
+    logging.disable(logging.CRITICAL)
+
+
+def parse_sample(path, repeat, measureMemory):
+    """Parse one file `repeat` times; keep the fastest run's stage timings."""
+    data = path.read_bytes()
+    bestTimings = None
+    result = None
+    for _ in range(max(repeat, 1)):
+        result = pipeline.parse_resume_file(data, path.name)
+        timings = result.get("debug", {}).get("stageTimingsMs", {})
+        if bestTimings is None or sum(timings.values()) < sum(bestTimings.values()):
+            bestTimings = timings
+
+    peakMb = None
+    if measureMemory:
+        tracemalloc.start()
+        try:
+            pipeline.parse_resume_file(data, path.name)
+            peakMb = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+        finally:
+            tracemalloc.stop()
+
+    result.pop("debug", None)
+    return {"file": path.name, "timingsMs": bestTimings, "peakMb": peakMb, "result": result}
+
+
+def golden_path(name):
+    return goldenDir / f"{Path(name).stem}.json"
+
+
+def run_benchmark(paths, workers=2, repeat=3, measureMemory=True):
+    """Parse `paths` (in a process pool unless workers is 0) and score each against its golden file."""
+    if workers <= 0:
+        previousSetting = pipeline.debugFilesEnabled
+        pipeline.debugFilesEnabled = False
+        try:
+            samples = [parse_sample(path, repeat, measureMemory) for path in paths]
+        finally:
+            pipeline.debugFilesEnabled = previousSetting
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+            samples = list(executor.map(parse_sample, paths, [repeat] * len(paths), [measureMemory] * len(paths)))
+
+    for sample in samples:
+        goldenPath = golden_path(sample["file"])
+        if goldenPath.exists():
+            golden = json.loads(goldenPath.read_text(encoding="utf-8"))
+            sample["fieldCounts"] = score(sample["result"], golden)
+        else:
+            sample["fieldCounts"] = None
+    return summarize(samples)
+
+
+def summarize(samples):
+    stageTotals = {stage: round(sum(s["timingsMs"].get(stage, 0.0) for s in samples), 3) for stage in stages}
+    fieldTotals = {}
+    for sample in samples:
+        for field, counts in (sample["fieldCounts"] or {}).items():
+            totals = fieldTotals.setdefault(field, [0, 0, 0])
+            for index, count in enumerate(counts):
+                totals[index] += count
+    matched, predicted, expected = (sum(counts[index] for counts in fieldTotals.values()) for index in range(3))
+    peaks = [s["peakMb"] for s in samples if s["peakMb"] is not None]
+    return {
+        "samples": samples,
+        "stageTotalsMs": stageTotals,
+        "totalMs": round(sum(stageTotals.values()), 3),
+        "peakMb": max(peaks) if peaks else None,
+        "fields": {
+            field: {"precision": ratio(counts[0], counts[1]), "recall": ratio(counts[0], counts[2])}
+            for field, counts in sorted(fieldTotals.items())
+        },
+        "precision": ratio(matched, predicted),
+        "recall": ratio(matched, expected),
+    }
+
+
+def mismatched_samples(run):
+    """Samples whose output differs from (or has no) golden file."""
+    mismatched = []
+    for sample in run["samples"]:
+        counts = sample["fieldCounts"]
+        if counts is None or any(c[0] != c[1] or c[0] != c[2] for c in counts.values()):
+            mismatched.append(sample["file"])
+    return mismatched
+
+
+def format_cell(value, digits=1):
+    return "-" if value is None else f"{value:.{digits}f}"
+
+
+def percent_change(current, previous):
+    if current is None or previous is None:
+        return ""
+    if not previous:
+        return f"{current - previous:+.3f}"
+    return f"{(current - previous) / previous * 100:+.1f}%"
+
+
+def format_report(run, previous=None):
+    previous = previous or {}
+    rows = [("", "previous", "current", "change")]
+    previousStages = previous.get("stageTotalsMs", {})
+    for stage in stages:
+        currentMs, previousMs = run["stageTotalsMs"][stage], previousStages.get(stage)
+        rows.append((f"{stage} ms", format_cell(previousMs), format_cell(currentMs), percent_change(currentMs, previousMs)))
+    rows.append(("total ms", format_cell(previous.get("totalMs")), format_cell(run["totalMs"]), percent_change(run["totalMs"], previous.get("totalMs"))))
+    rows.append(("peak MB", format_cell(previous.get("peakMb"), 2), format_cell(run["peakMb"], 2), percent_change(run["peakMb"], previous.get("peakMb"))))
+    for metric in ("precision", "recall"):
+        rows.append((metric, format_cell(previous.get(metric), 3), format_cell(run[metric], 3), ""))
+
+    previousFields = previous.get("fields", {})
+    for field, current in run["fields"].items():
+        before = previousFields.get(field, {})
+        if current["precision"] < 1 or current["recall"] < 1 or before.get("precision", 1) < 1 or before.get("recall", 1) < 1:
+            rows.append((
+                f"  {field} P/R",
+                f"{format_cell(before.get('precision'), 2)}/{format_cell(before.get('recall'), 2)}",
+                f"{format_cell(current['precision'], 2)}/{format_cell(current['recall'], 2)}",
+                "",
+            ))
+
+    widths = [max(len(row[index]) for row in rows) for index in range(4)]
+    lines = ["  ".join(cell.ljust(widths[0]) if index == 0 else cell.rjust(widths[index]) for index, cell in enumerate(row)) for row in rows]
+    mismatched = mismatched_samples(run)
+    lines.append("")
+    lines.append(f"{len(run['samples'])} samples, {len(mismatched)} differ from golden" + (f": {', '.join(mismatched)}" if mismatched else ""))
+    return "\n".join(lines)
+
+
+def write_golden(run):
+    goldenDir.mkdir(parents=True, exist_ok=True)
+    for sample in run["samples"]:
+        result = dict(sample["result"])
+        result.pop("warnings", None)
+        golden_path(sample["file"]).write_text(json.dumps(result, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def compare_docx_extractors(paths, repeat=3):
+    """Per file and extractor: non-empty lines extracted, fastest of `repeat` runs, tracemalloc peak."""
+    rows = []
+    for path in paths:
+        data = path.read_bytes()
+        for name, extractor in (("streaming", extract_docx), ("python-docx", extract_docx_object_model)):
+            bestMs = None
+            for _ in range(max(repeat, 1)):
+                started = time.perf_counter()
+                text = extractor(data)
+                elapsedMs = (time.perf_counter() - started) * 1000
+                bestMs = elapsedMs if bestMs is None else min(bestMs, elapsedMs)
+            tracemalloc.start()
+            try:
+                extractor(data)
+                peakMb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            finally:
+                tracemalloc.stop()
+            lines = sum(1 for line in text.splitlines() if line.strip())
+            rows.append({"file": path.name, "extractor": name, "lines": lines, "ms": round(bestMs, 3), "peakMb": round(peakMb, 2)})
+    return rows
+
+
+def format_docx_report(rows):
+    table = [("file", "extractor", "lines", "ms", "peak MB")]
+    table += [(row["file"], row["extractor"], str(row["lines"]), format_cell(row["ms"]), format_cell(row["peakMb"], 2)) for row in rows]
+    widths = [max(len(row[index]) for row in table) for index in range(5)]
+    return "\n".join("  ".join(cell.ljust(widths[index]) if index < 2 else cell.rjust(widths[index]) for index, cell in enumerate(row)) for row in table)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m resume_parser.benchmark", description="Parse the sample resumes; report timings and accuracy.")
+    parser.add_argument("files", nargs="*", help="sample file names (default: every PDF / DOCX in resume_parser/tests)")
+    parser.add_argument("--workers", type=int, default=min(os.cpu_count() or 1, 4), help="parser processes (0 = in this process)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed parses per file; the fastest counts")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--results", type=Path, default=runsDir / "last.json", help="where this run is saved (and the previous one read from)")
+    parser.add_argument("--update-golden", action="store_true", help="rewrite tests/golden/ from this run")
+    parser.add_argument("--check", action="store_true", help="exit 1 if any output differs from golden")
+    parser.add_argument("--docx", nargs="+", type=Path, metavar="FILE", help="compare the DOCX extractors on these files instead")
+    args = parser.parse_args(argv)
+
+    if args.docx:
+        print(format_docx_report(compare_docx_extractors(args.docx, repeat=args.repeat)))
+        return 0
+
+    if args.files:
+        paths = [samplesDir / name for name in args.files]
+    else:
+        paths = sorted(path for path in samplesDir.iterdir() if path.suffix.lower() in (".pdf", ".docx"))
+
+    run = run_benchmark(paths, workers=args.workers, repeat=args.repeat, measureMemory=not args.no_memory)
+    previous = json.loads(args.results.read_text(encoding="utf-8")) if args.results.exists() else None
+    print(format_report(run, previous))
+
+    args.results.parent.mkdir(parents=True, exist_ok=True)
+    args.results.write_text(json.dumps({key: value for key, value in run.items() if key != "samples"}, indent=2) + "\n", encoding="utf-8")
+    if args.update_golden:
+        write_golden(run)
+        print(f"golden files written to {goldenDir}")
+    return 1 if args.check and mismatched_samples(run) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
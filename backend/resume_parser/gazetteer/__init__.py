@@ -0,0 +1,115 @@
+# gazetteer/__init__.py
+
+# Offline name banks for the section parsers: schools, degree names, majors, cities and
+# regions (states / provinces / countries). each bank is a sorted data file under data/,
+# memory-mapped on first lookup (see phrase_index.py), so importing this costs nothing.
+
+# skills.tsv is the one skill / alias dictionary for the whole backend: the skills parser
+# names uploaded skills from it and the tailor (ai/extraction/skill_kb.py) canonicalizes
+# job-description terms with it, so "JS" on a resume and "javascript" in a posting meet
+# as the same skill. its values are "Display Name<TAB>category".
+
+from pathlib import Path
+from .phrase_index import PhraseIndex, normalize_phrase, phrase_tokens, skill_tokens
+
+dataDir = Path(__file__).resolve().parent / "data"
+
+schools = PhraseIndex(dataDir / "schools.tsv")      # school name or alias -> official name.
+degrees = PhraseIndex(dataDir / "degrees.tsv")      # degree name or abbreviation -> full degree name.
+majors = PhraseIndex(dataDir / "majors.tsv")        # field of study -> display name.
+cities = PhraseIndex(dataDir / "cities.tsv")        # city -> comma-separated regions it's in ("FL", "ON,Canada").
+regions = PhraseIndex(dataDir / "regions.tsv")      # state / province / country, name or code -> "FL" / "ON" / "United Kingdom".
+skills = PhraseIndex(dataDir / "skills.tsv", skill_tokens)  # skill or alias -> "Display Name<TAB>category".
+
+# banks whose keys keep skill punctuation; everything else uses phrase_tokens.
+bankTokenizers = {"skills.tsv": skill_tokens}
+skillCategories = ("languages", "frameworks", "databases", "cloud", "tools")
+
+unitedStates = "United States"
+maxCityWords = 4
+
+
+def is_known_city(city, region):
+    """'Winter Park', 'FL' -> True. region may be a code or a name ('Florida', 'UK', 'Canada')."""
+    cityRegions = cities.get(city)
+    region = regions.get(region)
+    if not cityRegions or not region:
+        return False
+    cityRegions = cityRegions.split(",")
+    if region in cityRegions:
+        return True
+    # "Austin, USA": any US state (or province, which is rare enough not to matter) counts.
+    return region == unitedStates and any(len(code) == 2 for code in cityRegions)
+
+
+def known_city_word_count(words, region):
+    """How many trailing words of `words` name a known city in region (longest wins), 0 if none."""
+    for count in range(min(len(words), maxCityWords), 0, -1):
+        # a city starts at a word, not at a separator ("Montevallo - Montevallo, AL").
+        if words[-count][:1].isalpha() and is_known_city(" ".join(words[-count:]), region):
+            return count
+    return 0
+
+
+def find_schools(text):
+    """(start, end, official name) for each known school named in text."""
+    return schools.find_all(text)
+
+
+def find_degree(text):
+    """First spelled-out degree name in text ('Bachelor of Fine Arts'), skipping abbreviations."""
+    for start, end, name in degrees.find_all(text):
+        if normalize_phrase(text[start:end]) == normalize_phrase(name):
+            return start, end, name
+    return None
+
+
+def find_major(text):
+    matches = majors.find_all(text)
+    return matches[0] if matches else None
+
+
+def split_skill_value(value):
+    display, _, category = value.partition("\t")
+    return display, category
+
+
+def canonical_skill(name):
+    """'reactjs' -> ('React', 'frameworks'); None for names the dictionary doesn't know."""
+    value = skills.get(name)
+    return split_skill_value(value) if value else None
+
+
+def skill_key(name):
+    """Lowercase canonical name the tailor ranks by ('AWS' -> 'amazon web services'), or None."""
+    skill = canonical_skill(name)
+    return skill[0].lower() if skill else None
+
+
+def find_skills(text):
+    """(start, end, display name, category) for each known skill named in text, longest match first."""
+    return [(start, end, *split_skill_value(value)) for start, end, value in skills.find_all(text)]
+
+
+__all__ = [
+    "PhraseIndex",
+    "normalize_phrase",
+    "phrase_tokens",
+    "skill_tokens",
+    "schools",
+    "degrees",
+    "majors",
+    "cities",
+    "regions",
+    "skills",
+    "bankTokenizers",
+    "skillCategories",
+    "is_known_city",
+    "known_city_word_count",
+    "find_schools",
+    "find_degree",
+    "find_major",
+    "canonical_skill",
+    "skill_key",
+    "find_skills",
+]
@@ -0,0 +1,15 @@
+# gazetteer/__main__.py
+
+# python -m resume_parser.gazetteer
+# re-normalizes and sorts every data file in place. add entries anywhere in a file as
+# "Display Name" or "alias<TAB>value" (skills.tsv: "alias<TAB>Display Name<TAB>category"),
+# then run this before committing.
+
+from . import bankTokenizers, dataDir
+from .phrase_index import format_bank, phrase_tokens
+
+if __name__ == "__main__":
+    for path in sorted(dataDir.glob("*.tsv")):
+        lines = format_bank(path.read_text(encoding="utf-8").splitlines(), bankTokenizers.get(path.name, phrase_tokens))
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        print(f"{path.name}: {len(lines)} entries")
@@ -0,0 +1,175 @@
+# gazetteer/phrase_index.py
+
+# Sorted phrase files, searched in place through mmap.
+
+# a data file is "key<TAB>value" lines sorted by key, where the key is the phrase in
+# normal form (normalize_phrase: lowercase, accents / apostrophes dropped, "&" -> "and",
+# any other punctuation -> a word break; the skills bank keeps "c++" / "node.js" whole, see
+# skill_tokens). lookups binary-search the mapped file, so
+# opening an index reads nothing up front, no python objects are built for entries we
+# never touch, and the parser worker processes share one copy through the page cache.
+
+import hashlib
+import mmap
+import re
+import threading
+import unicodedata
+from pathlib import Path
+
+tokenPattern = re.compile(r"[^\W_]+(?:['’][^\W_]+)*|&")
+# skill names lean on the punctuation phrases drop: "C++", "C#", ".NET", "Node.js".
+skillTokenPattern = re.compile(r"\.?[^\W_]+(?:[.+#][^\W_]+)*[+#]*")
+
+
+def normalize_token(token):
+    if token == "&":
+        return "and"
+    token = unicodedata.normalize("NFKD", token)
+    return "".join(ch for ch in token if not unicodedata.combining(ch) and ch not in "'’").lower()
+
+
+def phrase_tokens(text):
+    """(normalized word, start, end) for every word in text; offsets point into the original text."""
+    return [(normalize_token(match.group(0)), match.start(), match.end()) for match in tokenPattern.finditer(text or "")]
+
+
+def skill_tokens(text):
+    """phrase_tokens for skill names: 'C++/Node.js' -> c++, node.js (a trailing '.' still ends a word)."""
+    return [(normalize_token(match.group(0)), match.start(), match.end()) for match in skillTokenPattern.finditer(text or "")]
+
+
+def normalize_phrase(text, tokenizer=phrase_tokens):
+    """'St. Mary’s College' -> 'st marys college'. Keys in the data files are in this form."""
+    return " ".join(token for token, _, _ in tokenizer(text))
+
+
+class PhraseIndex:
+    """One sorted key<TAB>value file. Lookups are O(log n) per word; nothing is loaded until the first one."""
+
+    def __init__(self, path, tokenizer=phrase_tokens):
+        self.path = Path(path)
+        self.tokenizer = tokenizer
+        self.mapped = None
+        self.contentHash = None
+        self.lock = threading.Lock()
+
+    def mapped_bytes(self):
+        if self.mapped is None:
+            with self.lock:
+                if self.mapped is None:
+                    with open(self.path, "rb") as handle:
+                        # mmap can't map an empty file.
+                        empty = handle.seek(0, 2) == 0
+                        self.mapped = b"" if empty else mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.mapped
+
+    @property
+    def version(self):
+        """Short content hash of the data file, so caches built from it can tell when it changed."""
+        if self.contentHash is None:
+            self.contentHash = hashlib.sha1(self.mapped_bytes()).hexdigest()[:12]
+        return self.contentHash
+
+    def entry_at(self, offset):
+        """(key, value, next line offset) for the line starting at offset, or None past the end."""
+        data = self.mapped_bytes()
+        if offset >= len(data):
+            return None
+        end = data.find(b"\n", offset)
+        if end == -1:
+            end = len(data)
+        tab = data.find(b"\t", offset, end)
+        if tab == -1:
+            return data[offset:end], b"", end + 1
+        return data[offset:tab], data[tab + 1:end], end + 1
+
+    def seek(self, key):
+        """Offset of the first line whose key is >= key (bisect over byte offsets, snapping to line starts)."""
+        data = self.mapped_bytes()
+        lo, hi = 0, len(data)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = data.rfind(b"\n", 0, mid) + 1
+            lineKey, _, nextOffset = self.entry_at(start)
+            if lineKey < key:
+                lo = nextOffset
+            else:
+                hi = start
+        return lo
+
+    def get(self, phrase):
+        """Value for phrase (any spelling that normalizes to a key), or None."""
+        key = normalize_phrase(phrase, self.tokenizer).encode("utf-8")
+        if not key:
+            return None
+        entry = self.entry_at(self.seek(key))
+        return entry[1].decode("utf-8") if entry and entry[0] == key else None
+
+    def __contains__(self, phrase):
+        return self.get(phrase) is not None
+
+    def items(self):
+        """Every (key, value) in key order — for callers that build their own maps from a bank."""
+        offset = 0
+        while True:
+            entry = self.entry_at(offset)
+            if entry is None:
+                return
+            key, value, offset = entry
+            if key:
+                yield key.decode("utf-8"), value.decode("utf-8")
+
+    def longest_match(self, words, start=0):
+        """Longest key that spells words[start:end] -> (end, value), or None. words are normalized tokens."""
+        best = None
+        phrase = b""
+        for end in range(start, len(words)):
+            phrase = words[end].encode("utf-8") if end == start else phrase + b" " + words[end].encode("utf-8")
+            entry = self.entry_at(self.seek(phrase))
+            if entry is None:
+                break
+            key, value, nextOffset = entry
+            if key == phrase:
+                best = (end + 1, value.decode("utf-8"))
+                entry = self.entry_at(nextOffset)
+                if entry is None:
+                    break
+                key = entry[0]
+            # stop as soon as no key continues this phrase with another word.
+            if not key.startswith(phrase + b" "):
+                break
+        return best
+
+    def find_all(self, text):
+        """Non-overlapping (start, end, value) matches in text, left to right, longest first at each word."""
+        tokens = self.tokenizer(text)
+        words = [token for token, _, _ in tokens]
+        matches = []
+        index = 0
+        while index < len(words):
+            match = self.longest_match(words, index)
+            if match:
+                end, value = match
+                matches.append((tokens[index][1], tokens[end - 1][2], value))
+                index = end
+            else:
+                index += 1
+        return matches
+
+
+def format_bank(lines, tokenizer=phrase_tokens):
+    """Source lines ("Display" or "alias<TAB>value") -> sorted, deduplicated key<TAB>value lines."""
+    entries = {}
+    for line in lines:
+        line = line.strip("\n")
+        if not line.strip():
+            continue
+        name, _, value = line.partition("\t")
+        value = (value or name).strip()
+        key = normalize_phrase(name, tokenizer)
+        if not key:
+            continue
+        if key in entries and entries[key] != value:
+            raise ValueError(f"{key!r} maps to both {entries[key]!r} and {value!r}")
+        entries[key] = value
+    return [f"{key}\t{entries[key]}" for key in sorted(entries, key=lambda key: key.encode("utf-8"))]
@@ -0,0 +1,102 @@
+# resume_parser/parse_cache.py
+
+# parse results keyed by the uploaded file's bytes.
+
+# people upload the same resume on the Info page (/parse-resume-merge), again during
+# onboarding (/parse-resume), and again on retries — every one re-ran extraction and
+# all the section parsers. identical bytes + identical parser = identical result, so
+# the result is cached by sha-256 of the file plus the parser's version.
+
+# the version part is parserVersion (pipeline.py) plus a fingerprint of every .py file
+# and gazetteer data file under resume_parser/, so editing a parser or a name bank
+# invalidates old entries on the next deploy even if nobody remembers to bump the constant.
+
+# imports.
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from .pipeline import parserVersion
+
+parseCacheTtlSeconds = int(os.getenv("PARSE_CACHE_TTL_SECONDS", str(6 * 60 * 60)))
+parseCacheMaxBytes = int(os.getenv("PARSE_CACHE_MAX_MB", "32")) * 1024 * 1024
+
+
+def parser_fingerprint():
+    """parserVersion + a hash of the parser's source, computed once at import."""
+    packageDir = Path(__file__).resolve().parent
+    digest = hashlib.sha256(parserVersion.encode("utf-8"))
+    for path in sorted([*packageDir.rglob("*.py"), *packageDir.rglob("*.tsv")]):
+        if "tests" in path.relative_to(packageDir).parts:
+            continue
+        digest.update(str(path.relative_to(packageDir)).encode("utf-8"))
+        digest.update(path.read_bytes())
+    return f"{parserVersion}:{digest.hexdigest()[:16]}"
+
+
+parserFingerprint = parser_fingerprint()
+
+
+def parse_cache_key(fileBytes, filename):
+    # the extension picks the extractor, so the same bytes named .pdf vs .docx are different parses.
+    extension = os.path.splitext(filename or "")[1].lower()
+    return f"{parserFingerprint}:{extension}:{hashlib.sha256(fileBytes).hexdigest()}"
+
+
+# in-process LRU with a ttl and a total-size cap. results are stored as json text, so
+# every hit hands back a fresh copy and the size cap measures what's actually held.
+class ParseResultCache:
+
+    def __init__(self, ttlSeconds=parseCacheTtlSeconds, maxBytes=parseCacheMaxBytes):
+        self.ttlSeconds = ttlSeconds
+        self.maxBytes = maxBytes
+        self.entries = OrderedDict()  # key -> (expiresAt, json text)
+        self.totalBytes = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, filename):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expiresAt, payload = entry
+            if expiresAt <= time.monotonic():
+                self.drop(key)
+                return None
+            self.entries.move_to_end(key)
+        result = json.loads(payload)
+        if isinstance(result.get("debug"), dict) and result["debug"]:
+            result["debug"]["filename"] = filename
+        return result
+
+    def put(self, key, result):
+        # a pipeline failure might be transient (memory cap, timeout inside a parser) — don't pin it.
+        if any(str(warning).startswith("Pipeline failed") for warning in result.get("warnings") or []):
+            return
+        payload = json.dumps(result, ensure_ascii=False, default=str)
+        if len(payload) > self.maxBytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self.drop(key)
+            self.entries[key] = (time.monotonic() + self.ttlSeconds, payload)
+            self.totalBytes += len(payload)
+            # evict least recently used until back under the cap.
+            while self.totalBytes > self.maxBytes and self.entries:
+                self.drop(next(iter(self.entries)))
+
+    def drop(self, key):
+        _, payload = self.entries.pop(key)
+        self.totalBytes -= len(payload)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.totalBytes = 0
+
+
+parseCache = ParseResultCache()
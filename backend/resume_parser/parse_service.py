@@ -0,0 +1,188 @@
+# resume_parser/parse_service.py
+
+# runs parse_resume_file off the event loop, in a pool of pre-started worker processes.
+
+# the upload routes are async, so calling the parser inline meant pdf layout analysis
+# and the section regexes ran on the event loop — one heavy designed pdf stalled every
+# other request on that worker for seconds. here each parse runs in a separate process that already has the parser imported, with:
+# - the per-job timeout and bounded queue of the shared worker pool (worker_pool.py);
+#   past the queue, callers get ParserBusyError (-> 503).
+# - an address-space cap per worker, so a pathological pdf fails instead of eating the box.
+# results are cached by file content (parse_cache.py), so repeat uploads skip the pool.
+
+# stream() is the section-by-section variant: extraction runs as one job, then each
+# section parser runs as its own job (spread over the workers), and sections are handed
+# back in the order they finish.
+
+# imports.
+import asyncio
+import logging
+import os
+import time
+
+from worker_pool import PoolBusyError, PoolCrashedError, PoolTimeoutError, WorkerPool
+
+from .parse_cache import parseCache, parse_cache_key
+from .pipeline import SECTION_RESULT_KEYS, build_debug, empty_result, parse_resume_file, parse_section, prepare_sections
+
+logger = logging.getLogger(__name__)
+
+# RESUME_PARSER_WORKERS=0 parses in a thread instead (still off the loop; for dev / tests).
+parserWorkers = int(os.getenv("RESUME_PARSER_WORKERS", "2"))
+parserQueueSize = int(os.getenv("RESUME_PARSER_QUEUE", "8"))
+parserTimeoutSeconds = float(os.getenv("RESUME_PARSER_TIMEOUT_SECONDS", "20"))
+parserMemoryLimitMb = int(os.getenv("RESUME_PARSER_MEMORY_MB", "1024"))
+# the pipeline doesn't call spaCy today; opt in so each worker loads the (trimmed) model at
+# startup for the Dnlp helpers instead of on their first call (see Dnlp/nlp_service.py).
+parserPreloadSpacy = os.getenv("RESUME_PARSER_PRELOAD_SPACY", "0") == "1"
+# workers skip the debug_out/ snapshots unless RESUME_PARSER_DEBUG_FILES=1 is set explicitly:
+# concurrent workers would overwrite each other's files, so they only mean something when
+# debugging one upload at a time.
+parserDebugFiles = os.getenv("RESUME_PARSER_DEBUG_FILES") == "1"
+
+
+class ParserBusyError(PoolBusyError):
+    """Too many parses queued; the caller should retry later."""
+
+
+class ParserTimeoutError(PoolTimeoutError):
+    """The parse ran past its time budget and was stopped."""
+
+
+class ParserCrashedError(PoolCrashedError):
+    """The worker died mid-parse (memory cap hit, segfault in a native lib, ...)."""
+
+
+def warm_worker(memoryLimitMb, preloadSpacy, debugFiles=False):
+    """Pool initializer: cap memory and load the heavy bits once per worker process."""
+    from . import pipeline
+    pipeline.debugFilesEnabled = debugFiles
+    if memoryLimitMb:
+        try:
+            import resource
+            limitBytes = memoryLimitMb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limitBytes, limitBytes))
+        except (ImportError, ValueError, OSError):
+            logger.warning("Could not set parser worker memory limit (%s MB).", memoryLimitMb)
+    # pdfminer and the parser regexes come in with the pipeline import; pdfminer loads its
+    # font / cmap tables lazily, so touching them here keeps the first real parse fast.
+    import pdfminer.cmapdb  # noqa: F401
+    import pdfminer.pdffont  # noqa: F401
+    if preloadSpacy:
+        from .Dnlp.nlp_service import nlp_service
+        nlp_service.load()
+
+
+def prepare_job(fileBytes, filename):
+    timings = {}
+    rawText, text, sections = prepare_sections(fileBytes, filename, timings)
+    return rawText, text, sections, timings
+
+
+def section_job(name, text, sections):
+    started = time.perf_counter()
+    value, parserDebug = parse_section(name, text, sections)
+    return value, parserDebug, round((time.perf_counter() - started) * 1000, 3)
+
+
+class ResumeParseService(WorkerPool):
+    jobName = "Resume parse"
+    busyError = ParserBusyError
+    timeoutError = ParserTimeoutError
+    crashedError = ParserCrashedError
+
+    def __init__(self, workers=parserWorkers, queueSize=parserQueueSize, timeoutSeconds=parserTimeoutSeconds,
+                 memoryLimitMb=parserMemoryLimitMb, preloadSpacy=parserPreloadSpacy, debugFiles=parserDebugFiles):
+        super().__init__(workers, queueSize, timeoutSeconds, warm_worker, (memoryLimitMb, preloadSpacy, debugFiles))
+        self.memoryLimitMb = memoryLimitMb
+        self.preloadSpacy = preloadSpacy
+        self.debugFiles = debugFiles
+
+    async def parse(self, fileBytes, filename):
+        """Parse an upload off the event loop. Raises ParserBusyError / ParserTimeoutError / ParserCrashedError."""
+        # a re-upload of the same bytes never needs a worker (see parse_cache.py).
+        cacheKey = parse_cache_key(fileBytes, filename)
+        cached = parseCache.get(cacheKey, filename)
+        if cached is not None:
+            return cached
+        result = await self.parse_uncached(fileBytes, filename)
+        parseCache.put(cacheKey, result)
+        return result
+
+    async def parse_uncached(self, fileBytes, filename):
+        return await self.run(filename, parse_resume_file, fileBytes, filename)
+
+    async def stream(self, fileBytes, filename):
+        """Start a section-by-section parse. Extraction happens here, so ParserBusyError /
+        ParserTimeoutError / ParserCrashedError surface before anything is sent; returns an
+        async iterator of (event, payload): one event per section as it finishes, then "done"."""
+        cacheKey = parse_cache_key(fileBytes, filename)
+        cached = parseCache.get(cacheKey, filename)
+        if cached is not None:
+            return self.replay(cached)
+
+        # the slot covers extraction, the bulk of the work; the short section jobs that
+        # follow go straight to the pool.
+        self.admit()
+        try:
+            prepared = await self.run_job(filename, prepare_job, fileBytes, filename)
+        except (ParserTimeoutError, ParserCrashedError):
+            raise
+        except Exception as e:
+            # same outcome as parse_resume_file on a broken file: empty sections plus a warning.
+            logger.error("Error parsing resume: %s", e)
+            result = empty_result()
+            result["warnings"].append(f"Pipeline failed: {str(e)}")
+            return self.replay(result)
+        finally:
+            self.inFlight -= 1
+        return self.stream_sections(cacheKey, filename, *prepared)
+
+    async def replay(self, result):
+        for name, resultKey in SECTION_RESULT_KEYS.items():
+            yield name, result[resultKey]
+        yield "done", done_payload(result)
+
+    async def stream_sections(self, cacheKey, filename, rawText, text, sections, timings):
+        result = empty_result()
+        projectParserDebug = None
+        jobs = {
+            asyncio.ensure_future(self.run_job(filename, section_job, name, text, sections)): name
+            for name in SECTION_RESULT_KEYS
+        }
+        try:
+            pending = set(jobs)
+            while pending:
+                finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for job in finished:
+                    name = jobs[job]
+                    try:
+                        value, parserDebug, elapsedMs = job.result()
+                    except Exception as e:
+                        # one bad section doesn't sink the others; it just comes back empty.
+                        logger.error("Resume section parser failed: section=%s file=%s error=%r", name, filename, e)
+                        result["warnings"].append(f"Section {name} failed: {str(e) or type(e).__name__}")
+                        value, parserDebug, elapsedMs = result[SECTION_RESULT_KEYS[name]], None, None
+                    result[SECTION_RESULT_KEYS[name]] = value
+                    timings[name] = elapsedMs
+                    if name == "projects":
+                        projectParserDebug = parserDebug
+                    yield name, value
+        finally:
+            # client went away mid-stream: don't leave section jobs running for nobody.
+            for job in jobs:
+                job.cancel()
+
+        result["debug"] = build_debug(filename, rawText, text, sections, result, timings, projectParserDebug)
+        if not result["warnings"]:
+            parseCache.put(cacheKey, result)
+        yield "done", done_payload(result)
+
+
+def done_payload(result):
+    # the same debug object /parse-resume-merge returns, so Info.jsx's parser debug panel
+    # (raw text / section previews, parserDebug) has the same data on either path.
+    return {"warnings": result["warnings"], "debug": result.get("debug") or {}}
+
+
+resumeParser = ResumeParseService()
@@ -3,11 +3,14 @@
 # resume parsing pipeline.
 
 import json
+import os
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 import re
 import logging
-from typing import Dict
+from typing import Dict, Iterator, Optional, Tuple
 
 from .Aextractor import extract_pdf, extract_docx
 from .Csegmenter import split_into_sections
@@ -21,7 +24,14 @@ from .Eparsers import (
 )
 
 logger = logging.getLogger(__name__)
+
+# part of the parse cache key (see parse_cache.py). bump it when parse output changes for
+# a reason the cache can't see in resume_parser/'s own source — e.g. a pdfminer upgrade.
+parserVersion = "1"
+
 DEBUG_DIR = Path(__file__).resolve().parent / "debug_out"
+# RESUME_PARSER_DEBUG_FILES=0 skips the debug_out/ snapshots (the benchmark turns them off too).
+debugFilesEnabled = os.getenv("RESUME_PARSER_DEBUG_FILES", "1") != "0"
 EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
 DEGREE_RE = re.compile(r'(?i)\b(bachelor|master|mba|b\.?s\.?|b\.?a\.?|m\.?s\.?|m\.?a\.?)\b')
 SCHOOL_RE = re.compile(r'(?i)\b(university|college|institute|school)\b')
@@ -139,6 +149,8 @@ def _repair_misplaced_sections(sections: Dict[str, str]) -> Dict[str, str]:
 
 
 def _write_debug_file(name: str, content: str) -> None:
+    if not debugFilesEnabled:
+        return
     try:
         DEBUG_DIR.mkdir(parents=True, exist_ok=True)
         (DEBUG_DIR / name).write_text(content, encoding="utf-8")
@@ -147,6 +159,8 @@ def _write_debug_file(name: str, content: str) -> None:
 
 
 def _write_debug_json(name: str, payload: Dict) -> None:
+    if not debugFilesEnabled:
+        return
     try:
         DEBUG_DIR.mkdir(parents=True, exist_ok=True)
         (DEBUG_DIR / name).write_text(json.dumps(payload, indent=2, ensure_ascii=False, default=str), encoding="utf-8")
@@ -154,8 +168,29 @@ def _write_debug_json(name: str, payload: Dict) -> None:
         logger.debug("Could not write resume parser debug json %s", name, exc_info=True)
 
 
-def parse_resume_file(file_bytes: bytes, filename: str) -> Dict:
-    result = {
+@contextmanager
+def _timed(timings: Dict[str, float], stage: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = round((time.perf_counter() - started) * 1000, 3)
+
+
+# the section parsers, by the name the streaming route emits them under, and the key each
+# one fills in the parse result. each takes the cleaned text and the split sections.
+SECTION_RESULT_KEYS = {
+    "contact": "contact_info",
+    "education": "education",
+    "experience": "experiences",
+    "skills": "skills",
+    "projects": "projects",
+    "summary": "summary",
+}
+
+
+def empty_result() -> Dict:
+    return {
         "contact_info": {},
         "education": [],
         "experiences": [],
@@ -166,7 +201,10 @@ def parse_resume_file(file_bytes: bytes, filename: str) -> Dict:
         "debug": {},
     }
 
-    try:
+
+def prepare_sections(file_bytes: bytes, filename: str, timings: Dict[str, float]) -> Tuple[str, str, Dict[str, str]]:
+    """Extract, clean and split an upload -> (raw text, cleaned text, sections)."""
+    with _timed(timings, "extract"):
         if filename.lower().endswith(".pdf"):
             raw_text = extract_pdf(file_bytes)
         elif filename.lower().endswith(".docx"):
@@ -174,42 +212,77 @@ def parse_resume_file(file_bytes: bytes, filename: str) -> Dict:
         else:
             raise ValueError("unsupported file type (PDF/DOCX only).")
 
-        _write_debug_file("01_raw_extracted_text.txt", raw_text)
+    _write_debug_file("01_raw_extracted_text.txt", raw_text)
 
+    with _timed(timings, "clean"):
         text = minimal_clean(raw_text)
-        _write_debug_file("02_cleaned_text.txt", text)
+    _write_debug_file("02_cleaned_text.txt", text)
 
+    with _timed(timings, "segment"):
         sections = _repair_misplaced_sections(split_into_sections(text))
+    return raw_text, text, sections
+
+
+def parse_section(name: str, text: str, sections: Dict[str, str]) -> Tuple[object, Optional[Dict]]:
+    """Run one section parser (see SECTION_RESULT_KEYS) -> (its result, parser debug or None)."""
+    if name == "contact":
+        return parse_contact(text, sections=sections), None
+    if name == "education":
+        return parse_education(sections.get("education", "")), None
+    if name == "experience":
+        return parse_experience(sections.get("experience", "")), None
+    if name == "skills":
+        return parse_skills(sections.get("skills", "")), None
+    if name == "projects":
+        return parse_projects_with_debug(sections.get("projects", ""))
+    if name == "summary":
+        return parse_summary(sections.get("summary", "")), None
+    raise ValueError(f"unknown resume section: {name}")
+
+
+def build_debug(filename: str, raw_text: str, text: str, sections: Dict[str, str], result: Dict,
+                timings: Dict[str, float], project_parser_debug: Optional[Dict]) -> Dict:
+    return {
+        "filename": filename,
+        "debugDir": str(DEBUG_DIR),
+        "rawTextLength": len(raw_text or ""),
+        "cleanedTextLength": len(text or ""),
+        "rawTextPreview": (raw_text or "")[:1200],
+        "cleanedTextPreview": (text or "")[:1200],
+        "stageTimingsMs": timings,
+        "sectionNames": list(sections.keys()),
+        "sectionLengths": {name: len(value or "") for name, value in sections.items()},
+        "sectionPreviews": {name: (value or "")[:700] for name, value in sections.items()},
+        "parserDebug": {
+            "projects": project_parser_debug,
+        },
+        "parsedCounts": {
+            "contactFields": len([value for value in result["contact_info"].values() if value]),
+            "education": len(result["education"]),
+            "experiences": len(result["experiences"]),
+            "skills": len(result["skills"]),
+            "projects": len(result["projects"]),
+            "summary": 1 if result["summary"] else 0,
+        },
+    }
 
-        result["contact_info"] = parse_contact(text, sections=sections)
-        result["education"] = parse_education(sections.get("education", ""))
-        result["experiences"] = parse_experience(sections.get("experience", ""))
-        result["skills"] = parse_skills(sections.get("skills", ""))
-        result["projects"], project_parser_debug = parse_projects_with_debug(sections.get("projects", ""))
-        result["summary"] = parse_summary(sections.get("summary", ""))
 
-        result["debug"] = {
-            "filename": filename,
-            "debugDir": str(DEBUG_DIR),
-            "rawTextLength": len(raw_text or ""),
-            "cleanedTextLength": len(text or ""),
-            "rawTextPreview": (raw_text or "")[:1200],
-            "cleanedTextPreview": (text or "")[:1200],
-            "sectionNames": list(sections.keys()),
-            "sectionLengths": {name: len(value or "") for name, value in sections.items()},
-            "sectionPreviews": {name: (value or "")[:700] for name, value in sections.items()},
-            "parserDebug": {
-                "projects": project_parser_debug,
-            },
-            "parsedCounts": {
-                "contactFields": len([value for value in result["contact_info"].values() if value]),
-                "education": len(result["education"]),
-                "experiences": len(result["experiences"]),
-                "skills": len(result["skills"]),
-                "projects": len(result["projects"]),
-                "summary": 1 if result["summary"] else 0,
-            },
-        }
+def parse_resume_file(file_bytes: bytes, filename: str) -> Dict:
+    result = empty_result()
+
+    # milliseconds per stage, reported in debug.stageTimingsMs (the benchmark reads them).
+    timings = {}
+    try:
+        raw_text, text, sections = prepare_sections(file_bytes, filename, timings)
+
+        project_parser_debug = None
+        for name, result_key in SECTION_RESULT_KEYS.items():
+            with _timed(timings, name):
+                result[result_key], parser_debug = parse_section(name, text, sections)
+            if name == "projects":
+                project_parser_debug = parser_debug
+
+        result["debug"] = build_debug(filename, raw_text, text, sections, result, timings, project_parser_debug)
 
         debug_snapshot = {
             "createdAtUtc": datetime.now(timezone.utc).isoformat(),
@@ -3,9 +3,9 @@
 # export routers.
 from .auth import router as auth_router
 from .profile import router as profile_router
-from .resume_generator import router as generator_router
+from .resume_generator import router as generator_router, socket_router as generator_socket_router
 from .templates import router as templates_router
 from .ai import router as ai_router
 
-__all__ = ["auth_router", "profile_router", "generator_router", "templates_router", "ai_router"]
+__all__ = ["auth_router", "profile_router", "generator_router", "generator_socket_router", "templates_router", "ai_router"]
 
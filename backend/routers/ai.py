@@ -1,4 +1,3 @@
-from datetime import datetime, date
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
@@ -6,27 +5,23 @@ from ai import tailor_resume, JobTailorSuggestRequest, JobTailorSuggestResponse
 from database import get_db
 from models import User
 from .auth import get_current_user_from_token
+from .quota import consume_quota, refund_quota, quotaRules
 
 router = APIRouter(prefix="/api/ai", tags=["ai"])
 
-DAILY_TAILOR_LIMIT = 5
+DAILY_TAILOR_LIMIT = quotaRules["tailor"]["limit"]
 
 
 def _check_and_increment_tailor_usage(user: User, db: Session) -> None:
-    today = date.today()
-    reset_date = user.daily_tailor_reset_date.date() if user.daily_tailor_reset_date else None
-
-    if reset_date != today:
-        user.daily_tailor_count = 0
-        user.daily_tailor_reset_date = datetime.utcnow()
-
-    if user.daily_tailor_count >= DAILY_TAILOR_LIMIT:
+    # the quota check and the increment are one conditional UPDATE, so parallel tailor
+    # requests can't both take the last slot. committed right away so the slot is held
+    # (and the row lock released) before the slow AI call starts.
+    if consume_quota(db, user.id, "tailor") is None:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail=f"You've used all {DAILY_TAILOR_LIMIT} tailors for today. Come back tomorrow.",
         )
-
-    user.daily_tailor_count += 1
     db.commit()
 
 
@@ -37,4 +32,10 @@ async def suggest_job_tailor(
     db: Session = Depends(get_db),
 ):
     _check_and_increment_tailor_usage(current_user, db)
-    return tailor_resume(payload, user_id=current_user.id)
+    try:
+        return tailor_resume(payload, user_id=current_user.id)
+    except Exception:
+        # a failed run shouldn't burn one of the user's daily tailors.
+        refund_quota(db, current_user.id, "tailor")
+        db.commit()
+        raise
@@ -4,9 +4,10 @@ from datetime import datetime, timedelta
 import logging
 import os
 import secrets
+from functools import lru_cache
+from string import Template
 from urllib.parse import quote
 
-import httpx
 from sqlalchemy.orm import Session
 from fastapi import APIRouter, Cookie, Depends, Header, HTTPException, Response, status
 from fastapi.responses import RedirectResponse
@@ -25,7 +26,6 @@ from schemas import (
 from .security import (
     AUTH_COOKIE_NAME,
     clear_session_cookie,
-    constant_time_equals,
     create_access_token,
     get_password_hash,
     set_session_cookie,
@@ -33,6 +33,8 @@ from .security import (
     verify_password,
     verify_token,
 )
+from .quota import consume_quota
+from .email_outbox import enqueue_email, notify_outbox
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/auth", tags=["auth"])
@@ -54,27 +56,20 @@ def _new_raw_token() -> str:
     return secrets.token_urlsafe(32)
 
 
-async def _send_resend_email(*, to_email: str, subject: str, html: str) -> None:
-    api_key = (os.getenv("RESEND_API_KEY") or "").strip()
-    from_email = (os.getenv("EMAIL_FROM") or "").strip()
-    if not api_key or not from_email:
-        logger.warning("Email not sent; RESEND_API_KEY or EMAIL_FROM is missing. subject=%s to=%s", subject, to_email)
-        return
-
-    async with httpx.AsyncClient(timeout=10) as client:
-        response = await client.post(
-            "https://api.resend.com/emails",
-            headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-            json={"from": from_email, "to": [to_email], "subject": subject, "html": html},
-        )
-        if response.status_code >= 400:
-            logger.error("Resend email failed: status=%s body=%s", response.status_code, response.text[:500])
-            raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="We hit a snag sending your email. Try again in a moment — if it keeps happening, reach out at hello@trytaylor.io")
-
-
 def _email_shell(*, logo_url: str, heading: str, body_html: str, cta_url: str, cta_label: str, footer_note: str) -> str:
     """Shared HTML email shell — white card on cream, brand-pink CTA, logo top-left."""
-    return f"""<!DOCTYPE html>
+    return _email_template(heading=heading, body_html=body_html, cta_label=cta_label, footer_note=footer_note).substitute(
+        logo_url=logo_url, cta_url=cta_url
+    )
+
+
+# the shell is ~150 lines of markup; build it once per email type (heading/body/label are
+# static per type) and only substitute the per-send values: the link and the logo url.
+@lru_cache(maxsize=32)
+def _email_template(*, heading: str, body_html: str, cta_label: str, footer_note: str) -> Template:
+    heading, body_html, cta_label, footer_note = (part.replace("$", "$$") for part in (heading, body_html, cta_label, footer_note))
+    logo_url, cta_url = "${logo_url}", "${cta_url}"
+    return Template(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8" />
@@ -200,20 +195,21 @@ def _email_shell(*, logo_url: str, heading: str, body_html: str, cta_url: str, c
     </tr>
   </table>
 </body>
-</html>"""
+</html>""")
 
 
-async def _send_verification_email(user: User) -> None:
+def _send_verification_email(db: Session, user: User) -> None:
     raw_token = _new_raw_token()
     user.email_verification_token_hash = token_hash(raw_token)
     user.email_verification_expires_at = datetime.utcnow() + _verification_ttl()
     link = f"{_frontend_url()}/auth/verify-email?token={quote(raw_token)}"
     logo_url = f"{_frontend_url()}/lg_tr_logo.png"
     logger.info("Verification link generated for %s: %s", user.email, link)
-    await _send_resend_email(
-        to_email=user.email,
-        subject="Confirm your email — taylor",
-        html=_email_shell(
+    enqueue_email(
+        db,
+        user.email,
+        "Confirm your email — taylor",
+        _email_shell(
             logo_url=logo_url,
             heading="Confirm your email.",
             body_html="<p style='margin:0'>Thanks for signing up for taylor! Verify your email address to continue setting up your account and start building tailored resumes that stand out.</p>",
@@ -224,17 +220,18 @@ async def _send_verification_email(user: User) -> None:
     )
 
 
-async def _send_password_reset_email(user: User) -> None:
+def _send_password_reset_email(db: Session, user: User) -> None:
     raw_token = _new_raw_token()
     user.password_reset_token_hash = token_hash(raw_token)
     user.password_reset_expires_at = datetime.utcnow() + _reset_ttl()
     link = f"{_frontend_url()}/auth/reset-password?token={quote(raw_token)}"
     logo_url = f"{_frontend_url()}/lg_tr_logo.png"
     logger.info("Password reset link generated for %s: %s", user.email, link)
-    await _send_resend_email(
-        to_email=user.email,
-        subject="Reset your password — taylor",
-        html=_email_shell(
+    enqueue_email(
+        db,
+        user.email,
+        "Reset your password — taylor",
+        _email_shell(
             logo_url=logo_url,
             heading="Reset your password.",
             body_html="<p style='margin:0'>We received a request to reset your taylor password. Click below to choose a new one. If you didn't request this, you can safely ignore this email.</p>",
@@ -246,44 +243,26 @@ async def _send_password_reset_email(user: User) -> None:
 
 
 # outbound email throttle: 60s cooldown + daily cap per user per email type
-# ("verification" or "reset"). returns True and records the send when allowed.
+# ("verification" or "reset"), enforced by the "<kind>_email" quotas in routers/quota.py.
+# returns True and records the send when allowed (recorded in the caller's session, so
+# it commits or rolls back with the rest of the request).
 # callers silently skip sending when denied — responses stay generic either way,
 # so throttling never leaks whether an account exists.
-EMAIL_SEND_COOLDOWN_SECONDS = 60
-EMAIL_SEND_DAILY_LIMIT = 5
-
-
-def _email_throttle_allows(user: User, kind: str) -> bool:
-    now = datetime.utcnow()
-    last_sent = getattr(user, f"{kind}_email_last_sent_at")
-    if last_sent and (now - last_sent).total_seconds() < EMAIL_SEND_COOLDOWN_SECONDS:
-        return False
-
-    count_date = getattr(user, f"{kind}_email_count_date")
-    count = getattr(user, f"{kind}_email_daily_count") or 0
-    if not count_date or count_date.date() != now.date():
-        count = 0
-    if count >= EMAIL_SEND_DAILY_LIMIT:
-        return False
-
-    setattr(user, f"{kind}_email_last_sent_at", now)
-    setattr(user, f"{kind}_email_daily_count", count + 1)
-    setattr(user, f"{kind}_email_count_date", now)
-    return True
+def _email_throttle_allows(db: Session, user: User, kind: str) -> bool:
+    return consume_quota(db, user.id, f"{kind}_email") is not None
 
 
 def _find_user_by_token_hash(db: Session, raw_token: str, hash_field: str, expires_field: str) -> User | None:
+    # the stored value is a sha-256 of a 256-bit random token, so an indexed equality
+    # lookup on the hash leaks nothing useful and avoids loading every pending user.
     hashed = token_hash(raw_token)
-    candidates = db.query(User).filter(getattr(User, hash_field).isnot(None)).all()
-    now = datetime.utcnow()
-    for user in candidates:
-        stored = getattr(user, hash_field) or ""
-        expires = getattr(user, expires_field)
-        if expires and expires < now:
-            continue
-        if constant_time_equals(stored, hashed):
-            return user
-    return None
+    user = db.query(User).filter(getattr(User, hash_field) == hashed).first()
+    if not user:
+        return None
+    expires = getattr(user, expires_field)
+    if expires and expires < datetime.utcnow():
+        return None
+    return user
 
 
 @router.post("/register", response_model=AuthStatusResponse)
@@ -302,9 +281,10 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     )
     db.add(new_user)
     db.flush()
-    _email_throttle_allows(new_user, "verification")  # record the send so an instant resend hits the cooldown
-    await _send_verification_email(new_user)
+    _email_throttle_allows(db, new_user, "verification")  # record the send so an instant resend hits the cooldown
+    _send_verification_email(db, new_user)
     db.commit()
+    notify_outbox()
     return {"status": "verification_required", "email": new_user.email, "message": "Check your email to verify your account."}
 
 
@@ -369,9 +349,10 @@ async def me(current_user: User = Depends(get_current_user_from_token)):
 @router.post("/resend-verification", response_model=AuthStatusResponse)
 async def resend_verification(payload: EmailRequest, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.email == str(payload.email).lower()).first()
-    if user and not user.email_verified and _email_throttle_allows(user, "verification"):
-        await _send_verification_email(user)
+    if user and not user.email_verified and _email_throttle_allows(db, user, "verification"):
+        _send_verification_email(db, user)
         db.commit()
+        notify_outbox()
     return {"status": "ok", "email": payload.email, "message": "If the account needs verification, a new email was sent."}
 
 
@@ -391,9 +372,10 @@ async def verify_email(token: str, db: Session = Depends(get_db)):
 @router.post("/forgot-password", response_model=AuthStatusResponse)
 async def forgot_password(payload: EmailRequest, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.email == str(payload.email).lower()).first()
-    if user and _email_throttle_allows(user, "reset"):
-        await _send_password_reset_email(user)
+    if user and _email_throttle_allows(db, user, "reset"):
+        _send_password_reset_email(db, user)
         db.commit()
+        notify_outbox()
     return {"status": "ok", "message": "If an account exists, we sent a reset link."}
 
 
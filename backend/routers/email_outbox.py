@@ -0,0 +1,251 @@
+# routers/email_outbox.py
+
+# outbound email: queue in the db, deliver from a background worker.
+
+# current:
+# - enqueue_email                 -      adds a message to the outbox in the caller's session.
+# - notify_outbox                 -      wakes the worker after the caller commits.
+# - deliver_due_emails            -      claims due messages and sends them (one worker pass).
+# - purge_finished_emails         -      deletes sent / failed rows past the retention window.
+# - start_outbox_worker           -      app startup: launches the delivery loop.
+# - stop_outbox_worker            -      app shutdown: stops the loop, closes the pooled client.
+# - ResendEmailProvider           -      Resend api over one shared httpx.AsyncClient.
+# - FakeEmailProvider             -      in-memory provider for tests / local dev (EMAIL_PROVIDER=fake).
+
+# register / resend-verification / forgot-password used to await Resend inline, so
+# their latency was the provider's latency and a slow provider became a 502. now the
+# route only writes an email_outbox row next to the token it's emailing (same commit,
+# so a rolled-back request never sends), and this worker delivers it with retries.
+
+# imports.
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+
+import httpx
+from sqlalchemy import delete, select, update
+
+from database import SessionLocal
+from models import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+# retry policy: exponential backoff from 30s, capped at an hour, give up after 6 tries.
+outboxMaxAttempts = 6
+outboxBackoffBaseSeconds = 30
+outboxBackoffMaxSeconds = 60 * 60
+# a claimed message is invisible to other workers for this long; if the worker dies
+# mid-send the lease runs out and the message is picked up again.
+outboxClaimLeaseSeconds = 120
+outboxBatchSize = 20
+# verify / reset bodies carry live token links, so a finished row drops its html right
+# away and the row itself (kept only for debugging) is deleted after this long.
+outboxRetentionSeconds = 24 * 60 * 60
+outboxPollSeconds = float(os.getenv("EMAIL_OUTBOX_POLL_SECONDS", "5"))
+
+
+class EmailDeliveryError(Exception):
+    """Provider refused or failed a send. retryable=False means don't bother trying again."""
+
+    def __init__(self, message, retryable=True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+# spaces sends out so we stay under a provider's requests-per-second limit.
+class ProviderRateLimiter:
+
+    def __init__(self, perSecond):
+        self.minInterval = 1.0 / perSecond if perSecond > 0 else 0.0
+        self.nextSendAt = 0.0
+        self.lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self.lock:
+            delay = self.nextSendAt - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.nextSendAt = time.monotonic() + self.minInterval
+
+
+class ResendEmailProvider:
+
+    name = "resend"
+
+    def __init__(self):
+        self.client = None
+        self.rateLimiter = ProviderRateLimiter(float(os.getenv("RESEND_RATE_PER_SECOND", "2")))
+
+    def http_client(self):
+        # one pooled client for the life of the process instead of a new one per email.
+        if self.client is None:
+            self.client = httpx.AsyncClient(timeout=10, limits=httpx.Limits(max_connections=10, max_keepalive_connections=5))
+        return self.client
+
+    async def send(self, toEmail, subject, html):
+        apiKey = (os.getenv("RESEND_API_KEY") or "").strip()
+        fromEmail = (os.getenv("EMAIL_FROM") or "").strip()
+        if not apiKey or not fromEmail:
+            logger.warning("Email not sent; RESEND_API_KEY or EMAIL_FROM is missing. subject=%s to=%s", subject, toEmail)
+            return
+
+        await self.rateLimiter.wait()
+        try:
+            response = await self.http_client().post(
+                "https://api.resend.com/emails",
+                headers={"Authorization": f"Bearer {apiKey}", "Content-Type": "application/json"},
+                json={"from": fromEmail, "to": [toEmail], "subject": subject, "html": html},
+            )
+        except httpx.HTTPError as e:
+            raise EmailDeliveryError(f"transport error: {e!r}")
+        if response.status_code >= 400:
+            # 429 and 5xx are worth retrying; any other 4xx (bad address, bad key) won't fix itself.
+            retryable = response.status_code == 429 or response.status_code >= 500
+            raise EmailDeliveryError(f"status={response.status_code} body={response.text[:300]}", retryable=retryable)
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+
+class FakeEmailProvider:
+
+    name = "fake"
+
+    def __init__(self):
+        self.sent = []          # (to, subject, html) for every delivered message.
+        self.failures = []      # queued EmailDeliveryErrors raised by the next sends, in order.
+
+    async def send(self, toEmail, subject, html):
+        if self.failures:
+            raise self.failures.pop(0)
+        self.sent.append((toEmail, subject, html))
+
+    async def close(self):
+        pass
+
+
+emailProvider = FakeEmailProvider() if os.getenv("EMAIL_PROVIDER", "resend").lower() == "fake" else ResendEmailProvider()
+outboxWake = asyncio.Event()
+outboxTask = None
+
+
+def enqueue_email(db, toEmail, subject, html):
+    """Queue an email in the caller's session; it goes out after the caller commits (see notify_outbox)."""
+    message = EmailOutbox(to_email=toEmail, subject=subject, html=html, next_attempt_at=datetime.utcnow())
+    db.add(message)
+    return message
+
+
+def notify_outbox():
+    # nudge the worker so a just-committed message doesn't wait for the next poll.
+    outboxWake.set()
+
+
+def backoff_delay(attempts):
+    return timedelta(seconds=min(outboxBackoffBaseSeconds * 2 ** max(attempts - 1, 0), outboxBackoffMaxSeconds))
+
+
+async def deliver_due_emails(sessionFactory=SessionLocal, provider=None, now=None):
+    """One worker pass: claim due messages, send them, record the outcome. Returns how many were sent."""
+    provider = provider or emailProvider
+    now = now or datetime.utcnow()
+    table = EmailOutbox.__table__
+    db = sessionFactory()
+    delivered = 0
+    try:
+        dueIds = db.execute(
+            select(table.c.id)
+            .where(table.c.status == "pending", table.c.next_attempt_at <= now)
+            .order_by(table.c.next_attempt_at, table.c.id)  # oldest-due first, straight off the (status, next_attempt_at) index.
+            .limit(outboxBatchSize)
+        ).scalars().all()
+
+        for messageId in dueIds:
+            # claim: push the due time out by the lease. if another worker got here first
+            # the WHERE no longer matches and we skip the message.
+            claimed = db.execute(
+                update(table)
+                .where(table.c.id == messageId, table.c.status == "pending", table.c.next_attempt_at <= now)
+                .values(next_attempt_at=now + timedelta(seconds=outboxClaimLeaseSeconds), attempts=table.c.attempts + 1)
+            ).rowcount
+            db.commit()
+            if not claimed:
+                continue
+
+            message = db.execute(select(table).where(table.c.id == messageId)).mappings().first()
+            try:
+                await provider.send(message["to_email"], message["subject"], message["html"])
+            except Exception as e:
+                retryable = getattr(e, "retryable", True)
+                gaveUp = not retryable or message["attempts"] >= outboxMaxAttempts
+                logger.error("Email delivery failed: id=%s attempt=%s error=%s", messageId, message["attempts"], e)
+                db.execute(
+                    update(table)
+                    .where(table.c.id == messageId)
+                    .values(
+                        status="failed" if gaveUp else "pending",
+                        next_attempt_at=datetime.utcnow() + backoff_delay(message["attempts"]),
+                        last_error=str(e)[:500],
+                        html=None if gaveUp else message["html"],
+                    )
+                )
+            else:
+                delivered += 1
+                db.execute(update(table).where(table.c.id == messageId).values(status="sent", sent_at=datetime.utcnow(), last_error=None, html=None))
+            db.commit()
+
+        purge_finished_emails(db, now)
+        db.commit()
+    finally:
+        db.close()
+    return delivered
+
+
+def purge_finished_emails(db, now):
+    # a finished row's next_attempt_at is within an hour of its last attempt, close enough
+    # for retention, and it keeps this a range scan on the (status, next_attempt_at) index.
+    table = EmailOutbox.__table__
+    return db.execute(
+        delete(table).where(
+            table.c.status.in_(("sent", "failed")),
+            table.c.next_attempt_at <= now - timedelta(seconds=outboxRetentionSeconds),
+        )
+    ).rowcount
+
+
+async def run_outbox_worker():
+    while True:
+        try:
+            await deliver_due_emails()
+        except Exception:
+            logger.exception("Email outbox pass crashed; retrying on the next poll.")
+        # sleep until the next poll, or until a route enqueues something.
+        try:
+            await asyncio.wait_for(outboxWake.wait(), timeout=outboxPollSeconds)
+        except asyncio.TimeoutError:
+            pass
+        outboxWake.clear()
+
+
+def start_outbox_worker():
+    global outboxTask
+    # EMAIL_OUTBOX_WORKER=0 leaves delivery to another process (or to tests calling deliver_due_emails).
+    if os.getenv("EMAIL_OUTBOX_WORKER", "1") == "0" or outboxTask is not None:
+        return
+    outboxTask = asyncio.get_event_loop().create_task(run_outbox_worker())
+
+
+async def stop_outbox_worker():
+    global outboxTask
+    if outboxTask is not None:
+        outboxTask.cancel()
+        try:
+            await outboxTask
+        except asyncio.CancelledError:
+            pass
+        outboxTask = None
+    await emailProvider.close()
@@ -10,14 +10,18 @@
 # - create_experiences_bulk       -      creates multiple experiences for the current user.
 # - create_projects_bulk          -      creates multiple projects for the current user.
 # - create_skills_bulk            -      creates multiple skills for the current user.
+# (bulk endpoints sync through profile_sync.sync_user_rows — constant round trips per save.)
+# - parse_resume_stream           -      parses an upload, streaming each section as NDJSON as it's ready.
 
 # imports.
+import json
 import os
 from typing import List, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, selectinload, undefer
 from sqlalchemy import func
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi.responses import StreamingResponse
 
 # local imports.
 from database import get_db
@@ -32,10 +36,19 @@ from schemas import (
     SectionLabelsUpdate,
     AttachResumeRequest,
     SummaryCreate, SummaryResponse,
-    SavedResumeCreate, SavedResumeResponse, SavedResumeUpdate,
+    SavedResumeCreate, SavedResumeResponse, SavedResumeSummary, SavedResumeUpdate,
 )
-from resume_parser import parse_resume_file
+from resume_parser.parse_service import resumeParser, ParserBusyError, ParserTimeoutError, ParserCrashedError
+from resume_parser.pipeline import SECTION_RESULT_KEYS
 from .auth import get_current_user_from_token
+from .profile_sync import (
+    sync_user_rows,
+    blank_to_none,
+    education_match_key,
+    experience_match_key,
+    project_match_key,
+    skill_match_key,
+)
 from models import User, Experience, Projects, Skills, Contact, Education, Summary, SavedResume
 
 # max saved resumes per user (env: MAX_SAVED_RESUMES, default 3)
@@ -281,79 +294,11 @@ async def create_experiences_bulk(
     current_user: User = Depends(get_current_user_from_token),
     db: Session = Depends(get_db)
 ):
-    # get all existing experiences for this user.
-    existing_experiences = db.query(Experience).filter(
-        Experience.user_id == current_user.id
-    ).all()
-    
-    # normalize None values for matching (treat empty string as None).
-    def normalize_for_match(value):
-        return None if value is None or (isinstance(value, str) and value.strip() == '') else value
-    
-    # create a matching key function for experiences (title + company + start_date).
-    def get_match_key(exp):
-        return (
-            exp.title.strip().lower() if exp.title else '',
-            normalize_for_match(exp.company) or '',
-            exp.start_date
-        )
-    
-    # build a map of existing experiences by match key.
-    existing_map = {}
-    for exp in existing_experiences:
-        key = get_match_key(exp)
-        existing_map[key] = exp
-    
-    # process incoming experiences: update existing or create new.
-    result_experiences = []
-    matched_keys = set()
-    
-    for exp_data in experiences_data:
-        # normalize incoming data for matching.
-        incoming_key = (
-            exp_data.title.strip().lower() if exp_data.title else '',
-            normalize_for_match(exp_data.company) or '',
-            exp_data.start_date
-        )
-        
-        if incoming_key in existing_map:
-            # update existing experience.
-            existing_exp = existing_map[incoming_key]
-            existing_exp.title = exp_data.title
-            existing_exp.company = exp_data.company
-            existing_exp.description = exp_data.description
-            existing_exp.start_date = exp_data.start_date
-            existing_exp.end_date = exp_data.end_date
-            existing_exp.location = exp_data.location
-            existing_exp.skills = exp_data.skills
-            result_experiences.append(existing_exp)
-            matched_keys.add(incoming_key)
-        else:
-            # create new experience.
-            new_exp = Experience(
-                user_id=current_user.id,
-                title=exp_data.title,
-                company=exp_data.company,
-                description=exp_data.description,
-                start_date=exp_data.start_date,
-                end_date=exp_data.end_date,
-                location=exp_data.location,
-                skills=exp_data.skills,
-            )
-            db.add(new_exp)
-            result_experiences.append(new_exp)
-    
-    # delete existing experiences that weren't matched.
-    for key, exp in existing_map.items():
-        if key not in matched_keys:
-            db.delete(exp)
-    
-    # commit all changes.
-    db.commit()
-    for exp in result_experiences:
-        db.refresh(exp)
-    
-    return [ExperienceResponse.model_validate(exp) for exp in result_experiences]
+    # match incoming experiences to existing ones by title + company + start_date; matched
+    # rows are updated in place, new ones inserted, and anything not sent is deleted.
+    rows = [exp_data.model_dump() for exp_data in experiences_data]
+    saved = sync_user_rows(db, Experience, current_user.id, rows, experience_match_key)
+    return [ExperienceResponse.model_validate(exp) for exp in saved]
 
 
 # bulk create projects.
@@ -363,57 +308,10 @@ async def create_projects_bulk(
     current_user: User = Depends(get_current_user_from_token),
     db: Session = Depends(get_db)
 ):
-    # get all existing projects for this user.
-    existing_projects = db.query(Projects).filter(
-        Projects.user_id == current_user.id
-    ).all()
-    
-    # build a map of existing projects by title (case-insensitive).
-    existing_map = {}
-    for proj in existing_projects:
-        key = proj.title.strip().lower() if proj.title else ''
-        existing_map[key] = proj
-    
-    # process incoming projects: update existing or create new.
-    result_projects = []
-    matched_keys = set()
-    
-    for proj_data in projects_data:
-        # normalize title for matching.
-        incoming_key = proj_data.title.strip().lower() if proj_data.title else ''
-        
-        if incoming_key and incoming_key in existing_map:
-            # update existing project.
-            existing_proj = existing_map[incoming_key]
-            existing_proj.title = proj_data.title
-            existing_proj.description = proj_data.description
-            existing_proj.tech_stack = proj_data.tech_stack
-            existing_proj.url = proj_data.url
-            result_projects.append(existing_proj)
-            matched_keys.add(incoming_key)
-        else:
-            # create new project.
-            new_proj = Projects(
-                user_id=current_user.id,
-                title=proj_data.title,
-                description=proj_data.description,
-                tech_stack=proj_data.tech_stack,
-                url=proj_data.url,
-            )
-            db.add(new_proj)
-            result_projects.append(new_proj)
-    
-    # delete existing projects that weren't matched.
-    for key, proj in existing_map.items():
-        if key not in matched_keys:
-            db.delete(proj)
-    
-    # commit all changes.
-    db.commit()
-    for proj in result_projects:
-        db.refresh(proj)
-    
-    return [ProjectResponse.model_validate(proj) for proj in result_projects]
+    # match by title (case-insensitive); untitled projects never match and always insert.
+    rows = [proj_data.model_dump() for proj_data in projects_data]
+    saved = sync_user_rows(db, Projects, current_user.id, rows, project_match_key)
+    return [ProjectResponse.model_validate(proj) for proj in saved]
 
 
 # create or update contact info.
@@ -504,34 +402,12 @@ async def create_education_bulk(
     current_user: User = Depends(get_current_user_from_token),
     db: Session = Depends(get_db)
 ):
-    # delete all existing education entries for this user first (replace all pattern).
-    db.query(Education).filter(Education.user_id == current_user.id).delete()
-    
-    # create multiple education entries for the current user.
-    new_education_list = []
-    for edu_data in education_data:
-        new_edu = Education(
-            user_id=current_user.id,
-            school=edu_data.school,
-            degree=edu_data.degree,
-            discipline=edu_data.discipline,
-            start_date=edu_data.start_date,
-            end_date=edu_data.end_date,
-            current=edu_data.current,
-            gpa=edu_data.gpa,
-            location=edu_data.location,
-            minor=edu_data.minor,
-            subsections=edu_data.subsections,
-        )
-        db.add(new_edu)
-        new_education_list.append(new_edu)
-    
-    # add, commit, and refresh db.
-    db.commit()
-    for edu in new_education_list:
-        db.refresh(edu)
-    
-    return [EducationResponse.model_validate(edu) for edu in new_education_list]
+    # the list sent is the full set of education entries. entries that still match an
+    # existing row (same school + degree + discipline) keep their id and are updated in
+    # place instead of the old delete-everything-and-reinsert.
+    rows = [edu_data.model_dump() for edu_data in education_data]
+    saved = sync_user_rows(db, Education, current_user.id, rows, education_match_key)
+    return [EducationResponse.model_validate(edu) for edu in saved]
 
 
 # bulk create skills.
@@ -541,53 +417,35 @@ async def create_skills_bulk(
     current_user: User = Depends(get_current_user_from_token),
     db: Session = Depends(get_db)
 ):
-    # get all existing skills for this user.
-    existing_skills = db.query(Skills).filter(
-        Skills.user_id == current_user.id
-    ).all()
-    
-    # build a map of existing skills by normalized name (case-insensitive).
-    existing_map = {}
-    for skill in existing_skills:
-        key = normalize_skill_name(skill.name)
-        existing_map[key] = skill
-    
-    # process incoming skills: update existing or create new.
-    result_skills = []
-    matched_keys = set()
-    
-    for skill_data in skills_data:
-        # normalize incoming skill name and category.
-        normalized_name = normalize_skill_name(skill_data.name)
-        normalized_category = normalize_category(skill_data.category)
-        
-        if normalized_name in existing_map:
-            # update existing skill (update category, preserve original name case if needed).
-            existing_skill = existing_map[normalized_name]
-            existing_skill.category = normalized_category
-            result_skills.append(existing_skill)
-            matched_keys.add(normalized_name)
-        else:
-            # create new skill.
-            new_skill = Skills(
-                user_id=current_user.id,
-                name=skill_data.name.strip(),  # store original case
-                category=normalized_category,
-            )
-            db.add(new_skill)
-            result_skills.append(new_skill)
-    
-    # delete existing skills that weren't matched (removed from frontend).
-    for key, skill in existing_map.items():
-        if key not in matched_keys:
-            db.delete(skill)
-    
-    # commit all changes.
-    db.commit()
-    for skill in result_skills:
-        db.refresh(skill)
-    
-    return [SkillResponse.model_validate(skill) for skill in result_skills]
+    # match by normalized name (case-insensitive). a matched skill only gets its category
+    # updated so the originally stored name casing is preserved; skills not sent are deleted.
+    # names sent twice in different case ("React", "react") are saved once.
+    rows = [
+        {"name": skill_data.name.strip(), "category": normalize_category(skill_data.category)}  # store original case
+        for skill_data in skills_data
+    ]
+    saved = sync_user_rows(db, Skills, current_user.id, rows, skill_match_key, updateFields=["category"], uniqueKeys=True)
+    return [SkillResponse.model_validate(skill) for skill in saved]
+
+
+# run the parser in the worker pool (resume_parser/parse_service.py) so a heavy pdf never
+# blocks the event loop, and map the pool's failure modes onto http errors.
+async def run_resume_parser(file_bytes, filename, stream=False):
+    try:
+        if stream:
+            return await resumeParser.stream(file_bytes, filename)
+        return await resumeParser.parse(file_bytes, filename)
+    except ParserBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="We're reading a lot of resumes right now. Try again in a few seconds.",
+            headers={"Retry-After": "5"},
+        )
+    except (ParserTimeoutError, ParserCrashedError):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="We couldn't read this file. Try exporting it again as a PDF or DOCX.",
+        )
 
 
 # parse resume file (merge mode - no DB save, for Info page).
@@ -614,7 +472,7 @@ async def parse_resume_merge(
             detail="File too large. Maximum size is 10MB."
         )
     try:
-        parsed_data = parse_resume_file(file_bytes, file.filename)
+        parsed_data = await run_resume_parser(file_bytes, file.filename)
         return ParsedResumeResponse(
             experiences=parsed_data.get("experiences", []),
             education=parsed_data.get("education", []),
@@ -625,6 +483,8 @@ async def parse_resume_merge(
             warnings=parsed_data.get("warnings", []),
             debug=parsed_data.get("debug")
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -632,6 +492,50 @@ async def parse_resume_merge(
         )
 
 
+# parse resume file, streamed (no DB save). one NDJSON line per section as its parser finishes —
+# {"event": "contact", "data": {...}} — in finishing order, then {"event": "done", "data":
+# {"warnings": [...], "debug": {...}}} (debug as in /parse-resume-merge). section data has the same shape as the
+# matching field of /parse-resume-merge. busy / unreadable files fail before the stream starts.
+@router.post("/parse-resume-stream")
+async def parse_resume_stream(
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user_from_token),
+):
+    if not file.filename:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No filename provided"
+        )
+    if not (file.filename.lower().endswith('.pdf') or file.filename.lower().endswith(('.docx', '.doc'))):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unsupported file type. Only PDF and DOCX files are supported."
+        )
+    file_bytes = await file.read()
+    if len(file_bytes) > 10 * 1024 * 1024:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File too large. Maximum size is 10MB."
+        )
+
+    events = await run_resume_parser(file_bytes, file.filename, stream=True)
+
+    async def ndjson_lines():
+        async for event, payload in events:
+            if event in SECTION_RESULT_KEYS:
+                # validate through the same schema as the non-streaming response.
+                field = SECTION_RESULT_KEYS[event]
+                payload = ParsedResumeResponse(**{field: payload}).model_dump(mode="json")[field]
+            yield json.dumps({"event": event, "data": payload}, default=str) + "\n"
+
+    return StreamingResponse(
+        ndjson_lines(),
+        media_type="application/x-ndjson",
+        # proxies (nginx) otherwise buffer the whole body, which defeats the point.
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
+
+
 # parse resume file (saves contact/education/summary to DB - used by WelcomeStep).
 @router.post("/parse-resume", response_model=ParsedResumeResponse)
 async def parse_resume(
@@ -664,7 +568,7 @@ async def parse_resume(
     
     try:
         # parse the resume file.
-        parsed_data = parse_resume_file(file_bytes, file.filename)
+        parsed_data = await run_resume_parser(file_bytes, file.filename)
         
         # helper function to parse date strings.
         def parse_date(date_str: str) -> datetime | None:
@@ -743,6 +647,8 @@ async def parse_resume(
             warnings=parsed_data.get("warnings", []),
             debug=parsed_data.get("debug")
         )
+    except HTTPException:
+        raise
     except ImportError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -788,15 +694,66 @@ async def detach_resume(
 
 # ------------------- saved resumes (preview snapshots) -------------------
 
+# status is a free-form slug ("draft", "ready", "needs_review"); empty -> draft.
+def clean_saved_status(value):
+    cleanStatus = str(value or "").strip().lower().replace(" ", "_")
+    return cleanStatus[:40] or "draft"
+
+
+# tags: trimmed, no leading '#', 28 chars max, case-insensitive dedupe, max 8.
+def clean_saved_tags(tags):
+    seen = set()
+    cleanTags = []
+    for tag in tags or []:
+        cleanTag = str(tag or "").strip().lstrip("#")[:28]
+        key = cleanTag.lower()
+        if not cleanTag or key in seen:
+            continue
+        seen.add(key)
+        cleanTags.append(cleanTag)
+        if len(cleanTags) >= 8:
+            break
+    return cleanTags
+
+
+# lift the card fields out of a snapshot once at save time, so listing never has to open it.
+def saved_resume_card_fields(resumeData):
+    metadata = resumeData.get("saveMetadata") or {}
+    tailorIntent = resumeData.get("tailorIntent") or {}
+    targetRole = metadata.get("targetRole") or tailorIntent.get("jobTitle") or None
+    targetCompany = metadata.get("targetCompany") or tailorIntent.get("company") or None
+    return {
+        "status": clean_saved_status(metadata.get("status")),
+        "tags": clean_saved_tags(metadata.get("tags")),
+        "target_role": str(targetRole)[:255] if targetRole else None,
+        "target_company": str(targetCompany)[:255] if targetCompany else None,
+        "changed_sections": [str(s) for s in (metadata.get("changedSections") or []) if s][:12],
+    }
+
+
+# full response for a single resume. the status/tags columns are the source of truth
+# after a PATCH, so fold them back into saveMetadata before the editor sees the snapshot.
+# pass resumeData when it's already in memory to skip re-reading the deferred blob.
+def saved_resume_full_response(saved, resumeData=None):
+    resumeData = dict(saved.resume_data if resumeData is None else resumeData)
+    metadata = dict(resumeData.get("saveMetadata") or {})
+    metadata["status"] = saved.status
+    metadata["tags"] = list(saved.tags or [])
+    resumeData["saveMetadata"] = metadata
+    summary = SavedResumeSummary.model_validate(saved)
+    return SavedResumeResponse(**summary.model_dump(), resume_data=resumeData)
+
+
 @router.get("/saved-resumes")
 async def list_saved_resumes(
     current_user: User = Depends(get_current_user_from_token),
     db: Session = Depends(get_db),
 ):
-    """List user's saved resume previews, newest first. Includes max limit."""
+    """List user's saved resume cards (metadata only), newest first. Includes max limit."""
+    # snapshot is a deferred column, so this SELECT only reads the small metadata columns.
     saved = db.query(SavedResume).filter(SavedResume.user_id == current_user.id).order_by(SavedResume.created_at.desc()).all()
     return {
-        "items": [SavedResumeResponse.model_validate(s) for s in saved],
+        "items": [SavedResumeSummary.model_validate(s) for s in saved],
         "max": MAX_SAVED_RESUMES,
     }
 
@@ -814,16 +771,18 @@ async def create_saved_resume(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"You can save up to {MAX_SAVED_RESUMES} resumes. Delete one to save a new one.",
         )
+    resume_data = payload.resume_data or {}
     new_saved = SavedResume(
         user_id=current_user.id,
         name=payload.name.strip() or "Untitled Resume",
-        resume_data=payload.resume_data,
         template=payload.template,
+        **saved_resume_card_fields(resume_data),
     )
+    new_saved.set_resume_data(resume_data)
     db.add(new_saved)
     db.commit()
     db.refresh(new_saved)
-    return SavedResumeResponse.model_validate(new_saved)
+    return saved_resume_full_response(new_saved, resume_data)
 
 
 @router.get("/saved-resumes/{saved_id}", response_model=SavedResumeResponse)
@@ -832,14 +791,19 @@ async def get_saved_resume(
     current_user: User = Depends(get_current_user_from_token),
     db: Session = Depends(get_db),
 ):
-    """Get a single saved resume by id."""
-    saved = db.query(SavedResume).filter(SavedResume.id == saved_id, SavedResume.user_id == current_user.id).first()
+    """Get a single saved resume by id, snapshot included."""
+    saved = (
+        db.query(SavedResume)
+        .options(undefer(SavedResume.snapshot))
+        .filter(SavedResume.id == saved_id, SavedResume.user_id == current_user.id)
+        .first()
+    )
     if not saved:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Saved resume not found")
-    return SavedResumeResponse.model_validate(saved)
+    return saved_resume_full_response(saved)
 
 
-@router.patch("/saved-resumes/{saved_id}", response_model=SavedResumeResponse)
+@router.patch("/saved-resumes/{saved_id}", response_model=SavedResumeSummary)
 async def update_saved_resume(
     saved_id: int,
     payload: SavedResumeUpdate,
@@ -847,6 +811,7 @@ async def update_saved_resume(
     db: Session = Depends(get_db),
 ):
     """Update saved resume metadata without changing the resume snapshot."""
+    # loads metadata columns only; the UPDATE below touches just the changed columns.
     saved = db.query(SavedResume).filter(SavedResume.id == saved_id, SavedResume.user_id == current_user.id).first()
     if not saved:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Saved resume not found")
@@ -854,34 +819,14 @@ async def update_saved_resume(
     if payload.name is not None:
         saved.name = payload.name.strip() or saved.name
 
-    resume_data = dict(saved.resume_data or {})
-    metadata = dict(resume_data.get("saveMetadata") or {})
-
     if payload.status is not None:
-        clean_status = payload.status.strip().lower().replace(" ", "_")
-        metadata["status"] = clean_status or "draft"
+        saved.status = clean_saved_status(payload.status)
 
     if payload.tags is not None:
-        seen = set()
-        clean_tags = []
-        for tag in payload.tags:
-            clean_tag = str(tag or "").strip().lstrip("#")[:28]
-            key = clean_tag.lower()
-            if not clean_tag or key in seen:
-                continue
-            seen.add(key)
-            clean_tags.append(clean_tag)
-            if len(clean_tags) >= 8:
-                break
-        metadata["tags"] = clean_tags
-
-    resume_data["saveMetadata"] = metadata
-    saved.resume_data = resume_data
-
-    db.add(saved)
+        saved.tags = clean_saved_tags(payload.tags)
+
     db.commit()
-    db.refresh(saved)
-    return SavedResumeResponse.model_validate(saved)
+    return SavedResumeSummary.model_validate(saved)
 
 
 @router.delete("/saved-resumes/{saved_id}")
@@ -891,9 +836,8 @@ async def delete_saved_resume(
     db: Session = Depends(get_db),
 ):
     """Delete a saved resume."""
-    saved = db.query(SavedResume).filter(SavedResume.id == saved_id, SavedResume.user_id == current_user.id).first()
-    if not saved:
+    deleted = db.query(SavedResume).filter(SavedResume.id == saved_id, SavedResume.user_id == current_user.id).delete(synchronize_session=False)
+    if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Saved resume not found")
-    db.delete(saved)
     db.commit()
     return {"ok": True}
@@ -0,0 +1,137 @@
+# routers/profile_sync.py
+
+# set-based sync for the profile bulk endpoints (experiences, projects, skills, education).
+
+# the bulk endpoints get "the full list as the user sees it now" and have to make the
+# db match. instead of loading ORM objects, diffing, and then add/delete/refresh one
+# row at a time, sync_user_rows does it in a fixed number of round trips:
+#   1. one SELECT of the user's current rows.
+#   2. one DELETE ... WHERE id IN (...) for rows the client dropped.
+#   3. one executemany UPDATE for rows that matched an existing one.
+#   4. one multi-row INSERT ... RETURNING for new rows (postgres). sqlite on
+#      sqlalchemy 1.4 can't compile RETURNING, so there it's an executemany INSERT
+#      plus one SELECT of the new ids.
+#
+# match keys are case-folded / null-normalized (e.g. lower(title) + company + start
+# date), so there is no unique constraint for INSERT ... ON CONFLICT to target; the
+# match is resolved in python off step 1 instead.
+
+# imports.
+from collections import deque
+
+from sqlalchemy import bindparam, delete, insert, select, update
+
+
+# empty strings and whitespace count as "missing" so '' and None match each other.
+def blank_to_none(value):
+    return None if value is None or (isinstance(value, str) and value.strip() == "") else value
+
+
+# match keys for the bulk endpoints (routers/profile.py). a None key never matches.
+def experience_match_key(row):
+    return (
+        row["title"].strip().lower() if row["title"] else '',
+        blank_to_none(row["company"]) or '',
+        row["start_date"],
+    )
+
+
+def project_match_key(row):
+    # untitled projects never match and always insert.
+    return row["title"].strip().lower() if row["title"] and row["title"].strip() else None
+
+
+def education_match_key(row):
+    return tuple((blank_to_none(row[field]) or '').strip().lower() for field in ("school", "degree", "discipline"))
+
+
+def skill_match_key(row):
+    return row["name"].strip().lower() if row["name"] else ''
+
+
+def sync_user_rows(db, model, userId, incomingRows, keyOf, updateFields=None, uniqueKeys=False):
+    """Make `model`'s rows for `userId` match `incomingRows`; returns the saved rows as dicts in incoming order.
+
+    incomingRows are plain column dicts (no id / user_id). keyOf(row) gives the match
+    key for a row dict; a None key never matches, so that row is always inserted.
+    updateFields limits which columns a matched row overwrites (default: all incoming).
+    uniqueKeys drops incoming rows whose key an earlier row already has (first one wins).
+    """
+    table = model.__table__
+
+    # "React" and "react" are one skill: without this the second would be inserted as a
+    # duplicate row. entries like education can legitimately share a key, so it's opt-in.
+    if uniqueKeys:
+        seenKeys = set()
+        uniqueRows = []
+        for row in incomingRows:
+            key = keyOf(row)
+            if key is not None and key in seenKeys:
+                continue
+            seenKeys.add(key)
+            uniqueRows.append(row)
+        incomingRows = uniqueRows
+
+    # 1. current rows for this user, keyed for matching. rows sharing a key queue up in id
+    # order, and each one is handed to at most one incoming row (two entries with the same
+    # school + degree + discipline stay two rows).
+    existingRows = [dict(r) for r in db.execute(select(table).where(table.c.user_id == userId).order_by(table.c.id)).mappings()]
+    existingByKey = {}
+    for row in existingRows:
+        key = keyOf(row)
+        if key is not None:
+            existingByKey.setdefault(key, deque()).append(row)
+
+    # split incoming into updates of a matched row vs brand-new inserts, remembering slots
+    # so the response keeps the order the client sent.
+    results = [None] * len(incomingRows)
+    updates, inserts, insertSlots = [], [], []
+    matchedIds = set()
+    for slot, row in enumerate(incomingRows):
+        key = keyOf(row)
+        queued = existingByKey.get(key) if key is not None else None
+        existing = queued.popleft() if queued else None
+        if existing is None:
+            inserts.append({**row, "user_id": userId})
+            insertSlots.append(slot)
+            continue
+        changes = {field: row[field] for field in (updateFields or row.keys())}
+        updates.append({"rowId": existing["id"], **changes})
+        matchedIds.add(existing["id"])
+        results[slot] = {**existing, **changes}
+
+    # 2. drop everything the client no longer sends.
+    staleIds = [row["id"] for row in existingRows if row["id"] not in matchedIds]
+    if staleIds:
+        db.execute(delete(table).where(table.c.id.in_(staleIds)))
+
+    # 3. one executemany UPDATE; bind names are prefixed so they don't collide with SET columns.
+    if updates:
+        fields = [field for field in updates[0] if field != "rowId"]
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("rowId"))
+            .values({field: bindparam(f"new_{field}") for field in fields})
+        )
+        db.execute(statement, [
+            {"rowId": u["rowId"], **{f"new_{field}": u[field] for field in fields}} for u in updates
+        ])
+
+    # 4. inserts, reading generated ids back without a refresh per row.
+    if inserts:
+        if db.get_bind().dialect.full_returning:
+            inserted = db.execute(insert(table).values(inserts).returning(*table.c)).mappings().all()
+        else:
+            # after the delete, the user's rows are exactly the matched ones plus what we just
+            # inserted (ids ascend in insert order). don't filter on the pre-sync id set:
+            # sqlite hands a deleted max rowid straight back out.
+            db.execute(insert(table), inserts)
+            inserted = [
+                r for r in db.execute(select(table).where(table.c.user_id == userId).order_by(table.c.id)).mappings()
+                if r["id"] not in matchedIds
+            ]
+        for slot, row in zip(insertSlots, inserted):
+            results[slot] = dict(row)
+
+    db.commit()
+    return results
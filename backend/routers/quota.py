@@ -0,0 +1,160 @@
+# routers/quota.py
+
+# per-user usage quotas: daily tailor cap + outbound email throttles.
+
+# current:
+# - consume_quota                 -      atomically takes one use of a quota kind, or refuses.
+# - refund_quota                  -      gives one use back (e.g. the tailor run failed).
+# - DatabaseQuotaBackend          -      usage_quotas table, one conditional UPDATE per check.
+# - MemoryQuotaBackend            -      in-process sliding window, for single-process dev.
+
+# the old version read the counter off the loaded User, bumped it in python and
+# committed — two concurrent tailor requests could both read 4 and both pass a limit
+# of 5. here the check and the increment are the same UPDATE statement, so the db
+# decides who gets the last slot.
+
+# imports.
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, case, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from models import UsageQuota
+
+# limits per quota kind. daily limits reset at utc midnight in the db backend and
+# roll over a 24h sliding window in the memory backend.
+quotaRules = {
+    "tailor": {"limit": 5, "cooldownSeconds": 0},
+    "verification_email": {"limit": 5, "cooldownSeconds": 60},
+    "reset_email": {"limit": 5, "cooldownSeconds": 60},
+}
+
+
+# db backend: a row per (user, kind) that resets itself when its window_date goes stale.
+class DatabaseQuotaBackend:
+
+    def consume(self, db, userId, kind, limit, cooldownSeconds=0):
+        """Take one use; returns the new count, or None when over the limit / inside the cooldown."""
+        count = self.try_increment(db, userId, kind, limit, cooldownSeconds)
+        # no row matched: either denied, or this user has never used this kind (or another
+        # request created the row a moment ago). make sure the row exists and run the same
+        # gated UPDATE once more — the allowed path stays a single statement.
+        if count is None:
+            self.create_row(db, userId, kind)
+            count = self.try_increment(db, userId, kind, limit, cooldownSeconds)
+        return count
+
+    def try_increment(self, db, userId, kind, limit, cooldownSeconds):
+        now = datetime.utcnow()
+        today = now.date()
+        table = UsageQuota.__table__
+
+        # stale window -> this use starts a fresh day at 1; same day -> count + 1, but
+        # only while under the limit. the WHERE clause is the actual gate.
+        allowed = or_(table.c.window_date.is_(None), table.c.window_date != today, table.c.count < limit)
+        if cooldownSeconds:
+            cutoff = now - timedelta(seconds=cooldownSeconds)
+            allowed = and_(allowed, or_(table.c.last_used_at.is_(None), table.c.last_used_at <= cutoff))
+        statement = (
+            update(table)
+            .where(table.c.user_id == userId, table.c.kind == kind, allowed)
+            .values(
+                count=case((table.c.window_date == today, table.c.count + 1), else_=1),
+                window_date=today,
+                last_used_at=now,
+            )
+        )
+
+        if db.get_bind().dialect.full_returning:
+            row = db.execute(statement.returning(table.c.count)).first()
+            return row[0] if row else None
+
+        # sqlite on sqlalchemy 1.4 can't compile RETURNING; sqlite serializes writers, so
+        # rowcount + a read inside the same transaction is still race-free there.
+        if db.execute(statement).rowcount == 0:
+            return None
+        return db.execute(select(table.c.count).where(table.c.user_id == userId, table.c.kind == kind)).scalar()
+
+    def refund(self, db, userId, kind):
+        """Give back one use from today's window (never below zero)."""
+        table = UsageQuota.__table__
+        db.execute(
+            update(table)
+            .where(
+                table.c.user_id == userId,
+                table.c.kind == kind,
+                table.c.window_date == datetime.utcnow().date(),
+                table.c.count > 0,
+            )
+            .values(count=table.c.count - 1)
+        )
+
+    def create_row(self, db, userId, kind):
+        """Create the (user, kind) row if it doesn't exist yet."""
+        # a concurrent first use just wins the race — ON CONFLICT DO NOTHING.
+        dialectName = db.get_bind().dialect.name
+        insertFor = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}.get(dialectName)
+        if insertFor is None:
+            exists = db.execute(
+                select(UsageQuota.id).where(UsageQuota.user_id == userId, UsageQuota.kind == kind)
+            ).first()
+            if not exists:
+                db.execute(UsageQuota.__table__.insert().values(user_id=userId, kind=kind, count=0))
+            return
+        db.execute(
+            insertFor(UsageQuota.__table__)
+            .values(user_id=userId, kind=kind, count=0)
+            .on_conflict_do_nothing(index_elements=["user_id", "kind"])
+        )
+
+
+# memory backend: timestamps of recent uses per (user, kind) in a sliding 24h window.
+# single process only — counts vanish on restart and aren't shared between workers.
+class MemoryQuotaBackend:
+
+    windowSeconds = 24 * 60 * 60
+
+    def __init__(self):
+        self.uses = {}
+        self.lock = threading.Lock()
+
+    def consume(self, db, userId, kind, limit, cooldownSeconds=0):
+        now = time.monotonic()
+        with self.lock:
+            recent = self.uses.setdefault((userId, kind), deque())
+            while recent and now - recent[0] >= self.windowSeconds:
+                recent.popleft()
+            if len(recent) >= limit:
+                return None
+            if cooldownSeconds and recent and now - recent[-1] < cooldownSeconds:
+                return None
+            recent.append(now)
+            return len(recent)
+
+    def refund(self, db, userId, kind):
+        with self.lock:
+            recent = self.uses.get((userId, kind))
+            if recent:
+                recent.pop()
+
+
+# QUOTA_BACKEND=memory swaps in the in-process backend (local dev without a shared db).
+quotaBackend = MemoryQuotaBackend() if os.getenv("QUOTA_BACKEND", "db").lower() == "memory" else DatabaseQuotaBackend()
+
+
+def consume_quota(db, userId, kind):
+    """Take one use of `kind` for the user. Returns the new count, or None when denied.
+
+    Runs inside the caller's session; the caller commits (so a failed request rolls the use back).
+    """
+    rule = quotaRules[kind]
+    return quotaBackend.consume(db, userId, kind, rule["limit"], rule["cooldownSeconds"])
+
+
+def refund_quota(db, userId, kind):
+    """Return one use of `kind`, e.g. when the work it paid for failed."""
+    quotaBackend.refund(db, userId, kind)
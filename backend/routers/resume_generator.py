@@ -10,9 +10,14 @@
 # language.
 
 # imports.
-from fastapi import APIRouter, Depends, Response
+import json
 
+from fastapi import APIRouter, Depends, HTTPException, Response, WebSocket, WebSocketDisconnect, status
+from sqlalchemy.orm import Session
+
+from database import get_db
 from .auth import get_current_user_from_token
+from .security import AUTH_COOKIE_NAME
 
 # create router. every route requires a logged-in user (session cookie or bearer token).
 router = APIRouter(
@@ -21,7 +26,22 @@ router = APIRouter(
     dependencies=[Depends(get_current_user_from_token)],
 )
 
-from generator.pipeline import generate_resume, generate_pdf, generate_docx
+# the live preview socket sits on its own router: a router dependency that rejects the
+# handshake raises an HTTPException a websocket can't send, so the socket checks the user itself.
+socket_router = APIRouter(prefix="/api/resume/generator", tags=["generator"])
+
+from generator.pipeline import generate_resume, generate_pdf
+from generator.auto_fit import generate_pdf_auto_fit
+from generator.pdf_renderer import RETRY_AFTER_SECONDS as PDF_RETRY_AFTER_SECONDS, PdfBusyError
+from generator.preview_fragments import patch_preview, register_render
+from generator.preview_session import run_preview_session
+from generator.export_service import (
+    DocxBusyError,
+    DocxCrashedError,
+    DocxTimeoutError,
+    docxExports,
+    retryAfterSeconds,
+)
 
 # ------------------- routes -------------------
 
@@ -31,6 +51,19 @@ def _style_from_payload(payload: dict) -> dict:
     return raw if isinstance(raw, dict) else {}
 
 
+def _fit_pages_from_payload(payload: dict) -> int | None:
+    """Auto-fit target: "fitPages": N picks the roomiest preset that fits N pages."""
+    raw = payload.get("fitPages")
+    if isinstance(raw, bool) or not isinstance(raw, int) or raw < 1:
+        return None
+    return raw
+
+
+def _fit_headers(preferences: dict, pages: int) -> dict:
+    # the chosen style (send it back as "style" to get the same layout in the other format).
+    return {"X-Fit-Style": json.dumps(preferences, separators=(",", ":")), "X-Fit-Pages": str(pages)}
+
+
 # generate resume preview.
 @router.post("/preview")
 async def generate_resume_preview(payload: dict):
@@ -43,8 +76,50 @@ async def generate_resume_preview(payload: dict):
     # generate resume.
     html_content = generate_resume(template, resume_data, style)
 
-    # return response with html content.
-    return Response(content=html_content, media_type="text/html")
+    # return response with html content (+ its render id, for /preview/patch).
+    return Response(content=html_content, media_type="text/html", headers={"X-Render-Id": register_render(html_content)})
+
+
+# re-render the preview, sending back only the sections that changed since renderId.
+@router.post("/preview/patch")
+async def generate_resume_preview_patch(payload: dict):
+
+    # grab template, resume data and the render the client is showing now.
+    template = payload.get("template")
+    resume_data = payload.get("resume_data")
+    style = _style_from_payload(payload)
+    render_id = payload.get("renderId")
+
+    # unchanged sections come out of the fragment cache, so this costs about as much as the edit.
+    html_content = generate_resume(template, resume_data, style)
+
+    # {"renderId", "full": true, "html"} or {"renderId", "full": false, "sections": {key: html}}.
+    return patch_preview(html_content, render_id if isinstance(render_id, str) else None)
+
+
+# live preview session: the resume stays server-side, the editor sends json-patch deltas.
+@socket_router.websocket("/preview/ws")
+async def resume_preview_socket(websocket: WebSocket, db: Session = Depends(get_db)):
+
+    # same session cookie (or bearer token) as the other routes; no user, no session (1008).
+    try:
+        await get_current_user_from_token(
+            authorization=websocket.headers.get("authorization"),
+            taylor_session=websocket.cookies.get(AUTH_COOKIE_NAME),
+            db=db,
+        )
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+
+    # {"type": "init" | "patch", ...} in; {"type": "full" | "patch" | "error", "seq", ...} out.
+    try:
+        await run_preview_session(websocket.receive_json, websocket.send_json)
+    except WebSocketDisconnect:
+        pass
+
 
 # generate resume PDF.
 @router.post("/pdf")
@@ -55,8 +130,22 @@ async def generate_resume_pdf(payload: dict):
     resume_data = payload.get("resume_data")
     style = _style_from_payload(payload)
 
-    # generate resume.
-    pdf_content = await generate_pdf(template, resume_data, style)
+    # every pdf prints on the one warm renderer thread (generator/pdf_renderer.py); past its queue, refuse.
+    fit_pages = _fit_pages_from_payload(payload)
+    try:
+        # auto-fit: search the style presets in one browser page, then print the one that fits.
+        if fit_pages:
+            pdf_content, fit_style, pages = await generate_pdf_auto_fit(template, resume_data, style, fit_pages)
+            return Response(content=pdf_content, media_type="application/pdf", headers=_fit_headers(fit_style, pages))
+
+        # generate resume.
+        pdf_content = await generate_pdf(template, resume_data, style)
+    except PdfBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="We're building a lot of documents right now. Try again in a few seconds.",
+            headers={"Retry-After": str(PDF_RETRY_AFTER_SECONDS)},
+        )
 
     # return response with pdf content.
     return Response(content=pdf_content, media_type="application/pdf")
@@ -71,11 +160,31 @@ async def generate_resume_docx(payload: dict):
     resume_data = payload.get("resume_data")
     style = _style_from_payload(payload)
 
-    docx_content = generate_docx(template or "classic", resume_data, style)
+    # build in the export pool (generator/export_service.py) so python-docx never runs on the event loop.
+    fit_pages = _fit_pages_from_payload(payload)
+    headers = None
+    try:
+        if fit_pages:
+            docx_content, fit_style, pages = await docxExports.build_fitted(template or "classic", resume_data, style, fit_pages)
+            headers = _fit_headers(fit_style, pages)
+        else:
+            docx_content = await docxExports.build(template or "classic", resume_data, style)
+    except DocxBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="We're building a lot of documents right now. Try again in a few seconds.",
+            headers={"Retry-After": str(retryAfterSeconds)},
+        )
+    except (DocxTimeoutError, DocxCrashedError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="We couldn't build this document. Try again, or export it as a PDF.",
+        )
 
     # return response with docx content.
     return Response(
         content=docx_content,
         media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        headers=headers,
     )
 
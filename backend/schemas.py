@@ -288,12 +288,29 @@ class SavedResumeUpdate(BaseModel):
     tags: Optional[List[str]] = None
 
 
-class SavedResumeResponse(BaseModel):
+# card-sized view used by the saved-resumes list — never carries the snapshot.
+class SavedResumeSummary(BaseModel):
     id: int
     user_id: int
     name: str
-    resume_data: Dict
     template: Optional[str] = None
+    status: str = "draft"
+    tags: List[str] = []
+    target_role: Optional[str] = None
+    target_company: Optional[str] = None
+    changed_sections: List[str] = []
+    size_bytes: int = 0
+    content_hash: Optional[str] = None
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
+
+    @field_validator("tags", "changed_sections", mode="before")
+    @classmethod
+    def list_default(cls, value):
+        return value or []
+
+
+class SavedResumeResponse(SavedResumeSummary):
+    resume_data: Dict
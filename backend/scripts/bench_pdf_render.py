@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+repoRoot = Path(__file__).resolve().parents[2]
+backendRoot = repoRoot / "backend"
+templatesDir = backendRoot / "templates"
+defaultFixturePath = templatesDir / "preview_fixture.json"
+
+# Same import style as validate_templates.py (`from generator.pipeline import ...`).
+if str(backendRoot) not in sys.path:
+    sys.path.insert(0, str(backendRoot))
+
+from generator import pipeline
+from generator.pdf_renderer import pdf_renderer
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Time per-PDF latency: a browser launch per PDF (PDF_RENDERER=launch) vs warm template pages."
+    )
+    parser.add_argument(
+        "--fixture",
+        default=str(defaultFixturePath),
+        help="Path to the resume fixture JSON.",
+    )
+    parser.add_argument(
+        "--template",
+        action="append",
+        dest="templateSlugs",
+        help="Template slug to render. Repeat for several. Default: classic, sidebar, timeline-split.",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=10,
+        help="PDFs per template and mode. Default: 10",
+    )
+    return parser.parse_args()
+
+
+def time_renders(mode, templateSlugs, resumeData, runs):
+    # convert_html_to_pdf_sync reads the mode from the pipeline module.
+    pipeline.pdf_renderer_mode = mode
+    timings = {}
+    for templateSlug in templateSlugs:
+        html = pipeline.generate_resume(templateSlug, resumeData, {})
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            pipeline.convert_html_to_pdf_sync(html, templateSlug, {})
+            samples.append((time.perf_counter() - started) * 1000)
+        timings[templateSlug] = samples
+    return timings
+
+
+def main():
+    args = parse_args()
+    with open(args.fixture, "r", encoding="utf-8") as file:
+        resumeData = json.load(file)
+    templateSlugs = args.templateSlugs or ["classic", "sidebar", "timeline-split"]
+
+    launch = time_renders("launch", templateSlugs, resumeData, args.runs)
+    # the first warm render per template loads its shell; report it apart from the rest.
+    warm = time_renders("warm", templateSlugs, resumeData, args.runs + 1)
+    pdf_renderer.stop()
+
+    print(f"{'template':<18}{'launch p50':>12}{'warm first':>12}{'warm p50':>10}{'warm p95':>10}  (ms)")
+    for templateSlug in templateSlugs:
+        warmSamples = sorted(warm[templateSlug][1:])
+        p95 = warmSamples[min(len(warmSamples) - 1, int(round(0.95 * (len(warmSamples) - 1))))]
+        print(
+            f"{templateSlug:<18}{statistics.median(launch[templateSlug]):>12.0f}"
+            f"{warm[templateSlug][0]:>12.0f}{statistics.median(warmSamples):>10.0f}{p95:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
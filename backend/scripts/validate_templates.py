@@ -24,6 +24,7 @@ if str(repoRoot) not in sys.path:
     sys.path.insert(1, str(repoRoot))
 
 from generator.pipeline import generate_docx, generate_pdf, generate_resume
+from generator.shared.assets import external_references, preflight_template
 from generator.layouts.registry import SUPPORTED_DOCX_PROFILES
 from generator.word.docx_styles import DocxStyleConfig
 
@@ -368,6 +369,12 @@ class TemplateValidator:
             if key not in DOCX_STYLE_FIELDS:
                 self.add_error(slug, f"docx_styles.json contains unknown DocxStyleConfig field '{key}'", docx_path)
 
+    def validate_assets(self, slug: str, template_dir: Path) -> None:
+        # Rendering must be network-free: fonts and images ship in the template folder.
+        for problem in preflight_template(slug):
+            filename = problem.split(" ", 1)[0]
+            self.add_error(slug, problem, template_dir / filename)
+
     def validate_rendering(self, slug: str, fixture: dict[str, Any]) -> None:
         try:
             html = generate_resume(slug, fixture, style_preferences={})
@@ -379,6 +386,9 @@ class TemplateValidator:
             if placeholder in html:
                 self.add_error(slug, f"rendered HTML still contains placeholder {placeholder}")
 
+        for url in external_references(html):
+            self.add_error(slug, f"rendered HTML fetches an external resource: {url}")
+
         try:
             docx_bytes = generate_docx(slug, fixture, style_preferences={})
         except Exception as exc:
@@ -419,6 +429,7 @@ class TemplateValidator:
         self.validate_template_html(slug, template_dir, layout_profile)
         self.validate_tokens_and_css(slug, template_dir)
         self.validate_docx_styles(slug, template_dir)
+        self.validate_assets(slug, template_dir)
         self.validate_rendering(slug, fixture)
 
     def run(self) -> int:
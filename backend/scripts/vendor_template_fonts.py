@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import argparse
+import shutil
+from pathlib import Path
+
+
+repoRoot = Path(__file__).resolve().parents[2]
+backendRoot = repoRoot / "backend"
+templatesDir = backendRoot / "templates"
+
+try:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+except ImportError as exc:
+    raise SystemExit(
+        "fontTools is required to vendor template fonts. "
+        "Install it with: pip install fonttools brotli"
+    ) from exc
+
+# Characters resume text and the templates draw: Latin (incl. accented names), Latin-1
+# punctuation / symbols, general punctuation (dashes, quotes, bullets), currency and arrows.
+# Resume text is arbitrary, so fonts are cut to these ranges rather than to one resume's glyphs.
+RESUME_UNICODE_RANGES = (
+    (0x0020, 0x007E),
+    (0x00A0, 0x00FF),
+    (0x0100, 0x017F),
+    (0x2000, 0x206F),
+    (0x20A0, 0x20CF),
+    (0x2190, 0x21FF),
+    (0x25A0, 0x25CF),
+)
+
+FONT_SUFFIXES = (".ttf", ".otf", ".woff", ".woff2")
+
+# Open faces drawn to the metrics of the system fonts the templates name. A vendored face
+# from this table is declared under the name it stands in for, so the token font stacks
+# (and the DOCX, which still names the system font) stay as they are, and the PDF draws the
+# vendored file on every machine, whether or not it has the system font.
+METRIC_COMPATIBLE_FACES = {
+    "Carlito": "Calibri",
+    "Caladea": "Cambria",
+    "Gelasio": "Georgia",
+    "Liberation Serif": "Times New Roman",
+}
+
+# --write-css keeps the rules between these lines at the top of preview.css.
+CSS_BLOCK_START = "/* vendored fonts: scripts/vendor_template_fonts.py */"
+CSS_BLOCK_END = "/* end vendored fonts */"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Copy fonts into a template's fonts/ folder, subset to the characters resumes use, "
+            "and print the @font-face rules to add to its preview.css (or write them with --write-css)."
+        )
+    )
+    parser.add_argument("template", help="Template slug (folder under backend/templates).")
+    parser.add_argument("fonts", nargs="+", help="Font files to vendor (.ttf / .otf / .woff / .woff2).")
+    parser.add_argument(
+        "--flavor",
+        choices=["woff2", "woff", "ttf"],
+        default="woff2",
+        help="Output format. woff2 needs the brotli package. Default: woff2",
+    )
+    parser.add_argument(
+        "--license",
+        action="append",
+        default=[],
+        help="License file to copy into fonts/ next to the vendored files (repeatable).",
+    )
+    parser.add_argument(
+        "--write-css",
+        action="store_true",
+        help="Write the @font-face rules into the template's preview.css instead of printing them.",
+    )
+    return parser.parse_args()
+
+
+def font_face_properties(font):
+    # (family, weight, style) from the name / OS/2 tables.
+    names = font["name"]
+    family = names.getBestFamilyName() or "Unnamed"
+    family = METRIC_COMPATIBLE_FACES.get(family, family)
+    weight = font["OS/2"].usWeightClass if "OS/2" in font else 400
+    italic = bool(font["OS/2"].fsSelection & 0x01) if "OS/2" in font else False
+    return family, weight, "italic" if italic else "normal"
+
+
+def vendor_font(sourcePath, fontsDir, flavor):
+    options = subset.Options()
+    options.flavor = None if flavor == "ttf" else flavor
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+
+    font = TTFont(str(sourcePath))
+    family, weight, style = font_face_properties(font)
+    subsetter = subset.Subsetter(options=options)
+    subsetter.populate(unicodes=[code for start, end in RESUME_UNICODE_RANGES for code in range(start, end + 1)])
+    subsetter.subset(font)
+
+    outputPath = fontsDir / f"{sourcePath.stem}.{flavor}"
+    subset.save_font(font, str(outputPath), options)
+    return family, weight, style, outputPath
+
+
+def write_css_block(cssPath, rules):
+    # Replace the vendored-fonts block at the top of preview.css (or add one).
+    css = cssPath.read_text(encoding="utf-8")
+    block = "\n".join([CSS_BLOCK_START, *rules, CSS_BLOCK_END]) + "\n"
+    start = css.find(CSS_BLOCK_START)
+    end = css.find(CSS_BLOCK_END)
+    if start != -1 and end != -1:
+        css = css[:start] + block + css[end + len(CSS_BLOCK_END):].lstrip("\n")
+    else:
+        css = block + "\n" + css
+    cssPath.write_text(css, encoding="utf-8")
+
+
+def main():
+    args = parse_args()
+    templateDir = templatesDir / args.template
+    if not templateDir.is_dir():
+        raise SystemExit(f"Template folder does not exist: {args.template}")
+    fontsDir = templateDir / "fonts"
+    fontsDir.mkdir(exist_ok=True)
+
+    rules = []
+    for rawPath in args.fonts:
+        sourcePath = Path(rawPath).resolve()
+        if sourcePath.suffix.lower() not in FONT_SUFFIXES or not sourcePath.is_file():
+            raise SystemExit(f"Not a font file: {rawPath}")
+        family, weight, style, outputPath = vendor_font(sourcePath, fontsDir, args.flavor)
+        before, after = sourcePath.stat().st_size, outputPath.stat().st_size
+        print(f"{outputPath.relative_to(repoRoot)}: {before // 1024} KB -> {after // 1024} KB")
+        rules.append(
+            "@font-face {\n"
+            f'  font-family: "{family}";\n'
+            f'  src: url("fonts/{outputPath.name}") format("{"truetype" if args.flavor == "ttf" else args.flavor}");\n'
+            f"  font-weight: {weight};\n"
+            f"  font-style: {style};\n"
+            "}"
+        )
+
+    for rawPath in args.license:
+        licensePath = Path(rawPath).resolve()
+        if not licensePath.is_file():
+            raise SystemExit(f"License file does not exist: {rawPath}")
+        shutil.copyfile(licensePath, fontsDir / licensePath.name)
+
+    if args.write_css:
+        write_css_block(templateDir / "preview.css", rules)
+        print(f"\nWrote {len(rules)} @font-face rules to templates/{args.template}/preview.css")
+        return
+    print(f"\nAdd to templates/{args.template}/preview.css (inlined as data URIs at render time):\n")
+    print("\n".join(rules))
+
+
+if __name__ == "__main__":
+    main()
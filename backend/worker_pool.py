@@ -0,0 +1,171 @@
+# worker_pool.py
+
+# a bounded pool of pre-started worker processes, for CPU-bound work called from async routes.
+
+# the resume parser (resume_parser/parse_service.py) and the docx export
+# (generator/export_service.py) both subclass WorkerPool and only add their jobs, their
+# worker setup and their error types. every job gets:
+# - a per-job timeout (soft in the worker, hard kill from the parent as a backstop, timed
+#   from when the pool picks the job up).
+# - a bounded number of jobs running or waiting; past it, callers get busyError (-> 503).
+# workers=0 runs jobs in a thread instead (still off the loop; for dev / tests).
+
+# imports.
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger(__name__)
+
+# how long past the soft timeout the parent waits before killing the workers outright.
+hardTimeoutGraceSeconds = 5.0
+# how often a queued job checks whether the pool has picked it up.
+pickupPollSeconds = 0.05
+
+
+class PoolBusyError(Exception):
+    """Too many jobs running or queued; the caller should retry later."""
+
+
+class PoolTimeoutError(Exception):
+    """The job ran past its time budget and was stopped."""
+
+
+class PoolCrashedError(Exception):
+    """The worker died mid-job."""
+
+
+# BaseException on purpose: the parser turns every Exception into a warning and returns a
+# partial result, and a builder's own `except Exception` shouldn't swallow it either.
+class WorkerTimeout(BaseException):
+    pass
+
+
+def raise_worker_timeout(signum, frame):
+    raise WorkerTimeout()
+
+
+def start_worker(initializer, initargs):
+    # the parent handles ctrl-c / shutdown; workers just die with the pool.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def worker_ready():
+    return os.getpid()
+
+
+def run_in_worker(function, args, timeoutSeconds):
+    # soft timeout: SIGALRM interrupts the job in the worker's main thread.
+    previous = signal.signal(signal.SIGALRM, raise_worker_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeoutSeconds)
+    try:
+        return function(*args)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+class WorkerPool:
+    # subclasses name their jobs (for the logs) and raise their own subclasses of the errors.
+    jobName = "job"
+    busyError = PoolBusyError
+    timeoutError = PoolTimeoutError
+    crashedError = PoolCrashedError
+
+    def __init__(self, workers, queueSize, timeoutSeconds, initializer=None, initargs=()):
+        self.workers = workers
+        self.maxInFlight = max(workers, 1) + queueSize
+        self.timeoutSeconds = timeoutSeconds
+        self.initializer = initializer
+        self.initargs = initargs
+        self.executor = None
+        self.inFlight = 0
+
+    def start(self):
+        """Start the pool and fork every worker now, so the first job doesn't pay for it."""
+        if self.workers <= 0 or self.executor is not None:
+            return
+        # forkserver: workers come from a clean single-threaded process, not a copy of the
+        # (threaded) server. falls back to spawn where forkserver isn't available.
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=start_worker,
+            initargs=(self.initializer, self.initargs),
+        )
+        for _ in range(self.workers):
+            self.executor.submit(worker_ready)
+
+    def stop(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def restart(self, executor):
+        # a stuck or dead worker can't be reclaimed individually from ProcessPoolExecutor;
+        # kill the pool's processes and start a fresh one. jobs that shared the broken pool
+        # all land here — only the first one (still pointing at the current pool) restarts it.
+        if executor is not self.executor:
+            return
+        self.executor = None
+        for process in list((executor._processes or {}).values()):
+            process.kill()
+        executor.shutdown(wait=False, cancel_futures=True)
+        self.start()
+
+    def admit(self):
+        # backpressure: a fixed number of jobs running or waiting; everything past that is refused.
+        if self.inFlight >= self.maxInFlight:
+            raise self.busyError()
+        self.inFlight += 1
+
+    async def run(self, label, function, *args):
+        """run_job, counted against the in-flight limit."""
+        self.admit()
+        try:
+            return await self.run_job(label, function, *args)
+        finally:
+            self.inFlight -= 1
+
+    async def run_job(self, label, function, *args):
+        """function(*args) in a worker (or a thread with workers=0), with the timeouts / restarts below."""
+        executor = None
+        try:
+            if self.workers <= 0:
+                return await asyncio.wait_for(asyncio.to_thread(function, *args), self.timeoutSeconds)
+            if self.executor is None:
+                self.start()
+            executor = self.executor
+            future = executor.submit(run_in_worker, function, args, self.timeoutSeconds)
+            waiter = asyncio.wrap_future(future)
+            # the hard timer starts once the pool picks the job up, not at submit: time spent
+            # queued behind other jobs is not a stuck worker, and a restart would kill them all.
+            try:
+                while not future.running() and not waiter.done():
+                    await asyncio.wait({waiter}, timeout=pickupPollSeconds)
+            except asyncio.CancelledError:
+                waiter.cancel()
+                raise
+            # "running" means handed to the workers' call queue, which holds one job beyond the
+            # workers; that job may still wait out one soft timeout before a worker is free.
+            return await asyncio.wait_for(waiter, 2 * self.timeoutSeconds + hardTimeoutGraceSeconds)
+        except WorkerTimeout:
+            logger.warning("%s timed out after %ss: %s", self.jobName, self.timeoutSeconds, label)
+            raise self.timeoutError()
+        except asyncio.TimeoutError:
+            logger.error("%s hit the hard timeout; restarting its pool. %s", self.jobName, label)
+            if executor is not None:
+                self.restart(executor)
+            raise self.timeoutError()
+        except BrokenProcessPool:
+            logger.error("%s worker died; restarting its pool. %s", self.jobName, label)
+            self.restart(executor)
+            raise self.crashedError()
@@ -7,7 +7,7 @@ const baseURL = import.meta.env.VITE_API_URL || 'http://localhost:8000'
 const inFlightGetJsonRequests = new Map()
 
 // unified helper function to make api requests.
-// options.responseType: 'json' (default, returns { data }), 'blob', or 'text'
+// options.responseType: 'json' (default, returns { data }), 'blob', 'text', or 'response' (the raw fetch Response, for streamed bodies)
 async function apiRequestCore(endpoint, options = {}) {
     // construct full url for request.
     const url = `${baseURL}${endpoint}`
@@ -60,7 +60,9 @@ async function apiRequestCore(endpoint, options = {}) {
         }
         
         // parse response based on responseType.
-        if (responseType === 'blob') {
+        if (responseType === 'response') {
+            return response
+        } else if (responseType === 'blob') {
             return await response.blob()
         } else if (responseType === 'text') {
             return await response.text()
@@ -99,6 +101,10 @@ export async function apiRequestText(endpoint, options = {}) {
     return apiRequestCore(endpoint, { ...options, responseType: 'text' })
 }
 
+export async function apiRequestStream(endpoint, options = {}) {
+    return apiRequestCore(endpoint, { ...options, responseType: 'response' })
+}
+
 // --- export base url for use in other files. ---
 export const API_BASE_URL = baseURL
 
@@ -3,11 +3,15 @@
 // resume generation api calls.
 
 // generate resume as a pdf.
+// generate resume as a pdf / word document fitted to N pages.
 // generate resume as an html preview.
+// re-render the html preview, getting back only the sections that changed.
+// live html preview over a websocket (edits sent as json-patch deltas).
 // parse resume file (PDF or DOCX).
+// parse resume file, section by section as each is ready.
 
 // services.
-import { apiRequest, apiRequestText, apiRequestBlob } from '../api'
+import { API_BASE_URL, apiRequest, apiRequestText, apiRequestBlob, apiRequestStream } from '../api'
 
 // parse resume file (PDF or DOCX) - saves to DB (WelcomeStep).
 export async function parseResume(file) {
@@ -29,6 +33,53 @@ export async function parseResumeMerge(file) {
 	})
 }
 
+// parse resume file, streamed - no DB save. onSection(name, data) fires as each section is
+// parsed ('contact', 'summary', 'education', 'skills', 'experience', 'projects', in finishing
+// order); resolves with the same shape parseResumeMerge returns in .data.
+const STREAM_SECTION_KEYS = {
+	contact: 'contact_info',
+	summary: 'summary',
+	education: 'education',
+	skills: 'skills',
+	experience: 'experiences',
+	projects: 'projects',
+}
+
+export async function parseResumeStream(file, onSection = () => {}) {
+	const formData = new FormData()
+	formData.append('file', file)
+	const response = await apiRequestStream('/api/profile/parse-resume-stream', {
+		method: 'POST',
+		body: formData,
+	})
+
+	const parsed = { warnings: [] }
+	const reader = response.body.getReader()
+	const decoder = new TextDecoder()
+	let buffered = ''
+	const handleLine = (line) => {
+		if (!line.trim()) return
+		const { event, data } = JSON.parse(line)
+		if (event === 'done') {
+			parsed.warnings = data.warnings || []
+			parsed.debug = data.debug || null
+		} else if (STREAM_SECTION_KEYS[event]) {
+			parsed[STREAM_SECTION_KEYS[event]] = data
+			onSection(event, data)
+		}
+	}
+	for (;;) {
+		const { value, done } = await reader.read()
+		if (done) break
+		buffered += decoder.decode(value, { stream: true })
+		const lines = buffered.split('\n')
+		buffered = lines.pop()
+		lines.forEach(handleLine)
+	}
+	handleLine(buffered + decoder.decode())
+	return parsed
+}
+
 export async function generateResumePreview(template, resumeData, style = undefined, options = {}) {
 	// construct url for request.
 
@@ -56,6 +107,148 @@ export async function generateResumePreview(template, resumeData, style = undefi
 	}
 }
 
+// re-render the preview against the render currently shown (renderId, null for none).
+// returns { renderId, html } — the full document, with changed sections spliced in when it can be patched.
+export async function generateResumePreviewPatch(template, resumeData, style = undefined, previous = null, options = {}) {
+	const url = `/api/resume/generator/preview/patch`
+
+	// create payload for request.
+	const payload = {
+		template: template,
+		resume_data: resumeData,
+		renderId: previous?.renderId ?? null,
+	}
+	if (style != null) {
+		payload.style = style
+	}
+
+	// make request to backend.
+	try {
+		const result = await apiRequest(url, {
+			method: 'POST',
+			body: JSON.stringify(payload),
+			signal: options.signal,
+		})
+		if (result.full || !previous?.html) {
+			return { renderId: result.renderId, html: result.html }
+		}
+		return { renderId: result.renderId, html: spliceSectionFragments(previous.html, result.sections || {}) }
+	} catch (error) {
+		console.error('Error patching resume preview:', error)
+		throw error
+	}
+}
+
+// swap each section's html between its <!--rt:key--> ... <!--/rt:key--> markers.
+export function spliceSectionFragments(html, sections) {
+	let out = html
+	for (const [key, fragment] of Object.entries(sections)) {
+		const open = `<!--rt:${key}-->`
+		const close = `<!--/rt:${key}-->`
+		const start = out.indexOf(open)
+		const end = out.indexOf(close, start)
+		if (start < 0 || end < 0) continue
+		out = out.slice(0, start + open.length) + fragment + out.slice(end)
+	}
+	return out
+}
+
+// swap the :root token css between its /*rt:tokens*/ ... /*/rt:tokens*/ markers.
+export function spliceTokenCss(html, css) {
+	const open = '/*rt:tokens*/'
+	const close = '/*/rt:tokens*/'
+	const start = html.indexOf(open)
+	const end = html.indexOf(close, start)
+	if (start < 0 || end < 0) return html
+	return html.slice(0, start + open.length) + css + html.slice(end)
+}
+
+function isPlainObject(value) {
+	return value !== null && typeof value === 'object' && !Array.isArray(value)
+}
+
+// rfc 6902 ops turning `before` into `after` (arrays that change length are replaced whole).
+export function diffJsonPatch(before, after, path = '', ops = []) {
+	if (before === after) return ops
+	if (isPlainObject(before) && isPlainObject(after)) {
+		for (const key of Object.keys(before)) {
+			if (!(key in after)) ops.push({ op: 'remove', path: `${path}/${escapePointer(key)}` })
+		}
+		for (const key of Object.keys(after)) {
+			const child = `${path}/${escapePointer(key)}`
+			if (key in before) diffJsonPatch(before[key], after[key], child, ops)
+			else if (after[key] !== undefined) ops.push({ op: 'add', path: child, value: after[key] })
+		}
+		return ops
+	}
+	if (Array.isArray(before) && Array.isArray(after) && before.length === after.length) {
+		after.forEach((item, index) => diffJsonPatch(before[index], item, `${path}/${index}`, ops))
+		return ops
+	}
+	if (JSON.stringify(before) !== JSON.stringify(after)) {
+		ops.push({ op: 'replace', path, value: after ?? null })
+	}
+	return ops
+}
+
+function escapePointer(key) {
+	return String(key).replace(/~/g, '~0').replace(/\//g, '~1')
+}
+
+// live preview session: the server keeps { template, resume_data, style } and renders after edits pause.
+// onRender({ html, seq }) gets the full document every time (patches are spliced in here).
+// returns { update(template, resumeData, style) -> seq, isOpen(), close() }; when the socket isn't
+// open (or closes), isOpen() is false and the caller should fall back to the http preview.
+export function openPreviewSocket({ onRender, onError } = {}) {
+	const url = `${API_BASE_URL.replace(/^http/, 'ws')}/api/resume/generator/preview/ws`
+	const socket = new WebSocket(url)
+	let sent = null	// the document as the server has it.
+	let html = null
+	let seq = 0
+
+	function send(message) {
+		socket.send(JSON.stringify({ ...message, seq: ++seq }))
+		return seq
+	}
+
+	function init(document) {
+		sent = document
+		return send({ type: 'init', ...document })
+	}
+
+	socket.onmessage = (event) => {
+		const message = JSON.parse(event.data)
+		if (message.type === 'full') {
+			html = message.html
+		} else if (message.type === 'patch' && html != null) {
+			html = spliceSectionFragments(html, message.sections || {})
+			if (message.css != null) html = spliceTokenCss(html, message.css)
+		} else if (message.type === 'error') {
+			// our copy and the server's diverged: start over from what we last sent.
+			// resyncSeq is the seq of the render that will replace the failed one (null if none).
+			const resyncSeq = message.resync && sent ? init(sent) : null
+			onError?.({ ...message, resyncSeq })
+			return
+		} else {
+			return
+		}
+		onRender?.({ html, seq: message.seq })
+	}
+
+	return {
+		isOpen: () => socket.readyState === WebSocket.OPEN,
+		update(template, resumeData, style) {
+			const document = { template, resume_data: resumeData, style: style ?? {} }
+			if (!sent) return init(document)
+			const ops = diffJsonPatch(sent, document)
+			if (ops.length === 0) return null
+			sent = document
+			return send({ type: 'patch', ops })
+		},
+		close: () => socket.close(),
+	}
+}
+
 export async function generateResumePDF(template, resumeData, style = undefined, options = {}) {
 	// construct url for request.
 	const url = `/api/resume/generator/pdf`
@@ -82,6 +275,37 @@ export async function generateResumePDF(template, resumeData, style = undefined,
 	}
 }
 
+// export fitted to options.fitPages pages (default 1): the server picks the roomiest style
+// preset that fits. resolves with { blob, fitStyle, fitPages } — send fitStyle back as the
+// style to export the other format with the same preset.
+export async function generateResumeFitted(format, template, resumeData, style = undefined, options = {}) {
+	const url = `/api/resume/generator/${format === 'word' ? 'docx' : 'pdf'}`
+	const payload = {
+		template: template,
+		resume_data: resumeData,
+		fitPages: options.fitPages || 1,
+	}
+	if (style != null) {
+		payload.style = style
+	}
+	try {
+		const response = await apiRequestStream(url, {
+			method: 'POST',
+			body: JSON.stringify(payload),
+			signal: options.signal,
+		})
+		const fitStyle = response.headers.get('X-Fit-Style')
+		return {
+			blob: await response.blob(),
+			fitStyle: fitStyle ? JSON.parse(fitStyle) : null,
+			fitPages: Number(response.headers.get('X-Fit-Pages')) || null,
+		}
+	} catch (error) {
+		console.error('Error generating fitted resume:', error)
+		throw error
+	}
+}
+
 export async function generateResumeWord(template, resumeData, style = undefined, options = {}) {
 	const url = `/api/resume/generator/docx`
 	const payload = {
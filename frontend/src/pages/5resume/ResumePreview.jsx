@@ -5,7 +5,7 @@ import { useState, useCallback, useMemo, useEffect, useRef } from 'react'
 import { useNavigate, useLocation } from 'react-router-dom'
 
 // --- api imports.
-import { generateResumePDF, generateResumeWord } from '@/api/services/resume'
+import { generateResumeFitted, generateResumePDF, generateResumeWord } from '@/api/services/resume'
 
 // --- main ui component imports.
 import LeftPanel from './components/left/LeftPanel'
@@ -59,6 +59,10 @@ function ResumePreview() {
 	const [saveDraftModalOpen, setSaveDraftModalOpen] = useState(false)
 	const downloadControllerRef = useRef(null)
 
+	// export fitted to one page; the preset the server picked is reused for the other format.
+	const [fitToOnePage, setFitToOnePage] = useState(false)
+	const fitStyleRef = useRef(null)	// { key, style } of the last fitted export.
+
 	useEffect(() => {
 		return () => {
 			downloadControllerRef.current?.abort()
@@ -284,6 +288,28 @@ function ResumePreview() {
 		}
 	}
 
+	// fitted export: search the presets once per resume + style, then reuse the chosen one.
+	const downloadFitted = async (type, signal) => {
+		const fitKey = JSON.stringify([template, editorVisibleResumePayload, stylePreferences])
+		const fitStyle = fitStyleRef.current?.key === fitKey ? fitStyleRef.current.style : null
+		if (fitStyle) {
+			return type === 'word'
+				? await generateResumeWord(template, editorVisibleResumePayload, fitStyle, { signal })
+				: await generateResumePDF(template, editorVisibleResumePayload, fitStyle, { signal })
+		}
+		const fitted = await generateResumeFitted(type, template, editorVisibleResumePayload, stylePreferences, {
+			fitPages: 1,
+			signal,
+		})
+		if (fitted.fitStyle) {
+			fitStyleRef.current = { key: fitKey, style: fitted.fitStyle }
+		}
+		if (fitted.fitPages > 1) {
+			toast("This resume runs past one page even at the most compact settings.")
+		}
+		return fitted.blob
+	}
+
 	// downloads relevant document.
 	const handleDownloadDocument = async (type) => {
 		// is this a word document?
@@ -297,6 +323,14 @@ function ResumePreview() {
 
 		// try to generate the document.
 		try {
+			if (fitToOnePage) {
+				const blob = await downloadFitted(type, controller.signal)
+				downloadBlob(blob, isWord ? 'resume.docx' : 'resume.pdf')
+				setDownloadStatus({ type: isWord ? 'word' : 'pdf', phase: 'success' })
+				window.setTimeout(() => setDownloadStatus(null), 2200)
+				return
+			}
+
 			if (!isWord && exactPdfBlob && isExactPdfFresh) {
 				downloadBlob(exactPdfBlob, 'resume.pdf')
 				setDownloadStatus({ type: 'pdf', phase: 'success' })
@@ -614,6 +648,8 @@ function ResumePreview() {
 					isGeneratingPreview={isGeneratingPreview}
 					downloadStatus={downloadStatus}
 					onDownloadDocument={handleDownloadDocument}
+					fitToOnePage={fitToOnePage}
+					onToggleFitToOnePage={() => setFitToOnePage((v) => !v)}
 					onRefreshPreview={handleRefreshPreview}
 					validationIssues={validationIssues}
 					exactPdfUrl={exactPdfBlobUrl}
@@ -42,17 +42,15 @@ function normalizeStatus(status) {
 	return clean || 'draft'
 }
 
+// list items are metadata-only cards (status/tags/target_* columns); the snapshot is never sent with the list.
 function draftMeta(resume) {
-	const metadata = resume?.resume_data?.saveMetadata || {}
-	const tailorIntent = resume?.resume_data?.tailorIntent || {}
-	const status = normalizeStatus(metadata.status)
-	const tags = Array.isArray(metadata.tags) ? metadata.tags.filter(Boolean) : []
+	const tags = Array.isArray(resume?.tags) ? resume.tags.filter(Boolean) : []
 	return {
-		status,
+		status: normalizeStatus(resume?.status),
 		tags,
-		role: metadata.targetRole || tailorIntent.jobTitle || '',
-		company: metadata.targetCompany || tailorIntent.company || '',
-		changedSections: Array.isArray(metadata.changedSections) ? metadata.changedSections : [],
+		role: resume?.target_role || '',
+		company: resume?.target_company || '',
+		changedSections: Array.isArray(resume?.changed_sections) ? resume.changed_sections : [],
 	}
 }
 
@@ -374,7 +372,7 @@ export default function ResumesHub() {
 		const items = savedResumes.items
 		const ready = items.filter((resume) => draftMeta(resume).status === 'ready').length
 		const drafts = items.filter((resume) => draftMeta(resume).status === 'draft').length
-		const tailored = items.filter((resume) => Boolean(draftMeta(resume).role || resume.resume_data?.tailorIntent)).length
+		const tailored = items.filter((resume) => Boolean(draftMeta(resume).role)).length
 		return { total: items.length, ready, drafts, tailored }
 	}, [savedResumes.items])
 
@@ -384,7 +382,7 @@ export default function ResumesHub() {
 			const meta = draftMeta(resume)
 			const hay = `${resume.name || ''} ${meta.role} ${meta.company} ${meta.status} ${meta.tags.join(' ')} ${resume.template || ''}`.toLowerCase()
 			if (needle && !hay.includes(needle)) return false
-			if (activeTab === 'tailored' && !meta.role && !resume.resume_data?.tailorIntent) return false
+			if (activeTab === 'tailored' && !meta.role) return false
 			if (activeTab === 'draft' && meta.status !== 'draft') return false
 			if (activeTab === 'ready' && meta.status !== 'ready') return false
 			if (statusFilter !== 'all' && meta.status !== statusFilter) return false
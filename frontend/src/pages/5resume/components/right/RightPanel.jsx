@@ -11,6 +11,7 @@ import {
 	faSpinner,
 	faCircleCheck,
 	faExclamationTriangle,
+	faCompress,
 } from '@fortawesome/free-solid-svg-icons'
 
 const iconSm = 'h-4 w-4 shrink-0'
@@ -27,6 +28,8 @@ function RightPanel({
 	isGeneratingPreview,
 	downloadStatus = null,
 	onDownloadDocument,
+	fitToOnePage = false,
+	onToggleFitToOnePage = () => {},
 	onRefreshPreview,
 	validationIssues = [],
 	exactPdfUrl = null,
@@ -153,6 +156,19 @@ function RightPanel({
 							<span className="pr-0.5">Word</span>
 						</button>
 						<span className="w-px shrink-0 self-stretch bg-gray-200" aria-hidden="true" />
+						<button
+							type="button"
+							onClick={onToggleFitToOnePage}
+							disabled={isDownloadBusy}
+							className={`inline-flex items-center gap-2 px-3 text-sm font-medium transition-colors duration-150 disabled:cursor-not-allowed disabled:opacity-45 focus-visible:relative focus-visible:z-10 focus-visible:outline focus-visible:outline-2 focus-visible:outline-offset-[-2px] focus-visible:outline-gray-400/60 ${fitToOnePage ? 'bg-brand-pink/[0.08] text-brand-pink' : 'text-gray-600 hover:bg-gray-100 hover:text-gray-900'}`}
+							aria-pressed={fitToOnePage}
+							aria-label="Fit exports to one page"
+							title="Fit PDF and Word exports to one page"
+						>
+							<FontAwesomeIcon icon={faCompress} className={iconSm} />
+							<span className="hidden pr-0.5 sm:inline">1 page</span>
+						</button>
+						<span className="w-px shrink-0 self-stretch bg-gray-200" aria-hidden="true" />
 						<button
 							type="button"
 							onClick={onRefreshPreview}
@@ -1,7 +1,6 @@
 function SavedResumeMeta({ resume }) {
-	const metadata = resume?.resume_data?.saveMetadata || {}
-	const tags = Array.isArray(metadata.tags) ? metadata.tags.filter(Boolean).slice(0, 2) : []
-	const status = metadata.status ? String(metadata.status).replace(/_/g, ' ') : ''
+	const tags = Array.isArray(resume?.tags) ? resume.tags.filter(Boolean).slice(0, 2) : []
+	const status = resume?.status ? String(resume.status).replace(/_/g, ' ') : ''
 
 	if (!status && tags.length === 0) return null
 
@@ -3,7 +3,7 @@
 // --- imports ---
 import { useCallback, useEffect, useRef, useState } from 'react'
 import toast from 'react-hot-toast'
-import { generateResumePreview, generateResumePDF } from '@/api/services/resume'
+import { generateResumePreview, generateResumePreviewPatch, generateResumePDF, openPreviewSocket } from '@/api/services/resume'
 import { validateResumeData } from '../utils/resumeValidation'
 
 // --- constants ---
@@ -47,6 +47,9 @@ export function useDebouncedPreviews({
 	const exactPdfRequestIdRef = useRef(0)	// to track the exact pdf request id.
 	const exactPdfBlobUrlRef = useRef(null)	// to track the exact pdf blob url.
 	const refreshControllerRef = useRef(null)
+	const lastRenderRef = useRef(null)	// { renderId, html } of the last patched draft preview.
+	const previewSocketRef = useRef(null)	// live preview session (falls back to http when closed).
+	const pendingSeqRef = useRef(null)	// seq of the last edit sent over the socket.
 
 	// state for the validation issues.
 	const [validationIssues, setValidationIssues] = useState([])
@@ -58,6 +61,27 @@ export function useDebouncedPreviews({
 		exactPdfBlobUrlRef.current = exactPdfBlobUrl
 	}, [exactPdfBlobUrl])
 
+	// open the live preview socket once; renders come back as edits pause (server-side debounce).
+	useEffect(() => {
+		const socket = openPreviewSocket({
+			onRender: ({ html, seq }) => {
+				setPreviewHtml(html)
+				if (seq === pendingSeqRef.current) setIsGeneratingPreview(false)
+			},
+			onError: (message) => {
+				console.error('Live preview error:', message.detail)
+				// a resync re-renders under a new seq; a failed render of the latest edit means none is coming.
+				if (message.resyncSeq != null) pendingSeqRef.current = message.resyncSeq
+				else if (message.seq === pendingSeqRef.current) setIsGeneratingPreview(false)
+			},
+		})
+		previewSocketRef.current = socket
+		return () => {
+			previewSocketRef.current = null
+			socket.close()
+		}
+	}, [])
+
 	// upon unmount, revoke the memory of the exact pdf blob url.
 	useEffect(() => {
 		return () => {
@@ -214,15 +238,27 @@ export function useDebouncedPreviews({
 		// set the generating preview flag to true.
 		setIsGeneratingPreview(true)
 
+		// live session: send the delta right away, the server coalesces bursts and sends back changed sections.
+		const socket = previewSocketRef.current
+		if (socket?.isOpen()) {
+			const seq = socket.update(template, visibleResumePayload, stylePreferences)
+			if (seq == null) setIsGeneratingPreview(false)
+			else pendingSeqRef.current = seq
+			lastPreviewInputRef.current = previewInputKey
+			return
+		}
+
 		// create a timer to generate the preview.
 		const controller = new AbortController()
 		const timer = setTimeout(async () => {
 			// try to generate the preview.
 			try {
-				const htmlContent = await generateResumePreview(template, visibleResumePayload, stylePreferences, {
+				// only the sections that changed come back; they're spliced into the last render.
+				const render = await generateResumePreviewPatch(template, visibleResumePayload, stylePreferences, lastRenderRef.current, {
 					signal: controller.signal,
 				})
-				setPreviewHtml(htmlContent)
+				lastRenderRef.current = render
+				setPreviewHtml(render.html)
 				lastPreviewInputRef.current = previewInputKey
 			} catch (error) {
 				if (isAbortError(error)) return
@@ -279,6 +315,8 @@ export function useDebouncedPreviews({
 				const htmlContent = await generateResumePreview(template, payload, stylePreferences, {
 					signal: controller.signal,
 				})
+				// a full render replaces the patch base; the next draft edit starts from scratch.
+				lastRenderRef.current = null
 				setPreviewHtml(htmlContent)
 				lastPreviewInputRef.current = key
 				return true
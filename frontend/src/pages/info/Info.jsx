@@ -33,7 +33,7 @@ import {
 	detachResume,
 } from '@/api/services/profile'
 import { logoutUser } from '@/api/services/auth'
-import { parseResumeMerge } from '@/api/services/resume'
+import { parseResumeStream } from '@/api/services/resume'
 import { mergeParsedData } from './utils/mergeParsedData'
 import DashboardShell from '@/components/DashboardShell'
 import ContactSection from './components/ContactSection'
@@ -163,6 +163,7 @@ function Info() {
 	const [isLoading, setIsLoading] = useState(true)
 	const [savingSection, setSavingSection] = useState(null)
 	const [isParsingResume, setIsParsingResume] = useState(false)
+	const [parsedSectionCount, setParsedSectionCount] = useState(0)
 	const [parseResumeError, setParseResumeError] = useState('')
 	const [parseMergeReport, setParseMergeReport] = useState(null)
 	const [showParseDebug, setShowParseDebug] = useState(false)
@@ -643,6 +644,7 @@ function Info() {
 			return
 		}
 		setParseResumeError('')
+		setParsedSectionCount(0)
 		setIsParsingResume(true)
 		try {
 			// save snapshot before merge so user can undo if they detach
@@ -655,8 +657,8 @@ function Info() {
 				skills: JSON.parse(JSON.stringify(s.skills)),
 				summary: JSON.parse(JSON.stringify(s.summary)),
 			}
-			const res = await parseResumeMerge(file)
-			const parsed = res.data || res
+			// sections arrive as each parser finishes; the merge below waits for all of them.
+			const parsed = await parseResumeStream(file, () => setParsedSectionCount((count) => count + 1))
 			const existing = { contact, education, experiences, projects, skills, summary }
 			const { merged, counts, details } = mergeParsedData(parsed, existing)
 			setContact(merged.contact)
@@ -1121,7 +1123,7 @@ function Info() {
 											htmlFor="info-resume-upload"
 											className="mt-4 inline-flex cursor-pointer items-center gap-2 rounded-xl bg-brand-pink px-5 py-2.5 text-sm font-black text-white shadow-sm transition hover:bg-brand-pink-dark"
 										>
-											{isParsingResume ? 'Parsing...' : 'Upload PDF or DOCX'}
+											{isParsingResume ? (parsedSectionCount ? `Parsing... (${parsedSectionCount}/6 sections)` : 'Parsing...') : 'Upload PDF or DOCX'}
 										</label>
 										{parseResumeError && (
 											<div className="mt-4 rounded-lg border border-red-200 bg-red-50 p-3 text-sm text-red-700">